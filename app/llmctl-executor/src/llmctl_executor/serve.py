@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import selectors
+import signal
+import socket
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from .contracts import (
+    CONTRACT_VERSION,
+    ERROR_CANCELLED,
+    ERROR_INFRA,
+    ERROR_TIMEOUT,
+    ExecutionResult,
+    RESULT_PREFIX,
+    ResultError,
+    STATUS_CANCELLED,
+    STATUS_FAILED,
+    STATUS_INFRA_ERROR,
+    STATUS_TIMEOUT,
+    utcnow,
+)
+from .payload import ExecutionPayload, PayloadError
+from .runtime import execute_single_run
+
+SERVE_READY_EVENT = "executor_serving"
+CONTROL_OP_CANCEL = "cancel"
+CONTROL_OP_SHUTDOWN = "shutdown"
+_TIMEOUT_GRACE_SECONDS = 5.0
+_KILL_GRACE_SECONDS = 5.0
+_MAX_SELECT_SECONDS = 1.0
+_READ_CHUNK_BYTES = 65536
+
+
+def _rss_bytes(max_rss: int) -> int:
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    return int(max_rss) if sys.platform == "darwin" else int(max_rss) * 1024
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _terminal_result(
+    payload: ExecutionPayload | None,
+    *,
+    status: str,
+    code: str,
+    message: str,
+    started_at: datetime | None = None,
+    details: dict[str, Any] | None = None,
+) -> ExecutionResult:
+    now = utcnow()
+    return ExecutionResult(
+        status=status,
+        exit_code=124 if status == STATUS_TIMEOUT else (130 if status == STATUS_CANCELLED else 1),
+        started_at=started_at or now,
+        finished_at=now,
+        stdout="",
+        stderr="",
+        error=ResultError(code=code, message=message, details=details),
+        provider_metadata={
+            "executor": "llmctl-executor",
+            "provider": payload.provider if payload is not None else "workspace",
+            "request_id": payload.request_id if payload is not None else "executor-error",
+            "execution_mode": "serve",
+        },
+    )
+
+
+@dataclass
+class _ActiveRun:
+    payload: ExecutionPayload
+    sequence: int
+    pid: int
+    result_fd: int
+    started_at: datetime
+    started_monotonic: float
+    deadline: float
+    chunks: list[bytes] = field(default_factory=list)
+    stop_status: str | None = None
+    kill_at: float | None = None
+
+
+class ExecutorServer:
+    """Runs newline-delimited payloads one after another in a warm process.
+
+    Each payload executes in a child forked from this process, so modules
+    imported at startup (``--preload``) are shared, while the payload's own
+    imports and its cwd, env and ``sys.path`` changes stay in the child.
+    The child can be killed for timeouts and cancellation without losing the
+    server. Besides payloads, an input line may be a control message:
+    ``{"op": "cancel", "request_id": "..."}`` or ``{"op": "shutdown"}``.
+    """
+
+    def __init__(self, in_fd: int, out_fd: int) -> None:
+        self.in_fd = in_fd
+        self.out_fd = out_fd
+        self.shutdown_requested = False
+        self._queue: deque[ExecutionPayload] = deque()
+        self._active: _ActiveRun | None = None
+        self._input_closed = False
+        self._buffer = b""
+        self._sequence = 0
+        # poll() also accepts regular files (stdin redirected from a file);
+        # epoll, the default on Linux, rejects them.
+        self._selector = (
+            selectors.PollSelector()
+            if hasattr(selectors, "PollSelector")
+            else selectors.SelectSelector()
+        )
+
+    def serve(self) -> None:
+        self._emit_line(
+            json.dumps(
+                {
+                    "event": SERVE_READY_EVENT,
+                    "contract_version": CONTRACT_VERSION,
+                    "pid": os.getpid(),
+                },
+                separators=(",", ":"),
+                sort_keys=True,
+            )
+        )
+        self._selector.register(self.in_fd, selectors.EVENT_READ)
+        try:
+            while True:
+                if self._active is None and self._queue:
+                    self._start(self._queue.popleft())
+                if self._active is None and (self._input_closed or self.shutdown_requested):
+                    return
+                for key, _ in self._selector.select(self._select_timeout()):
+                    if key.fd == self.in_fd:
+                        self._read_input()
+                    elif self._active is not None and key.fd == self._active.result_fd:
+                        self._read_result()
+                self._enforce_deadlines()
+        finally:
+            if self._active is not None:
+                self.stop_active(STATUS_CANCELLED)
+                self._kill_active(signal.SIGKILL)
+                self._finish()
+            self._selector.close()
+
+    def stop_active(self, status: str) -> None:
+        active = self._active
+        if active is None or active.stop_status is not None:
+            return
+        active.stop_status = status
+        active.kill_at = time.monotonic() + _KILL_GRACE_SECONDS
+        self._kill_active(signal.SIGTERM)
+
+    def _select_timeout(self) -> float:
+        active = self._active
+        if active is None:
+            return _MAX_SELECT_SECONDS
+        next_event = active.kill_at if active.kill_at is not None else active.deadline
+        return max(0.0, min(_MAX_SELECT_SECONDS, next_event - time.monotonic()))
+
+    def _read_input(self) -> None:
+        chunk = os.read(self.in_fd, _READ_CHUNK_BYTES)
+        if not chunk:
+            self._input_closed = True
+            self._selector.unregister(self.in_fd)
+            lines = [self._buffer] if self._buffer.strip() else []
+            self._buffer = b""
+        else:
+            self._buffer += chunk
+            *lines, self._buffer = self._buffer.split(b"\n")
+        for line in lines:
+            self._handle_line(line.decode("utf-8", errors="replace").strip())
+
+    def _handle_line(self, line: str) -> None:
+        if not line:
+            return
+        try:
+            raw = json.loads(line)
+        except json.JSONDecodeError as exc:
+            self._emit_result(
+                _terminal_result(
+                    None,
+                    status=STATUS_INFRA_ERROR,
+                    code=ERROR_INFRA,
+                    message=f"serve input line is not valid JSON: {exc.msg}.",
+                )
+            )
+            return
+        if isinstance(raw, dict) and raw.get("op"):
+            self._handle_control(raw)
+            return
+        try:
+            payload = ExecutionPayload.from_dict(raw)
+        except PayloadError as exc:
+            status = STATUS_INFRA_ERROR if exc.code == ERROR_INFRA else STATUS_FAILED
+            self._emit_result(
+                _terminal_result(
+                    None,
+                    status=status,
+                    code=exc.code,
+                    message=str(exc),
+                    details=exc.details,
+                )
+            )
+            return
+        self._queue.append(payload)
+
+    def _handle_control(self, message: dict[str, Any]) -> None:
+        op = str(message.get("op") or "").strip().lower()
+        if op == CONTROL_OP_SHUTDOWN:
+            self.shutdown_requested = True
+            return
+        if op != CONTROL_OP_CANCEL:
+            self._emit_result(
+                _terminal_result(
+                    None,
+                    status=STATUS_INFRA_ERROR,
+                    code=ERROR_INFRA,
+                    message=f"Unknown serve control op '{op}'.",
+                )
+            )
+            return
+        request_id = str(message.get("request_id") or "").strip()
+        if self._active is not None and self._active.payload.request_id == request_id:
+            self.stop_active(STATUS_CANCELLED)
+        for payload in [item for item in self._queue if item.request_id == request_id]:
+            self._queue.remove(payload)
+            self._emit_result(
+                _terminal_result(
+                    payload,
+                    status=STATUS_CANCELLED,
+                    code=ERROR_CANCELLED,
+                    message="Payload was cancelled before it started.",
+                )
+            )
+
+    def _start(self, payload: ExecutionPayload) -> None:
+        self._sequence += 1
+        read_fd, write_fd = os.pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the forked child
+            os.close(read_fd)
+            self._run_child(payload, write_fd)
+        os.close(write_fd)
+        try:
+            os.setpgid(pid, pid)
+        except OSError:
+            pass
+        now = time.monotonic()
+        self._active = _ActiveRun(
+            payload=payload,
+            sequence=self._sequence,
+            pid=pid,
+            result_fd=read_fd,
+            started_at=utcnow(),
+            started_monotonic=now,
+            deadline=now + payload.timeout_seconds + _TIMEOUT_GRACE_SECONDS,
+        )
+        self._selector.register(read_fd, selectors.EVENT_READ)
+
+    def _run_child(self, payload: ExecutionPayload, result_fd: int) -> None:  # pragma: no cover
+        exit_code = 0
+        try:
+            # Own process group so command payloads die with the child.
+            os.setpgid(0, 0)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            if self.out_fd != 1:
+                os.dup2(self.out_fd, 1)
+            # The payload stream stays with the server; subprocesses started
+            # without an explicit stdin must not consume queued payloads.
+            devnull_fd = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull_fd, 0)
+            os.close(devnull_fd)
+            if self.in_fd not in (0, 1):
+                os.close(self.in_fd)
+            try:
+                result = execute_single_run(payload)
+            except Exception as exc:
+                result = _terminal_result(
+                    payload,
+                    status=STATUS_INFRA_ERROR,
+                    code=ERROR_INFRA,
+                    message=f"Unexpected executor failure: {exc}",
+                )
+            sys.stdout.flush()
+            sys.stderr.flush()
+            _write_all(result_fd, json.dumps(result.as_dict()).encode("utf-8"))
+        except BaseException:
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _read_result(self) -> None:
+        active = self._active
+        if active is None:
+            return
+        chunk = os.read(active.result_fd, _READ_CHUNK_BYTES)
+        if chunk:
+            active.chunks.append(chunk)
+            return
+        self._finish()
+
+    def _enforce_deadlines(self) -> None:
+        active = self._active
+        if active is None:
+            return
+        now = time.monotonic()
+        if active.stop_status is None and now >= active.deadline:
+            self.stop_active(STATUS_TIMEOUT)
+        elif active.kill_at is not None and now >= active.kill_at:
+            self._kill_active(signal.SIGKILL)
+            active.kill_at = None
+
+    def _kill_active(self, signum: int) -> None:
+        active = self._active
+        if active is None:
+            return
+        try:
+            os.killpg(active.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            try:
+                os.kill(active.pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def _finish(self) -> None:
+        active = self._active
+        if active is None:
+            return
+        self._active = None
+        self._selector.unregister(active.result_fd)
+        os.close(active.result_fd)
+        _, wait_status, usage = os.wait4(active.pid, 0)
+        payload = active.payload
+        result_dict: dict[str, Any] | None = None
+        if active.stop_status is None:
+            try:
+                result_dict = json.loads(b"".join(active.chunks).decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                result_dict = None
+        if result_dict is None:
+            if active.stop_status == STATUS_TIMEOUT:
+                result = _terminal_result(
+                    payload,
+                    status=STATUS_TIMEOUT,
+                    code=ERROR_TIMEOUT,
+                    message=f"Execution timed out after {payload.timeout_seconds} seconds.",
+                    started_at=active.started_at,
+                    details={"timeout_seconds": payload.timeout_seconds},
+                )
+            elif active.stop_status == STATUS_CANCELLED:
+                result = _terminal_result(
+                    payload,
+                    status=STATUS_CANCELLED,
+                    code=ERROR_CANCELLED,
+                    message="Payload was cancelled.",
+                    started_at=active.started_at,
+                )
+            else:
+                result = _terminal_result(
+                    payload,
+                    status=STATUS_INFRA_ERROR,
+                    code=ERROR_INFRA,
+                    message=(
+                        "Executor worker exited without a result "
+                        f"(wait status {wait_status})."
+                    ),
+                    started_at=active.started_at,
+                )
+            result_dict = result.as_dict()
+        metrics = result_dict.get("metrics")
+        if not isinstance(metrics, dict):
+            metrics = {}
+        metrics.setdefault(
+            "duration_seconds",
+            round(time.monotonic() - active.started_monotonic, 3),
+        )
+        metrics["max_rss_bytes"] = _rss_bytes(usage.ru_maxrss)
+        metrics["server_max_rss_bytes"] = _rss_bytes(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        )
+        metrics["serve_sequence"] = active.sequence
+        result_dict["metrics"] = metrics
+        self._emit_line(f"{RESULT_PREFIX}{json.dumps(result_dict, sort_keys=True)}")
+
+    def _emit_result(self, result: ExecutionResult) -> None:
+        self._emit_line(f"{RESULT_PREFIX}{json.dumps(result.as_dict(), sort_keys=True)}")
+
+    def _emit_line(self, line: str) -> None:
+        if self.out_fd == 1:
+            sys.stdout.flush()
+        _write_all(self.out_fd, (line + "\n").encode("utf-8"))
+
+
+def build_serve_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="llmctl-executor serve",
+        description=(
+            "Run newline-delimited llmctl executor payloads from stdin or a "
+            "local socket, one result per payload."
+        ),
+    )
+    parser.add_argument(
+        "--socket",
+        default="",
+        help="Listen on this Unix socket path instead of reading stdin.",
+    )
+    parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="MODULE",
+        help="Import MODULE before serving so the first payload starts warm.",
+    )
+    return parser
+
+
+def _serve_socket(path: str, servers: list[ExecutorServer]) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        listener.bind(path)
+        listener.listen(1)
+        while True:
+            connection, _ = listener.accept()
+            with connection:
+                server = ExecutorServer(connection.fileno(), connection.fileno())
+                servers.append(server)
+                server.serve()
+                servers.remove(server)
+                if server.shutdown_requested:
+                    return
+    finally:
+        listener.close()
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def serve_main(argv: list[str] | None = None) -> int:
+    args = build_serve_parser().parse_args(argv)
+    for module_name in args.preload:
+        __import__(module_name)
+
+    servers: list[ExecutorServer] = []
+
+    def _terminate(_signum, _frame) -> None:
+        if not servers:
+            raise SystemExit(0)
+        for server in list(servers):
+            server.shutdown_requested = True
+            server.stop_active(STATUS_CANCELLED)
+
+    signal.signal(signal.SIGTERM, _terminate)
+    socket_path = str(args.socket or "").strip()
+    if socket_path:
+        _serve_socket(socket_path, servers)
+        return 0
+    server = ExecutorServer(sys.stdin.fileno(), sys.stdout.fileno())
+    servers.append(server)
+    server.serve()
+    return 0
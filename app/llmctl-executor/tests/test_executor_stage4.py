@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
 import stat
 import subprocess
 import sys
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -199,5 +201,232 @@ class PayloadInputStage4Tests(unittest.TestCase):
         self.assertEqual("v1", payload.get("contract_version"))
 
 
+class ServeModeStage4Tests(unittest.TestCase):
+    def _result_lines(self, stdout: str) -> list[dict[str, object]]:
+        prefix = "LLMCTL_EXECUTOR_RESULT_JSON="
+        return [
+            json.loads(line[len(prefix):])
+            for line in stdout.splitlines()
+            if line.startswith(prefix)
+        ]
+
+    def _node_payload(self, tmp_dir: str, request_id: str, **extra: object) -> dict[str, object]:
+        return {
+            "contract_version": "v1",
+            "provider": "kubernetes",
+            "request_id": request_id,
+            "cwd": tmp_dir,
+            "node_execution": {
+                "entrypoint": "serve_entrypoint_test:run_node",
+                "python_paths": [tmp_dir],
+                "request": {"node_type": "start"},
+            },
+            **extra,
+        }
+
+    def _write_serve_entrypoint(self, tmp_dir: str) -> Path:
+        imports_log = Path(tmp_dir) / "imports.log"
+        (Path(tmp_dir) / "serve_entrypoint_test.py").write_text(
+            "\n".join(
+                [
+                    "from pathlib import Path",
+                    f"with Path({str(imports_log)!r}).open('a') as handle:",
+                    "    handle.write('imported\\n')",
+                    "",
+                    "def run_node(request):",
+                    "    return {'node_type': request.node_type}, {}",
+                ]
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        return imports_log
+
+    def test_serve_runs_payloads_in_order_with_preloaded_entrypoint(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            imports_log = self._write_serve_entrypoint(tmp_dir)
+            lines = [
+                json.dumps(self._node_payload(tmp_dir, "node-1")),
+                "not json",
+                json.dumps(self._node_payload(tmp_dir, "node-2")),
+            ]
+            completed = subprocess.run(
+                [
+                    sys.executable,
+                    str(EXECUTOR_RUN),
+                    "serve",
+                    "--preload",
+                    "serve_entrypoint_test",
+                ],
+                input="\n".join(lines) + "\n",
+                capture_output=True,
+                text=True,
+                check=False,
+                cwd=str(REPO_ROOT),
+                env={**os.environ, "PYTHONPATH": tmp_dir},
+                timeout=60,
+            )
+            import_count = imports_log.read_text(encoding="utf-8").count("imported")
+
+        self.assertEqual(0, completed.returncode, completed.stderr)
+        results = self._result_lines(completed.stdout)
+        self.assertEqual(
+            ["infra_error", "success", "success"],
+            [result["status"] for result in results],
+        )
+        self.assertEqual(
+            ["executor-error", "node-1", "node-2"],
+            [result["provider_metadata"]["request_id"] for result in results],
+        )
+        self.assertEqual(1, import_count)
+        for sequence, result in enumerate(results[1:], start=1):
+            self.assertEqual({"node_type": "start"}, result["output_state"])
+            self.assertEqual(sequence, result["metrics"]["serve_sequence"])
+            self.assertGreater(result["metrics"]["max_rss_bytes"], 0)
+        self.assertEqual(2, completed.stdout.count("LLMCTL_EXECUTOR_STARTED"))
+
+    def test_serve_imports_payload_entrypoints_in_the_child(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            imports_log = self._write_serve_entrypoint(tmp_dir)
+            lines = [
+                json.dumps(self._node_payload(tmp_dir, "node-1")),
+                json.dumps(self._node_payload(tmp_dir, "node-2")),
+            ]
+            completed = subprocess.run(
+                [sys.executable, str(EXECUTOR_RUN), "serve"],
+                input="\n".join(lines) + "\n",
+                capture_output=True,
+                text=True,
+                check=False,
+                cwd=str(REPO_ROOT),
+                timeout=60,
+            )
+            import_count = imports_log.read_text(encoding="utf-8").count("imported")
+
+        self.assertEqual(0, completed.returncode, completed.stderr)
+        results = self._result_lines(completed.stdout)
+        self.assertEqual(["success", "success"], [result["status"] for result in results])
+        # Payload python_paths and imports never reach the server process, so
+        # each forked child imports the entrypoint itself.
+        self.assertEqual(2, import_count)
+
+    def test_serve_child_subprocesses_do_not_read_queued_payloads(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            (Path(tmp_dir) / "serve_stdin_entrypoint_test.py").write_text(
+                "\n".join(
+                    [
+                        "import subprocess",
+                        "import sys",
+                        "",
+                        "def run_node(request):",
+                        "    completed = subprocess.run(",
+                        "        [sys.executable, '-c', 'import sys; print(sys.stdin.read())'],",
+                        "        capture_output=True,",
+                        "        text=True,",
+                        "    )",
+                        "    return {'stdin': completed.stdout.strip()}, {}",
+                    ]
+                )
+                + "\n",
+                encoding="utf-8",
+            )
+            reader = self._node_payload(tmp_dir, "reader")
+            reader["node_execution"]["entrypoint"] = "serve_stdin_entrypoint_test:run_node"
+            self._write_serve_entrypoint(tmp_dir)
+            process = subprocess.Popen(
+                [sys.executable, str(EXECUTOR_RUN), "serve"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                cwd=str(REPO_ROOT),
+            )
+            assert process.stdin is not None and process.stdout is not None
+            stdin_lock = threading.Lock()
+
+            def _send_after() -> None:
+                with stdin_lock:
+                    if not process.stdin.closed:
+                        process.stdin.write(
+                            json.dumps(self._node_payload(tmp_dir, "after")) + "\n"
+                        )
+                        process.stdin.close()
+
+            # A subprocess reading the inherited stdin blocks until more input
+            # arrives; send the next payload anyway rather than hang the suite.
+            watchdog = threading.Timer(10, _send_after)
+            try:
+                process.stdin.write(json.dumps(reader) + "\n")
+                process.stdin.flush()
+                watchdog.start()
+                stdout = ""
+                while "LLMCTL_EXECUTOR_RESULT_JSON=" not in stdout:
+                    line = process.stdout.readline()
+                    if not line:
+                        break
+                    stdout += line
+                watchdog.cancel()
+                with stdin_lock:
+                    reader_finished_first = not process.stdin.closed
+                _send_after()
+                stdout += process.stdout.read()
+                process.wait(timeout=30)
+            finally:
+                watchdog.cancel()
+                if process.poll() is None:
+                    process.kill()
+                process.stdout.close()
+
+        self.assertTrue(reader_finished_first)
+        results = self._result_lines(stdout)
+        self.assertEqual(
+            ["reader", "after"],
+            [result["provider_metadata"]["request_id"] for result in results],
+        )
+        self.assertEqual({"stdin": ""}, results[0]["output_state"])
+        self.assertEqual("success", results[1]["status"])
+
+    def test_serve_cancels_running_payload_and_keeps_serving(self) -> None:
+        process = subprocess.Popen(
+            [sys.executable, str(EXECUTOR_RUN), "serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=str(REPO_ROOT),
+        )
+        try:
+            assert process.stdin is not None and process.stdout is not None
+            for request_id, command in (("slow", "sleep 30"), ("after", "echo after")):
+                process.stdin.write(
+                    json.dumps(
+                        {
+                            "contract_version": "v1",
+                            "provider": "workspace",
+                            "request_id": request_id,
+                            "command": ["/bin/sh", "-c", command],
+                        }
+                    )
+                    + "\n"
+                )
+            process.stdin.flush()
+            while "LLMCTL_EXECUTOR_STARTED" not in process.stdout.readline():
+                pass
+            process.stdin.write(json.dumps({"op": "cancel", "request_id": "slow"}) + "\n")
+            process.stdin.close()
+            stdout = process.stdout.read()
+            process.wait(timeout=30)
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.stderr.close()
+
+        results = self._result_lines(stdout)
+        self.assertEqual(["cancelled", "success"], [result["status"] for result in results])
+        self.assertEqual("cancelled", results[0]["error"]["code"])
+        self.assertIn("after", results[1]["stdout"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -73,6 +73,13 @@ class RAGRetrievalResponse:
     citation_records: list[dict[str, Any]] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class RAGHealthRetrieval:
+    health: RAGHealth
+    retrieval: RAGRetrievalResponse | None = None
+    error: "RAGContractError | None" = None
+
+
 class RAGContractError(RuntimeError):
     def __init__(
         self,
@@ -1,23 +1,30 @@
 from __future__ import annotations
 
+import http.client
 import json
 import os
 import socket
 from dataclasses import dataclass, field
 from typing import Any, Protocol
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
 from chat.contracts import (
     RAGCollection,
     RAGContractError,
     RAGHealth,
+    RAGHealthRetrieval,
     RAGRetrievalRequest,
     RAGRetrievalResponse,
     RAG_HEALTH_CONFIGURED_HEALTHY,
     RAG_HEALTH_UNCONFIGURED,
     RAG_REASON_RETRIEVAL_FAILED,
 )
+from core.http_pool import (
+    DEFAULT_MAX_CONNECTIONS,
+    HTTPConnectionPool,
+    HTTPConnectionPoolRegistry,
+)
+
+DEFAULT_POOL_SIZE = DEFAULT_MAX_CONNECTIONS
 
 
 class RAGContractClient(Protocol):
@@ -55,11 +62,95 @@ class StubRAGContractClient:
             )
         return self.retrieval_response
 
+    def health_and_retrieve(self, payload: RAGRetrievalRequest) -> RAGHealthRetrieval:
+        health = self.health()
+        if health.state != RAG_HEALTH_CONFIGURED_HEALTHY:
+            return RAGHealthRetrieval(health=health)
+        try:
+            return RAGHealthRetrieval(health=health, retrieval=self.retrieve(payload))
+        except RAGContractError as exc:
+            return RAGHealthRetrieval(health=health, error=exc)
+
+
+class RAGConnectionPool(HTTPConnectionPool):
+    """Keep-alive HTTP connections to the RAG contract service."""
+
+    service_name = "RAG contract"
+
+
+_pools = HTTPConnectionPoolRegistry(RAGConnectionPool)
+
+
+def get_rag_connection_pool(
+    base_url: str,
+    *,
+    max_connections: int = DEFAULT_POOL_SIZE,
+) -> RAGConnectionPool:
+    return _pools.get(base_url.rstrip("/"), max_connections=max_connections)
+
+
+def close_rag_connection_pools() -> None:
+    _pools.close_all()
+
+
+def _parse_health(payload: dict[str, Any]) -> RAGHealth:
+    state = str(payload.get("state") or "").strip() or RAG_HEALTH_UNCONFIGURED
+    provider = str(payload.get("provider") or "chroma")
+    error = str(payload.get("error") or "").strip() or None
+    return RAGHealth(state=state, provider=provider, error=error)
+
+
+def _retrieval_payload(payload: RAGRetrievalRequest) -> dict[str, Any]:
+    return {
+        "question": payload.question,
+        "collections": payload.collections,
+        "top_k": payload.top_k,
+        "model_id": payload.model_id,
+        "request_id": payload.request_id,
+        "synthesize_answer": payload.synthesize_answer,
+    }
+
 
 @dataclass(slots=True)
 class HttpRAGContractClient:
     base_url: str
     timeout_seconds: float = 2.0
+    pool_size: int = DEFAULT_POOL_SIZE
+
+    def _send(
+        self,
+        *,
+        method: str,
+        path: str,
+        data: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[int, str]:
+        pool = get_rag_connection_pool(self.base_url, max_connections=self.pool_size)
+        for attempt in range(2):
+            connection, reused = pool.acquire(self.timeout_seconds)
+            reusable = False
+            received = False
+            try:
+                connection.request(method, pool.path(path), body=data, headers=headers)
+                response = connection.getresponse()
+                received = True
+                body = response.read().decode("utf-8", errors="replace")
+                reusable = not response.will_close
+                return int(response.status), body
+            except (TimeoutError, socket.timeout):
+                # The server may still be working on the request; re-sending
+                # it would double both the work and the caller's wait.
+                raise
+            except ConnectionError:
+                # A keep-alive connection the server already closed is reset
+                # before any response (RemoteDisconnected is a
+                # ConnectionResetError); retry that once on a fresh connection.
+                if reused and not received and attempt == 0:
+                    continue
+                raise
+            finally:
+                pool.release(connection, reusable=reusable)
+        raise http.client.HTTPException(f"RAG contract request to {path} failed.")
 
     def _request_json(
         self,
@@ -68,41 +159,32 @@ class HttpRAGContractClient:
         path: str,
         payload: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        url = f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
         data = None
-        headers = {"Accept": "application/json"}
+        headers = {"Accept": "application/json", "Connection": "keep-alive"}
         if payload is not None:
             data = json.dumps(payload).encode("utf-8")
             headers["Content-Type"] = "application/json"
-        req = Request(url, method=method, headers=headers, data=data)
+            headers["Content-Length"] = str(len(data))
         try:
-            with urlopen(req, timeout=self.timeout_seconds) as response:
-                body = response.read().decode("utf-8", errors="replace")
-        except HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="replace")
-            raise RAGContractError(
-                reason_code=RAG_REASON_RETRIEVAL_FAILED,
-                message=body or str(exc),
-                metadata={"status": exc.code, "path": path},
-            ) from exc
-        except URLError as exc:
-            raise RAGContractError(
-                reason_code=RAG_REASON_RETRIEVAL_FAILED,
-                message=str(exc),
-                metadata={"path": path},
-            ) from exc
+            status, body = self._send(method=method, path=path, data=data, headers=headers)
         except (TimeoutError, socket.timeout) as exc:
             raise RAGContractError(
                 reason_code=RAG_REASON_RETRIEVAL_FAILED,
                 message=f"RAG contract request timed out for {path}.",
                 metadata={"path": path, "timeout_seconds": self.timeout_seconds},
             ) from exc
-        except OSError as exc:
+        except (OSError, http.client.HTTPException, ValueError) as exc:
             raise RAGContractError(
                 reason_code=RAG_REASON_RETRIEVAL_FAILED,
                 message=str(exc),
                 metadata={"path": path},
             ) from exc
+        if status >= 400:
+            raise RAGContractError(
+                reason_code=RAG_REASON_RETRIEVAL_FAILED,
+                message=body or f"HTTP {status}",
+                metadata={"status": status, "path": path},
+            )
         try:
             decoded = json.loads(body) if body else {}
         except json.JSONDecodeError as exc:
@@ -119,11 +201,9 @@ class HttpRAGContractClient:
         return decoded
 
     def health(self) -> RAGHealth:
-        payload = self._request_json(method="GET", path="/api/rag/contract/health")
-        state = str(payload.get("state") or "").strip() or RAG_HEALTH_UNCONFIGURED
-        provider = str(payload.get("provider") or "chroma")
-        error = str(payload.get("error") or "").strip() or None
-        return RAGHealth(state=state, provider=provider, error=error)
+        return _parse_health(
+            self._request_json(method="GET", path="/api/rag/contract/health")
+        )
 
     def list_collections(self) -> list[RAGCollection]:
         payload = self._request_json(method="GET", path="/api/rag/contract/collections")
@@ -150,19 +230,51 @@ class HttpRAGContractClient:
         return collections
 
     def retrieve(self, payload: RAGRetrievalRequest) -> RAGRetrievalResponse:
+        return self._parse_retrieval(
+            self._request_json(
+                method="POST",
+                path="/api/rag/contract/retrieve",
+                payload=_retrieval_payload(payload),
+            )
+        )
+
+    def health_and_retrieve(self, payload: RAGRetrievalRequest) -> RAGHealthRetrieval:
+        """Check health and retrieve in one round trip.
+
+        Retrieval only runs server-side when RAG is healthy; a retrieval
+        failure is returned as ``error`` rather than raised so callers can
+        still act on the health result.
+        """
         response = self._request_json(
             method="POST",
-            path="/api/rag/contract/retrieve",
-            payload={
-                "question": payload.question,
-                "collections": payload.collections,
-                "top_k": payload.top_k,
-                "model_id": payload.model_id,
-                "request_id": payload.request_id,
-                "synthesize_answer": payload.synthesize_answer,
-            },
+            path="/api/rag/contract/health-retrieve",
+            payload=_retrieval_payload(payload),
+        )
+        health_payload = response.get("health")
+        health = _parse_health(health_payload if isinstance(health_payload, dict) else {})
+        error_payload = response.get("error")
+        if isinstance(error_payload, dict):
+            metadata = error_payload.get("metadata")
+            return RAGHealthRetrieval(
+                health=health,
+                error=RAGContractError(
+                    reason_code=str(
+                        error_payload.get("reason_code") or RAG_REASON_RETRIEVAL_FAILED
+                    ),
+                    message=str(error_payload.get("message") or "RAG retrieval failed."),
+                    metadata=metadata if isinstance(metadata, dict) else {},
+                ),
+            )
+        retrieval_payload = response.get("retrieval")
+        if not isinstance(retrieval_payload, dict):
+            return RAGHealthRetrieval(health=health)
+        return RAGHealthRetrieval(
+            health=health,
+            retrieval=self._parse_retrieval(retrieval_payload),
         )
 
+    @staticmethod
+    def _parse_retrieval(response: dict[str, Any]) -> RAGRetrievalResponse:
         def _format_context_item(item: dict[str, Any], text: str) -> str:
             source_bits: list[str] = []
             collection = str(item.get("collection") or "").strip()
@@ -272,7 +384,15 @@ def get_rag_contract_client() -> RAGContractClient:
                 timeout_seconds = parsed_timeout
         except ValueError:
             timeout_seconds = 10.0
+    pool_size = DEFAULT_POOL_SIZE
+    pool_size_raw = (os.getenv("CHAT_RAG_CONTRACT_POOL_SIZE") or "").strip()
+    if pool_size_raw:
+        try:
+            pool_size = max(1, int(pool_size_raw))
+        except ValueError:
+            pool_size = DEFAULT_POOL_SIZE
     return HttpRAGContractClient(
         base_url=base_url,
         timeout_seconds=timeout_seconds,
+        pool_size=pool_size,
     )
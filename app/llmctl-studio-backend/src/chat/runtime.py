@@ -4,6 +4,7 @@ import json
 import math
 import re
 import subprocess
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -34,6 +35,7 @@ from chat.contracts import (
     RAG_REASON_RETRIEVAL_FAILED,
     RAG_REASON_UNAVAILABLE,
     RAGHealth,
+    RAGHealthRetrieval,
     RAG_HEALTH_CONFIGURED_HEALTHY,
     RAG_HEALTH_UNCONFIGURED,
     RAGContractError,
@@ -1179,9 +1181,37 @@ def execute_turn(
         # Do not hold chat write locks while running health/retrieval/LLM calls.
         session.commit()
 
+        retrieval_collections: list[str] = []
+        if selected_rag_collections:
+            retrieval_collections = (
+                _extract_collection_hints(cleaned_message, selected_rag_collections)
+                or selected_rag_collections
+            )
+        retrieval_request = RAGRetrievalRequest(
+            question=cleaned_message,
+            collections=retrieval_collections,
+            top_k=settings.rag_top_k,
+            model_id=str(model.id),
+            request_id=request_id,
+            synthesize_answer=False,
+        )
+        # Clients that support it answer health and retrieval in one round
+        # trip; the retrieval half is replayed below as if fetched separately.
+        health_and_retrieve = (
+            getattr(client, "health_and_retrieve", None)
+            if selected_rag_collections
+            else None
+        )
+        prefetched: RAGHealthRetrieval | None = None
+        rag_timings_ms: dict[str, float] = {}
         rag_health_error: RAGContractError | None = None
+        rag_request_started = time.perf_counter()
         try:
-            rag_health = client.health()
+            if callable(health_and_retrieve):
+                prefetched = health_and_retrieve(retrieval_request)
+                rag_health = prefetched.health
+            else:
+                rag_health = client.health()
         except RAGContractError as exc:
             rag_health_error = exc
             rag_health = RAGHealth(
@@ -1200,6 +1230,9 @@ def execute_turn(
                 provider="unknown",
                 error=str(exc),
             )
+        rag_timings_ms["health_retrieve" if prefetched is not None else "health"] = round(
+            (time.perf_counter() - rag_request_started) * 1000, 2
+        )
 
         turn.rag_health_state = rag_health.state
         if selected_rag_collections and rag_health_error is not None:
@@ -1226,6 +1259,7 @@ def execute_turn(
                     "selected_collections": selected_rag_collections,
                     "provider": rag_health.provider,
                     "metadata": rag_health_error.metadata,
+                    "rag_timings_ms": rag_timings_ms,
                 },
             )
             thread.last_activity_at = _now()
@@ -1264,6 +1298,7 @@ def execute_turn(
                     "rag_health_state": rag_health.state,
                     "selected_collections": selected_rag_collections,
                     "provider": rag_health.provider,
+                    "rag_timings_ms": rag_timings_ms,
                 },
             )
             thread.last_activity_at = _now()
@@ -1287,21 +1322,23 @@ def execute_turn(
             "matched_ranks": [],
         }
         if selected_rag_collections:
-            retrieval_collections = (
-                _extract_collection_hints(cleaned_message, selected_rag_collections)
-                or selected_rag_collections
-            )
             try:
-                retrieval = client.retrieve(
-                    RAGRetrievalRequest(
-                        question=cleaned_message,
-                        collections=retrieval_collections,
-                        top_k=settings.rag_top_k,
-                        model_id=str(model.id),
-                        request_id=request_id,
-                        synthesize_answer=False,
+                if prefetched is not None:
+                    if prefetched.error is not None:
+                        raise prefetched.error
+                    if prefetched.retrieval is None:
+                        raise RAGContractError(
+                            reason_code=RAG_REASON_RETRIEVAL_FAILED,
+                            message="RAG retrieval returned no result.",
+                            metadata={"rag_health_state": rag_health.state},
+                        )
+                    retrieval = prefetched.retrieval
+                else:
+                    retrieval_started = time.perf_counter()
+                    retrieval = client.retrieve(retrieval_request)
+                    rag_timings_ms["retrieve"] = round(
+                        (time.perf_counter() - retrieval_started) * 1000, 2
                     )
-                )
             except RAGContractError as exc:
                 turn.reason_code = exc.reason_code or RAG_REASON_RETRIEVAL_FAILED
                 turn.error_message = str(exc)
@@ -1397,6 +1434,7 @@ def execute_turn(
                     "selected_collections": selected_rag_collections,
                     "retrieval_stats": retrieval_stats,
                     "citation_count": len(citation_records),
+                    "rag_timings_ms": rag_timings_ms,
                 },
             )
             if rag_context_missing and not selected_mcp_keys:
@@ -187,6 +187,13 @@ class Config:
         "LLMCTL_STUDIO_SOCKETIO_ENGINEIO_LOGGER",
         False,
     )
+    # Superseded status events for the same entity are coalesced per room
+    # within this window; 0 emits every event immediately.
+    REALTIME_COALESCE_WINDOW_MS = _env_int(
+        "LLMCTL_STUDIO_REALTIME_COALESCE_WINDOW_MS",
+        250,
+        minimum=0,
+    )
 
     AGENT_POLL_SECONDS = float(os.getenv("AGENT_POLL_SECONDS", "1"))
     CELERY_REVOKE_ON_STOP = os.getenv("CELERY_REVOKE_ON_STOP", "false").lower() == "true"
@@ -196,6 +203,40 @@ class Config:
     WORKSPACE_CLEANUP_INTERVAL_SECONDS = float(
         os.getenv("WORKSPACE_CLEANUP_INTERVAL_SECONDS", "300")
     )
+    NODE_ARTIFACT_RETENTION_SWEEP_ENABLED = _env_bool(
+        "NODE_ARTIFACT_RETENTION_SWEEP_ENABLED",
+        True,
+    )
+    NODE_ARTIFACT_RETENTION_SWEEP_INTERVAL_SECONDS = _env_float(
+        "NODE_ARTIFACT_RETENTION_SWEEP_INTERVAL_SECONDS",
+        60.0,
+    )
+    NODE_ARTIFACT_RETENTION_SWEEP_BATCH_SIZE = _env_int(
+        "NODE_ARTIFACT_RETENTION_SWEEP_BATCH_SIZE",
+        1000,
+        minimum=1,
+    )
+    NODE_ARTIFACT_RETENTION_SWEEP_MAX_BATCHES = _env_int(
+        "NODE_ARTIFACT_RETENTION_SWEEP_MAX_BATCHES",
+        50,
+        minimum=1,
+    )
+    RAG_RETRIEVAL_AUDIT_ASYNC = _env_bool("RAG_RETRIEVAL_AUDIT_ASYNC", True)
+    RAG_RETRIEVAL_AUDIT_BATCH_SIZE = _env_int(
+        "RAG_RETRIEVAL_AUDIT_BATCH_SIZE",
+        200,
+        minimum=1,
+    )
+    RAG_RETRIEVAL_AUDIT_FLUSH_INTERVAL_SECONDS = _env_float(
+        "RAG_RETRIEVAL_AUDIT_FLUSH_INTERVAL_SECONDS",
+        1.0,
+        minimum=0.05,
+    )
+    RAG_RETRIEVAL_AUDIT_MAX_QUEUE_ROWS = _env_int(
+        "RAG_RETRIEVAL_AUDIT_MAX_QUEUE_ROWS",
+        5000,
+        minimum=1,
+    )
 
     LLM_PROVIDER = os.getenv("LLM_PROVIDER", "")
     CODEX_CMD = os.getenv("CODEX_CMD", "codex")
@@ -220,9 +261,33 @@ class Config:
     CLAUDE_AUTH_REQUIRE_API_KEY = (
         os.getenv("CLAUDE_AUTH_REQUIRE_API_KEY", "true").lower() == "true"
     )
+    # Provider SDK clients are shared per process; 0 connections keeps the
+    # SDK's own HTTP pool limits.
+    LLM_SDK_CLIENT_MAX_ENTRIES = _env_int("LLM_SDK_CLIENT_MAX_ENTRIES", 32, minimum=1)
+    LLM_SDK_MAX_CONNECTIONS = _env_int("LLM_SDK_MAX_CONNECTIONS", 0, minimum=0)
+    LLM_SDK_MAX_KEEPALIVE_CONNECTIONS = _env_int(
+        "LLM_SDK_MAX_KEEPALIVE_CONNECTIONS",
+        20,
+        minimum=1,
+    )
+    LLM_SDK_TIMEOUT_SECONDS = _env_float("LLM_SDK_TIMEOUT_SECONDS", 600.0, minimum=1.0)
+    # Integration settings are cached per process; the version row is
+    # re-checked at most every check interval and entries expire after the
+    # TTL regardless. A TTL of 0 disables the cache.
+    INTEGRATION_SETTINGS_CACHE_TTL_SECONDS = _env_float(
+        "INTEGRATION_SETTINGS_CACHE_TTL_SECONDS",
+        300.0,
+        minimum=0.0,
+    )
+    INTEGRATION_SETTINGS_CACHE_VERSION_CHECK_SECONDS = _env_float(
+        "INTEGRATION_SETTINGS_CACHE_VERSION_CHECK_SECONDS",
+        1.0,
+        minimum=0.0,
+    )
     VLLM_LOCAL_CMD = os.getenv("VLLM_LOCAL_CMD", "vllm")
     VLLM_REMOTE_BASE_URL = os.getenv("VLLM_REMOTE_BASE_URL", "")
     VLLM_REMOTE_API_KEY = os.getenv("VLLM_REMOTE_API_KEY", "")
+    VLLM_REMOTE_MAX_CONNECTIONS = _env_int("VLLM_REMOTE_MAX_CONNECTIONS", 8, minimum=1)
     _VLLM_LOCAL_CUSTOM_MODELS_DIR_ENV = os.getenv(
         "LLMCTL_STUDIO_VLLM_LOCAL_CUSTOM_MODELS_DIR"
     )
@@ -317,3 +382,25 @@ class Config:
         "LLMCTL_NODE_EXECUTOR_K8S_IMAGE_PULL_SECRETS_JSON",
         "",
     )
+    NODE_EXECUTOR_K8S_WARM_POOL_ENABLED = (
+        os.getenv("LLMCTL_NODE_EXECUTOR_K8S_WARM_POOL_ENABLED", "false")
+        .strip()
+        .lower()
+        in {"1", "true", "yes", "on"}
+    )
+    NODE_EXECUTOR_K8S_WARM_POOL_SIZE = os.getenv(
+        "LLMCTL_NODE_EXECUTOR_K8S_WARM_POOL_SIZE",
+        "1",
+    )
+    NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS = os.getenv(
+        "LLMCTL_NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS",
+        "600",
+    )
+    NODE_EXECUTOR_K8S_WARM_POOL_FRONTIER_MAX = os.getenv(
+        "LLMCTL_NODE_EXECUTOR_K8S_WARM_POOL_FRONTIER_MAX",
+        "4",
+    )
+    NODE_EXECUTOR_K8S_WARM_POOL_VLLM_MAX = os.getenv(
+        "LLMCTL_NODE_EXECUTOR_K8S_WARM_POOL_VLLM_MAX",
+        "0",
+    )
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from datetime import datetime, timezone
+import hashlib
 import json
 from pathlib import Path
+import threading
 import time
 import tomllib
 
@@ -14,6 +16,10 @@ from storage.script_storage import write_script_file
 
 _engine = None
 SessionLocal = None
+# Engine whose schema has been verified against the migration ledger in this
+# process; init_db() is a no-op for it afterwards.
+_schema_ready_engine = None
+_schema_init_lock = threading.Lock()
 NODE_EXECUTOR_PROVIDER_ALLOWED_VALUES = ("kubernetes",)
 NODE_EXECUTOR_DISPATCH_STATUS_ALLOWED_VALUES = (
     "dispatch_pending",
@@ -106,6 +112,10 @@ NODE_EXECUTOR_AGENT_TASK_CHECKS: tuple[tuple[str, str], ...] = (
     ),
 )
 SCHEMA_MIGRATION_ADVISORY_LOCK_KEY = 958_203_417
+# Bump when _ensure_schema gains a migration that the ORM metadata checksum
+# cannot see (data backfills, constraint rewrites, views).
+SCHEMA_MIGRATION_VERSION = 1
+SCHEMA_MIGRATION_LEDGER_TABLE = "schema_migrations"
 MEMORY_NODE_MODE_LLM_GUIDED = "llm_guided"
 MEMORY_NODE_MODE_DETERMINISTIC = "deterministic"
 MEMORY_NODE_RETRY_COUNT_DEFAULT = 1
@@ -177,11 +187,102 @@ def _ensure_model_metadata_loaded() -> None:
 
 
 def init_db() -> None:
+    """Bring the schema up to date once per process and engine.
+
+    The first call checks the ``schema_migrations`` ledger for the current
+    version and metadata checksum and only runs ``create_all`` plus the
+    ``_ensure_schema`` chain when they are missing. Later calls return
+    immediately.
+    """
+    global _schema_ready_engine
     if _engine is None:
         raise RuntimeError("Database engine is not initialized")
+    engine = _engine
+    if _schema_ready_engine is engine:
+        return
+    with _schema_init_lock:
+        if _schema_ready_engine is engine:
+            return
+        _ensure_model_metadata_loaded()
+        checksum = schema_checksum()
+        with engine.connect() as connection:
+            current = _schema_ledger_has(connection, checksum)
+        if not current:
+            _migrate_schema(engine, checksum)
+        _schema_ready_engine = engine
+
+
+def schema_checksum() -> str:
     _ensure_model_metadata_loaded()
-    Base.metadata.create_all(bind=_engine)
-    _ensure_schema()
+    digest = hashlib.sha256(f"version:{SCHEMA_MIGRATION_VERSION}\n".encode("utf-8"))
+    for table in Base.metadata.sorted_tables:
+        digest.update(f"table:{table.name}\n".encode("utf-8"))
+        for column in table.columns:
+            digest.update(
+                f"column:{column.name}:{column.type!r}:{column.nullable}\n".encode(
+                    "utf-8"
+                )
+            )
+        for index in sorted(table.indexes, key=lambda item: str(item.name)):
+            digest.update(f"index:{index.name}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _migrate_schema(engine, checksum: str) -> None:
+    with engine.begin() as connection:
+        _acquire_schema_migration_lock(connection)
+        # Another process may have finished the migration while this one
+        # waited for the lock.
+        if _schema_ledger_has(connection, checksum):
+            return
+        Base.metadata.create_all(bind=connection)
+        _ensure_schema(connection)
+        _record_schema_migration(connection, checksum)
+
+
+def _schema_ledger_exists(connection) -> bool:
+    if connection.dialect.name == "postgresql":
+        return (
+            connection.execute(
+                text("SELECT to_regclass(:table_name)"),
+                {"table_name": SCHEMA_MIGRATION_LEDGER_TABLE},
+            ).scalar()
+            is not None
+        )
+    return SCHEMA_MIGRATION_LEDGER_TABLE in _table_names(connection)
+
+
+def _schema_ledger_has(connection, checksum: str) -> bool:
+    if not _schema_ledger_exists(connection):
+        return False
+    return (
+        connection.execute(
+            text(
+                f"SELECT 1 FROM {SCHEMA_MIGRATION_LEDGER_TABLE} "
+                "WHERE version = :version AND checksum = :checksum LIMIT 1"
+            ),
+            {"version": SCHEMA_MIGRATION_VERSION, "checksum": checksum},
+        ).first()
+        is not None
+    )
+
+
+def _record_schema_migration(connection, checksum: str) -> None:
+    _execute_ddl(
+        connection,
+        f"CREATE TABLE IF NOT EXISTS {SCHEMA_MIGRATION_LEDGER_TABLE} ("
+        "version INTEGER NOT NULL, "
+        "checksum VARCHAR(64) NOT NULL, "
+        "applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+        "PRIMARY KEY (version, checksum))",
+    )
+    connection.execute(
+        text(
+            f"INSERT INTO {SCHEMA_MIGRATION_LEDGER_TABLE} (version, checksum) "
+            "VALUES (:version, :checksum)"
+        ),
+        {"version": SCHEMA_MIGRATION_VERSION, "checksum": checksum},
+    )
 
 
 def create_session() -> Session:
@@ -190,217 +291,213 @@ def create_session() -> Session:
     return SessionLocal()
 
 
-def _ensure_schema() -> None:
-    if _engine is None:
-        return
-    with _engine.begin() as connection:
-        _acquire_schema_migration_lock(connection)
-        _migrate_roles_schema(connection)
-        role_columns = {
-            "description": "TEXT",
-            "details_json": "TEXT",
-            "is_system": "BOOLEAN NOT NULL DEFAULT FALSE",
-        }
-        _ensure_columns(connection, "roles", role_columns)
-        _migrate_role_payloads(connection)
-        _drop_role_prompt_columns(connection)
-        agent_columns = {
-            "description": "TEXT",
-            "autonomous_prompt": "TEXT",
-            "role_id": "INTEGER",
-            "is_system": "BOOLEAN NOT NULL DEFAULT FALSE",
-            "last_run_task_id": "TEXT",
-            "run_max_loops": "INTEGER",
-            "run_end_requested": "BOOLEAN NOT NULL DEFAULT FALSE",
-        }
-        _ensure_columns(connection, "agents", agent_columns)
-        _migrate_agent_descriptions(connection)
-        _migrate_agent_status_column(connection)
-        _drop_agent_is_active_column(connection)
-        _ensure_agent_priority_schema(connection)
-        _drop_run_is_active_column(connection)
-        run_columns = {
-            "name": "TEXT",
-        }
-        _ensure_columns(connection, "runs", run_columns)
-
-        script_columns = {
-            "file_path": "TEXT",
-        }
-        _ensure_columns(connection, "scripts", script_columns)
-        _ensure_columns(connection, "agent_task_scripts", {"position": "INTEGER"})
-        _migrate_script_storage(connection)
-        _migrate_script_positions(connection)
+def _ensure_schema(connection) -> None:
+    _migrate_roles_schema(connection)
+    role_columns = {
+        "description": "TEXT",
+        "details_json": "TEXT",
+        "is_system": "BOOLEAN NOT NULL DEFAULT FALSE",
+    }
+    _ensure_columns(connection, "roles", role_columns)
+    _migrate_role_payloads(connection)
+    _drop_role_prompt_columns(connection)
+    agent_columns = {
+        "description": "TEXT",
+        "autonomous_prompt": "TEXT",
+        "role_id": "INTEGER",
+        "is_system": "BOOLEAN NOT NULL DEFAULT FALSE",
+        "last_run_task_id": "TEXT",
+        "run_max_loops": "INTEGER",
+        "run_end_requested": "BOOLEAN NOT NULL DEFAULT FALSE",
+    }
+    _ensure_columns(connection, "agents", agent_columns)
+    _migrate_agent_descriptions(connection)
+    _migrate_agent_status_column(connection)
+    _drop_agent_is_active_column(connection)
+    _ensure_agent_priority_schema(connection)
+    _drop_run_is_active_column(connection)
+    run_columns = {
+        "name": "TEXT",
+    }
+    _ensure_columns(connection, "runs", run_columns)
 
-        mcp_server_columns = {
-            "server_type": "TEXT NOT NULL DEFAULT 'custom'",
-        }
-        _ensure_columns(connection, "mcp_servers", mcp_server_columns)
-        _migrate_mcp_server_configs_to_jsonb(connection)
-
-        flowchart_columns = {
-            "description": "VARCHAR(512)",
-            "max_node_executions": "INTEGER",
-            "max_runtime_minutes": "INTEGER",
-            "max_parallel_nodes": "INTEGER NOT NULL DEFAULT 1",
-        }
-        _ensure_columns(connection, "flowcharts", flowchart_columns)
-
-        flowchart_node_columns = {
-            "node_type": "TEXT NOT NULL DEFAULT 'task'",
-            "ref_id": "INTEGER",
-            "title": "VARCHAR(255)",
-            "x": "FLOAT NOT NULL DEFAULT 0",
-            "y": "FLOAT NOT NULL DEFAULT 0",
-            "config_json": "TEXT",
-            "model_id": "INTEGER",
-        }
-        _ensure_columns(connection, "flowchart_nodes", flowchart_node_columns)
-        _migrate_memory_node_mode_defaults(connection)
-        _migrate_plan_node_store_mode_defaults(connection)
-
-        flowchart_edge_columns = {
-            "source_handle_id": "VARCHAR(32)",
-            "target_handle_id": "VARCHAR(32)",
-            "edge_mode": "VARCHAR(16) NOT NULL DEFAULT 'solid'",
-            "condition_key": "VARCHAR(128)",
-            "label": "VARCHAR(255)",
-            "control_points_json": "TEXT",
-        }
-        _ensure_columns(connection, "flowchart_edges", flowchart_edge_columns)
-        _migrate_flowchart_edge_modes(connection)
-
-        flowchart_run_columns = {
-            "celery_task_id": "VARCHAR(255)",
-            "status": "VARCHAR(32) NOT NULL DEFAULT 'queued'",
-            "started_at": "DATETIME",
-            "finished_at": "DATETIME",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-        }
-        _ensure_columns(connection, "flowchart_runs", flowchart_run_columns)
-
-        flowchart_run_node_columns = {
-            "execution_index": "INTEGER NOT NULL DEFAULT 1",
-            "agent_task_id": "INTEGER",
-            "status": "VARCHAR(32) NOT NULL DEFAULT 'queued'",
-            "input_context_json": "TEXT",
-            "output_state_json": "TEXT",
-            "routing_state_json": "TEXT",
-            "output_contract_version": "VARCHAR(16) NOT NULL DEFAULT 'v1'",
-            "routing_contract_version": "VARCHAR(16) NOT NULL DEFAULT 'v1'",
-            "degraded_status": "BOOLEAN NOT NULL DEFAULT FALSE",
-            "degraded_reason": "TEXT",
-            "idempotency_key": "VARCHAR(255)",
-            "resolved_skill_ids_json": "TEXT",
-            "resolved_skill_versions_json": "TEXT",
-            "resolved_skill_manifest_hash": "VARCHAR(128)",
-            "skill_adapter_mode": "VARCHAR(32)",
-            "resolved_role_id": "INTEGER",
-            "resolved_role_version": "VARCHAR(128)",
-            "resolved_agent_id": "INTEGER",
-            "resolved_agent_version": "VARCHAR(128)",
-            "resolved_instruction_manifest_hash": "VARCHAR(128)",
-            "instruction_adapter_mode": "VARCHAR(32)",
-            "instruction_materialized_paths_json": "TEXT",
-            "error": "TEXT",
-            "started_at": "DATETIME",
-            "finished_at": "DATETIME",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-        }
-        _ensure_columns(connection, "flowchart_run_nodes", flowchart_run_node_columns)
-        node_artifact_columns = {
-            "flowchart_id": "INTEGER NOT NULL",
-            "flowchart_node_id": "INTEGER NOT NULL",
-            "flowchart_run_id": "INTEGER NOT NULL",
-            "flowchart_run_node_id": "INTEGER",
-            "node_type": "VARCHAR(32) NOT NULL",
-            "artifact_type": "VARCHAR(64) NOT NULL",
-            "ref_id": "INTEGER",
-            "execution_index": "INTEGER",
-            "variant_key": "VARCHAR(128)",
-            "retention_mode": "VARCHAR(32) NOT NULL DEFAULT 'ttl'",
-            "expires_at": "DATETIME",
-            "request_id": "VARCHAR(128)",
-            "correlation_id": "VARCHAR(128)",
-            "payload_json": "TEXT NOT NULL DEFAULT '{}'",
-            "contract_version": "VARCHAR(16) NOT NULL DEFAULT 'v1'",
-            "payload_version": "INTEGER NOT NULL DEFAULT 1",
-            "idempotency_key": "VARCHAR(255)",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-        }
-        _ensure_columns(connection, "node_artifacts", node_artifact_columns)
-
-        _ensure_columns(connection, "flowchart_node_scripts", {"position": "INTEGER"})
-        _ensure_columns(connection, "flowchart_node_skills", {"position": "INTEGER"})
-        _ensure_flowchart_node_attachment_schema(connection)
-        _ensure_agent_skill_binding_schema(connection)
-        _ensure_runtime_idempotency_schema(connection)
-
-        milestone_columns = {
-            "status": "TEXT NOT NULL DEFAULT 'planned'",
-            "priority": "TEXT NOT NULL DEFAULT 'medium'",
-            "owner": "TEXT",
-            "start_date": "DATETIME",
-            "progress_percent": "INTEGER NOT NULL DEFAULT 0",
-            "health": "TEXT NOT NULL DEFAULT 'green'",
-            "success_criteria": "TEXT",
-            "dependencies": "TEXT",
-            "links": "TEXT",
-            "latest_update": "TEXT",
-        }
-        _ensure_columns(connection, "milestones", milestone_columns)
-        _migrate_milestone_status(connection)
+    script_columns = {
+        "file_path": "TEXT",
+    }
+    _ensure_columns(connection, "scripts", script_columns)
+    _ensure_columns(connection, "agent_task_scripts", {"position": "INTEGER"})
+    _migrate_script_storage(connection)
+    _migrate_script_positions(connection)
 
-        existing_agent_task_columns = _table_columns(connection, "agent_tasks")
-        task_columns = {
-            "run_id": "INTEGER",
-            "model_id": "INTEGER",
-            "flowchart_id": "INTEGER",
-            "flowchart_run_id": "INTEGER",
-            "flowchart_node_id": "INTEGER",
-            "kind": "TEXT",
-            "integration_keys_json": "TEXT",
-            "current_stage": "TEXT",
-            "stage_logs": "TEXT",
-            "resolved_role_id": "INTEGER",
-            "resolved_role_version": "VARCHAR(128)",
-            "resolved_agent_id": "INTEGER",
-            "resolved_agent_version": "VARCHAR(128)",
-            "resolved_skill_ids_json": "TEXT",
-            "resolved_skill_versions_json": "TEXT",
-            "resolved_skill_manifest_hash": "VARCHAR(128)",
-            "skill_adapter_mode": "VARCHAR(32)",
-            "resolved_instruction_manifest_hash": "VARCHAR(128)",
-            "instruction_adapter_mode": "VARCHAR(32)",
-            "instruction_materialized_paths_json": "TEXT",
-            "selected_provider": "TEXT NOT NULL DEFAULT 'kubernetes'",
-            "final_provider": "TEXT NOT NULL DEFAULT 'kubernetes'",
-            "provider_dispatch_id": "TEXT",
-            "workspace_identity": "TEXT NOT NULL DEFAULT 'default'",
-            "dispatch_status": "TEXT NOT NULL DEFAULT 'dispatch_pending'",
-            "fallback_attempted": "BOOLEAN NOT NULL DEFAULT FALSE",
-            "fallback_reason": "TEXT",
-            "dispatch_uncertain": "BOOLEAN NOT NULL DEFAULT FALSE",
-            "api_failure_category": "TEXT",
-            "cli_fallback_used": "BOOLEAN NOT NULL DEFAULT FALSE",
-            "cli_preflight_passed": "BOOLEAN",
-        }
-        _ensure_columns(connection, "agent_tasks", task_columns)
-        _migrate_agent_task_node_executor_fields(connection, existing_agent_task_columns)
-        _ensure_agent_tasks_node_executor_checks_sqlite(connection)
-        _migrate_agent_task_agent_nullable(connection)
-        _migrate_agent_task_kind_values(connection)
-        _drop_pipeline_schema(connection)
-        _ensure_flowchart_indexes(connection)
-        _ensure_rag_schema(connection)
-        _ensure_rag_indexes(connection)
-        _ensure_chat_schema(connection)
-        _ensure_chat_indexes(connection)
-        _drop_agent_utility_ownership(connection)
-        _ensure_canonical_workflow_views(connection)
+    mcp_server_columns = {
+        "server_type": "TEXT NOT NULL DEFAULT 'custom'",
+    }
+    _ensure_columns(connection, "mcp_servers", mcp_server_columns)
+    _migrate_mcp_server_configs_to_jsonb(connection)
+
+    flowchart_columns = {
+        "description": "VARCHAR(512)",
+        "max_node_executions": "INTEGER",
+        "max_runtime_minutes": "INTEGER",
+        "max_parallel_nodes": "INTEGER NOT NULL DEFAULT 1",
+    }
+    _ensure_columns(connection, "flowcharts", flowchart_columns)
+
+    flowchart_node_columns = {
+        "node_type": "TEXT NOT NULL DEFAULT 'task'",
+        "ref_id": "INTEGER",
+        "title": "VARCHAR(255)",
+        "x": "FLOAT NOT NULL DEFAULT 0",
+        "y": "FLOAT NOT NULL DEFAULT 0",
+        "config_json": "TEXT",
+        "model_id": "INTEGER",
+    }
+    _ensure_columns(connection, "flowchart_nodes", flowchart_node_columns)
+    _migrate_memory_node_mode_defaults(connection)
+    _migrate_plan_node_store_mode_defaults(connection)
+
+    flowchart_edge_columns = {
+        "source_handle_id": "VARCHAR(32)",
+        "target_handle_id": "VARCHAR(32)",
+        "edge_mode": "VARCHAR(16) NOT NULL DEFAULT 'solid'",
+        "condition_key": "VARCHAR(128)",
+        "label": "VARCHAR(255)",
+        "control_points_json": "TEXT",
+    }
+    _ensure_columns(connection, "flowchart_edges", flowchart_edge_columns)
+    _migrate_flowchart_edge_modes(connection)
+
+    flowchart_run_columns = {
+        "celery_task_id": "VARCHAR(255)",
+        "status": "VARCHAR(32) NOT NULL DEFAULT 'queued'",
+        "started_at": "DATETIME",
+        "finished_at": "DATETIME",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+    }
+    _ensure_columns(connection, "flowchart_runs", flowchart_run_columns)
+
+    flowchart_run_node_columns = {
+        "execution_index": "INTEGER NOT NULL DEFAULT 1",
+        "agent_task_id": "INTEGER",
+        "status": "VARCHAR(32) NOT NULL DEFAULT 'queued'",
+        "input_context_json": "TEXT",
+        "output_state_json": "TEXT",
+        "routing_state_json": "TEXT",
+        "output_contract_version": "VARCHAR(16) NOT NULL DEFAULT 'v1'",
+        "routing_contract_version": "VARCHAR(16) NOT NULL DEFAULT 'v1'",
+        "degraded_status": "BOOLEAN NOT NULL DEFAULT FALSE",
+        "degraded_reason": "TEXT",
+        "idempotency_key": "VARCHAR(255)",
+        "resolved_skill_ids_json": "TEXT",
+        "resolved_skill_versions_json": "TEXT",
+        "resolved_skill_manifest_hash": "VARCHAR(128)",
+        "skill_adapter_mode": "VARCHAR(32)",
+        "resolved_role_id": "INTEGER",
+        "resolved_role_version": "VARCHAR(128)",
+        "resolved_agent_id": "INTEGER",
+        "resolved_agent_version": "VARCHAR(128)",
+        "resolved_instruction_manifest_hash": "VARCHAR(128)",
+        "instruction_adapter_mode": "VARCHAR(32)",
+        "instruction_materialized_paths_json": "TEXT",
+        "error": "TEXT",
+        "started_at": "DATETIME",
+        "finished_at": "DATETIME",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+    }
+    _ensure_columns(connection, "flowchart_run_nodes", flowchart_run_node_columns)
+    node_artifact_columns = {
+        "flowchart_id": "INTEGER NOT NULL",
+        "flowchart_node_id": "INTEGER NOT NULL",
+        "flowchart_run_id": "INTEGER NOT NULL",
+        "flowchart_run_node_id": "INTEGER",
+        "node_type": "VARCHAR(32) NOT NULL",
+        "artifact_type": "VARCHAR(64) NOT NULL",
+        "ref_id": "INTEGER",
+        "execution_index": "INTEGER",
+        "variant_key": "VARCHAR(128)",
+        "retention_mode": "VARCHAR(32) NOT NULL DEFAULT 'ttl'",
+        "expires_at": "DATETIME",
+        "request_id": "VARCHAR(128)",
+        "correlation_id": "VARCHAR(128)",
+        "payload_json": "TEXT NOT NULL DEFAULT '{}'",
+        "contract_version": "VARCHAR(16) NOT NULL DEFAULT 'v1'",
+        "payload_version": "INTEGER NOT NULL DEFAULT 1",
+        "idempotency_key": "VARCHAR(255)",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+    }
+    _ensure_columns(connection, "node_artifacts", node_artifact_columns)
+
+    _ensure_columns(connection, "flowchart_node_scripts", {"position": "INTEGER"})
+    _ensure_columns(connection, "flowchart_node_skills", {"position": "INTEGER"})
+    _ensure_flowchart_node_attachment_schema(connection)
+    _ensure_agent_skill_binding_schema(connection)
+    _ensure_runtime_idempotency_schema(connection)
+
+    milestone_columns = {
+        "status": "TEXT NOT NULL DEFAULT 'planned'",
+        "priority": "TEXT NOT NULL DEFAULT 'medium'",
+        "owner": "TEXT",
+        "start_date": "DATETIME",
+        "progress_percent": "INTEGER NOT NULL DEFAULT 0",
+        "health": "TEXT NOT NULL DEFAULT 'green'",
+        "success_criteria": "TEXT",
+        "dependencies": "TEXT",
+        "links": "TEXT",
+        "latest_update": "TEXT",
+    }
+    _ensure_columns(connection, "milestones", milestone_columns)
+    _migrate_milestone_status(connection)
+
+    existing_agent_task_columns = _table_columns(connection, "agent_tasks")
+    task_columns = {
+        "run_id": "INTEGER",
+        "model_id": "INTEGER",
+        "flowchart_id": "INTEGER",
+        "flowchart_run_id": "INTEGER",
+        "flowchart_node_id": "INTEGER",
+        "kind": "TEXT",
+        "integration_keys_json": "TEXT",
+        "current_stage": "TEXT",
+        "stage_logs": "TEXT",
+        "resolved_role_id": "INTEGER",
+        "resolved_role_version": "VARCHAR(128)",
+        "resolved_agent_id": "INTEGER",
+        "resolved_agent_version": "VARCHAR(128)",
+        "resolved_skill_ids_json": "TEXT",
+        "resolved_skill_versions_json": "TEXT",
+        "resolved_skill_manifest_hash": "VARCHAR(128)",
+        "skill_adapter_mode": "VARCHAR(32)",
+        "resolved_instruction_manifest_hash": "VARCHAR(128)",
+        "instruction_adapter_mode": "VARCHAR(32)",
+        "instruction_materialized_paths_json": "TEXT",
+        "selected_provider": "TEXT NOT NULL DEFAULT 'kubernetes'",
+        "final_provider": "TEXT NOT NULL DEFAULT 'kubernetes'",
+        "provider_dispatch_id": "TEXT",
+        "workspace_identity": "TEXT NOT NULL DEFAULT 'default'",
+        "dispatch_status": "TEXT NOT NULL DEFAULT 'dispatch_pending'",
+        "fallback_attempted": "BOOLEAN NOT NULL DEFAULT FALSE",
+        "fallback_reason": "TEXT",
+        "dispatch_uncertain": "BOOLEAN NOT NULL DEFAULT FALSE",
+        "api_failure_category": "TEXT",
+        "cli_fallback_used": "BOOLEAN NOT NULL DEFAULT FALSE",
+        "cli_preflight_passed": "BOOLEAN",
+    }
+    _ensure_columns(connection, "agent_tasks", task_columns)
+    _migrate_agent_task_node_executor_fields(connection, existing_agent_task_columns)
+    _ensure_agent_tasks_node_executor_checks_sqlite(connection)
+    _migrate_agent_task_agent_nullable(connection)
+    _migrate_agent_task_kind_values(connection)
+    _drop_pipeline_schema(connection)
+    _ensure_flowchart_indexes(connection)
+    _ensure_rag_schema(connection)
+    _ensure_rag_indexes(connection)
+    _ensure_chat_schema(connection)
+    _ensure_chat_indexes(connection)
+    _drop_agent_utility_ownership(connection)
+    _ensure_canonical_workflow_views(connection)
 
 
 def _ensure_columns(connection, table: str, columns: dict[str, str]) -> None:
@@ -2265,6 +2362,8 @@ def _ensure_rag_schema(connection) -> None:
         "drive_folder_id": "VARCHAR(255)",
         "collection": "VARCHAR(128) NOT NULL DEFAULT ''",
         "last_indexed_at": "DATETIME",
+        "last_indexed_commit": "VARCHAR(64)",
+        "drive_change_token": "VARCHAR(255)",
         "last_error": "TEXT",
         "indexed_file_count": "INTEGER",
         "indexed_chunk_count": "INTEGER",
@@ -2286,6 +2385,9 @@ def _ensure_rag_schema(connection) -> None:
         "indexed": "INTEGER NOT NULL DEFAULT 0",
         "doc_type": "VARCHAR(32)",
         "chunk_count": "INTEGER NOT NULL DEFAULT 0",
+        "size_bytes": "BIGINT",
+        "mtime_ns": "BIGINT",
+        "inode": "BIGINT",
         "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
         "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
     }
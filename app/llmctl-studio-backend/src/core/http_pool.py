@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import http.client
+import threading
+from typing import Callable, Generic, TypeVar
+from urllib.parse import urlsplit
+
+DEFAULT_MAX_CONNECTIONS = 8
+
+ConnectionFactory = Callable[..., http.client.HTTPConnection]
+
+
+class HTTPConnectionPool:
+    """Keep-alive ``http.client`` connections to one base URL.
+
+    At most ``max_connections`` requests are in flight at once; callers beyond
+    that wait for a connection to be returned. Idle connections are reused
+    most-recent first so the server's keep-alive timeout retires the rest.
+    Subclasses set ``service_name`` and ``timeout_error`` for their messages.
+    """
+
+    service_name = "HTTP"
+    timeout_error: type[Exception] = TimeoutError
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        connection_factory: ConnectionFactory | None = None,
+    ) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"Unsupported {self.service_name} base URL: {base_url!r}")
+        self.base_url = base_url
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.max_connections = max(1, int(max_connections))
+        self._connection_factory = connection_factory
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self.closed = False
+
+    def path(self, suffix: str) -> str:
+        return f"{self.base_path}/{suffix.lstrip('/')}"
+
+    def acquire(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """Return a connection and whether it was reused from the idle set."""
+        if not self._slots.acquire(timeout=max(0.0, timeout)):
+            raise self.timeout_error(
+                f"Timed out waiting for a {self.service_name} connection to "
+                f"{self.base_url} ({self.max_connections} in use)."
+            )
+        with self._lock:
+            if self._idle:
+                connection = self._idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        try:
+            return self._new_connection(timeout), False
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection: http.client.HTTPConnection, *, reusable: bool) -> None:
+        try:
+            if reusable and not self.closed:
+                with self._lock:
+                    self._idle.append(connection)
+                return
+            connection.close()
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        self.closed = True
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for connection in idle:
+            connection.close()
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        if self._connection_factory is not None:
+            return self._connection_factory(self.host, self.port, timeout=timeout)
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+
+PoolT = TypeVar("PoolT", bound=HTTPConnectionPool)
+
+
+class HTTPConnectionPoolRegistry(Generic[PoolT]):
+    """Process-wide pools of one ``HTTPConnectionPool`` type, keyed by base URL
+    and connection limit."""
+
+    def __init__(self, pool_type: type[PoolT]) -> None:
+        self._pool_type = pool_type
+        self._pools: dict[tuple[str, int], PoolT] = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_url: str, *, max_connections: int) -> PoolT:
+        key = (base_url, max(1, int(max_connections)))
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None or pool.closed:
+                pool = self._pool_type(base_url, max_connections=key[1])
+                self._pools[key] = pool
+            return pool
+
+    def close_all(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
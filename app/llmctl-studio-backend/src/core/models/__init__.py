@@ -13,15 +13,37 @@ from .associations import (
     flowchart_node_skills,
 )
 from .skills import Skill, SkillFile, SkillVersion
-from .resources import Attachment, IntegrationSetting, MCPServer, Memory, Script
-from .rag import RAGRetrievalAudit, RAGSetting, RAGSource, RAGSourceFileState
-from .agent import Agent, AgentPriority, AgentTask, LLMModel, Role, Run
+from .resources import (
+    Attachment,
+    IntegrationSetting,
+    IntegrationSettingVersion,
+    MCPServer,
+    Memory,
+    Script,
+)
+from .rag import (
+    RAGDriveFileState,
+    RAGRetrievalAudit,
+    RAGSetting,
+    RAGSource,
+    RAGSourceFileState,
+)
+from .agent import (
+    Agent,
+    AgentPriority,
+    AgentTask,
+    AgentTaskLogSegment,
+    LLMModel,
+    Role,
+    Run,
+)
 from .flowchart import (
     Flowchart,
     FlowchartEdge,
     FlowchartNode,
     FlowchartRun,
     FlowchartRunNode,
+    FlowchartRunTraceEntry,
     NodeArtifact,
     RuntimeIdempotencyKey,
 )
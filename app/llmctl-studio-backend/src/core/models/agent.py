@@ -2,7 +2,17 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.db import BaseModel, utcnow
@@ -314,3 +324,31 @@ class AgentTask(BaseModel):
         secondary=agent_task_attachments,
         back_populates="tasks",
     )
+
+
+class AgentTaskLogSegment(BaseModel):
+    __tablename__ = "agent_task_log_segments"
+    __table_args__ = (
+        UniqueConstraint(
+            "agent_task_id",
+            "stream",
+            "seq",
+            name="uq_agent_task_log_segments_task_stream_seq",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    agent_task_id: Mapped[int] = mapped_column(
+        ForeignKey("agent_tasks.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    stream: Mapped[str] = mapped_column(String(16), nullable=False)
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    start_offset: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    end_offset: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    stage: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
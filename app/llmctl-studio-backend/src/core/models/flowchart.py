@@ -7,6 +7,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -392,6 +393,105 @@ class NodeArtifact(BaseModel):
     )
 
 
+class FlowchartRunTraceEntry(BaseModel):
+    """Trace projection of one node run, kept current as the node changes state.
+
+    Holds the filterable fields of the run trace endpoint so node, tool and
+    failure surfaces page through an index instead of parsing node state JSON.
+    ``source_updated_at`` mirrors the node run's ``updated_at`` at projection
+    time; a mismatch marks the row stale.
+    """
+
+    __tablename__ = "flowchart_run_trace_entries"
+    __table_args__ = (
+        Index(
+            "ix_flowchart_run_trace_entries_run_sequence",
+            "flowchart_run_id",
+            "sequence",
+            "node_created_at",
+            "flowchart_run_node_id",
+        ),
+        Index(
+            "ix_flowchart_run_trace_entries_run_status",
+            "flowchart_run_id",
+            "status",
+            "sequence",
+        ),
+        Index(
+            "ix_flowchart_run_trace_entries_run_node",
+            "flowchart_run_id",
+            "flowchart_node_id",
+            "sequence",
+        ),
+        Index(
+            "ix_flowchart_run_trace_entries_run_request",
+            "flowchart_run_id",
+            "request_id",
+            "sequence",
+        ),
+        Index(
+            "ix_flowchart_run_trace_entries_run_timeline",
+            "flowchart_run_id",
+            "timeline_at",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    flowchart_run_id: Mapped[int] = mapped_column(
+        ForeignKey("flowchart_runs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    flowchart_run_node_id: Mapped[int] = mapped_column(
+        ForeignKey("flowchart_run_nodes.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    flowchart_node_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    agent_task_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False)
+    node_created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    degraded_status: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=text("false"),
+    )
+    request_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    correlation_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    has_tooling: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=text("false"),
+    )
+    is_failure: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=text("false"),
+    )
+    warning_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    warnings_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    tooling_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    timeline_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    source_updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False
+    )
+
+
 class RuntimeIdempotencyKey(BaseModel):
     __tablename__ = "runtime_idempotency_keys"
     __table_args__ = (
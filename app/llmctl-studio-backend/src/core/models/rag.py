@@ -2,7 +2,17 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint, text
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.db import BaseModel, utcnow
@@ -27,6 +37,8 @@ class RAGSource(BaseModel):
     last_indexed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    last_indexed_commit: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    drive_change_token: Mapped[str | None] = mapped_column(String(255), nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
     indexed_file_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     indexed_chunk_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -56,6 +68,11 @@ class RAGSource(BaseModel):
         cascade="all, delete-orphan",
         order_by="RAGSourceFileState.path.asc()",
     )
+    drive_file_states: Mapped[list["RAGDriveFileState"]] = relationship(
+        "RAGDriveFileState",
+        back_populates="source",
+        cascade="all, delete-orphan",
+    )
 
 
 class RAGSourceFileState(BaseModel):
@@ -73,6 +90,9 @@ class RAGSourceFileState(BaseModel):
     indexed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     doc_type: Mapped[str | None] = mapped_column(String(32), nullable=True)
     chunk_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    size_bytes: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    mtime_ns: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    inode: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=utcnow, nullable=False
@@ -86,6 +106,38 @@ class RAGSourceFileState(BaseModel):
     )
 
 
+class RAGDriveFileState(BaseModel):
+    """Last-synced revision of one Google Drive item for a drive source."""
+
+    __tablename__ = "rag_drive_file_states"
+    __table_args__ = (
+        UniqueConstraint("source_id", "file_id", name="uq_rag_drive_file_source_file"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    source_id: Mapped[int] = mapped_column(
+        ForeignKey("rag_sources.id"), nullable=False, index=True
+    )
+    file_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    parent_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    mime_type: Mapped[str] = mapped_column(String(255), nullable=False)
+    local_path: Mapped[str] = mapped_column(Text, nullable=False)
+    md5_checksum: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    modified_time: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    version: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False
+    )
+
+    source: Mapped["RAGSource"] = relationship(
+        "RAGSource", back_populates="drive_file_states"
+    )
+
+
 class RAGRetrievalAudit(BaseModel):
     __tablename__ = "rag_retrieval_audits"
 
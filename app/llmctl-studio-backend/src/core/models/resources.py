@@ -158,3 +158,16 @@ class IntegrationSetting(BaseModel):
     )
 
 
+class IntegrationSettingVersion(BaseModel):
+    # One row per settings provider, bumped in the same transaction as any
+    # integration_settings write so process-local caches can cheaply detect
+    # changes made by other workers.
+    __tablename__ = "integration_setting_versions"
+
+    provider: Mapped[str] = mapped_column(String(32), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False
+    )
+
+
@@ -17,15 +17,39 @@ except (ImportError, ModuleNotFoundError):  # pragma: no cover
     chromadb = None
 
 from core.config import Config
-from core.db import session_scope, utcnow
-from core.models import RAGRetrievalAudit, RAGSource
+from core.db import utcnow
+from core.models import RAGSource
 from rag.engine.config import build_source_config, load_config
-from rag.engine.ingest import _iter_files, get_collection, index_paths
+from rag.engine.ingest import (
+    _is_iterable_path,
+    _iter_files,
+    get_collection,
+    index_paths,
+)
+from rag.engine.lexical_index import delete_lexical_paths
+from rag.engine.logging_utils import log_event
 from rag.engine.logging_utils import log_sink as rag_log_sink
+from rag.engine.query_cache import QueryResultCache, query_cache_key
 from rag.engine.retrieval import get_collections, query_collections
-from rag.integrations.git_sync import ensure_git_repo, git_fetch_and_reset
-from rag.integrations.google_drive_sync import sync_folder
+from rag.integrations.git_sync import (
+    ensure_git_repo,
+    git_diff_paths,
+    git_fetch_and_reset,
+    git_rev_parse,
+)
+from rag.integrations.google_drive_sync import (
+    DriveIncrementalSyncResult,
+    sync_folder_incremental,
+)
 from rag.providers.adapters import has_embedding_api_key
+from rag.repositories.drive_file_states import (
+    load_drive_manifest,
+    save_drive_manifest,
+)
+from rag.repositories.retrieval_audits import (
+    record_retrieval_audits,
+    retrieval_audit_values,
+)
 from rag.repositories.source_file_states import (
     SourceFileStateInput,
     delete_source_file_states,
@@ -42,6 +66,9 @@ from services.integrations import load_integration_settings
 
 logger = logging.getLogger(__name__)
 
+_health_cache: dict[tuple[str, int], tuple[dict[str, Any], float]] = {}
+_query_result_cache = QueryResultCache()
+
 RAG_CONTRACT_VERSION = "v1"
 RAG_PROVIDER = "chroma"
 
@@ -64,6 +91,9 @@ RAG_FLOWCHART_MODE_CHOICES = (
 )
 
 RAG_HEALTH_TIMEOUT_SECONDS = 2.0
+# Healthy probes are reused this long by the retrieval contract; failures are
+# never cached so an outage is reported on the next call.
+RAG_HEALTH_CACHE_TTL_SECONDS = 5.0
 DOCKER_CHROMA_HOST_ALIASES = {"llmctl-chromadb", "chromadb"}
 
 
@@ -140,8 +170,12 @@ def _resolve_chroma_target() -> tuple[str, int | None]:
     return normalized_host, normalized_port
 
 
-def rag_health_snapshot() -> dict[str, Any]:
+def rag_health_snapshot(*, max_age_s: float = 0.0) -> dict[str, Any]:
     host, port = _resolve_chroma_target()
+    if host and port is not None and max_age_s > 0:
+        cached = _health_cache.get((host, port))
+        if cached is not None and time.monotonic() - cached[1] < max_age_s:
+            return dict(cached[0])
     if not host or port is None:
         return {
             "state": RAG_HEALTH_UNCONFIGURED,
@@ -158,6 +192,7 @@ def rag_health_snapshot() -> dict[str, Any]:
         with socket.create_connection((host, port), timeout=RAG_HEALTH_TIMEOUT_SECONDS):
             pass
     except OSError as exc:
+        _health_cache.pop((host, port), None)
         return {
             "state": RAG_HEALTH_CONFIGURED_UNHEALTHY,
             "provider": RAG_PROVIDER,
@@ -168,7 +203,7 @@ def rag_health_snapshot() -> dict[str, Any]:
             "timeout_seconds": RAG_HEALTH_TIMEOUT_SECONDS,
             "error": str(exc),
         }
-    return {
+    snapshot = {
         "state": RAG_HEALTH_CONFIGURED_HEALTHY,
         "provider": RAG_PROVIDER,
         "host": host,
@@ -178,6 +213,8 @@ def rag_health_snapshot() -> dict[str, Any]:
         "timeout_seconds": RAG_HEALTH_TIMEOUT_SECONDS,
         "error": None,
     }
+    _health_cache[(host, port)] = (dict(snapshot), time.monotonic())
+    return snapshot
 
 
 def list_collection_contract() -> dict[str, Any]:
@@ -244,23 +281,80 @@ def _persist_retrieval_audit_rows(
 ) -> None:
     if not rows:
         return
-    with session_scope() as session:
-        for row in rows:
-            RAGRetrievalAudit.create(
-                session,
-                request_id=request_id or None,
-                runtime_kind=runtime_kind,
-                flowchart_run_id=flowchart_run_id,
-                flowchart_node_run_id=flowchart_node_run_id,
-                provider=str(row.get("provider") or RAG_PROVIDER),
-                collection=(str(row.get("collection") or "").strip() or None),
-                source_id=(str(row.get("source_id") or "").strip() or None),
-                path=(str(row.get("path") or "").strip() or None),
-                chunk_id=(str(row.get("chunk_id") or "").strip() or None),
-                score=row.get("score"),
-                snippet=(str(row.get("snippet") or "").strip() or None),
-                retrieval_rank=row.get("retrieval_rank"),
-            )
+    record_retrieval_audits(
+        retrieval_audit_values(
+            rows,
+            request_id=request_id,
+            runtime_kind=runtime_kind,
+            flowchart_run_id=flowchart_run_id,
+            flowchart_node_run_id=flowchart_node_run_id,
+            provider=RAG_PROVIDER,
+        )
+    )
+
+
+def _retrieve_contract_rows(
+    config: Any,
+    sources: list[RAGSource],
+    question: str,
+    top_k: int,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    context_rows: list[dict[str, Any]] = []
+    citation_rows: list[dict[str, Any]] = []
+    audit_rows: list[dict[str, Any]] = []
+    collection_bindings = get_collections(config, sources)
+    documents, metadatas = query_collections(
+        question,
+        collection_bindings,
+        max(1, int(top_k)),
+        timeout_s=getattr(config, "retrieval_timeout_s", None),
+    )
+    for retrieval_rank, (doc, meta) in enumerate(zip(documents, metadatas), start=1):
+        text = str(doc or "").strip()
+        if not text:
+            continue
+        metadata = meta if isinstance(meta, dict) else {}
+        collection_name = str(metadata.get("collection") or "").strip()
+        source_id = metadata.get("source_id")
+        path = metadata.get("path")
+        chunk_id = metadata.get("chunk_id")
+        score = metadata.get("score")
+        context_rows.append(
+            {
+                "text": text,
+                "collection": collection_name or None,
+                "rank": retrieval_rank,
+                "provider": RAG_PROVIDER,
+                "source_id": source_id,
+                "path": path,
+                "chunk_id": chunk_id,
+                "score": score,
+            }
+        )
+        citation_rows.append(
+            {
+                "provider": RAG_PROVIDER,
+                "collection": collection_name or None,
+                "source_id": source_id,
+                "path": path,
+                "chunk_id": chunk_id,
+                "score": score,
+                "retrieval_rank": retrieval_rank,
+            }
+        )
+        audit_rows.append(
+            {
+                "provider": RAG_PROVIDER,
+                "collection": collection_name,
+                "source_id": source_id,
+                "path": path,
+                "chunk_id": chunk_id,
+                "score": score,
+                "snippet": text[:1200],
+                "retrieval_rank": retrieval_rank,
+            }
+        )
+    return context_rows, citation_rows, audit_rows
 
 
 def execute_query_contract(
@@ -275,7 +369,7 @@ def execute_query_contract(
     synthesize_answer: Callable[[str, list[dict[str, Any]]], str | None] | None = None,
 ) -> dict[str, Any]:
     selected_collections = normalize_collection_selection(collections)
-    health = rag_health_snapshot()
+    health = rag_health_snapshot(max_age_s=RAG_HEALTH_CACHE_TTL_SECONDS)
     if selected_collections and health["state"] != RAG_HEALTH_CONFIGURED_HEALTHY:
         raise RagContractError(
             reason_code=RAG_REASON_UNAVAILABLE_FOR_SELECTED_COLLECTIONS,
@@ -305,6 +399,7 @@ def execute_query_contract(
     context_rows: list[dict[str, Any]] = []
     citation_rows: list[dict[str, Any]] = []
     audit_rows: list[dict[str, Any]] = []
+    cache_hit = False
     started = time.perf_counter()
     try:
         if selected_collections:
@@ -315,59 +410,37 @@ def execute_query_contract(
                     status_code=500,
                     message="RAG embedding provider API key is not configured.",
                 )
-            collection_bindings = get_collections(config, sources)
-            documents, metadatas = query_collections(
+            _query_result_cache.configure(
+                max_entries=getattr(config, "retrieval_cache_max_entries", 256),
+                ttl_s=getattr(config, "retrieval_cache_ttl_s", 300.0),
+            )
+            cache_key = query_cache_key(
                 question,
-                collection_bindings,
+                selected_collections,
                 max(1, int(top_k)),
+                embed_provider=getattr(config, "embed_provider", ""),
+                embed_model=getattr(config, "embed_model", ""),
+                lexical_weight=getattr(config, "retrieval_lexical_weight", 0.0),
+                source_versions=[
+                    (getattr(source, "id", None), getattr(source, "last_indexed_at", None))
+                    for source in sources
+                ],
             )
-            for retrieval_rank, (doc, meta) in enumerate(
-                zip(documents, metadatas), start=1
-            ):
-                text = str(doc or "").strip()
-                if not text:
-                    continue
-                metadata = meta if isinstance(meta, dict) else {}
-                collection_name = str(metadata.get("collection") or "").strip()
-                source_id = metadata.get("source_id")
-                path = metadata.get("path")
-                chunk_id = metadata.get("chunk_id")
-                score = metadata.get("score")
-                context_rows.append(
-                    {
-                        "text": text,
-                        "collection": collection_name or None,
-                        "rank": retrieval_rank,
-                        "provider": RAG_PROVIDER,
-                        "source_id": source_id,
-                        "path": path,
-                        "chunk_id": chunk_id,
-                        "score": score,
-                    }
-                )
-                citation_rows.append(
-                    {
-                        "provider": RAG_PROVIDER,
-                        "collection": collection_name or None,
-                        "source_id": source_id,
-                        "path": path,
-                        "chunk_id": chunk_id,
-                        "score": score,
-                        "retrieval_rank": retrieval_rank,
-                    }
+            cached_rows = _query_result_cache.get(cache_key)
+            if cached_rows is not None:
+                cache_hit = True
+                context_rows, citation_rows, audit_rows = cached_rows
+            else:
+                context_rows, citation_rows, audit_rows = _retrieve_contract_rows(
+                    config, sources, question, top_k
                 )
-                audit_rows.append(
-                    {
-                        "provider": RAG_PROVIDER,
-                        "collection": collection_name,
-                        "source_id": source_id,
-                        "path": path,
-                        "chunk_id": chunk_id,
-                        "score": score,
-                        "snippet": text[:1200],
-                        "retrieval_rank": retrieval_rank,
-                    }
+                _query_result_cache.put(
+                    cache_key, (context_rows, citation_rows, audit_rows)
                 )
+            _query_result_cache.record(
+                hit=cache_hit,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+            )
     except RagContractError:
         raise
     except Exception as exc:
@@ -405,6 +478,8 @@ def execute_query_contract(
             "top_k": max(1, int(top_k)),
             "retrieved_count": len(context_rows),
             "elapsed_ms": elapsed_ms,
+            "cache_hit": cache_hit,
+            "cache": _query_result_cache.stats(),
         },
         "citation_records": citation_rows,
         "synthesis_error": synthesis_error,
@@ -482,6 +557,129 @@ def _path_fingerprint(path: Path) -> str:
     return f"sha1:{hasher.hexdigest()}"
 
 
+def _path_stat(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return (
+        int(stat_result.st_size),
+        int(stat_result.st_mtime_ns),
+        int(stat_result.st_ino),
+    )
+
+
+def _state_matches_stat(state: Any, stat: tuple[int, int, int] | None) -> bool:
+    if stat is None:
+        return False
+    size_bytes, mtime_ns, inode = stat
+    return (
+        getattr(state, "size_bytes", None) == size_bytes
+        and getattr(state, "mtime_ns", None) == mtime_ns
+        and getattr(state, "inode", None) == inode
+    )
+
+
+def _source_head_commit(source: RAGSource, repo_root: Path) -> str | None:
+    if source.kind != "github":
+        return None
+    try:
+        return git_rev_parse(repo_root) or None
+    except Exception:
+        return None
+
+
+def _git_delta_candidates(
+    *,
+    source: RAGSource,
+    source_config: Any,
+    repo_root: Path,
+    head_commit: str | None,
+    existing: dict[str, Any],
+) -> tuple[list[Path], list[str]] | None:
+    previous_commit = str(getattr(source, "last_indexed_commit", "") or "").strip()
+    if not previous_commit or not head_commit or not existing:
+        return None
+    if previous_commit == head_commit:
+        return [], []
+    try:
+        changed, deleted = git_diff_paths(repo_root, previous_commit, head_commit)
+    except RuntimeError as exc:
+        # The previous commit can disappear after a force push or a re-clone;
+        # fall back to the stat scan in that case.
+        logger.info(
+            "Git diff unavailable for RAG source %s (%s..%s): %s",
+            source.id,
+            previous_commit,
+            head_commit,
+            exc,
+        )
+        return None
+
+    candidates: list[Path] = []
+    removed: list[str] = []
+    for path in deleted:
+        rel_path = _relative_path(path, repo_root)
+        if rel_path in existing:
+            removed.append(rel_path)
+    for path in changed:
+        rel_path = _relative_path(path, repo_root)
+        if path.is_file() and _is_iterable_path(path, source_config):
+            candidates.append(path)
+        elif rel_path in existing:
+            removed.append(rel_path)
+    return candidates, removed
+
+
+def _sync_google_drive_source(
+    source: RAGSource,
+    source_config: Any,
+) -> DriveIncrementalSyncResult:
+    service_account_json = (
+        load_integration_settings("google_workspace").get("service_account_json")
+        or ""
+    ).strip()
+    local_path = str(getattr(source, "local_path", "") or "").strip()
+    folder_id = str(getattr(source, "drive_folder_id", "") or "").strip()
+    if not service_account_json:
+        raise RuntimeError(
+            "Google Drive service account JSON is required for indexing."
+        )
+    if not local_path or not folder_id:
+        raise RuntimeError("Google Drive source is missing local path or folder id.")
+    # The manifest is only saved once the synced files are indexed, so a
+    # failed run replays the same changes next time.
+    manifest, change_token = load_drive_manifest(source.id)
+    return sync_folder_incremental(
+        service_account_json,
+        folder_id,
+        Path(local_path),
+        manifest=manifest,
+        change_token=change_token,
+        max_workers=max(1, int(source_config.drive_sync_workers)),
+    )
+
+
+def _drive_delta_candidates(
+    *,
+    drive_sync: DriveIncrementalSyncResult | None,
+    source_config: Any,
+    repo_root: Path,
+    existing: dict[str, Any],
+) -> tuple[list[Path], list[str]] | None:
+    if drive_sync is None or not drive_sync.incremental or not existing:
+        return None
+    candidates: list[Path] = []
+    removed = [rel_path for rel_path in drive_sync.removed_paths if rel_path in existing]
+    for rel_path in drive_sync.changed_paths:
+        path = repo_root / rel_path
+        if path.is_file() and _is_iterable_path(path, source_config):
+            candidates.append(path)
+        elif rel_path in existing:
+            removed.append(rel_path)
+    return candidates, removed
+
+
 def _embedding_provider_for_model_provider(model_provider: str) -> str | None:
     cleaned = str(model_provider or "").strip().lower()
     if cleaned == "gemini":
@@ -506,11 +704,7 @@ def _rollback_partial_source_index(
             port=source_config.chroma_port,
         )
         if mode == RAG_FLOWCHART_MODE_FRESH_INDEX:
-            try:
-                client.delete_collection(name=source_config.collection)
-            except Exception:
-                pass
-            get_collection(client, source_config, reset=False)
+            get_collection(client, source_config, reset=True)
             delete_source_file_states(source.id)
             return None
         collection = get_collection(client, source_config, reset=False)
@@ -521,6 +715,7 @@ def _rollback_partial_source_index(
                 collection.delete(where={"path": rel_path})
             except Exception:
                 continue
+        delete_lexical_paths(source_config, touched_paths)
         return None
     except Exception as exc:
         return str(exc)
@@ -536,20 +731,9 @@ def _run_fresh_source_index(
     if source.kind == "github":
         ensure_git_repo(source_config)
         git_fetch_and_reset(source_config)
+    drive_sync: DriveIncrementalSyncResult | None = None
     if source.kind == "google_drive":
-        service_account_json = (
-            load_integration_settings("google_workspace").get("service_account_json")
-            or ""
-        ).strip()
-        local_path = str(getattr(source, "local_path", "") or "").strip()
-        folder_id = str(getattr(source, "drive_folder_id", "") or "").strip()
-        if not service_account_json:
-            raise RuntimeError(
-                "Google Drive service account JSON is required for indexing."
-            )
-        if not local_path or not folder_id:
-            raise RuntimeError("Google Drive source is missing local path or folder id.")
-        sync_folder(service_account_json, folder_id, Path(local_path))
+        drive_sync = _sync_google_drive_source(source, source_config)
 
     client = chromadb.HttpClient(
         host=source_config.chroma_host,
@@ -558,12 +742,16 @@ def _run_fresh_source_index(
     collection = get_collection(client, source_config, reset=True)
     paths = list(_iter_files(source_config))
     repo_root = Path(source_config.repo_root)
+    head_commit = _source_head_commit(source, repo_root)
     fingerprints: dict[str, str] = {}
+    stats_by_path: dict[str, tuple[int, int, int] | None] = {}
     for path in paths:
         rel_path = _relative_path(path, repo_root)
+        stat = _path_stat(path)
         fingerprint = _path_fingerprint(path)
         if rel_path and fingerprint:
             fingerprints[rel_path] = fingerprint
+            stats_by_path[rel_path] = stat
     indexed_by_path: dict[str, tuple[bool, str | None, int]] = {}
 
     def _on_file_result(
@@ -594,6 +782,7 @@ def _run_fresh_source_index(
         if not fingerprint:
             continue
         touched_paths.append(rel_path)
+        stat = stats_by_path.get(rel_path)
         state_updates.append(
             SourceFileStateInput(
                 path=rel_path,
@@ -601,9 +790,18 @@ def _run_fresh_source_index(
                 indexed=indexed,
                 doc_type=doc_type if indexed else None,
                 chunk_count=chunk_count if indexed else 0,
+                size_bytes=stat[0] if stat else None,
+                mtime_ns=stat[1] if stat else None,
+                inode=stat[2] if stat else None,
             )
         )
     upsert_source_file_states(source.id, state_updates)
+    if drive_sync is not None:
+        save_drive_manifest(
+            source.id,
+            drive_sync.manifest,
+            change_token=drive_sync.change_token,
+        )
     update_source_index(
         source.id,
         last_indexed_at=utcnow(),
@@ -611,6 +809,7 @@ def _run_fresh_source_index(
         indexed_file_count=file_total,
         indexed_chunk_count=chunk_total,
         indexed_file_types=json.dumps(files_by_type, sort_keys=True),
+        last_indexed_commit=head_commit or "",
     )
     schedule_source_next_index(source.id, from_time=utcnow())
     return {
@@ -632,20 +831,9 @@ def _run_delta_source_index(
     if source.kind == "github":
         ensure_git_repo(source_config)
         git_fetch_and_reset(source_config)
+    drive_sync: DriveIncrementalSyncResult | None = None
     if source.kind == "google_drive":
-        service_account_json = (
-            load_integration_settings("google_workspace").get("service_account_json")
-            or ""
-        ).strip()
-        local_path = str(getattr(source, "local_path", "") or "").strip()
-        folder_id = str(getattr(source, "drive_folder_id", "") or "").strip()
-        if not service_account_json:
-            raise RuntimeError(
-                "Google Drive service account JSON is required for indexing."
-            )
-        if not local_path or not folder_id:
-            raise RuntimeError("Google Drive source is missing local path or folder id.")
-        sync_folder(service_account_json, folder_id, Path(local_path))
+        drive_sync = _sync_google_drive_source(source, source_config)
 
     client = chromadb.HttpClient(
         host=source_config.chroma_host,
@@ -653,30 +841,93 @@ def _run_delta_source_index(
     )
     collection = get_collection(client, source_config, reset=False)
     repo_root = Path(source_config.repo_root)
-    all_paths = list(_iter_files(source_config))
-    current_by_path: dict[str, tuple[Path, str]] = {}
-    for path in all_paths:
-        rel_path = _relative_path(path, repo_root)
-        fingerprint = _path_fingerprint(path)
-        if rel_path and fingerprint:
-            current_by_path[rel_path] = (path, fingerprint)
-
     existing = {state.path: state for state in list_source_file_states(source.id)}
+    head_commit = _source_head_commit(source, repo_root)
+    git_candidates = _git_delta_candidates(
+        source=source,
+        source_config=source_config,
+        repo_root=repo_root,
+        head_commit=head_commit,
+        existing=existing,
+    )
+    drive_candidates = _drive_delta_candidates(
+        drive_sync=drive_sync,
+        source_config=source_config,
+        repo_root=repo_root,
+        existing=existing,
+    )
+    if git_candidates is not None:
+        scan_mode = "git_diff"
+        candidate_paths, removed_paths = git_candidates
+    elif drive_candidates is not None:
+        scan_mode = "drive_changes"
+        candidate_paths, removed_paths = drive_candidates
+    else:
+        scan_mode = "stat"
+        candidate_paths = list(_iter_files(source_config))
+        seen_rel_paths = {_relative_path(path, repo_root) for path in candidate_paths}
+        removed_paths = [path for path in existing if path not in seen_rel_paths]
+
+    # Only files whose size/mtime/inode changed since the last run are re-hashed;
+    # a matching content hash just refreshes the stored stat.
+    current_by_path: dict[str, tuple[Path, str, tuple[int, int, int] | None]] = {}
     changed_paths: list[Path] = []
     changed_rel_paths: list[str] = []
-    for rel_path, (path, fingerprint) in current_by_path.items():
+    stat_refreshes: list[SourceFileStateInput] = []
+    hashed_count = 0
+    for path in candidate_paths:
+        rel_path = _relative_path(path, repo_root)
+        if not rel_path:
+            continue
+        stat = _path_stat(path)
         existing_state = existing.get(rel_path)
-        if existing_state is None or str(existing_state.fingerprint or "") != fingerprint:
-            changed_paths.append(path)
-            changed_rel_paths.append(rel_path)
+        if existing_state is not None and _state_matches_stat(existing_state, stat):
+            continue
+        fingerprint = _path_fingerprint(path)
+        hashed_count += 1
+        if not fingerprint:
+            continue
+        if existing_state is not None and str(existing_state.fingerprint or "") == fingerprint:
+            stat_refreshes.append(
+                SourceFileStateInput(
+                    path=rel_path,
+                    fingerprint=fingerprint,
+                    indexed=bool(existing_state.indexed),
+                    doc_type=existing_state.doc_type,
+                    chunk_count=int(existing_state.chunk_count or 0),
+                    size_bytes=stat[0] if stat else None,
+                    mtime_ns=stat[1] if stat else None,
+                    inode=stat[2] if stat else None,
+                )
+            )
+            continue
+        current_by_path[rel_path] = (path, fingerprint, stat)
+        changed_paths.append(path)
+        changed_rel_paths.append(rel_path)
+    log_event(
+        "rag_delta_scan",
+        source_id=source.id,
+        scan_mode=scan_mode,
+        candidate_files=len(candidate_paths),
+        hashed_files=hashed_count,
+        changed_files=len(changed_paths),
+        removed_files=len(removed_paths),
+        message=(
+            f"Delta scan ({scan_mode}): {len(candidate_paths)} candidate file(s), "
+            f"{hashed_count} hashed, {len(changed_paths)} changed, "
+            f"{len(removed_paths)} removed"
+        ),
+    )
+    if stat_refreshes:
+        upsert_source_file_states(source.id, stat_refreshes)
 
-    removed_paths = [path for path in existing if path not in current_by_path]
     for rel_path in removed_paths:
         try:
             collection.delete(where={"path": rel_path})
         except Exception:
             continue
     if removed_paths:
+        delete_lexical_paths(source_config, removed_paths)
         delete_source_file_states(source.id, paths=removed_paths)
 
     indexed_by_path: dict[str, tuple[bool, str | None, int]] = {}
@@ -706,7 +957,7 @@ def _run_delta_source_index(
     updates: list[SourceFileStateInput] = []
     touched_paths = list(changed_rel_paths)
     for rel_path, (indexed, doc_type, chunk_count) in indexed_by_path.items():
-        fingerprint = current_by_path.get(rel_path, (None, ""))[1]
+        _, fingerprint, stat = current_by_path.get(rel_path, (None, "", None))
         if not fingerprint:
             continue
         updates.append(
@@ -716,10 +967,19 @@ def _run_delta_source_index(
                 indexed=indexed,
                 doc_type=doc_type if indexed else None,
                 chunk_count=chunk_count if indexed else 0,
+                size_bytes=stat[0] if stat else None,
+                mtime_ns=stat[1] if stat else None,
+                inode=stat[2] if stat else None,
             )
         )
     if updates:
         upsert_source_file_states(source.id, updates)
+    if drive_sync is not None:
+        save_drive_manifest(
+            source.id,
+            drive_sync.manifest,
+            change_token=drive_sync.change_token,
+        )
 
     stats = summarize_source_file_states(source.id)
     update_source_index(
@@ -729,6 +989,7 @@ def _run_delta_source_index(
         indexed_file_count=stats.indexed_file_count,
         indexed_chunk_count=stats.indexed_chunk_count,
         indexed_file_types=json.dumps(stats.indexed_file_types, sort_keys=True),
+        last_indexed_commit=head_commit or "",
     )
     schedule_source_next_index(source.id, from_time=utcnow())
     return {
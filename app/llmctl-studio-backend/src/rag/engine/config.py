@@ -50,6 +50,7 @@ _DEFAULT_MAX_FILE_BYTES_BY_TYPE = {
 _DOCKER_CHROMA_HOST_ALIASES = {"llmctl-chromadb", "chromadb"}
 _SUPPORTED_MODEL_PROVIDERS = {"openai", "gemini"}
 _SUPPORTED_CHAT_RESPONSE_STYLES = {"low", "medium", "high"}
+_SUPPORTED_INDEX_PARSE_EXECUTORS = {"thread", "process"}
 _CHAT_RESPONSE_STYLE_ALIASES = {
     "concise": "low",
     "brief": "low",
@@ -167,8 +168,17 @@ class RagConfig:
     ocr_include_char_boxes: bool
     drive_sync_workers: int
     index_parallel_workers: int
+    index_parse_executor: str
+    index_prefetch_files: int
     pdf_page_workers: int
+    pdf_page_executor: str
     embed_parallel_requests: int
+    embed_cache_enabled: bool
+    embed_cache_path: Path
+    embed_cache_max_entries: int
+    ocr_cache_enabled: bool
+    ocr_cache_path: Path
+    ocr_cache_max_entries: int
     openai_chat_model: str
     gemini_chat_model: str
     chat_model: str
@@ -179,6 +189,13 @@ class RagConfig:
     chat_max_context_chars: int
     chat_snippet_chars: int
     chat_context_budget_tokens: int
+    retrieval_handle_ttl_s: float
+    retrieval_timeout_s: float
+    lexical_index_enabled: bool
+    lexical_index_dir: Path
+    retrieval_lexical_weight: float
+    retrieval_cache_max_entries: int
+    retrieval_cache_ttl_s: float
     web_port: int
 
 
@@ -221,6 +238,33 @@ def _as_int_range(
     return parsed
 
 
+def _default_embed_cache_path() -> str:
+    try:
+        from core.config import Config
+
+        return str(Path(Config.DATA_DIR) / "rag" / "embedding-cache.sqlite3")
+    except Exception:
+        return "/tmp/llmctl-studio-rag-embedding-cache.sqlite3"
+
+
+def _default_ocr_cache_path() -> str:
+    try:
+        from core.config import Config
+
+        return str(Path(Config.DATA_DIR) / "rag" / "ocr-cache.sqlite3")
+    except Exception:
+        return "/tmp/llmctl-studio-rag-ocr-cache.sqlite3"
+
+
+def _default_lexical_index_dir() -> str:
+    try:
+        from core.config import Config
+
+        return str(Path(Config.DATA_DIR) / "rag" / "lexical")
+    except Exception:
+        return "/tmp/llmctl-studio-rag-lexical"
+
+
 def _normalize_chroma_target(host: str, port: int) -> tuple[str, int]:
     host_value = (host or "").strip()
     if host_value.lower() in _DOCKER_CHROMA_HOST_ALIASES and port != 8000:
@@ -282,6 +326,13 @@ def _normalize_chat_response_style(value: str | None, default: str = "high") ->
     return default
 
 
+def _normalize_index_parse_executor(value: str | None, default: str = "thread") -> str:
+    candidate = (value or "").strip().lower()
+    if candidate in _SUPPORTED_INDEX_PARSE_EXECUTORS:
+        return candidate
+    return default
+
+
 def build_git_url(
     repo: str | None, pat: str | None, ssh_key_path: str | None
 ) -> str | None:
@@ -721,6 +772,24 @@ def load_config() -> RagConfig:
                 1,
             ),
         ),
+        index_parse_executor=_normalize_index_parse_executor(
+            _setting(
+                "RAG_INDEX_PARSE_EXECUTOR",
+                rag_settings,
+                "index_parse_executor",
+                None,
+            )
+        ),
+        index_prefetch_files=_as_int_range(
+            _setting(
+                "RAG_INDEX_PREFETCH_FILES",
+                rag_settings,
+                "index_prefetch_files",
+                "0",
+            ),
+            0,
+            minimum=0,
+        ),
         pdf_page_workers=max(
             1,
             _as_int(
@@ -733,6 +802,14 @@ def load_config() -> RagConfig:
                 1,
             ),
         ),
+        pdf_page_executor=_normalize_index_parse_executor(
+            _setting(
+                "RAG_PDF_PAGE_EXECUTOR",
+                rag_settings,
+                "pdf_page_executor",
+                None,
+            )
+        ),
         embed_parallel_requests=max(
             1,
             _as_int(
@@ -751,6 +828,42 @@ def load_config() -> RagConfig:
                 6,
             ),
         ),
+        embed_cache_enabled=_as_bool(
+            _setting("RAG_EMBED_CACHE_ENABLED", rag_settings, "embed_cache_enabled", None),
+            True,
+        ),
+        embed_cache_path=Path(
+            _setting("RAG_EMBED_CACHE_PATH", rag_settings, "embed_cache_path", None)
+            or _default_embed_cache_path()
+        ).expanduser(),
+        embed_cache_max_entries=_as_int_range(
+            _setting(
+                "RAG_EMBED_CACHE_MAX_ENTRIES",
+                rag_settings,
+                "embed_cache_max_entries",
+                "200000",
+            ),
+            200000,
+            minimum=1,
+        ),
+        ocr_cache_enabled=_as_bool(
+            _setting("RAG_OCR_CACHE_ENABLED", rag_settings, "ocr_cache_enabled", None),
+            True,
+        ),
+        ocr_cache_path=Path(
+            _setting("RAG_OCR_CACHE_PATH", rag_settings, "ocr_cache_path", None)
+            or _default_ocr_cache_path()
+        ).expanduser(),
+        ocr_cache_max_entries=_as_int_range(
+            _setting(
+                "RAG_OCR_CACHE_MAX_ENTRIES",
+                rag_settings,
+                "ocr_cache_max_entries",
+                "50000",
+            ),
+            50000,
+            minimum=1,
+        ),
         openai_chat_model=openai_chat_model,
         gemini_chat_model=gemini_chat_model,
         chat_model=chat_model,
@@ -798,6 +911,83 @@ def load_config() -> RagConfig:
             8000,
             minimum=256,
         ),
+        retrieval_handle_ttl_s=max(
+            0.0,
+            _as_float(
+                _setting(
+                    "RAG_RETRIEVAL_HANDLE_TTL_S",
+                    rag_settings,
+                    "retrieval_handle_ttl_s",
+                    None,
+                ),
+                300.0,
+            ),
+        ),
+        retrieval_timeout_s=max(
+            0.1,
+            _as_float(
+                _setting(
+                    "RAG_RETRIEVAL_TIMEOUT_S",
+                    rag_settings,
+                    "retrieval_timeout_s",
+                    None,
+                ),
+                20.0,
+            ),
+        ),
+        lexical_index_enabled=_as_bool(
+            _setting(
+                "RAG_LEXICAL_INDEX_ENABLED",
+                rag_settings,
+                "lexical_index_enabled",
+                None,
+            ),
+            True,
+        ),
+        lexical_index_dir=Path(
+            _setting("RAG_LEXICAL_INDEX_DIR", rag_settings, "lexical_index_dir", None)
+            or _default_lexical_index_dir()
+        ).expanduser(),
+        # Share of the reciprocal-rank-fusion weight given to BM25 hits; 0
+        # keeps retrieval purely vector-based.
+        retrieval_lexical_weight=min(
+            1.0,
+            max(
+                0.0,
+                _as_float(
+                    _setting(
+                        "RAG_RETRIEVAL_LEXICAL_WEIGHT",
+                        rag_settings,
+                        "retrieval_lexical_weight",
+                        None,
+                    ),
+                    0.4,
+                ),
+            ),
+        ),
+        # 0 disables the query-result cache used by the retrieval contract.
+        retrieval_cache_max_entries=_as_int_range(
+            _setting(
+                "RAG_RETRIEVAL_CACHE_MAX_ENTRIES",
+                rag_settings,
+                "retrieval_cache_max_entries",
+                "256",
+            ),
+            256,
+            minimum=0,
+        ),
+        retrieval_cache_ttl_s=max(
+            0.0,
+            _as_float(
+                _setting(
+                    "RAG_RETRIEVAL_CACHE_TTL_S",
+                    rag_settings,
+                    "retrieval_cache_ttl_s",
+                    None,
+                ),
+                300.0,
+            ),
+        ),
         web_port=_as_int_range(
             _setting("RAG_WEB_PORT", rag_settings, "web_port", "5050"),
             5050,
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from array import array
+import hashlib
+from pathlib import Path
+import threading
+import time
+from typing import Any, Sequence
+
+from rag.engine.sqlite_utils import connect_shared_sqlite
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    text_sha256 TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    last_used_at REAL NOT NULL,
+    PRIMARY KEY (provider, model, text_sha256)
+);
+CREATE INDEX IF NOT EXISTS ix_embedding_cache_last_used_at
+    ON embedding_cache (last_used_at);
+CREATE TABLE IF NOT EXISTS embedding_model_dimensions (
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    PRIMARY KEY (provider, model)
+);
+"""
+# SQLite caps bound parameters per statement; stay well below the limit.
+_LOOKUP_CHUNK_SIZE = 400
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _encode_vector(vector: Sequence[float]) -> bytes:
+    return array("f", (float(value) for value in vector)).tobytes()
+
+
+def _decode_vector(blob: bytes) -> list[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """LRU cache of embedding vectors in a SQLite file.
+
+    Vectors are keyed by (provider, model, sha256 of the embedded text), so the
+    same text is embedded once per model regardless of file, source or
+    collection.
+    """
+
+    def __init__(self, path: Path, *, max_entries: int) -> None:
+        self.path = Path(path)
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._conn = connect_shared_sqlite(self.path, _SCHEMA)
+        self._entry_count = int(
+            self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        )
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def get_many(
+        self, provider: str, model: str, hashes: Sequence[str]
+    ) -> dict[str, list[float]]:
+        unique_hashes = list(dict.fromkeys(hashes))
+        found: dict[str, list[float]] = {}
+        if not unique_hashes:
+            return found
+        with self._lock:
+            expected = self._model_dimensions(provider, model)
+            stale: list[str] = []
+            for start in range(0, len(unique_hashes), _LOOKUP_CHUNK_SIZE):
+                chunk = unique_hashes[start : start + _LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = self._conn.execute(
+                    "SELECT text_sha256, dimensions, vector FROM embedding_cache "
+                    "WHERE provider = ? AND model = ? "
+                    f"AND text_sha256 IN ({placeholders})",
+                    (provider, model, *chunk),
+                ).fetchall()
+                for digest, dimensions, blob in rows:
+                    vector = _decode_vector(blob)
+                    # Vectors written before the model changed its output size
+                    # (or truncated blobs) would fail the Chroma upsert.
+                    if len(vector) != dimensions or (
+                        expected is not None and dimensions != expected
+                    ):
+                        stale.append(digest)
+                        continue
+                    found[digest] = vector
+            if stale:
+                self._delete(provider, model, stale)
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_used_at = ? "
+                    "WHERE provider = ? AND model = ? AND text_sha256 = ?",
+                    [(now, provider, model, digest) for digest in found],
+                )
+            self.hits += sum(1 for digest in hashes if digest in found)
+            self.misses += sum(1 for digest in hashes if digest not in found)
+        return found
+
+    def put_many(
+        self,
+        provider: str,
+        model: str,
+        entries: dict[str, Sequence[float]],
+    ) -> None:
+        if not entries:
+            return
+        now = time.time()
+        rows = [
+            (provider, model, digest, len(vector), _encode_vector(vector), now)
+            for digest, vector in entries.items()
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                # Fresh vectors come from the current model, so their size is
+                # the one cached rows are checked against on read. When it
+                # changes, drop the model's rows of the old size.
+                dimensions = rows[-1][3]
+                if self._model_dimensions(provider, model) != dimensions:
+                    self._conn.execute(
+                        "INSERT INTO embedding_model_dimensions "
+                        "(provider, model, dimensions) VALUES (?, ?, ?) "
+                        "ON CONFLICT (provider, model) "
+                        "DO UPDATE SET dimensions = excluded.dimensions",
+                        (provider, model, dimensions),
+                    )
+                    cursor = self._conn.execute(
+                        "DELETE FROM embedding_cache "
+                        "WHERE provider = ? AND model = ? AND dimensions != ?",
+                        (provider, model, dimensions),
+                    )
+                    self._entry_count = max(
+                        0, self._entry_count - max(0, int(cursor.rowcount))
+                    )
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO embedding_cache "
+                    "(provider, model, text_sha256, dimensions, vector, last_used_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                inserted = self._conn.total_changes - before
+                self._entry_count += inserted
+                self.writes += inserted
+                if self._entry_count > self.max_entries:
+                    # Other worker processes share the file; refresh the
+                    # local estimate before evicting anything.
+                    self._entry_count = int(
+                        self._conn.execute(
+                            "SELECT COUNT(*) FROM embedding_cache"
+                        ).fetchone()[0]
+                    )
+                overflow = self._entry_count - self.max_entries
+                if overflow > 0:
+                    cursor = self._conn.execute(
+                        "DELETE FROM embedding_cache WHERE rowid IN ("
+                        "SELECT rowid FROM embedding_cache "
+                        "ORDER BY last_used_at ASC LIMIT ?)",
+                        (overflow,),
+                    )
+                    evicted = max(0, int(cursor.rowcount))
+                    self._entry_count -= evicted
+                    self.evictions += evicted
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _model_dimensions(self, provider: str, model: str) -> int | None:
+        row = self._conn.execute(
+            "SELECT dimensions FROM embedding_model_dimensions "
+            "WHERE provider = ? AND model = ?",
+            (provider, model),
+        ).fetchone()
+        return int(row[0]) if row else None
+
+    def _delete(self, provider: str, model: str, hashes: list[str]) -> None:
+        deleted = 0
+        for start in range(0, len(hashes), _LOOKUP_CHUNK_SIZE):
+            chunk = hashes[start : start + _LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor = self._conn.execute(
+                "DELETE FROM embedding_cache WHERE provider = ? AND model = ? "
+                f"AND text_sha256 IN ({placeholders})",
+                (provider, model, *chunk),
+            )
+            deleted += max(0, int(cursor.rowcount))
+        self._entry_count = max(0, self._entry_count - deleted)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": self._entry_count,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_embedding_cache(config) -> EmbeddingCache | None:
+    if not bool(getattr(config, "embed_cache_enabled", False)):
+        return None
+    cache_path = getattr(config, "embed_cache_path", None)
+    if not cache_path:
+        return None
+    return EmbeddingCache(
+        Path(cache_path),
+        max_entries=int(getattr(config, "embed_cache_max_entries", 0) or 0),
+    )
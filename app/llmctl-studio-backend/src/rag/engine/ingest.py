@@ -1,9 +1,19 @@
 from __future__ import annotations
 
 import argparse
-from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
 import fnmatch
+from functools import lru_cache
+import multiprocessing
 import os
+import sqlite3
 import sys
 import threading
 import time
@@ -27,14 +37,26 @@ from rag.engine.config import (
     parser_signature,
 )
 from rag.engine.chunkers import build_chunker_registry
+from rag.engine.embedding_cache import open_embedding_cache, text_sha256
+from rag.engine.lexical_index import (
+    delete_lexical_paths,
+    open_lexical_index,
+    reset_lexical_index,
+)
 from rag.engine.parsers import build_parser_registry, guess_doc_type, is_doc_type_enabled
 from rag.engine.pipeline import make_chunk_id, make_doc_group_id
+from rag.engine.retrieval import invalidate_collection_handles
 from rag.engine.logging_utils import log_event, submit_with_log_context
 from rag.integrations.git_sync import ensure_git_repo, git_fetch_and_reset
-from rag.integrations.google_drive_sync import sync_folder
+from rag.integrations.google_drive_sync import sync_folder_incremental
+from rag.repositories.drive_file_states import load_drive_manifest, save_drive_manifest
 from rag.repositories.sources import list_sources
 from rag.engine.versions import CHUNKER_VERSION, PARSER_VERSION
-from rag.providers.adapters import build_embedding_function, get_embedding_model
+from rag.providers.adapters import (
+    build_embedding_function,
+    get_embedding_model,
+    get_embedding_provider,
+)
 from rag.engine.token_utils import TokenCounter
 
 
@@ -89,6 +111,21 @@ def _iter_files(config: RagConfig):
             yield path
 
 
+def _is_iterable_path(path: Path, config: RagConfig) -> bool:
+    # Mirrors the directory pruning in _iter_files for paths that come from
+    # elsewhere (for example git diff output).
+    try:
+        rel = path.relative_to(config.repo_root)
+    except ValueError:
+        return False
+    current = Path(config.repo_root)
+    for part in rel.parts[:-1]:
+        current = current / part
+        if _is_excluded(current, config):
+            return False
+    return not _is_excluded(path, config)
+
+
 def _is_binary(path: Path) -> bool:
     try:
         with path.open("rb") as handle:
@@ -129,6 +166,8 @@ def get_collection(client, config: RagConfig, reset: bool):
             client.delete_collection(name=config.collection)
         except Exception:
             pass
+        invalidate_collection_handles(config.collection)
+        reset_lexical_index(config)
 
     return client.get_or_create_collection(
         name=config.collection,
@@ -137,13 +176,16 @@ def get_collection(client, config: RagConfig, reset: bool):
     )
 
 
-def _add_batch(collection, ids, documents, metadatas):
+def _add_batch(collection, ids, documents, metadatas, embeddings=None):
     if not ids:
         return
+    kwargs = {"ids": ids, "documents": documents, "metadatas": metadatas}
+    if embeddings is not None:
+        kwargs["embeddings"] = embeddings
     if hasattr(collection, "upsert"):
-        collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+        collection.upsert(**kwargs)
     else:
-        collection.add(ids=ids, documents=documents, metadatas=metadatas)
+        collection.add(**kwargs)
 
 
 def _is_rate_limit_error(exc: Exception) -> bool:
@@ -208,6 +250,7 @@ class _EmbedBatchRateLimiter:
 
 def delete_paths(collection, config: RagConfig, paths: list[Path]) -> int:
     deleted = 0
+    deleted_rel_paths: list[str] = []
     for path in paths:
         if _is_excluded(path, config):
             continue
@@ -217,11 +260,222 @@ def delete_paths(collection, config: RagConfig, paths: list[Path]) -> int:
         try:
             collection.delete(where={"path": rel_path})
             deleted += 1
+            deleted_rel_paths.append(rel_path)
         except Exception:
             continue
+    delete_lexical_paths(config, deleted_rel_paths)
     return deleted
 
 
+@dataclass
+class _PreparedFile:
+    status: str
+    doc_type: str | None = None
+    records: list[tuple[str, str, dict[str, object], int]] = field(default_factory=list)
+    events: list[tuple[str, dict[str, object]]] = field(default_factory=list)
+
+
+@lru_cache(maxsize=1)
+def _prepare_registries():
+    return build_parser_registry(), build_chunker_registry()
+
+
+def _precheck_skip_reason(path: Path, config: RagConfig) -> str | None:
+    if _is_excluded(path, config):
+        return "excluded"
+    if not is_doc_type_enabled(config, guess_doc_type(path)):
+        return "disabled_doc_type"
+    return None
+
+
+def _build_prepare_executor(config: RagConfig, workers: int):
+    if workers <= 1:
+        return None
+    if getattr(config, "index_parse_executor", "thread") == "process":
+        # Spawned workers avoid inheriting the parent's threads and locks.
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def _prepare_file(
+    path: Path,
+    rel_path: str,
+    config: RagConfig,
+    parser_sig: str,
+    chunker_sig: str,
+    source_meta: dict[str, object] | None,
+    max_input_tokens: int,
+) -> _PreparedFile:
+    # Runs on parse workers (threads or processes). Log events are collected
+    # and replayed by index_paths in file order instead of being emitted here.
+    events: list[tuple[str, dict[str, object]]] = []
+    parser_registry, chunker_registry = _prepare_registries()
+    doc_type_hint = guess_doc_type(path)
+
+    parser = parser_registry.resolve(path)
+    if not parser:
+        events.append(
+            (
+                "rag_index_skip",
+                {"path": str(path), "reason": "no_parser", "doc_type": doc_type_hint},
+            )
+        )
+        return _PreparedFile(status="no_parser", events=events)
+    parser_name = _callable_name(parser)
+    events.append(
+        (
+            "rag_index_parser_selected",
+            {
+                "path": str(path),
+                "rel_path": rel_path,
+                "doc_type": doc_type_hint,
+                "parser": parser_name,
+                "message": f"Parsing {rel_path} with {parser_name}",
+            },
+        )
+    )
+    parsed = parser(path, config)
+    if parsed is None:
+        events.append(
+            (
+                "rag_index_skip",
+                {
+                    "path": str(path),
+                    "reason": _skip_reason(path, config, doc_type_hint),
+                    "doc_type": doc_type_hint,
+                },
+            )
+        )
+        return _PreparedFile(status="unparsed", events=events)
+
+    events.append(
+        (
+            "rag_index_parsed",
+            {
+                "path": str(path),
+                "rel_path": rel_path,
+                "doc_type": parsed.doc_type,
+                "language": parsed.language,
+                "message": f"Parsed {rel_path} as {parsed.doc_type}",
+            },
+        )
+    )
+    file_hash = parsed.source.get("file_hash")
+    doc_group_id = make_doc_group_id(Path(rel_path))
+    chunker = chunker_registry.resolve(parsed.doc_type)
+    if not chunker:
+        events.append(
+            (
+                "rag_index_skip",
+                {"path": str(path), "reason": "no_chunker", "doc_type": parsed.doc_type},
+            )
+        )
+        return _PreparedFile(status="no_chunker", doc_type=parsed.doc_type, events=events)
+    chunker_name = _callable_name(chunker)
+    events.append(
+        (
+            "rag_index_chunker_selected",
+            {
+                "path": str(path),
+                "rel_path": rel_path,
+                "doc_type": parsed.doc_type,
+                "chunker": chunker_name,
+                "message": f"Chunking {rel_path} with {chunker_name}",
+            },
+        )
+    )
+    chunks = chunker(parsed, config)
+    events.append(
+        (
+            "rag_index_chunked",
+            {
+                "path": str(path),
+                "rel_path": rel_path,
+                "doc_type": parsed.doc_type,
+                "chunk_count": len(chunks),
+                "message": f"Chunked {rel_path}: {len(chunks)} chunks",
+            },
+        )
+    )
+
+    token_counter = TokenCounter(get_embedding_model(config))
+    chunk_counter = 0
+    records: list[tuple[str, str, dict[str, object], int]] = []
+    for chunk_index, chunk in enumerate(chunks):
+        text = chunk.text.strip()
+        if not text:
+            continue
+
+        source = chunk.source or parsed.doc_type
+        page = None
+        if chunk.metadata:
+            page = chunk.metadata.get("page_number") or chunk.metadata.get("page")
+
+        base_metadata: dict[str, object] = {
+            "path": rel_path,
+            "doc_type": parsed.doc_type,
+            "language": parsed.language,
+            "file_hash": file_hash,
+            "source": source,
+            "doc_group_id": chunk.doc_group_id or doc_group_id,
+            "parser_version": PARSER_VERSION,
+            "chunker_version": CHUNKER_VERSION,
+            "parser_signature": parser_sig,
+            "chunker_signature": chunker_sig,
+            "original_chunk_index": chunk_index,
+        }
+        if chunk.start_line is not None:
+            base_metadata["start_line"] = chunk.start_line
+        if chunk.end_line is not None:
+            base_metadata["end_line"] = chunk.end_line
+        if chunk.start_offset is not None:
+            base_metadata["start_offset"] = chunk.start_offset
+        if chunk.end_offset is not None:
+            base_metadata["end_offset"] = chunk.end_offset
+        if chunk.metadata:
+            base_metadata.update(chunk.metadata)
+        if source_meta:
+            base_metadata.update(source_meta)
+
+        parts = token_counter.split(text, max_input_tokens)
+        if len(parts) > 1:
+            events.append(
+                (
+                    "rag_index_chunk_split",
+                    {
+                        "path": str(path),
+                        "doc_type": parsed.doc_type,
+                        "original_tokens": sum(token_count for _, token_count in parts),
+                        "split_count": len(parts),
+                    },
+                )
+            )
+
+        for part_index, (part_text, token_count) in enumerate(parts):
+            if token_count <= 0:
+                continue
+
+            metadata = dict(base_metadata)
+            metadata["chunk_index"] = chunk_counter
+            if len(parts) > 1:
+                metadata["split_index"] = part_index
+                metadata["split_count"] = len(parts)
+
+            doc_id = make_chunk_id(Path(rel_path), str(source), page, chunk_counter)
+            records.append((doc_id, part_text, metadata, token_count))
+            chunk_counter += 1
+
+    return _PreparedFile(
+        status="chunked",
+        doc_type=parsed.doc_type,
+        records=records,
+        events=events,
+    )
+
+
 def index_paths(
     collection,
     config: RagConfig,
@@ -241,10 +495,10 @@ def index_paths(
     documents: list[str] = []
     metadatas: list[dict] = []
     batch_rel_paths: list[str] = []
+    batch_token_counts: list[int] = []
     batch_token_total = 0
     file_embed_state: dict[str, dict[str, int]] = {}
     embed_parallel_requests = max(1, int(getattr(config, "embed_parallel_requests", 1)))
-    token_counter = TokenCounter(get_embedding_model(config))
     max_request_tokens = int(config.embed_max_tokens_per_request * 0.95)
     max_input_tokens = config.embed_max_tokens_per_input
     target_tokens_per_minute = max(0, int(config.embed_target_tokens_per_minute))
@@ -269,6 +523,20 @@ def index_paths(
         else None
     )
     embed_thread_local = threading.local()
+    try:
+        embed_cache = open_embedding_cache(config)
+    except (OSError, sqlite3.Error) as exc:
+        # The cache only saves provider calls; index without it.
+        log_event(
+            "rag_index_embed_cache_unavailable",
+            path=str(getattr(config, "embed_cache_path", "") or ""),
+            error=str(exc),
+            message=f"Embedding cache unavailable, embedding without it: {exc}",
+        )
+        embed_cache = None
+    embed_cache_provider = get_embedding_provider(config)
+    embed_cache_model = get_embedding_model(config)
+    lexical_index = open_lexical_index(config)
     in_flight_batches: dict[Future[None], tuple[dict[str, int], int, int]] = {}
 
     total_files = 0
@@ -276,8 +544,6 @@ def index_paths(
     skipped_files = 0
     files_by_type: dict[str, int] = {}
     chunks_by_type: dict[str, int] = {}
-    parser_registry = build_parser_registry()
-    chunker_registry = build_chunker_registry()
     parser_sig = parser_signature(config, PARSER_VERSION)
     chunker_sig = chunker_signature(config, CHUNKER_VERSION)
     path_total = len(paths)
@@ -304,6 +570,48 @@ def index_paths(
         embed_thread_local.collection = worker_collection
         return worker_collection
 
+    def _embedding_function_for_worker():
+        cached = getattr(embed_thread_local, "embedding_function", None)
+        if cached is not None:
+            return cached
+        embedding_function = _get_embedding_function(config)
+        embed_thread_local.embedding_function = embedding_function
+        return embedding_function
+
+    def _resolve_batch_embeddings(
+        batch_documents: list[str],
+        batch_hashes: list[str],
+        cached_vectors: dict[str, list[float]],
+    ) -> list[list[float]]:
+        missing: dict[str, str] = {}
+        for digest, text in zip(batch_hashes, batch_documents):
+            if digest not in cached_vectors and digest not in missing:
+                missing[digest] = text
+        vectors = dict(cached_vectors)
+        if missing:
+            embedded = _embedding_function_for_worker()(list(missing.values()))
+            fresh = {
+                digest: [float(value) for value in vector]
+                for digest, vector in zip(missing, embedded)
+            }
+            dimensions = len(next(iter(fresh.values()), []))
+            # Cached vectors of another size predate a model change; embed
+            # them again so the batch upserts with one dimension.
+            outdated = {
+                digest: text
+                for digest, text in zip(batch_hashes, batch_documents)
+                if digest in cached_vectors and len(cached_vectors[digest]) != dimensions
+            }
+            if outdated:
+                reembedded = _embedding_function_for_worker()(list(outdated.values()))
+                fresh.update(
+                    (digest, [float(value) for value in vector])
+                    for digest, vector in zip(outdated, reembedded)
+                )
+            embed_cache.put_many(embed_cache_provider, embed_cache_model, fresh)
+            vectors.update(fresh)
+        return [vectors[digest] for digest in batch_hashes]
+
     def _apply_embedding_progress(embedded_by_path: dict[str, int]) -> None:
         if not on_file_embedding_progress:
             return
@@ -328,10 +636,19 @@ def index_paths(
         batch_metadatas: list[dict],
         batch_tokens: int,
         batch_items: int,
+        batch_hashes: list[str] | None = None,
+        cached_vectors: dict[str, list[float]] | None = None,
     ) -> None:
         attempt = 0
+        batch_embeddings = None
         while True:
             try:
+                if embed_cache is not None and batch_embeddings is None:
+                    batch_embeddings = _resolve_batch_embeddings(
+                        batch_documents,
+                        batch_hashes or [],
+                        cached_vectors or {},
+                    )
                 target_collection = collection
                 if embed_executor is not None:
                     target_collection = _collection_for_embed_worker()
@@ -340,7 +657,10 @@ def index_paths(
                     batch_ids,
                     batch_documents,
                     batch_metadatas,
+                    embeddings=batch_embeddings,
                 )
+                if lexical_index is not None:
+                    lexical_index.upsert(batch_ids, batch_documents, batch_metadatas)
                 return
             except Exception as exc:
                 if not _is_rate_limit_error(exc) or attempt >= max_retry_attempts:
@@ -385,17 +705,34 @@ def index_paths(
         embedded_by_path: dict[str, int] = {}
         for rel_path in batch_rel_paths:
             embedded_by_path[rel_path] = embedded_by_path.get(rel_path, 0) + 1
+        batch_hashes: list[str] | None = None
+        cached_vectors: dict[str, list[float]] | None = None
+        # Only texts missing from the embedding cache reach the provider, so
+        # only their tokens count against the request rate limits.
+        request_tokens = batch_tokens
+        if embed_cache is not None:
+            batch_hashes = [text_sha256(text) for text in batch_documents]
+            cached_vectors = embed_cache.get_many(
+                embed_cache_provider, embed_cache_model, batch_hashes
+            )
+            request_tokens = sum(
+                token_count
+                for digest, token_count in zip(batch_hashes, batch_token_counts)
+                if digest not in cached_vectors
+            )
         ids.clear()
         documents.clear()
         metadatas.clear()
         batch_rel_paths.clear()
+        batch_token_counts.clear()
         batch_token_total = 0
 
         if embed_executor is not None:
             while len(in_flight_batches) >= embed_parallel_requests:
                 _drain_in_flight(wait_all=False)
-            rate_limiter.wait_for_slot(batch_tokens)
-            rate_limiter.record(batch_tokens)
+            if request_tokens > 0:
+                rate_limiter.wait_for_slot(request_tokens)
+                rate_limiter.record(request_tokens)
             future = submit_with_log_context(
                 embed_executor,
                 _upsert_batch_with_retry,
@@ -404,6 +741,8 @@ def index_paths(
                 batch_metadatas=batch_metadatas,
                 batch_tokens=batch_tokens,
                 batch_items=batch_items,
+                batch_hashes=batch_hashes,
+                cached_vectors=cached_vectors,
             )
             in_flight_batches[future] = (embedded_by_path, batch_items, batch_tokens)
             log_event(
@@ -415,270 +754,246 @@ def index_paths(
             )
             return
 
-        rate_limiter.wait_for_slot(batch_tokens)
-        rate_limiter.record(batch_tokens)
+        if request_tokens > 0:
+            rate_limiter.wait_for_slot(request_tokens)
+            rate_limiter.record(request_tokens)
         _upsert_batch_with_retry(
             batch_ids=batch_ids,
             batch_documents=batch_documents,
             batch_metadatas=batch_metadatas,
             batch_tokens=batch_tokens,
             batch_items=batch_items,
+            batch_hashes=batch_hashes,
+            cached_vectors=cached_vectors,
         )
         _apply_embedding_progress(embedded_by_path)
 
-    for file_position, path in enumerate(paths, start=1):
-        if should_stop and should_stop():
-            break
-        rel_path = _relative_path(path, config) or path.as_posix()
-        emit_file_progress(rel_path, file_position, "start")
-        if _is_excluded(path, config):
-            log_event(
-                "rag_index_skip",
-                path=str(path),
-                reason="excluded",
-            )
-            emit_file_progress(rel_path, file_position, "skipped")
-            if on_file_result:
-                on_file_result(rel_path, False, None, 0)
-            continue
-
-        doc_type_hint = guess_doc_type(path)
+    prepare_workers = max(1, int(getattr(config, "index_parallel_workers", 1)))
+    prepare_executor = _build_prepare_executor(config, prepare_workers)
+    prefetch_limit = max(
+        1,
+        int(getattr(config, "index_prefetch_files", 0) or 0) or prepare_workers * 2,
+    )
+    pending_prepares: dict[int, Future[_PreparedFile]] = {}
+    next_prepare_index = 0
+    if prepare_executor is not None:
         log_event(
-            "rag_index_file_start",
-            path=str(path),
-            rel_path=rel_path,
-            doc_type=doc_type_hint,
-            message=f"Indexing {rel_path} ({doc_type_hint or 'unknown'})",
+            "rag_index_prepare_concurrency",
+            prepare_workers=prepare_workers,
+            prepare_executor=config.index_parse_executor,
+            prefetch_files=prefetch_limit,
+            message=(
+                f"Parsing and chunking with {prepare_workers} "
+                f"{config.index_parse_executor} worker(s), "
+                f"up to {prefetch_limit} file(s) ahead"
+            ),
         )
-        if not is_doc_type_enabled(config, doc_type_hint):
-            log_event(
-                "rag_index_skip",
-                path=str(path),
-                reason="disabled_doc_type",
-                doc_type=doc_type_hint,
-            )
-            emit_file_progress(rel_path, file_position, "skipped")
-            if on_file_result:
-                on_file_result(rel_path, False, None, 0)
-            continue
-
-        should_delete = delete_first
-        if not should_delete:
-            try:
-                existing = collection.get(where={"path": rel_path}, include=["metadatas"])
-                for meta in existing.get("metadatas", []) or []:
-                    if not meta:
-                        continue
-                    if (
-                        meta.get("parser_signature") != parser_sig
-                        or meta.get("chunker_signature") != chunker_sig
-                    ):
-                        should_delete = True
-                        break
-            except Exception:
-                pass
-
-        if should_delete:
-            try:
-                collection.delete(where={"path": rel_path})
-            except Exception:
-                pass
 
-        parser = parser_registry.resolve(path)
-        if not parser:
-            log_event(
-                "rag_index_skip",
-                path=str(path),
-                reason="no_parser",
-                doc_type=doc_type_hint,
-            )
-            emit_file_progress(rel_path, file_position, "skipped")
-            if on_file_result:
-                on_file_result(rel_path, False, None, 0)
-            continue
-        parser_name = _callable_name(parser)
-        log_event(
-            "rag_index_parser_selected",
-            path=str(path),
-            rel_path=rel_path,
-            doc_type=doc_type_hint,
-            parser=parser_name,
-            message=f"Parsing {rel_path} with {parser_name}",
+    def _submit_prepare(path: Path, rel_path: str) -> Future[_PreparedFile]:
+        args = (
+            path,
+            rel_path,
+            config,
+            parser_sig,
+            chunker_sig,
+            source_meta,
+            max_input_tokens,
         )
-        parsed = parser(path, config)
-        if parsed is None:
-            skipped_files += 1
+        if isinstance(prepare_executor, ProcessPoolExecutor):
+            return prepare_executor.submit(_prepare_file, *args)
+        return submit_with_log_context(prepare_executor, _prepare_file, *args)
+
+    def _fill_prepare_window(current_index: int) -> None:
+        # Parse and chunk ahead of the embedder, but never more than
+        # prefetch_limit files ahead so prepared records stay bounded in memory.
+        nonlocal next_prepare_index
+        if prepare_executor is None:
+            return
+        next_prepare_index = max(next_prepare_index, current_index)
+        while (
+            next_prepare_index < path_total
+            and next_prepare_index - current_index < prefetch_limit
+        ):
+            path = paths[next_prepare_index]
+            if _precheck_skip_reason(path, config) is None:
+                rel_path = _relative_path(path, config) or path.as_posix()
+                pending_prepares[next_prepare_index] = _submit_prepare(path, rel_path)
+            next_prepare_index += 1
+
+    try:
+        for file_index, path in enumerate(paths):
+            file_position = file_index + 1
+            if should_stop and should_stop():
+                break
+            _fill_prepare_window(file_index)
+            rel_path = _relative_path(path, config) or path.as_posix()
+            emit_file_progress(rel_path, file_position, "start")
+            precheck_reason = _precheck_skip_reason(path, config)
+            if precheck_reason == "excluded":
+                log_event(
+                    "rag_index_skip",
+                    path=str(path),
+                    reason="excluded",
+                )
+                emit_file_progress(rel_path, file_position, "skipped")
+                if on_file_result:
+                    on_file_result(rel_path, False, None, 0)
+                continue
+
+            doc_type_hint = guess_doc_type(path)
             log_event(
-                "rag_index_skip",
+                "rag_index_file_start",
                 path=str(path),
-                reason=_skip_reason(path, config, doc_type_hint),
+                rel_path=rel_path,
                 doc_type=doc_type_hint,
+                message=f"Indexing {rel_path} ({doc_type_hint or 'unknown'})",
             )
-            emit_file_progress(rel_path, file_position, "skipped")
-            if on_file_result:
-                on_file_result(rel_path, False, None, 0)
-            continue
+            if precheck_reason == "disabled_doc_type":
+                log_event(
+                    "rag_index_skip",
+                    path=str(path),
+                    reason="disabled_doc_type",
+                    doc_type=doc_type_hint,
+                )
+                emit_file_progress(rel_path, file_position, "skipped")
+                if on_file_result:
+                    on_file_result(rel_path, False, None, 0)
+                continue
 
-        total_files += 1
-        files_by_type[parsed.doc_type] = files_by_type.get(parsed.doc_type, 0) + 1
-        log_event(
-            "rag_index_parsed",
-            path=str(path),
-            rel_path=rel_path,
-            doc_type=parsed.doc_type,
-            language=parsed.language,
-            message=f"Parsed {rel_path} as {parsed.doc_type}",
-        )
-        file_hash = parsed.source.get("file_hash")
-        doc_group_id = make_doc_group_id(Path(rel_path))
-        chunker = chunker_registry.resolve(parsed.doc_type)
-        if not chunker:
-            skipped_files += 1
-            log_event(
-                "rag_index_skip",
-                path=str(path),
-                reason="no_chunker",
-                doc_type=parsed.doc_type,
-            )
-            emit_file_progress(rel_path, file_position, "skipped")
-            if on_file_result:
-                on_file_result(rel_path, False, None, 0)
-            continue
-        chunker_name = _callable_name(chunker)
-        log_event(
-            "rag_index_chunker_selected",
-            path=str(path),
-            rel_path=rel_path,
-            doc_type=parsed.doc_type,
-            chunker=chunker_name,
-            message=f"Chunking {rel_path} with {chunker_name}",
-        )
-        chunks = chunker(parsed, config)
-        log_event(
-            "rag_index_chunked",
-            path=str(path),
-            rel_path=rel_path,
-            doc_type=parsed.doc_type,
-            chunk_count=len(chunks),
-            message=f"Chunked {rel_path}: {len(chunks)} chunks",
-        )
-        chunk_counter = 0
-        file_records: list[tuple[str, str, dict[str, object], int]] = []
+            should_delete = delete_first
+            if not should_delete:
+                try:
+                    existing = collection.get(where={"path": rel_path}, include=["metadatas"])
+                    for meta in existing.get("metadatas", []) or []:
+                        if not meta:
+                            continue
+                        if (
+                            meta.get("parser_signature") != parser_sig
+                            or meta.get("chunker_signature") != chunker_sig
+                        ):
+                            should_delete = True
+                            break
+                except Exception:
+                    pass
+
+            if should_delete:
+                try:
+                    collection.delete(where={"path": rel_path})
+                except Exception:
+                    pass
+                if lexical_index is not None:
+                    lexical_index.delete_paths([rel_path])
+
+            pending_prepare = pending_prepares.pop(file_index, None)
+            if pending_prepare is not None:
+                prepared = pending_prepare.result()
+            else:
+                prepared = _prepare_file(
+                    path,
+                    rel_path,
+                    config,
+                    parser_sig,
+                    chunker_sig,
+                    source_meta,
+                    max_input_tokens,
+                )
+            for event, fields in prepared.events:
+                log_event(event, **fields)
 
-        for chunk_index, chunk in enumerate(chunks):
-            text = chunk.text.strip()
-            if not text:
+            if prepared.status == "no_parser":
+                emit_file_progress(rel_path, file_position, "skipped")
+                if on_file_result:
+                    on_file_result(rel_path, False, None, 0)
+                continue
+            if prepared.status == "unparsed":
+                skipped_files += 1
+                emit_file_progress(rel_path, file_position, "skipped")
+                if on_file_result:
+                    on_file_result(rel_path, False, None, 0)
                 continue
 
-            source = chunk.source or parsed.doc_type
-            page = None
-            if chunk.metadata:
-                page = chunk.metadata.get("page_number") or chunk.metadata.get("page")
+            doc_type = prepared.doc_type or "unknown"
+            total_files += 1
+            files_by_type[doc_type] = files_by_type.get(doc_type, 0) + 1
+            if prepared.status == "no_chunker":
+                skipped_files += 1
+                emit_file_progress(rel_path, file_position, "skipped")
+                if on_file_result:
+                    on_file_result(rel_path, False, None, 0)
+                continue
 
-            base_metadata: dict[str, object] = {
-                "path": rel_path,
-                "doc_type": parsed.doc_type,
-                "language": parsed.language,
-                "file_hash": file_hash,
-                "source": source,
-                "doc_group_id": chunk.doc_group_id or doc_group_id,
-                "parser_version": PARSER_VERSION,
-                "chunker_version": CHUNKER_VERSION,
-                "parser_signature": parser_sig,
-                "chunker_signature": chunker_sig,
-                "original_chunk_index": chunk_index,
-            }
-            if chunk.start_line is not None:
-                base_metadata["start_line"] = chunk.start_line
-            if chunk.end_line is not None:
-                base_metadata["end_line"] = chunk.end_line
-            if chunk.start_offset is not None:
-                base_metadata["start_offset"] = chunk.start_offset
-            if chunk.end_offset is not None:
-                base_metadata["end_offset"] = chunk.end_offset
-            if chunk.metadata:
-                base_metadata.update(chunk.metadata)
-            if source_meta:
-                base_metadata.update(source_meta)
-
-            parts = token_counter.split(text, max_input_tokens)
-            if len(parts) > 1:
-                log_event(
-                    "rag_index_chunk_split",
-                    path=str(path),
-                    doc_type=parsed.doc_type,
-                    original_tokens=sum(token_count for _, token_count in parts),
-                    split_count=len(parts),
-                )
+            file_records = prepared.records
+            chunk_counter = len(file_records)
+            total_chunks += chunk_counter
+            if chunk_counter:
+                chunks_by_type[doc_type] = chunks_by_type.get(doc_type, 0) + chunk_counter
 
-            for part_index, (part_text, token_count) in enumerate(parts):
-                if token_count <= 0:
-                    continue
-
-                metadata = dict(base_metadata)
-                metadata["chunk_index"] = chunk_counter
-                if len(parts) > 1:
-                    metadata["split_index"] = part_index
-                    metadata["split_count"] = len(parts)
-
-                doc_id = make_chunk_id(Path(rel_path), str(source), page, chunk_counter)
-                file_records.append((doc_id, part_text, metadata, token_count))
-                chunk_counter += 1
-                total_chunks += 1
-                chunks_by_type[parsed.doc_type] = chunks_by_type.get(parsed.doc_type, 0) + 1
-
-        if on_file_embedding_progress:
-            on_file_embedding_progress(rel_path, 0, len(file_records))
-
-        if file_records:
-            file_embed_state[rel_path] = {
-                "embedded": 0,
-                "total": len(file_records),
-                "pending": 0,
-            }
+            if on_file_embedding_progress:
+                on_file_embedding_progress(rel_path, 0, len(file_records))
 
-        for doc_id, part_text, metadata, token_count in file_records:
-            if batch_token_total + token_count > max_request_tokens and ids:
-                flush_batch()
-            if token_count > max_request_tokens:
-                flush_batch()
-            ids.append(doc_id)
-            documents.append(part_text)
-            metadatas.append(metadata)
-            batch_rel_paths.append(rel_path)
-            batch_token_total += token_count
-            state = file_embed_state.get(rel_path)
-            if state:
-                state["pending"] += 1
-            if len(ids) >= max_batch_items:
-                flush_batch()
+            if file_records:
+                file_embed_state[rel_path] = {
+                    "embedded": 0,
+                    "total": len(file_records),
+                    "pending": 0,
+                }
 
-        log_event(
-            "rag_index_file_complete",
-            path=str(path),
-            rel_path=rel_path,
-            doc_type=parsed.doc_type,
-            chunks=chunk_counter,
-            message=f"Completed {rel_path}: {chunk_counter} chunks indexed",
-        )
-        emit_file_progress(rel_path, file_position, "complete")
-        if on_file_result:
-            on_file_result(rel_path, True, parsed.doc_type, chunk_counter)
-        if on_file_indexed:
-            on_file_indexed(
-                rel_path,
-                total_files,
-                total_chunks,
-                dict(files_by_type),
-                dict(chunks_by_type),
+            for doc_id, part_text, metadata, token_count in file_records:
+                if batch_token_total + token_count > max_request_tokens and ids:
+                    flush_batch()
+                if token_count > max_request_tokens:
+                    flush_batch()
+                ids.append(doc_id)
+                documents.append(part_text)
+                metadatas.append(metadata)
+                batch_rel_paths.append(rel_path)
+                batch_token_counts.append(token_count)
+                batch_token_total += token_count
+                state = file_embed_state.get(rel_path)
+                if state:
+                    state["pending"] += 1
+                if len(ids) >= max_batch_items:
+                    flush_batch()
+
+            log_event(
+                "rag_index_file_complete",
+                path=str(path),
+                rel_path=rel_path,
+                doc_type=doc_type,
+                chunks=chunk_counter,
+                message=f"Completed {rel_path}: {chunk_counter} chunks indexed",
             )
+            emit_file_progress(rel_path, file_position, "complete")
+            if on_file_result:
+                on_file_result(rel_path, True, doc_type, chunk_counter)
+            if on_file_indexed:
+                on_file_indexed(
+                    rel_path,
+                    total_files,
+                    total_chunks,
+                    dict(files_by_type),
+                    dict(chunks_by_type),
+                )
 
-    try:
         flush_batch()
         _drain_in_flight(wait_all=True)
     finally:
+        if prepare_executor is not None:
+            prepare_executor.shutdown(wait=True, cancel_futures=True)
         if embed_executor is not None:
             embed_executor.shutdown(wait=True, cancel_futures=False)
+        embed_cache_stats = embed_cache.stats() if embed_cache is not None else None
+        if embed_cache is not None:
+            embed_cache.close()
+    summary_fields: dict[str, object] = {}
+    if embed_cache_stats is not None:
+        summary_fields = {
+            "embed_cache_hits": embed_cache_stats["hits"],
+            "embed_cache_misses": embed_cache_stats["misses"],
+            "embed_cache_hit_rate": embed_cache_stats["hit_rate"],
+            "embed_cache_evictions": embed_cache_stats["evictions"],
+            "embed_cache_entries": embed_cache_stats["entries"],
+        }
     log_event(
         "rag_index_summary",
         total_files=total_files,
@@ -686,6 +1001,7 @@ def index_paths(
         skipped_files=skipped_files,
         files_by_type=files_by_type,
         chunks_by_type=chunks_by_type,
+        **summary_fields,
     )
     return total_files, total_chunks, files_by_type, chunks_by_type
 
@@ -750,6 +1066,7 @@ def main() -> int:
                     "source_name": source.name,
                     "source_kind": source.kind,
                 }
+                drive_sync = None
                 if source.kind == "github":
                     ensure_git_repo(source_config)
                     git_fetch_and_reset(source_config)
@@ -760,13 +1077,22 @@ def main() -> int:
                         raise RuntimeError("Google Drive source is missing local sync path.")
                     if not folder_id:
                         raise RuntimeError("Google Drive source is missing folder ID.")
-                    sync_folder(
+                    manifest, change_token = load_drive_manifest(source.id)
+                    drive_sync = sync_folder_incremental(
                         service_account_json,
                         folder_id,
                         Path(local_dir),
+                        manifest=manifest,
+                        change_token=change_token,
                         max_workers=max(1, int(source_config.drive_sync_workers)),
                     )
                 ingest(source_config, reset=args.reset, source_meta=source_meta)
+                if drive_sync is not None:
+                    save_drive_manifest(
+                        source.id,
+                        drive_sync.manifest,
+                        change_token=drive_sync.change_token,
+                    )
         else:
             ingest(config, reset=args.reset)
     except Exception as exc:
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Any, Sequence
+
+from rag.engine.sqlite_utils import connect_shared_sqlite
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    rowid INTEGER PRIMARY KEY,
+    chunk_id TEXT NOT NULL UNIQUE,
+    path TEXT,
+    document TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_chunks_path ON chunks (path);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+    document,
+    content='chunks',
+    content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS chunks_ai AFTER INSERT ON chunks BEGIN
+    INSERT INTO chunks_fts(rowid, document) VALUES (new.rowid, new.document);
+END;
+CREATE TRIGGER IF NOT EXISTS chunks_ad AFTER DELETE ON chunks BEGIN
+    INSERT INTO chunks_fts(chunks_fts, rowid, document)
+        VALUES ('delete', old.rowid, old.document);
+END;
+"""
+_DROP_SCHEMA = """
+DROP TRIGGER IF EXISTS chunks_ai;
+DROP TRIGGER IF EXISTS chunks_ad;
+DROP TABLE IF EXISTS chunks_fts;
+DROP TABLE IF EXISTS chunks;
+"""
+_QUERY_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_MAX_QUERY_TOKENS = 32
+_DELETE_CHUNK_SIZE = 400
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+_indexes_lock = threading.Lock()
+_indexes: dict[str, tuple[int, "LexicalIndex"]] = {}
+
+
+def lexical_match_query(text: str) -> str | None:
+    """Build an FTS5 OR-query from the words in ``text``.
+
+    Each word is quoted so identifiers such as ``parse_pdf`` or ``ERR-42``
+    match as adjacent tokens instead of being parsed as FTS5 syntax.
+    """
+    tokens: list[str] = []
+    seen: set[str] = set()
+    for match in _QUERY_TOKEN_RE.finditer(str(text or "").lower()):
+        token = match.group(0)
+        if token in seen:
+            continue
+        seen.add(token)
+        tokens.append(f'"{token}"')
+        if len(tokens) >= _MAX_QUERY_TOKENS:
+            break
+    return " OR ".join(tokens) if tokens else None
+
+
+class LexicalIndex:
+    """BM25 index over the chunk ids and texts that index_paths writes to Chroma.
+
+    Each collection gets one SQLite FTS5 file, shared by indexing workers and
+    retrieval in other processes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = connect_shared_sqlite(self.path, _SCHEMA)
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        documents: Sequence[str],
+        metadatas: Sequence[dict[str, Any] | None],
+    ) -> None:
+        rows = [
+            (
+                str(chunk_id),
+                str((metadata or {}).get("path") or "") or None,
+                str(document or ""),
+                json.dumps(metadata or {}, separators=(",", ":"), default=str),
+            )
+            for chunk_id, document, metadata in zip(ids, documents, metadatas)
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                # REPLACE deletes the old row first, which fires the FTS
+                # delete trigger before the insert trigger re-adds it.
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO chunks (chunk_id, path, document, metadata) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def delete_paths(self, paths: Sequence[str]) -> None:
+        unique_paths = [path for path in dict.fromkeys(paths) if path]
+        if not unique_paths:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for start in range(0, len(unique_paths), _DELETE_CHUNK_SIZE):
+                    chunk = unique_paths[start : start + _DELETE_CHUNK_SIZE]
+                    placeholders = ",".join("?" for _ in chunk)
+                    self._conn.execute(
+                        f"DELETE FROM chunks WHERE path IN ({placeholders})",
+                        chunk,
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def reset(self) -> None:
+        with self._lock:
+            self._conn.executescript(_DROP_SCHEMA)
+            self._conn.executescript(_SCHEMA)
+
+    def search(self, text: str, limit: int) -> list[dict[str, Any]]:
+        """Return up to ``limit`` chunks ranked by BM25 (best first)."""
+        match_query = lexical_match_query(text)
+        if not match_query or limit <= 0:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT chunks.chunk_id, chunks.document, chunks.metadata, "
+                "bm25(chunks_fts) AS rank "
+                "FROM chunks_fts JOIN chunks ON chunks.rowid = chunks_fts.rowid "
+                "WHERE chunks_fts MATCH ? ORDER BY rank LIMIT ?",
+                (match_query, int(limit)),
+            ).fetchall()
+        hits: list[dict[str, Any]] = []
+        for chunk_id, document, raw_metadata, rank in rows:
+            try:
+                metadata = json.loads(raw_metadata)
+            except (TypeError, ValueError):
+                metadata = {}
+            hits.append(
+                {
+                    "id": chunk_id,
+                    "document": document,
+                    "metadata": metadata if isinstance(metadata, dict) else {},
+                    # FTS5 reports BM25 negated so that smaller sorts first.
+                    "bm25": -float(rank),
+                }
+            )
+        return hits
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def lexical_index_path(config, collection_name: str) -> Path:
+    safe_name = _SAFE_NAME_RE.sub("_", str(collection_name or "").strip()) or "default"
+    return Path(config.lexical_index_dir) / f"{safe_name}.sqlite3"
+
+
+def open_lexical_index(config, collection_name: str | None = None) -> LexicalIndex | None:
+    """Return the shared lexical index for a collection, or ``None`` if disabled.
+
+    Handles are cached per process; a forked worker opens its own connection
+    instead of reusing the parent's.
+    """
+    if not bool(getattr(config, "lexical_index_enabled", False)):
+        return None
+    if not getattr(config, "lexical_index_dir", None):
+        return None
+    path = lexical_index_path(config, collection_name or config.collection)
+    key = str(path)
+    pid = os.getpid()
+    with _indexes_lock:
+        cached = _indexes.get(key)
+        if cached is not None and cached[0] == pid:
+            return cached[1]
+        index = LexicalIndex(path)
+        _indexes[key] = (pid, index)
+        return index
+
+
+def reset_lexical_index(config, collection_name: str | None = None) -> None:
+    # Tables are dropped in place rather than deleting the file, so other
+    # processes holding the index open see the reset too.
+    index = open_lexical_index(config, collection_name)
+    if index is not None:
+        index.reset()
+
+
+def delete_lexical_paths(
+    config,
+    paths: Sequence[str],
+    collection_name: str | None = None,
+) -> None:
+    index = open_lexical_index(config, collection_name)
+    if index is not None:
+        index.delete_paths(paths)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from rag.engine.sqlite_utils import connect_shared_sqlite
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ocr_cache (
+    cache_key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_ocr_cache_last_used_at
+    ON ocr_cache (last_used_at);
+"""
+
+
+def ocr_cache_key(
+    file_hash: str,
+    page_index: int,
+    *,
+    lang: str,
+    dpi: int,
+    include_char_boxes: bool,
+) -> str:
+    raw = json.dumps(
+        {
+            "file_hash": file_hash,
+            "page_index": int(page_index),
+            "lang": lang,
+            "dpi": int(dpi),
+            "include_char_boxes": bool(include_char_boxes),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class OcrCache:
+    """LRU cache of page OCR layers in a SQLite file.
+
+    Entries are keyed by the PDF content hash, page index and the settings
+    that change tesseract's output, so re-indexing an unchanged PDF (or the
+    same PDF under another source) reuses earlier results. Page workers in
+    other processes open the same file.
+    """
+
+    def __init__(self, path: Path, *, max_entries: int) -> None:
+        self.path = Path(path)
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._conn = connect_shared_sqlite(self.path, _SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def get(self, cache_key: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM ocr_cache WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            try:
+                payload = json.loads(row[0])
+            except (TypeError, ValueError):
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE ocr_cache SET last_used_at = ? WHERE cache_key = ?",
+                (time.time(), cache_key),
+            )
+            self.hits += 1
+        return payload if isinstance(payload, dict) else None
+
+    def put(self, cache_key: str, payload: dict[str, Any]) -> None:
+        encoded = json.dumps(payload, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ocr_cache "
+                    "(cache_key, payload, last_used_at) VALUES (?, ?, ?)",
+                    (cache_key, encoded, time.time()),
+                )
+                self.writes += 1
+                overflow = (
+                    int(self._conn.execute("SELECT COUNT(*) FROM ocr_cache").fetchone()[0])
+                    - self.max_entries
+                )
+                if overflow > 0:
+                    self._conn.execute(
+                        "DELETE FROM ocr_cache WHERE rowid IN ("
+                        "SELECT rowid FROM ocr_cache "
+                        "ORDER BY last_used_at ASC LIMIT ?)",
+                        (overflow,),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_ocr_cache(config) -> OcrCache | None:
+    if not bool(getattr(config, "ocr_cache_enabled", False)):
+        return None
+    cache_path = getattr(config, "ocr_cache_path", None)
+    if not cache_path:
+        return None
+    return OcrCache(
+        Path(cache_path),
+        max_entries=int(getattr(config, "ocr_cache_max_entries", 0) or 0),
+    )
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import hashlib
 import json
+import multiprocessing
 import re
+import sqlite3
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from rag.engine.config import RagConfig, max_file_bytes_for
 from rag.engine.logging_utils import log_event, submit_with_log_context
+from rag.engine.ocr_cache import OcrCache, ocr_cache_key, open_ocr_cache
 from rag.engine.pipeline import ParsedDocument
 
 try:
@@ -365,155 +368,289 @@ def _json_friendly(value: Any) -> Any:
     return str(value)
 
 
-def _parse_single_pdf_page(
+def _run_page_ocr(
+    page,
     path: Path,
-    page_index: int,
-    total_pages: int,
+    page_number: int,
     config: RagConfig,
-) -> tuple[int, dict[str, Any]]:
-    page_number = page_index + 1
-    doc = fitz.open(path)
+    *,
+    emit: Callable[..., None],
+) -> dict[str, Any] | None:
+    """OCR one rendered page; ``None`` when tesseract failed or timed out."""
+    pix = page.get_pixmap(dpi=max(72, int(config.ocr_dpi)))
+    image = _pixmap_to_image(pix)
     try:
-        page = doc.load_page(page_index)
-        log_event(
-            "rag_pdf_page_start",
-            path=str(path),
-            page_number=page_number,
-            total_pages=total_pages,
-            message=f"PDF page {page_number}/{total_pages}: extract text layer",
-        )
-        text_layer = _extract_text_layer(page)
-        text_len = len(text_layer.get("text", "") or "")
-        log_event(
-            "rag_pdf_text_layer_complete",
-            path=str(path),
-            page_number=page_number,
-            text_chars=text_len,
-            message=f"PDF page {page_number}: text layer {text_len} chars",
+        return _ocr_page(
+            image,
+            lang=config.ocr_lang,
+            timeout_s=max(0, int(config.ocr_timeout_s)),
+            include_char_boxes=bool(config.ocr_include_char_boxes),
         )
-        page_has_images = _page_has_embedded_image(page, text_layer)
-        ocr_layer = {"text": "", "word_boxes": [], "char_boxes": []}
-        if config.ocr_enabled and page_has_images:
-            log_event(
-                "rag_pdf_ocr_start",
+    except RuntimeError as exc:
+        if "timeout" in str(exc).lower():
+            emit(
+                "rag_pdf_ocr_timeout",
                 path=str(path),
                 page_number=page_number,
-                ocr_lang=config.ocr_lang,
-                message=f"PDF page {page_number}: OCR start (lang={config.ocr_lang})",
+                timeout_s=max(0, int(config.ocr_timeout_s)),
+                message=(
+                    f"PDF page {page_number}: OCR timed out after "
+                    f"{max(0, int(config.ocr_timeout_s))}s"
+                ),
             )
-            pix = page.get_pixmap(dpi=max(72, int(config.ocr_dpi)))
-            image = _pixmap_to_image(pix)
-            try:
-                ocr_layer = _ocr_page(
-                    image,
-                    lang=config.ocr_lang,
-                    timeout_s=max(0, int(config.ocr_timeout_s)),
-                    include_char_boxes=bool(config.ocr_include_char_boxes),
-                )
-            except RuntimeError as exc:
-                if "timeout" in str(exc).lower():
-                    log_event(
-                        "rag_pdf_ocr_timeout",
-                        path=str(path),
-                        page_number=page_number,
-                        timeout_s=max(0, int(config.ocr_timeout_s)),
-                        message=(
-                            f"PDF page {page_number}: OCR timed out after "
-                            f"{max(0, int(config.ocr_timeout_s))}s"
-                        ),
-                    )
-                else:
-                    log_event(
-                        "rag_pdf_ocr_error",
-                        path=str(path),
-                        page_number=page_number,
-                        error=str(exc),
-                        message=f"PDF page {page_number}: OCR failed ({exc})",
-                    )
-            finally:
-                del pix
-            ocr_text_len = len(ocr_layer.get("text", "") or "")
-            word_boxes = ocr_layer.get("word_boxes", [])
-            log_event(
-                "rag_pdf_ocr_complete",
-                path=str(path),
-                page_number=page_number,
-                ocr_chars=ocr_text_len,
-                ocr_words=len(word_boxes) if isinstance(word_boxes, list) else 0,
-                message=f"PDF page {page_number}: OCR done ({ocr_text_len} chars)",
-            )
-        elif config.ocr_enabled:
-            log_event(
-                "rag_pdf_ocr_skipped_no_image",
+        else:
+            emit(
+                "rag_pdf_ocr_error",
                 path=str(path),
                 page_number=page_number,
-                message=f"PDF page {page_number}: OCR skipped (no images detected)",
+                error=str(exc),
+                message=f"PDF page {page_number}: OCR failed ({exc})",
             )
+        return None
+    finally:
+        del pix
 
-        drawings = page.get_drawings()
-        vector_stats = _summarize_vector_geometry(drawings)
-        capture_vectors, vector_reason = _should_capture_vector_payload(vector_stats)
-        log_event(
-            "rag_pdf_vector_gate",
+
+def _parse_pdf_page(
+    page,
+    path: Path,
+    page_index: int,
+    total_pages: int,
+    config: RagConfig,
+    *,
+    file_hash: str,
+    ocr_cache: OcrCache | None,
+    emit: Callable[..., None],
+) -> tuple[int, dict[str, Any]]:
+    page_number = page_index + 1
+    emit(
+        "rag_pdf_page_start",
+        path=str(path),
+        page_number=page_number,
+        total_pages=total_pages,
+        message=f"PDF page {page_number}/{total_pages}: extract text layer",
+    )
+    text_layer = _extract_text_layer(page)
+    text_len = len(text_layer.get("text", "") or "")
+    emit(
+        "rag_pdf_text_layer_complete",
+        path=str(path),
+        page_number=page_number,
+        text_chars=text_len,
+        message=f"PDF page {page_number}: text layer {text_len} chars",
+    )
+    page_has_images = _page_has_embedded_image(page, text_layer)
+    ocr_layer = {"text": "", "word_boxes": [], "char_boxes": []}
+    if config.ocr_enabled and page_has_images:
+        emit(
+            "rag_pdf_ocr_start",
             path=str(path),
             page_number=page_number,
-            capture_vectors=capture_vectors,
-            vector_reason=vector_reason,
-            primitive_count=vector_stats.get("primitive_count", 0),
-            line_count=vector_stats.get("line_count", 0),
-            rect_count=vector_stats.get("rect_count", 0),
-            curve_count=vector_stats.get("curve_count", 0),
-            quad_count=vector_stats.get("quad_count", 0),
-            non_axis_line_count=vector_stats.get("non_axis_line_count", 0),
-            message=(
-                f"PDF page {page_number}: vector payload "
-                f"{'enabled' if capture_vectors else 'skipped'} ({vector_reason})"
-            ),
+            ocr_lang=config.ocr_lang,
+            message=f"PDF page {page_number}: OCR start (lang={config.ocr_lang})",
         )
-        if capture_vectors:
-            primitives = _build_vector_primitives(drawings)
-            drawings_serialized = _json_friendly(drawings)
+        cache_key = None
+        cached_layer = None
+        if ocr_cache is not None:
+            cache_key = ocr_cache_key(
+                file_hash,
+                page_index,
+                lang=config.ocr_lang,
+                dpi=max(72, int(config.ocr_dpi)),
+                include_char_boxes=bool(config.ocr_include_char_boxes),
+            )
+            cached_layer = ocr_cache.get(cache_key)
+        if cached_layer is not None:
+            ocr_layer = cached_layer
+            emit(
+                "rag_pdf_ocr_cache_hit",
+                path=str(path),
+                page_number=page_number,
+                message=f"PDF page {page_number}: OCR result reused from cache",
+            )
         else:
-            primitives = []
-            drawings_serialized = []
-
-        tables = _extract_tables(ocr_layer.get("word_boxes", []))
-        log_event(
-            "rag_pdf_vectors_complete",
+            ocr_layer = _run_page_ocr(
+                page,
+                path,
+                page_number,
+                config,
+                emit=emit,
+            )
+            if ocr_layer is not None and cache_key is not None:
+                ocr_cache.put(cache_key, ocr_layer)
+        if ocr_layer is None:
+            ocr_layer = {"text": "", "word_boxes": [], "char_boxes": []}
+        ocr_text_len = len(ocr_layer.get("text", "") or "")
+        word_boxes = ocr_layer.get("word_boxes", [])
+        emit(
+            "rag_pdf_ocr_complete",
             path=str(path),
             page_number=page_number,
-            drawing_count=vector_stats.get("drawing_count", 0),
-            primitive_count=len(primitives),
-            table_count=len(tables),
-            message=f"PDF page {page_number}: vectors {len(primitives)}, tables {len(tables)}",
+            ocr_chars=ocr_text_len,
+            ocr_words=len(word_boxes) if isinstance(word_boxes, list) else 0,
+            message=f"PDF page {page_number}: OCR done ({ocr_text_len} chars)",
         )
-        normalized_units = _normalize_units(
-            f"{text_layer.get('text','')} {ocr_layer.get('text','')}",
-            page_number,
-            "ocr",
-        )
-        log_event(
-            "rag_pdf_units_complete",
+    elif config.ocr_enabled:
+        emit(
+            "rag_pdf_ocr_skipped_no_image",
             path=str(path),
             page_number=page_number,
-            unit_count=len(normalized_units),
-            message=f"PDF page {page_number}: normalized {len(normalized_units)} units",
+            message=f"PDF page {page_number}: OCR skipped (no images detected)",
         )
 
-        return (
-            page_index,
-            {
-                "page_number": page_number,
-                "text_layer": text_layer,
-                "ocr": ocr_layer,
-                "vector_primitives": primitives,
-                "vector_raw": drawings_serialized,
-                "tables": tables,
-                "normalized_units": normalized_units,
-            },
+    drawings = page.get_drawings()
+    vector_stats = _summarize_vector_geometry(drawings)
+    capture_vectors, vector_reason = _should_capture_vector_payload(vector_stats)
+    emit(
+        "rag_pdf_vector_gate",
+        path=str(path),
+        page_number=page_number,
+        capture_vectors=capture_vectors,
+        vector_reason=vector_reason,
+        primitive_count=vector_stats.get("primitive_count", 0),
+        line_count=vector_stats.get("line_count", 0),
+        rect_count=vector_stats.get("rect_count", 0),
+        curve_count=vector_stats.get("curve_count", 0),
+        quad_count=vector_stats.get("quad_count", 0),
+        non_axis_line_count=vector_stats.get("non_axis_line_count", 0),
+        message=(
+            f"PDF page {page_number}: vector payload "
+            f"{'enabled' if capture_vectors else 'skipped'} ({vector_reason})"
+        ),
+    )
+    if capture_vectors:
+        primitives = _build_vector_primitives(drawings)
+        drawings_serialized = _json_friendly(drawings)
+    else:
+        primitives = []
+        drawings_serialized = []
+
+    tables = _extract_tables(ocr_layer.get("word_boxes", []))
+    emit(
+        "rag_pdf_vectors_complete",
+        path=str(path),
+        page_number=page_number,
+        drawing_count=vector_stats.get("drawing_count", 0),
+        primitive_count=len(primitives),
+        table_count=len(tables),
+        message=f"PDF page {page_number}: vectors {len(primitives)}, tables {len(tables)}",
+    )
+    normalized_units = _normalize_units(
+        f"{text_layer.get('text','')} {ocr_layer.get('text','')}",
+        page_number,
+        "ocr",
+    )
+    emit(
+        "rag_pdf_units_complete",
+        path=str(path),
+        page_number=page_number,
+        unit_count=len(normalized_units),
+        message=f"PDF page {page_number}: normalized {len(normalized_units)} units",
+    )
+
+    return (
+        page_index,
+        {
+            "page_number": page_number,
+            "text_layer": text_layer,
+            "ocr": ocr_layer,
+            "vector_primitives": primitives,
+            "vector_raw": drawings_serialized,
+            "tables": tables,
+            "normalized_units": normalized_units,
+        },
+    )
+
+
+def _open_ocr_cache(
+    config: RagConfig, path: Path, emit: Callable[..., None]
+) -> OcrCache | None:
+    try:
+        return open_ocr_cache(config)
+    except (OSError, sqlite3.Error) as exc:
+        # The cache only saves OCR passes; parse without it.
+        emit(
+            "rag_pdf_ocr_cache_unavailable",
+            path=str(path),
+            error=str(exc),
+            message=f"OCR cache unavailable for {path}, running OCR without it: {exc}",
         )
+        return None
+
+
+def _parse_pdf_page_range(
+    path: Path,
+    page_start: int,
+    page_stop: int,
+    total_pages: int,
+    config: RagConfig,
+    file_hash: str,
+    collect_events: bool = False,
+) -> tuple[list[tuple[int, dict[str, Any]]], list[tuple[str, dict[str, Any]]]]:
+    """Parse pages ``[page_start, page_stop)`` from a single open document.
+
+    With ``collect_events`` the log events are returned instead of emitted so
+    a parent process can replay them into its own log sink.
+    """
+    events: list[tuple[str, dict[str, Any]]] = []
+
+    def _collect(event: str, **fields: Any) -> None:
+        events.append((event, fields))
+
+    emit = _collect if collect_events else log_event
+    ocr_cache: OcrCache | None = None
+    doc = fitz.open(path)
+    try:
+        if config.ocr_enabled:
+            ocr_cache = _open_ocr_cache(config, path, emit)
+        pages = [
+            _parse_pdf_page(
+                doc.load_page(page_index),
+                path,
+                page_index,
+                total_pages,
+                config,
+                file_hash=file_hash,
+                ocr_cache=ocr_cache,
+                emit=emit,
+            )
+            for page_index in range(page_start, page_stop)
+        ]
     finally:
         doc.close()
+        if ocr_cache is not None:
+            ocr_cache.close()
+    return pages, events
+
+
+def _page_ranges(page_count: int, workers: int) -> list[tuple[int, int]]:
+    workers = max(1, min(workers, page_count))
+    size, remainder = divmod(page_count, workers)
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    for index in range(workers):
+        stop = start + size + (1 if index < remainder else 0)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _build_page_executor(config: RagConfig, workers: int):
+    if config.pdf_page_executor == "process":
+        if multiprocessing.current_process().daemon:
+            # Daemonic workers (e.g. Celery prefork children) cannot start
+            # child processes.
+            return ThreadPoolExecutor(max_workers=workers), "thread"
+        # Spawned workers avoid inheriting the parent's threads and locks.
+        return (
+            ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ),
+            "process",
+        )
+    return ThreadPoolExecutor(max_workers=workers), "thread"
 
 
 def parse_pdf(path: Path, config: RagConfig) -> ParsedDocument | None:
@@ -540,35 +677,44 @@ def parse_pdf(path: Path, config: RagConfig) -> ParsedDocument | None:
         path=str(path),
         pages=page_count,
         page_workers=page_workers,
-        message=f"Parsing PDF {path} ({page_count} pages, workers={page_workers})",
+        page_executor=config.pdf_page_executor,
+        message=(
+            f"Parsing PDF {path} ({page_count} pages, workers={page_workers}, "
+            f"executor={config.pdf_page_executor})"
+        ),
     )
 
     pages_by_index: dict[int, dict[str, Any]] = {}
     if page_count <= 1 or page_workers <= 1:
-        for index in range(page_count):
-            parsed_index, parsed_page = _parse_single_pdf_page(
-                path,
-                index,
-                page_count,
-                config,
-            )
-            pages_by_index[parsed_index] = parsed_page
+        parsed_pages, _ = _parse_pdf_page_range(path, 0, page_count, page_count, config, file_hash)
+        pages_by_index.update(parsed_pages)
     else:
-        with ThreadPoolExecutor(max_workers=page_workers) as executor:
-            futures = [
-                submit_with_log_context(
-                    executor,
-                    _parse_single_pdf_page,
+        # Each worker opens the document once and walks a contiguous page range.
+        executor, executor_kind = _build_page_executor(config, page_workers)
+        collect_events = executor_kind == "process"
+        with executor:
+            futures = []
+            for page_start, page_stop in _page_ranges(page_count, page_workers):
+                args = (
                     path,
-                    index,
+                    page_start,
+                    page_stop,
                     page_count,
                     config,
+                    file_hash,
+                    collect_events,
                 )
-                for index in range(page_count)
-            ]
-            for future in as_completed(futures):
-                parsed_index, parsed_page = future.result()
-                pages_by_index[parsed_index] = parsed_page
+                if collect_events:
+                    futures.append(executor.submit(_parse_pdf_page_range, *args))
+                else:
+                    futures.append(
+                        submit_with_log_context(executor, _parse_pdf_page_range, *args)
+                    )
+            for future in futures:
+                parsed_pages, events = future.result()
+                for event, fields in events:
+                    log_event(event, **fields)
+                pages_by_index.update(parsed_pages)
 
     pages = [pages_by_index[index] for index in range(page_count) if index in pages_by_index]
 
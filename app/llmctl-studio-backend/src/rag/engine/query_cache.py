@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Iterable
+
+
+def normalize_query_text(question: str) -> str:
+    return " ".join(str(question or "").split()).casefold()
+
+
+def query_cache_key(
+    question: str,
+    collections: Iterable[str],
+    top_k: int,
+    *,
+    embed_provider: str,
+    embed_model: str,
+    lexical_weight: float,
+    source_versions: Iterable[tuple[Any, Any]],
+) -> str:
+    raw = json.dumps(
+        {
+            "question": normalize_query_text(question),
+            "collections": sorted({str(name).lower() for name in collections}),
+            "top_k": int(top_k),
+            "embed_provider": str(embed_provider or ""),
+            "embed_model": str(embed_model or ""),
+            "lexical_weight": round(float(lexical_weight or 0.0), 4),
+            "sources": sorted(
+                [str(source_id), _version_token(indexed_at)]
+                for source_id, indexed_at in source_versions
+            ),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _version_token(value: Any) -> str:
+    if value is None:
+        return ""
+    isoformat = getattr(value, "isoformat", None)
+    if callable(isoformat):
+        return str(isoformat())
+    return str(value)
+
+
+class QueryResultCache:
+    """In-process LRU/TTL cache of retrieval contract results.
+
+    Results are keyed by each source's ``last_indexed_at``, so a re-index
+    produces a new key and stale entries simply age out of the LRU.
+    """
+
+    def __init__(self, *, max_entries: int = 256, ttl_s: float = 300.0) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_s = max(0.0, float(ttl_s))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._hit_ms_total = 0.0
+        self._miss_ms_total = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_s > 0
+
+    def configure(self, *, max_entries: int, ttl_s: float) -> None:
+        with self._lock:
+            self.max_entries = max(0, int(max_entries))
+            self.ttl_s = max(0.0, float(ttl_s))
+            self._evict_locked()
+
+    def get(self, key: str) -> Any | None:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            value, expires_at = cached
+            if expires_at <= now:
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (stored, time.monotonic() + self.ttl_s)
+            self._entries.move_to_end(key)
+            self._evict_locked()
+
+    def record(self, *, hit: bool, elapsed_ms: float) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+                self._hit_ms_total += max(0.0, float(elapsed_ms))
+            else:
+                self._misses += 1
+                self._miss_ms_total += max(0.0, float(elapsed_ms))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_s": self.ttl_s,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "avg_hit_ms": (
+                    round(self._hit_ms_total / self._hits, 2) if self._hits else None
+                ),
+                "avg_miss_ms": (
+                    round(self._miss_ms_total / self._misses, 2)
+                    if self._misses
+                    else None
+                ),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._hit_ms_total = 0.0
+            self._miss_ms_total = 0.0
+
+    def _evict_locked(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
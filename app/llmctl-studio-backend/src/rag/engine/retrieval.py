@@ -1,62 +1,355 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, wait
+import hashlib
+import threading
+import time
 from typing import Any
 
 from rag.engine.chromadb_loader import import_chromadb
-from rag.providers.adapters import build_embedding_function
+from rag.engine.lexical_index import open_lexical_index
+from rag.engine.logging_utils import log_event
+from rag.providers.adapters import (
+    build_embedding_function,
+    get_embedding_api_key,
+    get_embedding_model,
+    get_embedding_provider,
+)
+
+_DEFAULT_HANDLE_TTL_S = 300.0
+_QUERY_POOL_MAX_WORKERS = 8
+# Standard reciprocal-rank-fusion damping constant.
+_RRF_K = 60
+# Each retriever contributes this many candidates per requested result so the
+# fused ranking has hits to promote from beyond the other retriever's top_k.
+_HYBRID_CANDIDATE_MULTIPLIER = 2
+
+_handle_lock = threading.Lock()
+_clients: dict[tuple[str, int], tuple[Any, float]] = {}
+_embedding_functions: dict[tuple[str, str, str], tuple[Any, float]] = {}
+_collection_handles: dict[tuple[str, int, str, str, str], tuple[Any, float]] = {}
+_query_pool: ThreadPoolExecutor | None = None
+
+
+def _handle_ttl_s(config) -> float:
+    try:
+        return max(0.0, float(getattr(config, "retrieval_handle_ttl_s", _DEFAULT_HANDLE_TTL_S)))
+    except (TypeError, ValueError):
+        return _DEFAULT_HANDLE_TTL_S
+
+
+def _cached_handle(cache: dict, key, ttl_s: float, factory):
+    now = time.monotonic()
+    with _handle_lock:
+        cached = cache.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+    value = factory()
+    with _handle_lock:
+        cache[key] = (value, now + ttl_s)
+    return value
+
+
+def _embedding_function_key(config) -> tuple[str, str, str]:
+    provider = get_embedding_provider(config)
+    api_key = get_embedding_api_key(config)
+    key_fingerprint = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return provider, get_embedding_model(config), key_fingerprint
+
+
+def invalidate_collection_handles(collection_name: str | None = None) -> None:
+    with _handle_lock:
+        if collection_name is None:
+            _collection_handles.clear()
+            return
+        for key in [key for key in _collection_handles if key[2] == collection_name]:
+            _collection_handles.pop(key, None)
+
+
+def _get_query_pool() -> ThreadPoolExecutor:
+    global _query_pool
+    with _handle_lock:
+        if _query_pool is None:
+            _query_pool = ThreadPoolExecutor(
+                max_workers=_QUERY_POOL_MAX_WORKERS,
+                thread_name_prefix="rag-retrieval",
+            )
+        return _query_pool
 
 
 def get_collections(config, sources) -> list[dict[str, Any]]:
     chromadb = import_chromadb()
 
-    client = chromadb.HttpClient(host=config.chroma_host, port=config.chroma_port)
-    embedding_fn = build_embedding_function(config)
+    ttl_s = _handle_ttl_s(config)
+    host = config.chroma_host
+    port = int(config.chroma_port)
+    client = _cached_handle(
+        _clients,
+        (host, port),
+        ttl_s,
+        lambda: chromadb.HttpClient(host=host, port=port),
+    )
+    embedding_key = _embedding_function_key(config)
+    embedding_fn = _cached_handle(
+        _embedding_functions,
+        embedding_key,
+        ttl_s,
+        lambda: build_embedding_function(config),
+    )
+    lexical_weight = float(getattr(config, "retrieval_lexical_weight", 0.0) or 0.0)
     collections: list[dict[str, Any]] = []
     for source in sources:
         collection_name = getattr(source, "collection", None)
         if not collection_name:
             continue
-        collection = client.get_or_create_collection(
-            name=collection_name,
-            embedding_function=embedding_fn,
+        handle_key = (host, port, collection_name, embedding_key[0], embedding_key[1])
+
+        def _open_collection(name=collection_name):
+            return client.get_or_create_collection(
+                name=name,
+                embedding_function=embedding_fn,
+            )
+
+        collection = _cached_handle(_collection_handles, handle_key, ttl_s, _open_collection)
+        lexical_index = None
+        if lexical_weight > 0:
+            lexical_index = open_lexical_index(config, collection_name)
+        collections.append(
+            {
+                "source": source,
+                "collection": collection,
+                "embedding_function": embedding_fn,
+                "reopen": _open_collection,
+                "handle_key": handle_key,
+                "lexical_index": lexical_index,
+                "lexical_weight": lexical_weight,
+            }
         )
-        collections.append({"source": source, "collection": collection})
     return collections
 
 
+def _is_stale_collection_error(exc: Exception) -> bool:
+    # chromadb raises NotFoundError (1.x) or InvalidCollectionException (0.5)
+    # for a collection id that no longer exists; match by name and message so
+    # the check does not import chromadb.
+    if type(exc).__name__ in {"NotFoundError", "InvalidCollectionException"}:
+        return True
+    message = str(exc).lower()
+    return "collection" in message and "does not exist" in message
+
+
+def _query_collection(entry: dict[str, Any], query_kwargs: dict[str, Any]) -> dict[str, Any]:
+    collection = entry.get("collection")
+    try:
+        return collection.query(**query_kwargs)
+    except Exception as exc:
+        reopen = entry.get("reopen")
+        if reopen is None or not _is_stale_collection_error(exc):
+            raise
+    # The cached handle can point at a collection that was deleted and
+    # recreated by a fresh index; reopen it once before giving up.
+    collection = reopen()
+    handle_key = entry.get("handle_key")
+    if handle_key is not None:
+        with _handle_lock:
+            cached = _collection_handles.get(handle_key)
+            expires_at = cached[1] if cached else time.monotonic()
+            _collection_handles[handle_key] = (collection, expires_at)
+    return collection.query(**query_kwargs)
+
+
+def _annotate_source(meta: dict[str, Any], source: Any) -> None:
+    if not source:
+        return
+    meta.setdefault("source_id", getattr(source, "id", None))
+    meta.setdefault("source_name", getattr(source, "name", None))
+    meta.setdefault("source_kind", getattr(source, "kind", None))
+    meta.setdefault("collection", getattr(source, "collection", None))
+
+
+def _search_lexical(entry: dict[str, Any], message: str, limit: int) -> list[dict[str, Any]]:
+    lexical_index = entry.get("lexical_index")
+    if lexical_index is None:
+        return []
+    try:
+        return lexical_index.search(message, limit)
+    except Exception as exc:
+        # Lexical hits only refine the ranking; fall back to vector results.
+        log_event(
+            "rag_retrieval_lexical_error",
+            collection=getattr(entry.get("source"), "collection", None),
+            error=str(exc),
+        )
+        return []
+
+
+def _fuse_rankings(
+    vector_ranked: list[tuple[tuple[Any, str], str, dict[str, Any]]],
+    lexical_ranked: list[tuple[tuple[Any, str], str, dict[str, Any]]],
+    *,
+    lexical_weights: dict[Any, float],
+    top_k: int,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Weighted reciprocal-rank fusion of the vector and BM25 rankings.
+
+    ``lexical_weights`` maps a collection key to its BM25 weight; each hit is
+    weighted by its own collection's value. Results are ordered by the fusion
+    score, reported as ``rrf_score`` (higher is better); ``score`` stays the
+    vector distance (lower is better) and is absent on lexical-only hits.
+    """
+    fused: dict[tuple[Any, str], dict[str, Any]] = {}
+    for rank_key, lexical, ranked in (
+        ("vector_rank", False, vector_ranked),
+        ("lexical_rank", True, lexical_ranked),
+    ):
+        for rank, (key, doc, meta) in enumerate(ranked, start=1):
+            lexical_weight = lexical_weights.get(key[0], 0.0)
+            weight = lexical_weight if lexical else 1.0 - lexical_weight
+            item = fused.get(key)
+            if item is None:
+                item = {"doc": doc, "meta": meta, "rrf": 0.0}
+                fused[key] = item
+            item["rrf"] += weight / (_RRF_K + rank)
+            item["meta"].setdefault(rank_key, rank)
+    ordered = sorted(fused.values(), key=lambda item: item["rrf"], reverse=True)
+    results: list[tuple[str, dict[str, Any]]] = []
+    for item in ordered[:top_k]:
+        meta = item["meta"]
+        meta["rrf_score"] = round(item["rrf"], 8)
+        results.append((item["doc"], meta))
+    return results
+
+
 def query_collections(
     message: str,
     collections: list[dict[str, Any]],
     top_k: int,
+    *,
+    timeout_s: float | None = None,
 ) -> tuple[list[str], list[dict[str, Any]]]:
-    merged: list[tuple[float, str, dict[str, Any]]] = []
-    for entry in collections:
-        source = entry.get("source")
-        collection = entry.get("collection")
-        if not collection:
+    """Query every collection and return the best ``top_k`` chunks overall.
+
+    Collections with a lexical index are searched with BM25 as well, and the
+    two rankings are merged with reciprocal-rank fusion weighted by each
+    collection's ``lexical_weight``; otherwise results are ordered by vector
+    distance.
+    """
+    entries = [entry for entry in collections if entry.get("collection")]
+    hybrid = any(entry.get("lexical_index") is not None for entry in entries)
+    candidate_k = top_k * _HYBRID_CANDIDATE_MULTIPLIER if hybrid else top_k
+    # Embed the query once per embedding function instead of once per collection.
+    query_embeddings: dict[int, Any] = {}
+    entry_query_kwargs: list[dict[str, Any]] = []
+    for entry in entries:
+        embedding_fn = entry.get("embedding_function")
+        if embedding_fn is None:
+            entry_query_kwargs.append({"query_texts": [message], "n_results": candidate_k})
             continue
-        results = collection.query(query_texts=[message], n_results=top_k)
-        documents = (results.get("documents") or [[]])[0] or []
-        metadatas = (results.get("metadatas") or [[]])[0] or []
-        distances = (results.get("distances") or [[]])[0] or []
-        for doc, meta, distance in zip(documents, metadatas, distances):
+        fn_id = id(embedding_fn)
+        if fn_id not in query_embeddings:
+            query_embeddings[fn_id] = [list(embedding_fn([message])[0])]
+        entry_query_kwargs.append(
+            {"query_embeddings": query_embeddings[fn_id], "n_results": candidate_k}
+        )
+
+    results_by_index: dict[int, dict[str, Any]] = {}
+    lexical_by_index: dict[int, list[dict[str, Any]]] = {}
+    if entries:
+        # A single collection goes through the pool too so ``timeout_s`` bounds
+        # every query, not only fan-outs. BM25 lookups run beside the Chroma
+        # queries under the same deadline.
+        pool = _get_query_pool()
+        futures: dict[Any, tuple[bool, int]] = {}
+        for index, (entry, query_kwargs) in enumerate(zip(entries, entry_query_kwargs)):
+            futures[pool.submit(_query_collection, entry, query_kwargs)] = (False, index)
+            if entry.get("lexical_index") is not None:
+                lexical_future = pool.submit(_search_lexical, entry, message, candidate_k)
+                futures[lexical_future] = (True, index)
+        done, not_done = wait(set(futures), timeout=timeout_s)
+        for future in done:
+            lexical, index = futures[future]
+            if lexical:
+                lexical_by_index[index] = future.result()
+            else:
+                results_by_index[index] = future.result()
+        if not_done:
+            timed_out = [
+                getattr(entries[futures[future][1]].get("source"), "collection", None)
+                for future in not_done
+                if not futures[future][0]
+            ]
+            timed_out_lexical = [
+                getattr(entries[futures[future][1]].get("source"), "collection", None)
+                for future in not_done
+                if futures[future][0]
+            ]
+            for future in not_done:
+                future.cancel()
+            if not results_by_index:
+                raise TimeoutError(
+                    f"RAG retrieval timed out after {timeout_s}s for collections: "
+                    + ", ".join(str(name) for name in timed_out)
+                )
+            log_event(
+                "rag_retrieval_collection_timeout",
+                timeout_s=timeout_s,
+                timed_out_collections=timed_out,
+                timed_out_lexical_collections=timed_out_lexical,
+                completed_collections=len(results_by_index),
+            )
+
+    merged: list[tuple[float, tuple[Any, str], str, dict[str, Any]]] = []
+    lexical_merged: list[tuple[float, tuple[Any, str], str, dict[str, Any]]] = []
+    lexical_weights: dict[Any, float] = {}
+    for index, entry in enumerate(entries):
+        source = entry.get("source")
+        collection_key = getattr(source, "collection", None) or index
+        if entry.get("lexical_index") is not None:
+            lexical_weights[collection_key] = min(
+                1.0, max(0.0, float(entry.get("lexical_weight") or 0.0))
+            )
+        results = results_by_index.get(index)
+        if results is not None:
+            documents = (results.get("documents") or [[]])[0] or []
+            metadatas = (results.get("metadatas") or [[]])[0] or []
+            distances = (results.get("distances") or [[]])[0] or []
+            ids = (results.get("ids") or [[]])[0] or []
+            for position, (doc, meta, distance) in enumerate(
+                zip(documents, metadatas, distances)
+            ):
+                if not doc:
+                    continue
+                meta = meta or {}
+                chunk_id = ids[position] if position < len(ids) else None
+                if chunk_id:
+                    meta.setdefault("chunk_id", chunk_id)
+                _annotate_source(meta, source)
+                score = float(distance) if distance is not None else float("inf")
+                meta.setdefault("score", score)
+                merged.append((score, (collection_key, str(chunk_id or doc)), doc, meta))
+        for hit in lexical_by_index.get(index) or []:
+            doc = hit.get("document")
             if not doc:
                 continue
-            meta = meta or {}
-            if source:
-                meta.setdefault("source_id", getattr(source, "id", None))
-                meta.setdefault("source_name", getattr(source, "name", None))
-                meta.setdefault("source_kind", getattr(source, "kind", None))
-                meta.setdefault("collection", getattr(source, "collection", None))
-            score = float(distance) if distance is not None else float("inf")
-            meta.setdefault("score", score)
-            merged.append((score, doc, meta))
+            meta = dict(hit.get("metadata") or {})
+            meta.setdefault("chunk_id", hit.get("id"))
+            _annotate_source(meta, source)
+            key = (collection_key, str(hit.get("id") or doc))
+            lexical_merged.append((float(hit.get("bm25") or 0.0), key, doc, meta))
 
     merged.sort(key=lambda item: item[0])
-    trimmed = merged[:top_k]
-    documents = [item[1] for item in trimmed]
-    metadatas = [item[2] for item in trimmed]
-    return documents, metadatas
+    if not hybrid:
+        trimmed = merged[:top_k]
+        return [item[2] for item in trimmed], [item[3] for item in trimmed]
+
+    lexical_merged.sort(key=lambda item: item[0], reverse=True)
+    fused = _fuse_rankings(
+        [(key, doc, meta) for _, key, doc, meta in merged],
+        [(key, doc, meta) for _, key, doc, meta in lexical_merged],
+        lexical_weights=lexical_weights,
+        top_k=top_k,
+    )
+    return [doc for doc, _ in fused], [meta for _, meta in fused]
 
 
 def build_query_text(message: str, history: Any, max_history: int) -> str:
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+
+
+def connect_shared_sqlite(path: Path, schema: str) -> sqlite3.Connection:
+    """Open a SQLite file shared by indexing and retrieval processes.
+
+    The connection is in autocommit mode (callers issue ``BEGIN``/``COMMIT``)
+    and may be used from any thread behind the caller's own lock. WAL keeps
+    readers in other processes unblocked while one process writes.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        str(path),
+        timeout=30.0,
+        check_same_thread=False,
+        isolation_level=None,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(schema)
+    return conn
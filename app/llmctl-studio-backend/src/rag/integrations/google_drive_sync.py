@@ -3,6 +3,7 @@ from __future__ import annotations
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import json
+import os
 import re
 import shutil
 from pathlib import Path
@@ -12,6 +13,14 @@ import threading
 
 DRIVE_FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
 DRIVE_READONLY_SCOPE = "https://www.googleapis.com/auth/drive.readonly"
+DRIVE_SHORTCUT_MIME_TYPE = "application/vnd.google-apps.shortcut"
+DRIVE_SYNC_MODE_FULL = "full"
+DRIVE_SYNC_MODE_CHANGES = "changes"
+_MANIFEST_LIST_FIELDS = "nextPageToken, files(id,name,mimeType,md5Checksum,modifiedTime,version)"
+_CHANGES_LIST_FIELDS = (
+    "nextPageToken, newStartPageToken, changes(fileId,removed,"
+    "file(id,name,mimeType,parents,trashed,md5Checksum,modifiedTime,version))"
+)
 
 _GOOGLE_EXPORTS: dict[str, tuple[str, str]] = {
     "application/vnd.google-apps.document": (
@@ -43,6 +52,34 @@ class DriveSyncStats:
     files_skipped: int
 
 
+@dataclass(frozen=True)
+class DriveManifestEntry:
+    file_id: str
+    parent_id: str
+    mime_type: str
+    local_path: str
+    md5_checksum: str | None = None
+    modified_time: str | None = None
+    version: str | None = None
+
+    @property
+    def is_folder(self) -> bool:
+        return self.mime_type == DRIVE_FOLDER_MIME_TYPE
+
+
+@dataclass(frozen=True)
+class DriveIncrementalSyncResult:
+    stats: DriveSyncStats
+    manifest: dict[str, DriveManifestEntry]
+    change_token: str | None
+    mode: str
+    # True when the sync was reconciled against a previous manifest, so
+    # changed_paths/removed_paths describe every difference on disk.
+    incremental: bool
+    changed_paths: list[str]
+    removed_paths: list[str]
+
+
 @dataclass(frozen=True)
 class _DriveDownloadJob:
     file_id: str
@@ -98,6 +135,90 @@ def sync_folder(
     return DriveSyncStats(**stats)
 
 
+def sync_folder_incremental(
+    service_account_json: str,
+    folder_id: str,
+    destination: Path,
+    *,
+    manifest: dict[str, DriveManifestEntry] | None = None,
+    change_token: str | None = None,
+    service: Any | None = None,
+    on_file_downloaded: Callable[[Path, DriveSyncStats], None] | None = None,
+    max_workers: int = 1,
+) -> DriveIncrementalSyncResult:
+    """Bring ``destination`` in line with the Drive folder, downloading only changes.
+
+    With a previous ``manifest`` and ``change_token`` only the Drive changes
+    feed is read; folder moves or renames, name collisions and expired tokens
+    fall back to a full listing. Either way files are downloaded only when
+    their checksum, version or modified time differs from the manifest (or the
+    local copy is missing), and files no longer in the folder are deleted.
+    The returned manifest and token should be persisted once the synced files
+    have been indexed.
+    """
+    folder_key = _normalize_folder_id(folder_id)
+    drive_service = service or _build_drive_service(service_account_json)
+    service_factory: Callable[[], Any] | None = None
+    if service is None:
+        service_factory = lambda: _build_drive_service(service_account_json)
+    _get_folder_metadata(drive_service, folder_key)
+    previous = dict(manifest or {})
+    if not previous and destination.exists():
+        # Without a manifest nothing on disk can be trusted.
+        shutil.rmtree(destination)
+    destination.mkdir(parents=True, exist_ok=True)
+    stats = {"files_downloaded": 0, "folders_synced": 1, "files_skipped": 0}
+
+    current: dict[str, DriveManifestEntry] | None = None
+    new_token: str | None = None
+    mode = DRIVE_SYNC_MODE_CHANGES
+    if previous and change_token:
+        delta = _apply_drive_changes(drive_service, folder_key, previous, change_token)
+        if delta is not None:
+            current, new_token = delta
+    if current is None:
+        mode = DRIVE_SYNC_MODE_FULL
+        # Taken before listing so changes made during the walk are replayed.
+        new_token = _start_page_token(drive_service)
+        current = {}
+        _list_manifest_entries(drive_service, folder_key, "", stats, set(), current)
+    stats["folders_synced"] = 1 + sum(1 for entry in current.values() if entry.is_folder)
+
+    jobs, moves, changed_paths, removed_paths = _reconcile_manifest(
+        previous,
+        current,
+        destination,
+    )
+    for source_path, target_path in moves:
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(source_path, target_path)
+    for rel_path in removed_paths:
+        _remove_synced_path(destination, rel_path)
+    for entry in previous.values():
+        if entry.is_folder and entry.file_id not in current:
+            _remove_empty_dirs(destination, destination / entry.local_path)
+    for entry in current.values():
+        if entry.is_folder:
+            (destination / entry.local_path).mkdir(parents=True, exist_ok=True)
+    _download_jobs(
+        drive_service,
+        service_factory=service_factory,
+        jobs=jobs,
+        stats=stats,
+        on_file_downloaded=on_file_downloaded,
+        max_workers=max_workers,
+    )
+    return DriveIncrementalSyncResult(
+        stats=DriveSyncStats(**stats),
+        manifest=current,
+        change_token=new_token,
+        mode=mode,
+        incremental=bool(previous),
+        changed_paths=changed_paths,
+        removed_paths=removed_paths,
+    )
+
+
 def count_syncable_files(
     service_account_json: str,
     folder_id: str,
@@ -278,6 +399,290 @@ def _plan_folder_downloads(
         )
 
 
+def _local_file_name(name: str, mime_type: str) -> str | None:
+    if mime_type == DRIVE_SHORTCUT_MIME_TYPE:
+        return None
+    if mime_type.startswith("application/vnd.google-apps."):
+        export = _GOOGLE_EXPORTS.get(mime_type)
+        if not export:
+            return None
+        suffix = export[1]
+        return name if name.lower().endswith(suffix) else f"{name}{suffix}"
+    return name
+
+
+def _join_local_path(parent_path: str, name: str) -> str:
+    return f"{parent_path}/{name}" if parent_path else name
+
+
+def _reserve_local_path(local_path: str, reserved_paths: set[str]) -> str:
+    if local_path not in reserved_paths:
+        reserved_paths.add(local_path)
+        return local_path
+    path = Path(local_path)
+    for index in range(2, 10_000):
+        candidate = path.with_name(f"{path.stem}-{index}{path.suffix}").as_posix()
+        if candidate not in reserved_paths:
+            reserved_paths.add(candidate)
+            return candidate
+    raise RuntimeError(f"Unable to create a unique path for {path.name}.")
+
+
+def _manifest_entry(
+    item: dict[str, Any],
+    *,
+    parent_id: str,
+    local_path: str,
+) -> DriveManifestEntry:
+    def _optional(key: str) -> str | None:
+        value = item.get(key)
+        return str(value) if value not in (None, "") else None
+
+    return DriveManifestEntry(
+        file_id=str(item.get("id") or "").strip(),
+        parent_id=parent_id,
+        mime_type=str(item.get("mimeType") or "").strip(),
+        local_path=local_path,
+        md5_checksum=_optional("md5Checksum"),
+        modified_time=_optional("modifiedTime"),
+        version=_optional("version"),
+    )
+
+
+def _list_manifest_entries(
+    service,
+    folder_id: str,
+    parent_path: str,
+    stats: dict[str, int],
+    reserved_paths: set[str],
+    entries: dict[str, DriveManifestEntry],
+) -> None:
+    # Mirrors _plan_folder_downloads, but paths are reserved against the
+    # listing only so the same tree always maps to the same local paths.
+    items = _list_folder_items(service, folder_id, fields=_MANIFEST_LIST_FIELDS)
+    for item in items:
+        file_id = str(item.get("id") or "").strip()
+        mime_type = str(item.get("mimeType") or "").strip()
+        name = _safe_filename(str(item.get("name") or file_id))
+        if not file_id or not mime_type:
+            stats["files_skipped"] += 1
+            continue
+        if mime_type == DRIVE_FOLDER_MIME_TYPE:
+            local_path = _reserve_local_path(_join_local_path(parent_path, name), reserved_paths)
+            entries[file_id] = _manifest_entry(item, parent_id=folder_id, local_path=local_path)
+            _list_manifest_entries(service, file_id, local_path, stats, reserved_paths, entries)
+            continue
+        local_name = _local_file_name(name, mime_type)
+        if local_name is None:
+            stats["files_skipped"] += 1
+            continue
+        local_path = _reserve_local_path(_join_local_path(parent_path, local_name), reserved_paths)
+        entries[file_id] = _manifest_entry(item, parent_id=folder_id, local_path=local_path)
+
+
+def _start_page_token(service) -> str | None:
+    try:
+        response = service.changes().getStartPageToken(supportsAllDrives=True).execute()
+    except Exception:
+        return None
+    token = response.get("startPageToken") if isinstance(response, dict) else None
+    return str(token) if token else None
+
+
+def _list_drive_changes(service, change_token: str) -> tuple[list[dict[str, Any]], str] | None:
+    changes_by_file: dict[str, dict[str, Any]] = {}
+    page_token: str | None = change_token
+    new_token: str | None = None
+    while page_token:
+        try:
+            response = (
+                service.changes()
+                .list(
+                    pageToken=page_token,
+                    fields=_CHANGES_LIST_FIELDS,
+                    pageSize=1000,
+                    includeItemsFromAllDrives=True,
+                    supportsAllDrives=True,
+                    spaces="drive",
+                )
+                .execute()
+            )
+        except Exception:
+            # Expired or invalid tokens are recovered with a full listing.
+            return None
+        if not isinstance(response, dict):
+            return None
+        for change in response.get("changes") or []:
+            if not isinstance(change, dict):
+                continue
+            file_payload = change.get("file") if isinstance(change.get("file"), dict) else {}
+            file_id = str(change.get("fileId") or file_payload.get("id") or "").strip()
+            if file_id:
+                # Only the latest change per file matters.
+                changes_by_file.pop(file_id, None)
+                changes_by_file[file_id] = change
+        page_token = response.get("nextPageToken")
+        new_token = response.get("newStartPageToken") or new_token
+    if not new_token:
+        return None
+    return list(changes_by_file.values()), str(new_token)
+
+
+def _apply_drive_changes(
+    service,
+    root_folder_id: str,
+    previous: dict[str, DriveManifestEntry],
+    change_token: str,
+) -> tuple[dict[str, DriveManifestEntry], str] | None:
+    """Apply the Drive changes feed to ``previous``.
+
+    Returns ``None`` when a full listing is needed instead: the token is
+    unusable, a folder inside the tree changed, or a changed file would take
+    a local path another file already uses.
+    """
+    listed = _list_drive_changes(service, change_token)
+    if listed is None:
+        return None
+    changes, new_token = listed
+    folder_paths = {root_folder_id: ""}
+    folder_paths.update(
+        {entry.file_id: entry.local_path for entry in previous.values() if entry.is_folder}
+    )
+    current = dict(previous)
+    path_owners = {entry.local_path: entry.file_id for entry in previous.values()}
+
+    def _drop(file_id: str) -> None:
+        entry = current.pop(file_id, None)
+        if entry is not None and path_owners.get(entry.local_path) == file_id:
+            path_owners.pop(entry.local_path, None)
+
+    for change in changes:
+        file_payload = change.get("file") if isinstance(change.get("file"), dict) else {}
+        file_id = str(change.get("fileId") or file_payload.get("id") or "").strip()
+        mime_type = str(file_payload.get("mimeType") or "").strip()
+        parents = [str(parent) for parent in file_payload.get("parents") or []]
+        parent_id = next((parent for parent in parents if parent in folder_paths), None)
+        if file_id in folder_paths or (
+            mime_type == DRIVE_FOLDER_MIME_TYPE and parent_id is not None
+        ):
+            return None
+        if mime_type == DRIVE_FOLDER_MIME_TYPE:
+            continue
+        removed = bool(change.get("removed")) or bool(file_payload.get("trashed"))
+        name = _safe_filename(str(file_payload.get("name") or file_id))
+        local_name = _local_file_name(name, mime_type) if mime_type else None
+        if removed or parent_id is None or local_name is None:
+            _drop(file_id)
+            continue
+        local_path = _join_local_path(folder_paths[parent_id], local_name)
+        owner = path_owners.get(local_path)
+        if owner is not None and owner != file_id:
+            return None
+        _drop(file_id)
+        current[file_id] = _manifest_entry(
+            file_payload,
+            parent_id=parent_id,
+            local_path=local_path,
+        )
+        path_owners[local_path] = file_id
+    return current, new_token
+
+
+def _same_revision(previous: DriveManifestEntry, current: DriveManifestEntry) -> bool:
+    if previous.mime_type != current.mime_type:
+        return False
+    if previous.md5_checksum and current.md5_checksum:
+        return previous.md5_checksum == current.md5_checksum
+    return (previous.version, previous.modified_time) == (
+        current.version,
+        current.modified_time,
+    )
+
+
+def _reconcile_manifest(
+    previous: dict[str, DriveManifestEntry],
+    current: dict[str, DriveManifestEntry],
+    destination: Path,
+) -> tuple[list[_DriveDownloadJob], list[tuple[Path, Path]], list[str], list[str]]:
+    current_paths = {
+        entry.local_path for entry in current.values() if not entry.is_folder
+    }
+    removed_paths = sorted(
+        {
+            entry.local_path
+            for entry in previous.values()
+            if not entry.is_folder and entry.local_path not in current_paths
+        }
+    )
+    move_candidates: list[tuple[DriveManifestEntry, Path, Path]] = []
+    download_entries: list[DriveManifestEntry] = []
+    for file_id, entry in current.items():
+        if entry.is_folder:
+            continue
+        output_path = destination / entry.local_path
+        prior = previous.get(file_id)
+        if prior is not None and not prior.is_folder and _same_revision(prior, entry):
+            if prior.local_path == entry.local_path and output_path.is_file():
+                continue
+            source_path = destination / prior.local_path
+            if prior.local_path != entry.local_path and source_path.is_file():
+                move_candidates.append((entry, source_path, output_path))
+                continue
+        download_entries.append(entry)
+
+    # A move onto a path that is itself about to be moved away would clobber
+    # it; download those instead.
+    move_sources = {source_path for _entry, source_path, _target in move_candidates}
+    moves: list[tuple[Path, Path]] = []
+    for entry, source_path, target_path in move_candidates:
+        if target_path in move_sources:
+            download_entries.append(entry)
+            continue
+        moves.append((source_path, target_path))
+
+    jobs = [
+        _DriveDownloadJob(
+            file_id=entry.file_id,
+            output_path=destination / entry.local_path,
+            export_mime=(_GOOGLE_EXPORTS.get(entry.mime_type) or (None,))[0],
+        )
+        for entry in download_entries
+    ]
+    changed_paths = sorted(
+        {entry.local_path for entry in download_entries}
+        | {entry.local_path for entry, _source, target in move_candidates}
+    )
+    return jobs, moves, changed_paths, removed_paths
+
+
+def _remove_synced_path(destination: Path, rel_path: str) -> None:
+    path = destination / rel_path
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    except IsADirectoryError:
+        return
+    _remove_empty_dirs(destination, path.parent)
+
+
+def _remove_empty_dirs(destination: Path, directory: Path) -> None:
+    root = destination.resolve()
+    current = directory
+    while True:
+        try:
+            resolved = current.resolve()
+        except OSError:
+            return
+        if resolved == root or root not in resolved.parents:
+            return
+        try:
+            current.rmdir()
+        except OSError:
+            return
+        current = current.parent
+
+
 def _execute_download_job(service, job: _DriveDownloadJob) -> Path:
     if job.export_mime:
         _download_export(service, job.file_id, job.export_mime, job.output_path)
@@ -352,7 +757,12 @@ def _count_syncable_files(service, folder_id: str) -> int:
     return total
 
 
-def _list_folder_items(service, folder_id: str) -> list[dict[str, Any]]:
+def _list_folder_items(
+    service,
+    folder_id: str,
+    *,
+    fields: str = "nextPageToken, files(id,name,mimeType)",
+) -> list[dict[str, Any]]:
     items: list[dict[str, Any]] = []
     page_token = None
     while True:
@@ -360,7 +770,7 @@ def _list_folder_items(service, folder_id: str) -> list[dict[str, Any]]:
             service.files()
             .list(
                 q=f"'{folder_id}' in parents and trashed = false",
-                fields="nextPageToken, files(id,name,mimeType)",
+                fields=fields,
                 pageSize=1000,
                 pageToken=page_token,
                 includeItemsFromAllDrives=True,
@@ -59,6 +59,10 @@ def _provider_api_key(config, provider: str) -> str:
     return (getattr(config, "openai_api_key", None) or "").strip()
 
 
+def get_embedding_api_key(config) -> str:
+    return _provider_api_key(config, get_embedding_provider(config))
+
+
 def has_embedding_api_key(config) -> bool:
     provider = get_embedding_provider(config)
     return bool(_provider_api_key(config, provider))
@@ -273,7 +277,10 @@ def call_chat_completion(config, messages: list[dict[str, str]]) -> str:
 
     if OpenAI is None:
         raise RuntimeError("OpenAI Python package is required for openai chat provider.")
-    client = OpenAI(api_key=api_key)
+    # Imported here so the embedding helpers do not pull in the Studio config.
+    from services.llm_sdk_clients import get_sdk_client
+
+    client = get_sdk_client("openai", OpenAI, api_key=api_key)
     response = client.chat.completions.create(
         model=model,
         messages=messages,
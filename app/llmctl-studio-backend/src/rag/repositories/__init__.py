@@ -1,4 +1,14 @@
 """RAG repository layer for source/file-state/settings persistence."""
+from rag.repositories.drive_file_states import (
+    clear_drive_manifest,
+    load_drive_manifest,
+    save_drive_manifest,
+)
+from rag.repositories.retrieval_audits import (
+    flush_retrieval_audits,
+    record_retrieval_audits,
+    retrieval_audit_stats,
+)
 from rag.repositories.settings import (
     ensure_rag_setting_defaults,
     load_rag_settings,
@@ -33,18 +43,24 @@ __all__ = [
     "SCHEDULE_UNITS",
     "SourceFileStateInput",
     "SourceFileStats",
+    "clear_drive_manifest",
     "clear_source_next_index",
     "create_source",
     "delete_source",
     "delete_source_file_states",
     "ensure_rag_setting_defaults",
+    "flush_retrieval_audits",
     "get_source",
     "is_valid_kind",
     "list_due_sources",
     "list_source_file_states",
     "list_sources",
+    "load_drive_manifest",
     "load_rag_settings",
     "normalize_provider",
+    "record_retrieval_audits",
+    "retrieval_audit_stats",
+    "save_drive_manifest",
     "save_rag_settings",
     "schedule_source_next_index",
     "summarize_source_file_states",
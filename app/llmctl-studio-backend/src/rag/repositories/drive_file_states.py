@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from sqlalchemy import select
+
+from core.db import session_scope
+from core.models import RAGDriveFileState, RAGSource
+from rag.integrations.google_drive_sync import DriveManifestEntry
+
+
+def load_drive_manifest(source_id: int) -> tuple[dict[str, DriveManifestEntry], str | None]:
+    """Return the persisted Drive manifest and change token for a source."""
+    with session_scope() as session:
+        source = session.get(RAGSource, source_id)
+        change_token = source.drive_change_token if source is not None else None
+        stmt = select(RAGDriveFileState).where(RAGDriveFileState.source_id == source_id)
+        manifest = {
+            row.file_id: DriveManifestEntry(
+                file_id=row.file_id,
+                parent_id=row.parent_id,
+                mime_type=row.mime_type,
+                local_path=row.local_path,
+                md5_checksum=row.md5_checksum,
+                modified_time=row.modified_time,
+                version=row.version,
+            )
+            for row in session.execute(stmt).scalars().all()
+        }
+    return manifest, change_token
+
+
+def save_drive_manifest(
+    source_id: int,
+    manifest: dict[str, DriveManifestEntry],
+    *,
+    change_token: str | None,
+) -> None:
+    """Replace the persisted manifest for a source, writing only changed rows."""
+    with session_scope() as session:
+        source = session.get(RAGSource, source_id)
+        if source is None:
+            return
+        stmt = select(RAGDriveFileState).where(RAGDriveFileState.source_id == source_id)
+        existing = {row.file_id: row for row in session.execute(stmt).scalars().all()}
+        for file_id, row in existing.items():
+            if file_id not in manifest:
+                row.delete(session)
+        for file_id, entry in manifest.items():
+            values = {
+                "parent_id": entry.parent_id,
+                "mime_type": entry.mime_type,
+                "local_path": entry.local_path,
+                "md5_checksum": entry.md5_checksum,
+                "modified_time": entry.modified_time,
+                "version": entry.version,
+            }
+            row = existing.get(file_id)
+            if row is None:
+                RAGDriveFileState.create(
+                    session,
+                    source_id=source_id,
+                    file_id=file_id,
+                    **values,
+                )
+                continue
+            if any(getattr(row, key) != value for key, value in values.items()):
+                for key, value in values.items():
+                    setattr(row, key, value)
+                row.save(session)
+        source.drive_change_token = change_token
+        source.save(session)
+
+
+def clear_drive_manifest(source_id: int) -> None:
+    with session_scope() as session:
+        stmt = select(RAGDriveFileState).where(RAGDriveFileState.source_id == source_id)
+        for row in session.execute(stmt).scalars().all():
+            row.delete(session)
+        source = session.get(RAGSource, source_id)
+        if source is not None and source.drive_change_token is not None:
+            source.drive_change_token = None
+            source.save(session)
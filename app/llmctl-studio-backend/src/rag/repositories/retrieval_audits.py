@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import atexit
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+import fcntl
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Iterator
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError, DisconnectionError, InterfaceError, OperationalError
+
+from core.config import Config
+from core.db import session_scope, utcnow
+from core.models import RAGRetrievalAudit
+
+logger = logging.getLogger(__name__)
+
+_SPOOL_REPLAY_SUFFIX = ".replay"
+_SPOOL_LOCK_SUFFIX = ".lock"
+_SPOOL_QUARANTINE_SUFFIX = ".quarantine"
+
+
+def retrieval_audit_values(
+    rows: list[dict[str, Any]],
+    *,
+    request_id: str | None,
+    runtime_kind: str,
+    flowchart_run_id: int | None,
+    flowchart_node_run_id: int | None,
+    provider: str,
+) -> list[dict[str, Any]]:
+    """Map contract audit rows to ``rag_retrieval_audits`` column values."""
+    created_at = utcnow()
+    return [
+        {
+            "request_id": request_id or None,
+            "runtime_kind": runtime_kind,
+            "flowchart_run_id": flowchart_run_id,
+            "flowchart_node_run_id": flowchart_node_run_id,
+            "provider": str(row.get("provider") or provider),
+            "collection": (str(row.get("collection") or "").strip() or None),
+            "source_id": (str(row.get("source_id") or "").strip() or None),
+            "path": (str(row.get("path") or "").strip() or None),
+            "chunk_id": (str(row.get("chunk_id") or "").strip() or None),
+            "score": row.get("score"),
+            "snippet": (str(row.get("snippet") or "").strip() or None),
+            "retrieval_rank": row.get("retrieval_rank"),
+            "created_at": created_at,
+        }
+        for row in rows
+    ]
+
+
+def insert_retrieval_audits(values: list[dict[str, Any]]) -> int:
+    """Bulk insert audit rows in one statement; returns the number written."""
+    if not values:
+        return 0
+    with session_scope() as session:
+        session.execute(insert(RAGRetrievalAudit), values)
+    return len(values)
+
+
+def _default_spool_path() -> Path:
+    return Path(Config.DATA_DIR) / "rag" / "retrieval_audit_spool.jsonl"
+
+
+def _encode_spool_row(values: dict[str, Any]) -> str:
+    payload = dict(values)
+    created_at = payload.get("created_at")
+    if isinstance(created_at, datetime):
+        payload["created_at"] = created_at.isoformat()
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
+def _decode_spool_row(line: str) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    created_at = payload.get("created_at")
+    if isinstance(created_at, str):
+        try:
+            payload["created_at"] = datetime.fromisoformat(created_at)
+        except ValueError:
+            payload["created_at"] = utcnow()
+    return payload
+
+
+def _is_transient_db_error(exc: Exception) -> bool:
+    if isinstance(exc, (OperationalError, InterfaceError, DisconnectionError)):
+        return True
+    return isinstance(exc, DBAPIError) and bool(exc.connection_invalidated)
+
+
+@contextmanager
+def _flock(path: Path) -> Iterator[None]:
+    """Hold an exclusive ``flock`` on ``path`` across threads and processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class RetrievalAuditWriter:
+    """Bulk writer for retrieval audit rows with a JSONL spool fallback.
+
+    Rows are buffered in memory and written by a background thread in bulk,
+    once ``batch_size`` rows are pending or ``flush_interval_s`` elapses. Rows
+    that do not fit the queue, or whose insert fails, are appended to a JSONL
+    spool and replayed after the next successful flush; only rows that cannot
+    be spooled either are counted as dropped. The spool is shared by every
+    worker process, so appends, the rename to ``.replay`` and the replay itself
+    are serialized with ``flock``. Rows that fail on their own during replay
+    are moved to a ``.quarantine`` file instead of blocking the rows behind them.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 200,
+        flush_interval_s: float = 1.0,
+        max_queue_rows: int = 5000,
+        spool_path: Path | None = None,
+    ) -> None:
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval_s = max(0.05, float(flush_interval_s))
+        self.max_queue_rows = max(1, int(max_queue_rows))
+        self.spool_path = Path(spool_path) if spool_path else _default_spool_path()
+        self._queue: deque[dict[str, Any]] = deque()
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._thread_pid: int | None = None
+        self._closed = False
+        self._counters = {
+            "enqueued": 0,
+            "written": 0,
+            "spooled": 0,
+            "replayed": 0,
+            "quarantined": 0,
+            "dropped": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+        }
+        self._last_flush_ms: float | None = None
+
+    def enqueue(self, values: list[dict[str, Any]]) -> None:
+        if not values:
+            return
+        overflow: list[dict[str, Any]] = []
+        with self._condition:
+            if self._closed:
+                overflow = list(values)
+            else:
+                room = self.max_queue_rows - len(self._queue)
+                accepted = values[: max(0, room)]
+                overflow = values[len(accepted):]
+                self._queue.extend(accepted)
+                self._counters["enqueued"] += len(accepted)
+                if len(self._queue) >= self.batch_size:
+                    self._condition.notify()
+        if overflow:
+            self._spool(overflow)
+        self._ensure_thread()
+
+    def flush(self) -> int:
+        """Write every queued and spooled row on the calling thread."""
+        written = 0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                break
+            written += self._write_batch(batch)
+        written += self._replay_spool()
+        return written
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=max(1.0, self.flush_interval_s * 2))
+        self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            depth = len(self._queue)
+            counters = dict(self._counters)
+        return {
+            "queue_depth": depth,
+            "max_queue_rows": self.max_queue_rows,
+            "batch_size": self.batch_size,
+            "flush_interval_s": self.flush_interval_s,
+            "spool_pending": self._spool_pending(),
+            "last_flush_ms": self._last_flush_ms,
+            **counters,
+        }
+
+    def _ensure_thread(self) -> None:
+        pid = os.getpid()
+        with self._condition:
+            if self._closed:
+                return
+            # A forked worker inherits the object but not the thread.
+            if self._thread is not None and self._thread.is_alive() and self._thread_pid == pid:
+                return
+            self._thread_pid = pid
+            self._thread = threading.Thread(
+                target=self._run,
+                name="rag-retrieval-audit-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed and len(self._queue) < self.batch_size:
+                    self._condition.wait(timeout=self.flush_interval_s)
+                if self._closed and not self._queue:
+                    return
+            batch = self._take_batch()
+            if batch:
+                self._write_batch(batch)
+                self._replay_spool()
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        with self._condition:
+            size = min(self.batch_size, len(self._queue))
+            return [self._queue.popleft() for _ in range(size)]
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> int:
+        started = time.perf_counter()
+        with self._write_lock:
+            try:
+                written = insert_retrieval_audits(batch)
+            except Exception as exc:
+                logger.warning(
+                    "Retrieval audit flush of %s rows failed; spooling: %s",
+                    len(batch),
+                    exc,
+                )
+                with self._condition:
+                    self._counters["failed_flushes"] += 1
+                self._spool(batch)
+                return 0
+        with self._condition:
+            self._counters["written"] += written
+            self._counters["flushes"] += 1
+        self._last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+        return written
+
+    def _sibling_path(self, suffix: str) -> Path:
+        return self.spool_path.with_name(self.spool_path.name + suffix)
+
+    def _append_rows(self, path: Path, rows: list[dict[str, Any]]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as handle:
+            for row in rows:
+                handle.write(_encode_spool_row(row) + "\n")
+
+    def _spool(self, rows: list[dict[str, Any]]) -> None:
+        try:
+            with _flock(self._sibling_path(_SPOOL_LOCK_SUFFIX)):
+                self._append_rows(self.spool_path, rows)
+        except OSError as exc:
+            logger.error("Dropping %s retrieval audit rows: %s", len(rows), exc)
+            with self._condition:
+                self._counters["dropped"] += len(rows)
+            return
+        with self._condition:
+            self._counters["spooled"] += len(rows)
+
+    def _spool_pending(self) -> bool:
+        return (
+            self.spool_path.exists()
+            or self._sibling_path(_SPOOL_REPLAY_SUFFIX).exists()
+        )
+
+    def _replay_spool(self) -> int:
+        if not self._spool_pending():
+            return 0
+        replay_lock_path = self._sibling_path(_SPOOL_REPLAY_SUFFIX + _SPOOL_LOCK_SUFFIX)
+        try:
+            # Appends only wait on the spool lock for the rename; the replay
+            # lock keeps a second process from inserting the same rows.
+            with _flock(replay_lock_path):
+                return self._replay_spool_locked()
+        except OSError as exc:
+            logger.warning("Retrieval audit spool replay failed: %s", exc)
+            return 0
+
+    def _replay_spool_locked(self) -> int:
+        replay_path = self._sibling_path(_SPOOL_REPLAY_SUFFIX)
+        if not replay_path.exists():
+            with _flock(self._sibling_path(_SPOOL_LOCK_SUFFIX)):
+                if not self.spool_path.exists():
+                    return 0
+                self.spool_path.replace(replay_path)
+        lines = replay_path.read_text(encoding="utf-8").splitlines()
+        values = [row for row in map(_decode_spool_row, lines) if row is not None]
+        remaining: list[dict[str, Any]] = []
+        quarantined: list[dict[str, Any]] = []
+        with self._write_lock:
+            try:
+                written = insert_retrieval_audits(values)
+            except Exception as exc:
+                if _is_transient_db_error(exc):
+                    # Keep the replay file for the next attempt.
+                    logger.warning("Retrieval audit spool replay failed: %s", exc)
+                    return 0
+                written, remaining, quarantined = self._replay_rows_individually(values)
+        if quarantined:
+            self._append_rows(self._sibling_path(_SPOOL_QUARANTINE_SUFFIX), quarantined)
+            logger.error(
+                "Quarantined %s retrieval audit rows that failed to replay",
+                len(quarantined),
+            )
+        if remaining:
+            tmp_path = self._sibling_path(_SPOOL_REPLAY_SUFFIX + ".tmp")
+            tmp_path.unlink(missing_ok=True)
+            self._append_rows(tmp_path, remaining)
+            tmp_path.replace(replay_path)
+        else:
+            replay_path.unlink(missing_ok=True)
+        with self._condition:
+            self._counters["replayed"] += written
+            self._counters["written"] += written
+            self._counters["quarantined"] += len(quarantined)
+        return written
+
+    def _replay_rows_individually(
+        self, values: list[dict[str, Any]]
+    ) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
+        """Insert rows one at a time, separating bad rows from an unavailable database.
+
+        Returns ``(written, remaining, quarantined)``; ``remaining`` holds the
+        rows left untried after a transient error and stays in the replay file.
+        """
+        written = 0
+        quarantined: list[dict[str, Any]] = []
+        for index, row in enumerate(values):
+            try:
+                written += insert_retrieval_audits([row])
+            except Exception as exc:
+                if _is_transient_db_error(exc):
+                    logger.warning("Retrieval audit spool replay interrupted: %s", exc)
+                    return written, values[index:], quarantined
+                logger.warning("Retrieval audit row rejected during replay: %s", exc)
+                quarantined.append(row)
+        return written, [], quarantined
+
+
+_writer: RetrievalAuditWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_retrieval_audit_writer() -> RetrievalAuditWriter:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = RetrievalAuditWriter(
+                batch_size=Config.RAG_RETRIEVAL_AUDIT_BATCH_SIZE,
+                flush_interval_s=Config.RAG_RETRIEVAL_AUDIT_FLUSH_INTERVAL_SECONDS,
+                max_queue_rows=Config.RAG_RETRIEVAL_AUDIT_MAX_QUEUE_ROWS,
+            )
+            atexit.register(flush_retrieval_audits)
+        return _writer
+
+
+def record_retrieval_audits(values: list[dict[str, Any]]) -> None:
+    """Persist audit rows, off the request path unless async writes are disabled."""
+    if not values:
+        return
+    if not Config.RAG_RETRIEVAL_AUDIT_ASYNC:
+        insert_retrieval_audits(values)
+        return
+    get_retrieval_audit_writer().enqueue(values)
+
+
+def flush_retrieval_audits() -> int:
+    writer = _writer
+    if writer is None:
+        return 0
+    try:
+        return writer.flush()
+    except Exception:
+        logger.exception("Failed to flush retrieval audits")
+        return 0
+
+
+def retrieval_audit_stats() -> dict[str, Any]:
+    writer = _writer
+    if writer is None:
+        return {"async": bool(Config.RAG_RETRIEVAL_AUDIT_ASYNC), "queue_depth": 0}
+    return {"async": bool(Config.RAG_RETRIEVAL_AUDIT_ASYNC), **writer.stats()}
@@ -15,6 +15,9 @@ class SourceFileStateInput:
     indexed: bool
     doc_type: str | None = None
     chunk_count: int = 0
+    size_bytes: int | None = None
+    mtime_ns: int | None = None
+    inode: int | None = None
 
 
 @dataclass(frozen=True)
@@ -68,6 +71,9 @@ def upsert_source_file_states(source_id: int, states: list[SourceFileStateInput]
             indexed=bool(item.indexed),
             doc_type=(str(item.doc_type).strip() if item.doc_type else None),
             chunk_count=max(0, int(item.chunk_count or 0)),
+            size_bytes=_optional_int(item.size_bytes),
+            mtime_ns=_optional_int(item.mtime_ns),
+            inode=_optional_int(item.inode),
         )
     if not by_path:
         return
@@ -92,6 +98,9 @@ def upsert_source_file_states(source_id: int, states: list[SourceFileStateInput]
                 existing.indexed = 1 if payload.indexed else 0
                 existing.doc_type = payload.doc_type if payload.indexed else None
                 existing.chunk_count = payload.chunk_count if payload.indexed else 0
+                existing.size_bytes = payload.size_bytes
+                existing.mtime_ns = payload.mtime_ns
+                existing.inode = payload.inode
                 existing.save(session)
                 continue
             RAGSourceFileState.create(
@@ -102,6 +111,9 @@ def upsert_source_file_states(source_id: int, states: list[SourceFileStateInput]
                 indexed=1 if payload.indexed else 0,
                 doc_type=payload.doc_type if payload.indexed else None,
                 chunk_count=payload.chunk_count if payload.indexed else 0,
+                size_bytes=payload.size_bytes,
+                mtime_ns=payload.mtime_ns,
+                inode=payload.inode,
             )
 
 
@@ -140,6 +152,15 @@ def summarize_source_file_states(source_id: int) -> SourceFileStats:
     )
 
 
+def _optional_int(value: object) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def _chunked_unique_paths(paths: list[str], *, chunk_size: int = 500) -> list[list[str]]:
     cleaned: list[str] = []
     seen: set[str] = set()
@@ -130,16 +130,20 @@ def update_source(source_id: int, payload: RAGSourceInput) -> RAGSource:
 
         updated = source.save(session)
 
+    from rag.repositories.drive_file_states import clear_drive_manifest
     from rag.repositories.source_file_states import delete_source_file_states
 
     delete_source_file_states(source_id)
+    clear_drive_manifest(source_id)
     return updated
 
 
 def delete_source(source_id: int) -> None:
+    from rag.repositories.drive_file_states import clear_drive_manifest
     from rag.repositories.source_file_states import delete_source_file_states
 
     delete_source_file_states(source_id)
+    clear_drive_manifest(source_id)
     with session_scope() as session:
         source = session.get(RAGSource, source_id)
         if source:
@@ -154,6 +158,7 @@ def update_source_index(
     indexed_file_count: int | None = None,
     indexed_chunk_count: int | None = None,
     indexed_file_types: str | None = None,
+    last_indexed_commit: str | None = None,
 ) -> None:
     with session_scope() as session:
         source = session.get(RAGSource, source_id)
@@ -161,6 +166,8 @@ def update_source_index(
             return
         source.last_indexed_at = last_indexed_at
         source.last_error = last_error
+        if last_indexed_commit is not None:
+            source.last_indexed_commit = last_indexed_commit or None
         if indexed_file_count is not None:
             source.indexed_file_count = indexed_file_count
         if indexed_chunk_count is not None:
@@ -11,6 +11,7 @@ RAG_API_CONTRACT_PREFIX = f"{RAG_API_ROUTE_PREFIX}/contract"
 RAG_API_HEALTH = f"{RAG_API_CONTRACT_PREFIX}/health"
 RAG_API_COLLECTIONS = f"{RAG_API_CONTRACT_PREFIX}/collections"
 RAG_API_RETRIEVE = f"{RAG_API_CONTRACT_PREFIX}/retrieve"
+RAG_API_HEALTH_RETRIEVE = f"{RAG_API_CONTRACT_PREFIX}/health-retrieve"
 RAG_API_HEALTH_LEGACY = f"{RAG_API_ROUTE_PREFIX}/health"
 RAG_API_COLLECTIONS_LEGACY = f"{RAG_API_ROUTE_PREFIX}/collections"
 RAG_API_RETRIEVE_LEGACY = f"{RAG_API_ROUTE_PREFIX}/retrieve"
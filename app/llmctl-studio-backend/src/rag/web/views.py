@@ -23,6 +23,7 @@ from core.task_kinds import (
     RAG_QUICK_INDEX_TASK_KIND,
 )
 from rag.domain import (
+    RAG_HEALTH_CONFIGURED_HEALTHY,
     RAG_REASON_RETRIEVAL_EXECUTION_FAILED,
     RAG_REASON_UNAVAILABLE_FOR_SELECTED_COLLECTIONS,
     RagContractError,
@@ -42,6 +43,7 @@ from rag.providers.adapters import (
     has_embedding_api_key,
     missing_api_key_message,
 )
+from rag.repositories.retrieval_audits import retrieval_audit_stats
 from rag.repositories.sources import (
     RAGSourceInput,
     create_source,
@@ -59,6 +61,7 @@ from rag.web.routes import (
     RAG_API_GITHUB_REPOS,
     RAG_API_HEALTH,
     RAG_API_HEALTH_LEGACY,
+    RAG_API_HEALTH_RETRIEVE,
     RAG_API_RETRIEVE,
     RAG_API_RETRIEVE_LEGACY,
     RAG_PAGE_CHAT,
@@ -910,6 +913,7 @@ def api_source_status():
 def api_health():
     payload = rag_health_snapshot()
     payload["contract_version"] = "v1"
+    payload["retrieval_audit"] = retrieval_audit_stats()
     return payload
 
 
@@ -925,8 +929,40 @@ def api_collections():
 @bp.post(RAG_API_RETRIEVE)
 @bp.post(RAG_API_RETRIEVE_LEGACY)
 def api_retrieve():
-    started = time.time()
     payload = request.get_json(silent=True) or {}
+    return _retrieve_contract_response(payload)
+
+
+@bp.post(RAG_API_HEALTH_RETRIEVE)
+def api_health_retrieve():
+    """Health snapshot plus retrieval in one round trip for contract clients.
+
+    Retrieval runs only when RAG is healthy; its failures are reported under
+    ``error`` with a 200 so the caller still receives the health result.
+    """
+    payload = request.get_json(silent=True) or {}
+    health = rag_health_snapshot()
+    response: dict[str, Any] = {
+        "health": health,
+        "retrieval": None,
+        "error": None,
+        "contract_version": "v1",
+    }
+    if health.get("state") != RAG_HEALTH_CONFIGURED_HEALTHY:
+        return response
+    result, status_code = _retrieve_contract_response(payload)
+    if status_code >= 400:
+        error = result.get("error")
+        if not isinstance(error, dict):
+            error = {"message": str(error or f"HTTP {status_code}")}
+        response["error"] = {**error, "status": status_code}
+        return response
+    response["retrieval"] = result
+    return response
+
+
+def _retrieve_contract_response(payload: dict[str, Any]) -> tuple[dict[str, Any], int]:
+    started = time.time()
     question = str(payload.get("question") or "").strip()
     if not question:
         return {"error": "question is required."}, 400
@@ -998,7 +1034,7 @@ def api_retrieve():
     result["model"] = get_chat_model(config)
     result["elapsed_ms"] = int((time.time() - started) * 1000)
     result["contract_version"] = "v1"
-    return result
+    return result, 200
 
 
 @bp.post(RAG_API_CHAT)
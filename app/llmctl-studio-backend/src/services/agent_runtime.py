@@ -6,6 +6,8 @@ import subprocess
 import time
 from typing import Any, Callable
 
+from services.llm_sdk_clients import get_sdk_client
+
 
 @dataclass(slots=True, frozen=True)
 class AgentInfo:
@@ -214,7 +216,8 @@ class FrontierAgent:
             payload["top_p"] = top_p
 
         try:
-            response_payload = OpenAI(api_key=api_key).responses.create(**payload)
+            client = get_sdk_client("openai", OpenAI, api_key=api_key)
+            response_payload = client.responses.create(**payload)
         except Exception as exc:
             return subprocess.CompletedProcess(
                 ["sdk:codex"],
@@ -286,7 +289,11 @@ class FrontierAgent:
             request_config["top_k"] = top_k
 
         try:
-            response_payload = genai.Client(api_key=api_key).models.generate_content(
+            response_payload = get_sdk_client(
+                "gemini",
+                genai.Client,
+                api_key=api_key,
+            ).models.generate_content(
                 model=model_name,
                 contents=prompt,
                 config=request_config if request_config else None,
@@ -365,7 +372,11 @@ class FrontierAgent:
             payload["system"] = system_prompt
 
         try:
-            response_payload = Anthropic(api_key=claude_api_key).messages.create(**payload)
+            response_payload = get_sdk_client(
+                "anthropic",
+                Anthropic,
+                api_key=claude_api_key,
+            ).messages.create(**payload)
         except Exception as exc:
             return subprocess.CompletedProcess(
                 ["sdk:claude"],
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from celery import Celery
+from celery.signals import worker_process_shutdown
 from kombu import Queue
 
 from core.config import Config
@@ -9,6 +10,15 @@ from rag.contracts import RAG_QUEUE_DRIVE, RAG_QUEUE_GIT, RAG_QUEUE_INDEX
 STUDIO_TASK_QUEUE = "llmctl_studio"
 HUGGINGFACE_DOWNLOAD_QUEUE = "llmctl_studio.downloads.huggingface"
 
+
+def node_artifact_retention_sweep_scheduled() -> bool:
+    """Whether beat runs the retention sweep instead of inline pruning."""
+    return bool(
+        Config.NODE_ARTIFACT_RETENTION_SWEEP_ENABLED
+        and Config.NODE_ARTIFACT_RETENTION_SWEEP_INTERVAL_SECONDS > 0
+    )
+
+
 celery_app = Celery("llmctl_studio")
 celery_config = {
     "broker_url": Config.CELERY_BROKER_URL,
@@ -30,16 +40,37 @@ celery_config = {
         "services.tasks.run_huggingface_download_task": {"queue": HUGGINGFACE_DOWNLOAD_QUEUE},
     },
 }
+beat_schedule = {}
 if Config.WORKSPACE_CLEANUP_ENABLED and Config.WORKSPACE_CLEANUP_INTERVAL_SECONDS > 0:
-    celery_config["beat_schedule"] = {
-        "workspace_cleanup": {
-            "task": "services.tasks.cleanup_workspaces",
-            "schedule": Config.WORKSPACE_CLEANUP_INTERVAL_SECONDS,
-            "options": {"queue": STUDIO_TASK_QUEUE},
-        }
+    beat_schedule["workspace_cleanup"] = {
+        "task": "services.tasks.cleanup_workspaces",
+        "schedule": Config.WORKSPACE_CLEANUP_INTERVAL_SECONDS,
+        "options": {"queue": STUDIO_TASK_QUEUE},
     }
+if node_artifact_retention_sweep_scheduled():
+    beat_schedule["node_artifact_retention_sweep"] = {
+        "task": "services.tasks.sweep_node_artifact_retention",
+        "schedule": Config.NODE_ARTIFACT_RETENTION_SWEEP_INTERVAL_SECONDS,
+        "options": {"queue": STUDIO_TASK_QUEUE},
+    }
+if beat_schedule:
+    celery_config["beat_schedule"] = beat_schedule
 if Config.CELERY_BROKER_TRANSPORT_OPTIONS:
     celery_config["broker_transport_options"] = Config.CELERY_BROKER_TRANSPORT_OPTIONS
 celery_app.conf.update(celery_config)
 
 celery_app.autodiscover_tasks(["services", "rag.worker"])
+
+
+@worker_process_shutdown.connect
+def _flush_retrieval_audits_on_shutdown(**_kwargs) -> None:
+    from rag.repositories.retrieval_audits import flush_retrieval_audits
+
+    flush_retrieval_audits()
+
+
+@worker_process_shutdown.connect
+def _flush_realtime_events_on_shutdown(**_kwargs) -> None:
+    from services.realtime_events import flush_realtime_events
+
+    flush_realtime_events()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+from typing import Any, Iterable
+
+TOOL_OUTPUT_MAX_CHARS_DEFAULT = 16000
+_TOOL_OUTPUT_PREVIEW_MIN_CHARS = 256
+
+
+def _model_dump(payload: Any) -> Any:
+    if hasattr(payload, "model_dump"):
+        try:
+            return payload.model_dump(exclude_none=True)
+        except Exception:
+            return payload
+    return payload
+
+
+def _field(payload: Any, name: str) -> Any:
+    if isinstance(payload, dict):
+        return payload.get(name)
+    return getattr(payload, name, None)
+
+
+def _int_or_none(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def compact_tool_output(output: Any, *, max_chars: int) -> Any:
+    """Return ``output`` unchanged, or a truncated preview when it is too large.
+
+    ``max_chars`` of 0 disables compaction.
+    """
+    if max_chars <= 0:
+        return output
+    serialized = json.dumps(output, sort_keys=True, default=str)
+    if len(serialized) <= max_chars:
+        return output
+    preview_chars = max(_TOOL_OUTPUT_PREVIEW_MIN_CHARS, max_chars - 200)
+    return {
+        "truncated": True,
+        "original_chars": len(serialized),
+        "preview": serialized[:preview_chars],
+    }
+
+
+def provider_response_usage(provider: str, payload: Any) -> dict[str, int | None]:
+    """Input/output token counts reported by a provider response, if any."""
+    if provider == "gemini":
+        usage = _field(payload, "usage_metadata")
+        return {
+            "input_tokens": _int_or_none(_field(usage, "prompt_token_count")),
+            "output_tokens": _int_or_none(_field(usage, "candidates_token_count")),
+        }
+    usage = _field(_model_dump(payload), "usage")
+    return {
+        "input_tokens": _int_or_none(_field(usage, "input_tokens")),
+        "output_tokens": _int_or_none(_field(usage, "output_tokens")),
+    }
+
+
+# Carries the provider-native history of one tool loop so each cycle only
+# sends what is new: OpenAI Responses chains on ``previous_response_id``,
+# Claude and Gemini replay their own message/content history with native
+# tool_result / function_response parts instead of a re-serialized prompt.
+@dataclass(slots=True)
+class FrontierConversation:
+    provider: str
+    tool_output_max_chars: int = TOOL_OUTPUT_MAX_CHARS_DEFAULT
+    previous_response_id: str | None = None
+    pending_input: list[dict[str, Any]] = field(default_factory=list)
+    turns: list[Any] = field(default_factory=list)
+    cycle_usage: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def continuing(self) -> bool:
+        if self.provider == "codex":
+            return bool(self.previous_response_id)
+        return bool(self.turns)
+
+    def record_response(self, payload: Any, *, cycle_index: int) -> bool:
+        """Track a provider response; returns False if it cannot be continued."""
+        usage = provider_response_usage(self.provider, payload)
+        self.cycle_usage.append({"cycle": int(cycle_index), **usage})
+        if self.provider == "codex":
+            response_id = str(_field(_model_dump(payload), "id") or "").strip()
+            self.previous_response_id = response_id or None
+            self.pending_input = []
+            return bool(response_id)
+        if self.provider == "claude":
+            content = _field(_model_dump(payload), "content")
+            if not isinstance(content, list):
+                return False
+            self.turns.append(
+                {"role": "assistant", "content": [_model_dump(block) for block in content]}
+            )
+            return True
+        if self.provider == "gemini":
+            candidates = list(_field(payload, "candidates") or [])
+            content = _field(candidates[0], "content") if candidates else None
+            if content is None:
+                return False
+            self.turns.append(content)
+            return True
+        return False
+
+    def add_tool_results(self, tool_results: Iterable[Any]) -> None:
+        items = list(tool_results)
+        if self.provider == "codex":
+            self.pending_input = [
+                {
+                    "type": "function_call_output",
+                    "call_id": item.call_id,
+                    "output": json.dumps(self._tool_payload(item), sort_keys=True, default=str),
+                }
+                for item in items
+            ]
+        elif self.provider == "claude":
+            self.turns.append(
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": item.call_id,
+                            "content": json.dumps(
+                                self._compact(item.output),
+                                sort_keys=True,
+                                default=str,
+                            ),
+                            "is_error": bool(item.is_error),
+                        }
+                        for item in items
+                    ],
+                }
+            )
+        elif self.provider == "gemini":
+            self.turns.append(
+                {
+                    "role": "user",
+                    "parts": [
+                        {
+                            "function_response": {
+                                "id": item.call_id,
+                                "name": item.tool_name,
+                                "response": self._tool_payload(item),
+                            }
+                        }
+                        for item in items
+                    ],
+                }
+            )
+
+    def claude_messages(self, prompt: str) -> list[dict[str, Any]]:
+        return [{"role": "user", "content": prompt}, *self.turns]
+
+    def gemini_contents(self, prompt: str) -> list[Any]:
+        return [{"role": "user", "parts": [{"text": prompt}]}, *self.turns]
+
+    def usage_totals(self) -> dict[str, int]:
+        return {
+            "input_tokens": sum(int(item.get("input_tokens") or 0) for item in self.cycle_usage),
+            "output_tokens": sum(int(item.get("output_tokens") or 0) for item in self.cycle_usage),
+        }
+
+    def _compact(self, output: Any) -> Any:
+        return compact_tool_output(output, max_chars=self.tool_output_max_chars)
+
+    def _tool_payload(self, item: Any) -> dict[str, Any]:
+        payload: dict[str, Any] = {"output": self._compact(item.output)}
+        if item.is_error:
+            payload["is_error"] = True
+        return payload
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 import json
 import os
 import re
@@ -8,10 +9,27 @@ import subprocess
 import time
 from typing import Any, Callable
 
+from services.execution.agent_conversation import (
+    TOOL_OUTPUT_MAX_CHARS_DEFAULT,
+    FrontierConversation,
+    compact_tool_output,
+    provider_response_usage,
+)
+from services.execution.agent_stream import (
+    FrontierStreamCanceled,
+    FrontierStreamRelay,
+    merge_stream_metrics,
+)
+from services.llm_sdk_clients import get_sdk_client
+
 _UPSTREAM_500_MAX_ATTEMPTS = 2
 _MCP_TOOL_LIST_FAILED_DEPENDENCY_MAX_ATTEMPTS = 3
 _TOOL_LOOP_MAX_CYCLES_DEFAULT = 24
 _TOOL_LOOP_MAX_CYCLES_LIMIT = 64
+_TOOL_DISPATCH_MAX_WORKERS_DEFAULT = 4
+_TOOL_DISPATCH_MAX_WORKERS_LIMIT = 16
+_TOOL_DISPATCH_MODE_PARALLEL = "parallel"
+_TOOL_DISPATCH_MODE_SERIAL = "serial"
 
 
 @dataclass(slots=True, frozen=True)
@@ -39,6 +57,8 @@ class FrontierToolResult:
     tool_name: str
     output: Any
     is_error: bool = False
+    elapsed_ms: float | None = None
+    dispatch_mode: str | None = None
 
 
 class FrontierToolDispatchError(RuntimeError):
@@ -71,6 +91,9 @@ class FrontierAgentDependencies:
     dispatch_tool_call: Callable[[FrontierToolCall], FrontierToolResult | dict[str, Any]] | None = (
         None
     )
+    # Calls reported parallel-safe may run concurrently within a cycle; any
+    # other call runs alone, after every earlier call has finished.
+    tool_call_is_parallel_safe: Callable[[FrontierToolCall], bool] | None = None
 
 
 class FrontierAgent:
@@ -85,6 +108,7 @@ class FrontierAgent:
         *,
         on_update: Callable[[str, str], None] | None = None,
         on_log: Callable[[str], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> subprocess.CompletedProcess[str]:
         provider = str(request.provider or "").strip().lower()
         provider_label = self._dependencies.provider_label(provider)
@@ -116,41 +140,98 @@ class FrontierAgent:
         if max_cycles < 1:
             max_cycles = _TOOL_LOOP_MAX_CYCLES_DEFAULT
         max_cycles = min(max_cycles, _TOOL_LOOP_MAX_CYCLES_LIMIT)
-
+        max_workers = _safe_int(
+            config_map.get("tool_dispatch_max_workers"),
+            _TOOL_DISPATCH_MAX_WORKERS_DEFAULT,
+        )
+        if max_workers < 1:
+            max_workers = _TOOL_DISPATCH_MAX_WORKERS_DEFAULT
+        max_workers = min(max_workers, _TOOL_DISPATCH_MAX_WORKERS_LIMIT)
+        tool_output_max_chars = max(
+            0,
+            _safe_int(
+                config_map.get("tool_output_max_chars"),
+                TOOL_OUTPUT_MAX_CHARS_DEFAULT,
+            ),
+        )
+        conversation = FrontierConversation(
+            provider=provider,
+            tool_output_max_chars=tool_output_max_chars,
+        )
+        continuation_enabled = _config_flag(
+            config_map.get("tool_loop_continuation"),
+            default=True,
+        )
+        # Streaming only pays off when someone is listening for deltas or
+        # cancellation; otherwise the blocking create call is simpler.
+        stream_enabled = (
+            on_update is not None or should_cancel is not None
+        ) and _config_flag(config_map.get("stream"), default=True)
+        stream_metrics: list[dict[str, Any]] = []
+
+        # ``cycle_prompt`` is always kept current so a provider response that
+        # cannot be continued server-side falls back to re-sending the prompt.
         cycle_prompt = prompt_text
         tool_trace: list[dict[str, Any]] = []
         for cycle_index in range(1, max_cycles + 1):
+            if _cancel_requested(should_cancel):
+                return self._emit_result(
+                    _canceled_completed_process(provider),
+                    on_update=on_update,
+                    tool_trace=tool_trace,
+                    cycle_usage=conversation.cycle_usage,
+                    stream_metrics=stream_metrics,
+                )
+            continuing = continuation_enabled and conversation.continuing
             result = self._run_provider_cycle(
                 provider=provider,
                 provider_label=provider_label,
-                prompt=cycle_prompt,
+                prompt=prompt_text if continuing else cycle_prompt,
                 system_prompt=system_prompt_text,
                 mcp_configs=request.mcp_configs,
                 config_map=config_map,
                 env_map=env_map,
                 on_log=on_log,
+                conversation=conversation if continuing else None,
+                on_update=on_update if stream_enabled else None,
+                should_cancel=should_cancel if stream_enabled else None,
+                stream=stream_enabled,
             )
+            cycle_stream_metrics = getattr(result, "_llmctl_stream_metrics", None)
+            if isinstance(cycle_stream_metrics, dict):
+                stream_metrics.append(cycle_stream_metrics)
             if result.returncode != 0:
                 return self._emit_result(
                     result,
                     on_update=on_update,
                     tool_trace=tool_trace,
+                    cycle_usage=conversation.cycle_usage,
+                    stream_metrics=stream_metrics,
                 )
 
+            raw_response = getattr(result, "_llmctl_raw_response", None)
+            if not conversation.record_response(raw_response, cycle_index=cycle_index):
+                continuation_enabled = False
             tool_calls = _extract_provider_tool_calls(
                 provider=provider,
-                payload=getattr(result, "_llmctl_raw_response", None),
+                payload=raw_response,
             )
             if on_log:
+                usage = conversation.cycle_usage[-1]
                 on_log(
                     "sdk_tool_cycle "
-                    f"provider={provider} cycle={cycle_index} tool_calls={len(tool_calls)}"
+                    f"provider={provider} cycle={cycle_index} tool_calls={len(tool_calls)} "
+                    f"input_tokens={usage.get('input_tokens')} "
+                    f"output_tokens={usage.get('output_tokens')} "
+                    f"continued={continuing}"
                 )
             if not tool_calls:
                 return self._emit_result(
                     result,
                     on_update=on_update,
                     tool_trace=tool_trace,
+                    cycle_usage=conversation.cycle_usage,
+                    stream_metrics=stream_metrics,
                 )
 
             tool_results, dispatch_error = self._dispatch_tool_calls(
@@ -159,6 +240,7 @@ class FrontierAgent:
                 request_id=request_id,
                 correlation_id=correlation_id,
                 on_log=on_log,
+                max_workers=max_workers,
             )
             tool_trace.extend(
                 _build_tool_trace_entries(
@@ -172,11 +254,16 @@ class FrontierAgent:
                     dispatch_error,
                     on_update=on_update,
                     tool_trace=tool_trace,
+                    cycle_usage=conversation.cycle_usage,
+                    stream_metrics=stream_metrics,
                 )
+            if continuation_enabled:
+                conversation.add_tool_results(tool_results)
             cycle_prompt = _append_tool_results_to_prompt(
                 prompt=cycle_prompt,
                 tool_results=tool_results,
                 cycle_index=cycle_index,
+                max_output_chars=tool_output_max_chars,
             )
 
         return self._emit_result(
@@ -193,6 +280,8 @@ class FrontierAgent:
             ),
             on_update=on_update,
             tool_trace=tool_trace,
+            cycle_usage=conversation.cycle_usage,
+            stream_metrics=stream_metrics,
         )
 
     def _run_provider_cycle(
@@ -206,10 +295,25 @@ class FrontierAgent:
         config_map: dict[str, Any],
         env_map: dict[str, str],
         on_log: Callable[[str], None] | None,
+        conversation: FrontierConversation | None = None,
+        on_update: Callable[[str, str], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+        stream: bool = False,
     ) -> subprocess.CompletedProcess[str]:
+        provider_kwargs: dict[str, Any] = {}
+        if conversation is not None:
+            provider_kwargs["conversation"] = conversation
+
         def _run_once() -> subprocess.CompletedProcess[str]:
+            if stream:
+                # A fresh relay per attempt so a retried stream starts clean.
+                provider_kwargs["stream"] = FrontierStreamRelay(
+                    on_update=on_update,
+                    should_cancel=should_cancel,
+                )
             if provider == "codex":
                 return self._run_codex(
+                    **provider_kwargs,
                     prompt=prompt,
                     system_prompt=system_prompt,
                     mcp_configs=mcp_configs,
@@ -220,6 +324,7 @@ class FrontierAgent:
                 )
             if provider == "gemini":
                 return self._run_gemini(
+                    **provider_kwargs,
                     prompt=prompt,
                     system_prompt=system_prompt,
                     config_map=config_map,
@@ -229,6 +334,7 @@ class FrontierAgent:
                 )
             if provider == "claude":
                 return self._run_claude(
+                    **provider_kwargs,
                     prompt=prompt,
                     system_prompt=system_prompt,
                     config_map=config_map,
@@ -286,6 +392,7 @@ class FrontierAgent:
         request_id: str | None,
         correlation_id: str | None,
         on_log: Callable[[str], None] | None,
+        max_workers: int = 1,
     ) -> tuple[list[FrontierToolResult], subprocess.CompletedProcess[str] | None]:
         dispatcher = self._dependencies.dispatch_tool_call
         if dispatcher is None:
@@ -301,39 +408,53 @@ class FrontierAgent:
                 correlation_id=correlation_id,
             )
         results: list[FrontierToolResult] = []
-        for tool_call in tool_calls:
-            if on_log:
-                on_log(
-                    "sdk_tool_dispatch "
-                    f"provider={provider} call_id={tool_call.call_id} "
-                    f"tool_name={tool_call.tool_name}"
-                )
-            try:
-                raw_result = dispatcher(tool_call)
-            except Exception as exc:
-                if isinstance(exc, FrontierToolDispatchError):
-                    return results, _tool_loop_error_completed_process(
+        for batch, mode in _plan_tool_call_batches(
+            tool_calls,
+            is_parallel_safe=self._dependencies.tool_call_is_parallel_safe,
+            max_workers=max_workers,
+        ):
+            for tool_call in batch:
+                if on_log:
+                    on_log(
+                        "sdk_tool_dispatch "
+                        f"provider={provider} call_id={tool_call.call_id} "
+                        f"tool_name={tool_call.tool_name} mode={mode}"
+                    )
+            if len(batch) == 1:
+                outcomes = [_timed_tool_dispatch(dispatcher, batch[0])]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(batch)),
+                    thread_name_prefix="frontier-tool",
+                ) as executor:
+                    outcomes = list(
+                        executor.map(
+                            lambda call: _timed_tool_dispatch(dispatcher, call),
+                            batch,
+                        )
+                    )
+            # Outcomes are in call order, so the first failure wins exactly as
+            # it would have when dispatching one call at a time.
+            for tool_call, (raw_result, exc, elapsed_ms) in zip(batch, outcomes):
+                if exc is not None:
+                    return results, _tool_dispatch_error_completed_process(
+                        exc,
                         provider=provider,
-                        code=exc.code,
-                        message=str(exc),
-                        details=exc.details,
+                        tool_call=tool_call,
                         request_id=request_id,
                         correlation_id=correlation_id,
-                        retryable=exc.retryable,
                     )
-                return results, _tool_loop_error_completed_process(
-                    provider=provider,
-                    code="tool_dispatch_failed",
-                    message=f"Tool dispatch failed for {tool_call.tool_name}: {exc}",
-                    details={
-                        "call_id": tool_call.call_id,
-                        "tool_name": tool_call.tool_name,
-                    },
-                    request_id=request_id,
-                    correlation_id=correlation_id,
+                normalized_result = _normalize_frontier_tool_result(
+                    raw_result,
+                    fallback=tool_call,
+                )
+                results.append(
+                    replace(
+                        normalized_result,
+                        elapsed_ms=elapsed_ms,
+                        dispatch_mode=mode,
+                    )
                 )
-            normalized_result = _normalize_frontier_tool_result(raw_result, fallback=tool_call)
-            results.append(normalized_result)
         return results, None
 
     @staticmethod
@@ -342,9 +463,15 @@ class FrontierAgent:
         *,
         on_update: Callable[[str, str], None] | None = None,
         tool_trace: list[dict[str, Any]] | None = None,
+        cycle_usage: list[dict[str, Any]] | None = None,
+        stream_metrics: list[dict[str, Any]] | None = None,
     ) -> subprocess.CompletedProcess[str]:
         if isinstance(tool_trace, list):
             setattr(result, "_llmctl_tool_trace", list(tool_trace))
+        if cycle_usage:
+            setattr(result, "_llmctl_cycle_usage", list(cycle_usage))
+        if stream_metrics:
+            setattr(result, "_llmctl_stream_metrics", merge_stream_metrics(stream_metrics))
         if on_update is not None:
             on_update(str(result.stdout or ""), str(result.stderr or ""))
         return result
@@ -359,6 +486,8 @@ class FrontierAgent:
         env_map: dict[str, str],
         on_log: Callable[[str], None] | None,
         provider_label: str,
+        conversation: FrontierConversation | None = None,
+        stream: FrontierStreamRelay | None = None,
     ) -> subprocess.CompletedProcess[str]:
         try:
             from openai import OpenAI
@@ -404,6 +533,10 @@ class FrontierAgent:
             "model": model_name,
             "input": prompt,
         }
+        if conversation is not None and conversation.previous_response_id:
+            # Earlier turns live server-side; send only the new tool outputs.
+            payload["previous_response_id"] = conversation.previous_response_id
+            payload["input"] = list(conversation.pending_input)
         configured_instructions = str(config_map.get("instructions") or "").strip()
         effective_instructions = _merge_system_prompt(
             primary=system_prompt,
@@ -424,7 +557,13 @@ class FrontierAgent:
             payload["top_p"] = top_p
 
         try:
-            response_payload = OpenAI(api_key=api_key).responses.create(**payload)
+            client = get_sdk_client("openai", OpenAI, api_key=api_key)
+            if stream is not None:
+                response_payload = _stream_openai_response(client, payload, stream)
+            else:
+                response_payload = client.responses.create(**payload)
+        except FrontierStreamCanceled:
+            return _canceled_completed_process("codex", stream=stream)
         except Exception as exc:
             return subprocess.CompletedProcess(
                 ["sdk:codex"],
@@ -439,6 +578,8 @@ class FrontierAgent:
             "",
         )
         setattr(completed, "_llmctl_raw_response", response_payload)
+        if stream is not None:
+            _attach_stream_metrics(completed, provider="codex", stream=stream)
         return completed
 
     def _run_gemini(
@@ -450,6 +591,8 @@ class FrontierAgent:
         env_map: dict[str, str],
         on_log: Callable[[str], None] | None,
         provider_label: str,
+        conversation: FrontierConversation | None = None,
+        stream: FrontierStreamRelay | None = None,
     ) -> subprocess.CompletedProcess[str]:
         try:
             from google import genai
@@ -534,12 +677,23 @@ class FrontierAgent:
         if effective_system_instruction:
             request_config["system_instruction"] = effective_system_instruction
 
+        gemini_request: dict[str, Any] = {
+            "model": model_name,
+            "contents": (
+                conversation.gemini_contents(prompt)
+                if conversation is not None
+                else prompt
+            ),
+            "config": request_config if request_config else None,
+        }
         try:
-            response_payload = genai.Client(**client_kwargs).models.generate_content(
-                model=model_name,
-                contents=prompt,
-                config=request_config if request_config else None,
-            )
+            client = get_sdk_client("gemini", genai.Client, **client_kwargs)
+            if stream is not None:
+                response_payload = _stream_gemini_response(client, gemini_request, stream)
+            else:
+                response_payload = client.models.generate_content(**gemini_request)
+        except FrontierStreamCanceled:
+            return _canceled_completed_process("gemini", stream=stream)
         except Exception as exc:
             return subprocess.CompletedProcess(
                 ["sdk:gemini"],
@@ -554,6 +708,8 @@ class FrontierAgent:
             "",
         )
         setattr(completed, "_llmctl_raw_response", response_payload)
+        if stream is not None:
+            _attach_stream_metrics(completed, provider="gemini", stream=stream)
         return completed
 
     def _run_claude(
@@ -565,6 +721,8 @@ class FrontierAgent:
         env_map: dict[str, str],
         on_log: Callable[[str], None] | None,
         provider_label: str,
+        conversation: FrontierConversation | None = None,
+        stream: FrontierStreamRelay | None = None,
     ) -> subprocess.CompletedProcess[str]:
         try:
             from anthropic import Anthropic
@@ -604,7 +762,11 @@ class FrontierAgent:
         payload: dict[str, Any] = {
             "model": model_name,
             "max_tokens": _safe_int(config_map.get("max_tokens"), 2048),
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": (
+                conversation.claude_messages(prompt)
+                if conversation is not None
+                else [{"role": "user", "content": prompt}]
+            ),
         }
         temperature = _optional_float(config_map.get("temperature"))
         if temperature is not None:
@@ -621,7 +783,13 @@ class FrontierAgent:
             payload["system"] = effective_system_prompt
 
         try:
-            response_payload = Anthropic(api_key=claude_api_key).messages.create(**payload)
+            client = get_sdk_client("anthropic", Anthropic, api_key=claude_api_key)
+            if stream is not None:
+                response_payload = _stream_claude_message(client, payload, stream)
+            else:
+                response_payload = client.messages.create(**payload)
+        except FrontierStreamCanceled:
+            return _canceled_completed_process("claude", stream=stream)
         except Exception as exc:
             return subprocess.CompletedProcess(
                 ["sdk:claude"],
@@ -636,9 +804,181 @@ class FrontierAgent:
             "",
         )
         setattr(completed, "_llmctl_raw_response", response_payload)
+        if stream is not None:
+            _attach_stream_metrics(completed, provider="claude", stream=stream)
         return completed
 
 
+def _cancel_requested(should_cancel: Callable[[], bool] | None) -> bool:
+    if should_cancel is None:
+        return False
+    try:
+        return bool(should_cancel())
+    except Exception:
+        return False
+
+
+def _canceled_completed_process(
+    provider: str,
+    *,
+    stream: FrontierStreamRelay | None = None,
+) -> subprocess.CompletedProcess[str]:
+    completed = subprocess.CompletedProcess(
+        [f"sdk:{provider}"],
+        1,
+        stream.text if stream is not None else "",
+        "Canceled by user.",
+    )
+    setattr(completed, "_llmctl_canceled", True)
+    if stream is not None:
+        stream.finish()
+        setattr(completed, "_llmctl_stream_metrics", stream.metrics())
+    return completed
+
+
+def _attach_stream_metrics(
+    completed: subprocess.CompletedProcess[str],
+    *,
+    provider: str,
+    stream: FrontierStreamRelay,
+) -> None:
+    usage = provider_response_usage(
+        provider,
+        getattr(completed, "_llmctl_raw_response", None),
+    )
+    setattr(
+        completed,
+        "_llmctl_stream_metrics",
+        stream.metrics(
+            prompt_tokens=usage.get("input_tokens"),
+            completion_tokens=usage.get("output_tokens"),
+        ),
+    )
+
+
+def _close_stream(stream: Any) -> None:
+    close = getattr(stream, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:
+            pass
+
+
+def _stream_openai_response(
+    client: Any,
+    payload: dict[str, Any],
+    relay: FrontierStreamRelay,
+) -> Any:
+    # The terminal event carries the full Response object, so tool calls and
+    # the response id for continuation are read exactly as in blocking mode.
+    events = client.responses.create(**payload, stream=True)
+    final_response: Any = None
+    try:
+        for event in events:
+            event_type = str(getattr(event, "type", "") or "")
+            if event_type == "response.output_text.delta":
+                relay.delta(getattr(event, "delta", ""))
+            elif event_type in {"response.completed", "response.incomplete"}:
+                final_response = getattr(event, "response", None)
+            elif event_type == "response.failed":
+                error = getattr(getattr(event, "response", None), "error", None)
+                raise RuntimeError(
+                    str(getattr(error, "message", None) or "OpenAI response failed.")
+                )
+            elif event_type == "error":
+                raise RuntimeError(
+                    str(getattr(event, "message", None) or "OpenAI response stream failed.")
+                )
+            else:
+                relay.check_canceled()
+    finally:
+        _close_stream(events)
+    if final_response is None:
+        raise RuntimeError("OpenAI response stream ended without a final response.")
+    relay.finish()
+    return final_response
+
+
+def _stream_claude_message(
+    client: Any,
+    payload: dict[str, Any],
+    relay: FrontierStreamRelay,
+) -> Any:
+    with client.messages.stream(**payload) as message_stream:
+        # Iterate every event, not only ``text_stream``, so a response that is
+        # busy with tool-use JSON or thinking blocks still sees a cancel.
+        for event in message_stream:
+            if getattr(event, "type", None) == "text":
+                relay.delta(getattr(event, "text", ""))
+            else:
+                relay.check_canceled()
+        final_message = message_stream.get_final_message()
+    relay.finish()
+    return final_message
+
+
+def _stream_gemini_response(
+    client: Any,
+    request: dict[str, Any],
+    relay: FrontierStreamRelay,
+) -> Any:
+    from google.genai import types
+
+    chunks = client.models.generate_content_stream(**request)
+    parts: list[Any] = []
+    usage_metadata: Any = None
+    try:
+        for chunk in chunks:
+            usage_metadata = getattr(chunk, "usage_metadata", None) or usage_metadata
+            candidates = list(getattr(chunk, "candidates", None) or [])
+            content = getattr(candidates[0], "content", None) if candidates else None
+            for part in list(getattr(content, "parts", None) or []):
+                text_value = getattr(part, "text", None)
+                if text_value and not getattr(part, "thought", False):
+                    relay.delta(text_value)
+                parts.append(part)
+            relay.check_canceled()
+    finally:
+        _close_stream(chunks)
+    relay.finish()
+    # Rebuild one response from the chunks so text, function calls and the
+    # recorded conversation turn look the same as a blocking call's.
+    return types.GenerateContentResponse(
+        candidates=[
+            types.Candidate(
+                content=types.Content(role="model", parts=_merge_gemini_text_parts(parts)),
+            )
+        ],
+        usage_metadata=usage_metadata,
+    )
+
+
+def _merge_gemini_text_parts(parts: list[Any]) -> list[Any]:
+    from google.genai import types
+
+    merged: list[Any] = []
+    pending_text: list[str] = []
+    for part in parts:
+        text_value = getattr(part, "text", None)
+        is_plain_text = (
+            isinstance(text_value, str)
+            and not getattr(part, "thought", False)
+            and getattr(part, "function_call", None) is None
+            and getattr(part, "thought_signature", None) is None
+        )
+        if is_plain_text:
+            pending_text.append(text_value)
+            continue
+        if pending_text:
+            merged.append(types.Part(text="".join(pending_text)))
+            pending_text = []
+        merged.append(part)
+    if pending_text:
+        merged.append(types.Part(text="".join(pending_text)))
+    return merged
+
+
 def _merge_system_prompt(*, primary: str | None, secondary: str | None) -> str:
     first = str(primary or "").strip()
     second = str(secondary or "").strip()
@@ -662,6 +1002,17 @@ def _optional_float(value: Any) -> float | None:
         return None
 
 
+def _config_flag(value: Any, *, default: bool) -> bool:
+    if isinstance(value, bool):
+        return value
+    normalized = str(value or "").strip().lower()
+    if normalized in {"1", "true", "yes", "on"}:
+        return True
+    if normalized in {"0", "false", "no", "off"}:
+        return False
+    return default
+
+
 def _safe_int(value: Any, default: int) -> int:
     if value is None:
         return default
@@ -954,11 +1305,83 @@ def _normalize_frontier_tool_result(
     )
 
 
+def _plan_tool_call_batches(
+    tool_calls: list[FrontierToolCall],
+    *,
+    is_parallel_safe: Callable[[FrontierToolCall], bool] | None,
+    max_workers: int,
+) -> list[tuple[list[FrontierToolCall], str]]:
+    """Group consecutive parallel-safe calls; every other call is its own batch."""
+    batches: list[tuple[list[FrontierToolCall], str]] = []
+    pending: list[FrontierToolCall] = []
+    for tool_call in tool_calls:
+        parallel = False
+        if is_parallel_safe is not None and max_workers > 1:
+            try:
+                parallel = bool(is_parallel_safe(tool_call))
+            except Exception:
+                parallel = False
+        if parallel:
+            pending.append(tool_call)
+            continue
+        if pending:
+            batches.append((pending, _TOOL_DISPATCH_MODE_PARALLEL))
+            pending = []
+        batches.append(([tool_call], _TOOL_DISPATCH_MODE_SERIAL))
+    if pending:
+        batches.append((pending, _TOOL_DISPATCH_MODE_PARALLEL))
+    return batches
+
+
+def _timed_tool_dispatch(
+    dispatcher: Callable[[FrontierToolCall], FrontierToolResult | dict[str, Any]],
+    tool_call: FrontierToolCall,
+) -> tuple[FrontierToolResult | dict[str, Any] | None, Exception | None, float]:
+    started = time.perf_counter()
+    try:
+        raw_result = dispatcher(tool_call)
+    except Exception as exc:
+        return None, exc, round((time.perf_counter() - started) * 1000, 2)
+    return raw_result, None, round((time.perf_counter() - started) * 1000, 2)
+
+
+def _tool_dispatch_error_completed_process(
+    exc: Exception,
+    *,
+    provider: str,
+    tool_call: FrontierToolCall,
+    request_id: str | None,
+    correlation_id: str | None,
+) -> subprocess.CompletedProcess[str]:
+    if isinstance(exc, FrontierToolDispatchError):
+        return _tool_loop_error_completed_process(
+            provider=provider,
+            code=exc.code,
+            message=str(exc),
+            details=exc.details,
+            request_id=request_id,
+            correlation_id=correlation_id,
+            retryable=exc.retryable,
+        )
+    return _tool_loop_error_completed_process(
+        provider=provider,
+        code="tool_dispatch_failed",
+        message=f"Tool dispatch failed for {tool_call.tool_name}: {exc}",
+        details={
+            "call_id": tool_call.call_id,
+            "tool_name": tool_call.tool_name,
+        },
+        request_id=request_id,
+        correlation_id=correlation_id,
+    )
+
+
 def _append_tool_results_to_prompt(
     *,
     prompt: str,
     tool_results: list[FrontierToolResult],
     cycle_index: int,
+    max_output_chars: int = 0,
 ) -> str:
     serialized = json.dumps(
         [
@@ -966,7 +1389,7 @@ def _append_tool_results_to_prompt(
                 "call_id": item.call_id,
                 "tool_name": item.tool_name,
                 "is_error": bool(item.is_error),
-                "output": item.output,
+                "output": compact_tool_output(item.output, max_chars=max_output_chars),
             }
             for item in tool_results
         ],
@@ -1012,6 +1435,8 @@ def _build_tool_trace_entries(
                 "warnings": warnings_list,
                 "warning_count": len(warnings_list),
                 "trace_envelope": trace_envelope,
+                "elapsed_ms": item.elapsed_ms,
+                "dispatch_mode": item.dispatch_mode,
             }
         )
     return entries
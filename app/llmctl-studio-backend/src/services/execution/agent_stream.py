@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+STREAM_UPDATE_INTERVAL_SECONDS = 0.5
+STREAM_CANCEL_CHECK_INTERVAL_SECONDS = 1.0
+
+
+class FrontierStreamCanceled(RuntimeError):
+    """Raised from inside a provider stream once the run has been canceled."""
+
+
+class FrontierStreamRelay:
+    """Relay the text deltas of one streamed provider response.
+
+    The first delta is pushed through ``on_update`` immediately and later ones
+    at most every ``update_interval_s``, matching the vLLM streaming path;
+    ``should_cancel`` is polled on its own interval so a canceled run stops
+    reading the stream without a database round trip per token.
+    """
+
+    def __init__(
+        self,
+        *,
+        on_update: Callable[[str, str], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+        update_interval_s: float | None = None,
+        cancel_check_interval_s: float | None = None,
+    ) -> None:
+        self.on_update = on_update
+        self.should_cancel = should_cancel
+        if update_interval_s is None:
+            update_interval_s = STREAM_UPDATE_INTERVAL_SECONDS
+        if cancel_check_interval_s is None:
+            cancel_check_interval_s = STREAM_CANCEL_CHECK_INTERVAL_SECONDS
+        self.update_interval_s = max(0.0, float(update_interval_s))
+        self.cancel_check_interval_s = max(0.0, float(cancel_check_interval_s))
+        self.started = time.monotonic()
+        self.first_token_at: float | None = None
+        self.finished: float | None = None
+        self._chunks: list[str] = []
+        self._last_emit = 0.0
+        self._last_emit_chunks = 0
+        self._last_cancel_check = self.started
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    def delta(self, text: Any) -> None:
+        value = str(text or "")
+        if value:
+            if self.first_token_at is None:
+                self.first_token_at = time.monotonic()
+            self._chunks.append(value)
+            self._emit()
+        self.check_canceled()
+
+    def check_canceled(self, *, force: bool = False) -> None:
+        if self.should_cancel is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_cancel_check < self.cancel_check_interval_s:
+            return
+        self._last_cancel_check = now
+        try:
+            canceled = bool(self.should_cancel())
+        except Exception:
+            canceled = False
+        if canceled:
+            raise FrontierStreamCanceled("Canceled by user.")
+
+    def flush(self) -> None:
+        self._emit(force=True)
+
+    def finish(self) -> None:
+        if self.finished is None:
+            self.finished = time.monotonic()
+        self.flush()
+
+    def metrics(
+        self,
+        *,
+        prompt_tokens: int | None = None,
+        completion_tokens: int | None = None,
+    ) -> dict[str, Any]:
+        finished = self.finished if self.finished is not None else time.monotonic()
+        tokens = completion_tokens if completion_tokens is not None else self.chunk_count
+        metrics: dict[str, Any] = {
+            "streamed": True,
+            "duration_ms": round((finished - self.started) * 1000.0, 1),
+            "completion_tokens": tokens,
+            "time_to_first_token_ms": None,
+            "tokens_per_second": None,
+            "generation_ms": None,
+        }
+        if self.first_token_at is not None:
+            metrics["time_to_first_token_ms"] = round(
+                (self.first_token_at - self.started) * 1000.0, 1
+            )
+            generation_seconds = finished - self.first_token_at
+            metrics["generation_ms"] = round(generation_seconds * 1000.0, 1)
+            if generation_seconds > 0 and tokens > 1:
+                # The first token's latency is reported separately as TTFT.
+                metrics["tokens_per_second"] = round((tokens - 1) / generation_seconds, 2)
+        if prompt_tokens is not None:
+            metrics["prompt_tokens"] = prompt_tokens
+        return metrics
+
+    def _emit(self, *, force: bool = False) -> None:
+        if self.on_update is None or len(self._chunks) == self._last_emit_chunks:
+            return
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_emit_chunks
+            and now - self._last_emit < self.update_interval_s
+        ):
+            return
+        self.on_update(self.text, "")
+        self._last_emit = now
+        self._last_emit_chunks = len(self._chunks)
+
+
+def merge_stream_metrics(cycles: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine per-cycle stream metrics of one tool loop into run totals."""
+    if not cycles:
+        return {}
+    completion_tokens = sum(int(item.get("completion_tokens") or 0) for item in cycles)
+    generation_ms = sum(float(item.get("generation_ms") or 0.0) for item in cycles)
+    generated_after_first = sum(
+        max(0, int(item.get("completion_tokens") or 0) - 1)
+        for item in cycles
+        if item.get("generation_ms") is not None
+    )
+    merged: dict[str, Any] = {
+        "streamed": True,
+        "cycles": len(cycles),
+        "duration_ms": round(sum(float(item.get("duration_ms") or 0.0) for item in cycles), 1),
+        "completion_tokens": completion_tokens,
+        "time_to_first_token_ms": next(
+            (
+                item["time_to_first_token_ms"]
+                for item in cycles
+                if item.get("time_to_first_token_ms") is not None
+            ),
+            None,
+        ),
+        "tokens_per_second": None,
+    }
+    if generation_ms > 0 and generated_after_first > 0:
+        merged["tokens_per_second"] = round(generated_after_first / (generation_ms / 1000.0), 2)
+    prompt_tokens = [
+        item["prompt_tokens"] for item in cycles if item.get("prompt_tokens") is not None
+    ]
+    if prompt_tokens:
+        merged["prompt_tokens"] = sum(int(value) for value in prompt_tokens)
+    return merged
@@ -8,10 +8,11 @@ import shutil
 import stat
 import subprocess
 import tempfile
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
 
 from core.db import session_scope
 from core.models import AgentTask, FlowchartNode, LLMModel
@@ -25,6 +26,17 @@ from services.execution.contracts import (
     ExecutionResult,
 )
 from services.execution.idempotency import register_dispatch_key
+from services.execution.kubernetes_watch import (
+    KubernetesJobWatch,
+    PodLogFollower,
+    get_job_watch,
+    watch_registry_key,
+)
+from services.execution.kubernetes_warm_pool import (
+    WarmPodPool,
+    warm_pod_exec_command,
+    warm_pod_idle_command,
+)
 from services.integrations import (
     NODE_EXECUTOR_IMAGE_CLASS_FRONTIER,
     NODE_EXECUTOR_IMAGE_CLASS_VLLM,
@@ -45,6 +57,10 @@ _DEFAULT_JOB_TTL_SECONDS = 1800
 _EXECUTOR_LIVE_CODE_ENABLED_ENV = "LLMCTL_NODE_EXECUTOR_K8S_LIVE_CODE_ENABLED"
 _EXECUTOR_LIVE_CODE_HOST_PATH_ENV = "LLMCTL_NODE_EXECUTOR_K8S_LIVE_CODE_HOST_PATH"
 _EXECUTOR_LIVE_CODE_HOST_PATH_DEFAULT = "/workspace/llmctl"
+_EXECUTOR_WATCH_ENABLED_ENV = "LLMCTL_NODE_EXECUTOR_K8S_WATCH_ENABLED"
+_WATCH_SYNC_GRACE_SECONDS = 10.0
+_DISPATCH_PATH_JOB = "job"
+_DISPATCH_PATH_WARM_POOL = "warm_pool"
 _EXECUTOR_ARGOCD_APP_NAME_ENV = "LLMCTL_NODE_EXECUTOR_K8S_ARGOCD_APP_NAME"
 _EXECUTOR_ARGOCD_APP_NAME_DEFAULT = "llmctl-studio"
 _ARGOCD_INSTANCE_LABEL_KEY = "app.kubernetes.io/instance"
@@ -267,6 +283,7 @@ class _KubernetesDispatchOutcome:
     startup_marker_seen: bool
     executor_result: dict[str, Any] | None
     terminal_reason: str | None
+    dispatch_path: str = _DISPATCH_PATH_JOB
 
 
 class _KubernetesDispatchFailure(Exception):
@@ -293,6 +310,88 @@ class _KubernetesDispatchFailure(Exception):
         self.stderr = stderr
 
 
+class _ExecutorLogScan:
+    def __init__(self) -> None:
+        self.startup_seen = False
+        self.executor_result: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+        self._lines: list[str] = []
+        self._text = ""
+        self._text_line_count = 0
+
+    def feed(self, line: str) -> None:
+        with self._lock:
+            self._lines.append(line)
+            self._scan(line)
+
+    def reset(self, text: str) -> None:
+        with self._lock:
+            self.startup_seen = False
+            self.executor_result = None
+            self._lines = text.splitlines(keepends=True)
+            self._text = ""
+            self._text_line_count = 0
+            for line in self._lines:
+                self._scan(line)
+
+    def text(self) -> str:
+        with self._lock:
+            if self._text_line_count != len(self._lines):
+                self._text = "".join(self._lines)
+                self._text_line_count = len(self._lines)
+            return self._text
+
+    def _scan(self, line: str) -> None:
+        cleaned = line.strip()
+        if not cleaned:
+            return
+        if cleaned == _START_MARKER_LITERAL:
+            self.startup_seen = True
+            return
+        if cleaned.startswith("{") and '"event"' in cleaned:
+            try:
+                payload = json.loads(cleaned)
+            except json.JSONDecodeError:
+                payload = {}
+            if (
+                str(payload.get("event") or "").strip() == "executor_started"
+                and str(payload.get("contract_version") or "").strip() == "v1"
+            ):
+                self.startup_seen = True
+            return
+        if cleaned.startswith(_RESULT_PREFIX):
+            raw_payload = cleaned[len(_RESULT_PREFIX) :]
+            try:
+                self.executor_result = json.loads(raw_payload)
+            except json.JSONDecodeError:
+                self.executor_result = None
+
+
+def _item_name(item: dict[str, Any] | None) -> str | None:
+    if not isinstance(item, dict):
+        return None
+    metadata = item.get("metadata") if isinstance(item.get("metadata"), dict) else {}
+    return str(metadata.get("name") or "").strip() or None
+
+
+def _pod_phase(pod_payload: dict[str, Any] | None) -> str:
+    if not isinstance(pod_payload, dict):
+        return ""
+    status = pod_payload.get("status") if isinstance(pod_payload.get("status"), dict) else {}
+    return str(status.get("phase") or "").strip()
+
+
+def _pod_logs_available(pod_payload: dict[str, Any] | None) -> bool:
+    return _pod_phase(pod_payload) in {"Running", "Succeeded", "Failed"}
+
+
+def _remove_file_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 class KubernetesExecutor:
     provider = "kubernetes"
 
@@ -416,6 +515,7 @@ class KubernetesExecutor:
                 live_code_enabled=live_code_enabled,
                 live_code_host_path=live_code_host_path,
                 argocd_app_name=argocd_app_name,
+                image_class=image_class,
             )
         except _KubernetesDispatchFailure as exc:
             provider_dispatch_id = (
@@ -553,6 +653,7 @@ class KubernetesExecutor:
             "k8s_pod_name": outcome.pod_name or "",
             "k8s_terminal_reason": outcome.terminal_reason or "",
             "startup_marker_seen": outcome.startup_marker_seen,
+            "k8s_dispatch_path": outcome.dispatch_path,
         }
         if outcome.executor_result is not None:
             provider_metadata["executor_result"] = outcome.executor_result
@@ -594,6 +695,7 @@ class KubernetesExecutor:
         live_code_enabled: bool,
         live_code_host_path: str,
         argocd_app_name: str,
+        image_class: str = NODE_EXECUTOR_IMAGE_CLASS_FRONTIER,
     ) -> _KubernetesDispatchOutcome:
         kubeconfig_path: str | None = None
         payload_configmap_name: str | None = None
@@ -613,6 +715,24 @@ class KubernetesExecutor:
                 request=request,
                 execution_timeout=execution_timeout,
             )
+            warm_outcome = self._dispatch_via_warm_pool(
+                kubectl_args,
+                request=request,
+                job_name=job_name,
+                payload_json=payload_json,
+                image_class=image_class,
+                namespace=namespace,
+                image=image,
+                service_account=service_account,
+                image_pull_secrets=image_pull_secrets,
+                k8s_gpu_limit=k8s_gpu_limit,
+                execution_timeout=execution_timeout,
+                live_code_enabled=live_code_enabled,
+                live_code_host_path=live_code_host_path,
+                argocd_app_name=argocd_app_name,
+            )
+            if warm_outcome is not None:
+                return warm_outcome
             payload_configmap_name = self._payload_configmap_name(job_name)
             payload_configmap_manifest = self._build_payload_configmap_manifest(
                 request=request,
@@ -641,6 +761,13 @@ class KubernetesExecutor:
                 live_code_host_path=live_code_host_path,
                 argocd_app_name=argocd_app_name,
             )
+            job_watch = self._job_watch(
+                namespace=namespace,
+                in_cluster=in_cluster,
+                kubeconfig=kubeconfig,
+            )
+            if job_watch is not None:
+                job_watch.track(job_name)
             self._kubectl_apply_manifest(
                 kubectl_args,
                 manifest=manifest,
@@ -654,6 +781,7 @@ class KubernetesExecutor:
                 log_collection_timeout=log_collection_timeout,
                 cancel_grace_timeout=cancel_grace_timeout,
                 cancel_force_kill=cancel_force_kill,
+                job_watch=job_watch,
             )
         finally:
             if payload_configmap_name:
@@ -703,6 +831,52 @@ class KubernetesExecutor:
         args.extend(["--kubeconfig", path])
         return args, path
 
+    def _job_watch(
+        self,
+        *,
+        namespace: str,
+        in_cluster: bool,
+        kubeconfig: str,
+    ) -> KubernetesJobWatch | None:
+        watch_enabled = _as_bool(
+            os.getenv(
+                _EXECUTOR_WATCH_ENABLED_ENV,
+                self._settings.get("k8s_watch_enabled"),
+            ),
+            default=True,
+        )
+        if not watch_enabled:
+            return None
+
+        def _create_watch() -> KubernetesJobWatch:
+            # The watch outlives this dispatch, so it keeps its own kubeconfig copy.
+            watch_args, watch_kubeconfig_path = self._kubectl_context_args(
+                namespace=namespace,
+                in_cluster=in_cluster,
+                kubeconfig=kubeconfig,
+            )
+            return KubernetesJobWatch(
+                watch_args,
+                label_selector=f"{_EXECUTOR_LABEL_KEY}={_EXECUTOR_LABEL_VALUE}",
+                cleanup=(
+                    (lambda: _remove_file_quietly(watch_kubeconfig_path))
+                    if watch_kubeconfig_path
+                    else None
+                ),
+            )
+
+        try:
+            return get_job_watch(
+                watch_registry_key(
+                    namespace=namespace,
+                    in_cluster=in_cluster,
+                    kubeconfig=kubeconfig,
+                ),
+                _create_watch,
+            )
+        except _KubernetesDispatchFailure:
+            return None
+
     def _kubectl_preflight(self, kubectl_args: list[str], *, dispatch_timeout: int) -> None:
         if shutil.which("kubectl") is None:
             raise _KubernetesDispatchFailure(
@@ -964,6 +1138,91 @@ class KubernetesExecutor:
             },
         }
 
+    def _build_warm_pod_manifest(
+        self,
+        *,
+        pod_name: str,
+        namespace: str,
+        image: str,
+        labels: dict[str, str],
+        service_account: str,
+        image_pull_secrets: list[dict[str, str]],
+        k8s_gpu_limit: int,
+        idle_ttl_seconds: int,
+        live_code_enabled: bool = False,
+        live_code_host_path: str = "",
+        argocd_app_name: str = "",
+    ) -> dict[str, Any]:
+        pod_labels = {"llmctl.provider": self.provider, **labels}
+        annotations: dict[str, str] = {}
+        if argocd_app_name:
+            pod_labels[_ARGOCD_INSTANCE_LABEL_KEY] = argocd_app_name
+            annotations[_ARGOCD_TRACKING_ID_ANNOTATION_KEY] = (
+                f"{argocd_app_name}:v1/Pod:{namespace}/{pod_name}"
+            )
+            annotations[_ARGOCD_COMPARE_OPTIONS_ANNOTATION_KEY] = (
+                _ARGOCD_IGNORE_EXTRANEOUS_COMPARE_OPTION
+            )
+        resources: dict[str, dict[str, str]] = {
+            "requests": {"cpu": "100m", "memory": "128Mi"},
+            "limits": {"cpu": "1", "memory": "1Gi"},
+        }
+        if k8s_gpu_limit > 0:
+            resources["limits"]["nvidia.com/gpu"] = str(k8s_gpu_limit)
+        volume_mounts: list[dict[str, Any]] = [
+            {
+                "name": _EXECUTOR_RUNTIME_VOLUME_NAME,
+                "mountPath": _EXECUTOR_RUNTIME_MOUNT_PATH,
+            }
+        ]
+        volumes: list[dict[str, Any]] = [
+            {
+                "name": _EXECUTOR_RUNTIME_VOLUME_NAME,
+                "emptyDir": {},
+            }
+        ]
+        if live_code_enabled and live_code_host_path:
+            volume_mounts.append({"name": "project-code", "mountPath": "/app"})
+            volumes.append(
+                {
+                    "name": "project-code",
+                    "hostPath": {
+                        "path": live_code_host_path,
+                        "type": "Directory",
+                    },
+                }
+            )
+        pod_spec: dict[str, Any] = {
+            "restartPolicy": "Never",
+            "containers": [
+                {
+                    "name": "executor",
+                    "image": image,
+                    "imagePullPolicy": "IfNotPresent",
+                    "command": warm_pod_idle_command(idle_ttl_seconds),
+                    "env": self._executor_runtime_env_entries(),
+                    "resources": resources,
+                    "volumeMounts": volume_mounts,
+                }
+            ],
+            "volumes": volumes,
+        }
+        if service_account:
+            pod_spec["serviceAccountName"] = service_account
+        if image_pull_secrets:
+            pod_spec["imagePullSecrets"] = image_pull_secrets
+        return {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {
+                "name": pod_name,
+                "namespace": namespace,
+                "labels": pod_labels,
+                "annotations": annotations,
+            },
+            "spec": pod_spec,
+        }
+
     def _build_executor_payload_json(
         self,
         *,
@@ -1074,6 +1333,215 @@ class KubernetesExecutor:
                 dispatch_submitted=False,
             )
 
+    def _warm_pool_limits(self, image_class: str) -> tuple[int, int, int] | None:
+        settings = self._settings
+        if not _as_bool(settings.get("k8s_warm_pool_enabled"), default=False):
+            return None
+        max_key = (
+            "k8s_warm_pool_vllm_max"
+            if image_class == NODE_EXECUTOR_IMAGE_CLASS_VLLM
+            else "k8s_warm_pool_frontier_max"
+        )
+        max_pods = _as_int(settings.get(max_key), default=0, minimum=0, maximum=32)
+        if max_pods <= 0:
+            return None
+        target_idle = _as_int(
+            settings.get("k8s_warm_pool_size"),
+            default=1,
+            minimum=0,
+            maximum=16,
+        )
+        idle_ttl_seconds = _as_int(
+            settings.get("k8s_warm_pool_idle_ttl_seconds"),
+            default=600,
+            minimum=60,
+            maximum=24 * 3600,
+        )
+        return min(target_idle, max_pods), max_pods, idle_ttl_seconds
+
+    def _warm_pool_spec_hash(self, *, spec: dict[str, Any]) -> str:
+        material = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(material.encode("utf-8")).hexdigest()[:12]
+
+    def _dispatch_via_warm_pool(
+        self,
+        kubectl_args: list[str],
+        *,
+        request: ExecutionRequest,
+        job_name: str,
+        payload_json: str,
+        image_class: str,
+        namespace: str,
+        image: str,
+        service_account: str,
+        image_pull_secrets: list[dict[str, str]],
+        k8s_gpu_limit: int,
+        execution_timeout: int,
+        live_code_enabled: bool,
+        live_code_host_path: str,
+        argocd_app_name: str,
+    ) -> _KubernetesDispatchOutcome | None:
+        """Run the payload in an idle pre-started pod when the pool has one.
+
+        Returns ``None`` when the pool is disabled, empty, or the pod could not
+        accept the payload; the caller then creates a Job as usual.
+        """
+        limits = self._warm_pool_limits(image_class)
+        if limits is None:
+            return None
+        target_idle, max_pods, idle_ttl_seconds = limits
+        pod_settings = {
+            "namespace": namespace,
+            "image": image,
+            "service_account": service_account,
+            "image_pull_secrets": image_pull_secrets,
+            "k8s_gpu_limit": k8s_gpu_limit,
+            "idle_ttl_seconds": idle_ttl_seconds,
+            "live_code_enabled": live_code_enabled,
+            "live_code_host_path": live_code_host_path,
+        }
+        # Pods started from a different image or settings are replaced, so the
+        # spec hash covers everything the pod template is built from.
+        spec_hash = self._warm_pool_spec_hash(
+            spec=self._build_warm_pod_manifest(pod_name="", labels={}, **pod_settings)[
+                "spec"
+            ]
+        )
+        pool = WarmPodPool(kubectl_args, image_class=image_class, spec_hash=spec_hash)
+
+        def _build_manifest(pod_name: str) -> dict[str, Any]:
+            return self._build_warm_pod_manifest(
+                pod_name=pod_name,
+                labels=pool.pod_labels(),
+                argocd_app_name=argocd_app_name,
+                **pod_settings,
+            )
+
+        pods = pool.list_pods()
+        if pods is None:
+            return None
+        pod_name = pool.lease(pods, execution_timeout=execution_timeout)
+        pool.reconcile(
+            pods,
+            leased=pod_name,
+            target_idle=target_idle,
+            max_pods=max_pods,
+            build_manifest=_build_manifest,
+        )
+        if pod_name is None:
+            return None
+        logger.info(
+            "Node executor dispatch using warm pod=%s image_class=%s execution_id=%s",
+            pod_name,
+            image_class,
+            request.execution_id,
+        )
+        return self._run_in_warm_pod(
+            kubectl_args,
+            pool=pool,
+            pod_name=pod_name,
+            job_name=job_name,
+            payload_json=payload_json,
+            runtime_root=self._executor_runtime_root(request),
+            execution_timeout=execution_timeout,
+        )
+
+    def _run_in_warm_pod(
+        self,
+        kubectl_args: list[str],
+        *,
+        pool: WarmPodPool,
+        pod_name: str,
+        job_name: str,
+        payload_json: str,
+        runtime_root: str,
+        execution_timeout: int,
+    ) -> _KubernetesDispatchOutcome | None:
+        try:
+            process = subprocess.Popen(
+                [
+                    "kubectl",
+                    *kubectl_args,
+                    "exec",
+                    "-i",
+                    pod_name,
+                    "-c",
+                    "executor",
+                    "--",
+                    *warm_pod_exec_command(runtime_root),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                errors="replace",
+            )
+        except OSError as exc:
+            logger.warning("Warm pod exec failed to start for %s: %s", pod_name, exc)
+            pool.release(pod_name)
+            return None
+        try:
+            stdout, stderr = process.communicate(payload_json, timeout=execution_timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            stdout, stderr = process.communicate()
+            # The remote process may still be running; never hand this pod out again.
+            pool.discard(pod_name)
+            raise _KubernetesDispatchFailure(
+                fallback_reason="dispatch_timeout",
+                message=(
+                    f"Kubernetes warm pod '{pod_name}' timed out after "
+                    f"{execution_timeout} seconds."
+                ),
+                job_name=job_name,
+                pod_name=pod_name,
+                dispatch_submitted=True,
+                stdout=stdout or "",
+                stderr=stderr or "",
+            )
+        stdout = stdout or ""
+        stderr = stderr or ""
+        returncode = process.returncode
+        if returncode != 0 and not stdout.strip():
+            # Nothing reached the executor (pod gone, exec refused); use a Job.
+            logger.warning(
+                "Warm pod %s rejected the payload (exit %s): %s",
+                pod_name,
+                returncode,
+                stderr.strip(),
+            )
+            pool.discard(pod_name)
+            return None
+        startup_seen, executor_result = self._parse_executor_logs(stdout, stderr)
+        if executor_result is None:
+            pool.discard(pod_name)
+        else:
+            pool.release(pod_name)
+        terminal_reason = None if returncode == 0 else f"Executor exited with code {returncode}."
+        if executor_result is None and returncode != 0:
+            raise _KubernetesDispatchFailure(
+                fallback_reason="create_failed",
+                message=(
+                    f"Kubernetes warm pod '{pod_name}' failed before completion. "
+                    f"{terminal_reason}"
+                ),
+                job_name=job_name,
+                pod_name=pod_name,
+                dispatch_submitted=True,
+                stdout=stdout,
+                stderr=stderr,
+            )
+        return _KubernetesDispatchOutcome(
+            job_name=job_name,
+            pod_name=pod_name,
+            stdout=stdout,
+            stderr=stderr,
+            startup_marker_seen=startup_seen,
+            executor_result=executor_result,
+            terminal_reason=terminal_reason,
+            dispatch_path=_DISPATCH_PATH_WARM_POOL,
+        )
+
     def _wait_for_job_completion(
         self,
         kubectl_args: list[str],
@@ -1084,6 +1552,7 @@ class KubernetesExecutor:
         log_collection_timeout: int,
         cancel_grace_timeout: int,
         cancel_force_kill: bool,
+        job_watch: KubernetesJobWatch | None = None,
     ) -> _KubernetesDispatchOutcome:
         started_monotonic = time.monotonic()
         dispatch_deadline = started_monotonic + float(dispatch_timeout)
@@ -1091,6 +1560,9 @@ class KubernetesExecutor:
         latest_stdout = ""
         latest_stderr = ""
         pod_name: str | None = None
+        log_scan = _ExecutorLogScan()
+        log_follower: PodLogFollower | None = None
+        watch_version = 0
 
         try:
             while True:
@@ -1112,24 +1584,67 @@ class KubernetesExecutor:
                         stderr=latest_stderr,
                     )
 
-                pod_name = self._resolve_job_pod_name(kubectl_args, job_name=job_name)
-                terminal_status, terminal_reason = self._job_terminal_status_with_reason(
-                    kubectl_args,
-                    job_name=job_name,
-                    pod_name=pod_name,
-                )
-                if pod_name:
-                    logs = self._read_pod_logs(
+                watched = job_watch is not None and job_watch.healthy
+                pod_payload: dict[str, Any] | None = None
+                if watched:
+                    job_payload, pod_payload = job_watch.snapshot(job_name)
+                    if (
+                        job_payload is None
+                        and now - started_monotonic > _WATCH_SYNC_GRACE_SECONDS
+                    ):
+                        # The watch never reported this job; poll it directly.
+                        watched = False
+                if watched:
+                    pod_name = _item_name(pod_payload) or pod_name
+                    terminal_status, terminal_reason = self._terminal_status_from_job_status(
+                        (job_payload or {}).get("status"),
+                        pod_reason=lambda: self._pod_terminal_reason_from_payload(pod_payload),
+                    )
+                else:
+                    pod_name = self._resolve_job_pod_name(kubectl_args, job_name=job_name)
+                    terminal_status, terminal_reason = self._job_terminal_status_with_reason(
                         kubectl_args,
+                        job_name=job_name,
                         pod_name=pod_name,
-                        timeout=log_collection_timeout,
-                    )
-                    if logs:
-                        latest_stdout = logs
-                    startup_seen, executor_result = self._parse_executor_logs(
-                        latest_stdout,
-                        latest_stderr,
                     )
+                if pod_name:
+                    if (
+                        watched
+                        and log_follower is None
+                        and _pod_logs_available(pod_payload)
+                    ):
+                        log_follower = self._follow_pod_logs(
+                            job_watch,
+                            job_name=job_name,
+                            pod_name=pod_name,
+                            log_scan=log_scan,
+                        )
+                    if log_follower is not None:
+                        if terminal_status and not log_follower.wait_closed(
+                            log_collection_timeout
+                        ):
+                            logs = self._read_pod_logs(
+                                kubectl_args,
+                                pod_name=pod_name,
+                                timeout=log_collection_timeout,
+                            )
+                            if logs:
+                                log_scan.reset(logs)
+                        latest_stdout = log_scan.text()
+                        startup_seen = log_scan.startup_seen
+                        executor_result = log_scan.executor_result
+                    else:
+                        logs = self._read_pod_logs(
+                            kubectl_args,
+                            pod_name=pod_name,
+                            timeout=log_collection_timeout,
+                        )
+                        if logs:
+                            latest_stdout = logs
+                        startup_seen, executor_result = self._parse_executor_logs(
+                            latest_stdout,
+                            latest_stderr,
+                        )
                     if terminal_status == "complete":
                         return _KubernetesDispatchOutcome(
                             job_name=job_name,
@@ -1212,7 +1727,14 @@ class KubernetesExecutor:
                         terminal_reason=terminal_reason,
                     )
 
-                time.sleep(1.0)
+                if watched:
+                    watch_version = job_watch.wait_for_update(
+                        job_name,
+                        since_version=watch_version,
+                        timeout=1.0,
+                    )
+                else:
+                    time.sleep(1.0)
         except _KubernetesDispatchFailure as exc:
             if exc.dispatch_submitted:
                 raise
@@ -1226,6 +1748,29 @@ class KubernetesExecutor:
                 stdout=exc.stdout or latest_stdout,
                 stderr=exc.stderr or latest_stderr,
             ) from exc
+        finally:
+            if log_follower is not None:
+                log_follower.stop()
+            if job_watch is not None:
+                job_watch.forget(job_name)
+
+    def _follow_pod_logs(
+        self,
+        job_watch: KubernetesJobWatch,
+        *,
+        job_name: str,
+        pod_name: str,
+        log_scan: _ExecutorLogScan,
+    ) -> PodLogFollower:
+        follower = PodLogFollower(
+            job_watch.kubectl_args,
+            pod_name=pod_name,
+            on_line=log_scan.feed,
+            pod_terminated=lambda: _pod_phase(job_watch.snapshot(job_name)[1])
+            in {"Succeeded", "Failed"},
+        )
+        follower.start()
+        return follower
 
     def _kubectl_json(
         self,
@@ -1318,22 +1863,28 @@ class KubernetesExecutor:
         pod_name: str | None,
     ) -> tuple[str, str | None]:
         payload = self._kubectl_json(kubectl_args, ["get", "job", job_name])
-        status = payload.get("status")
+        return self._terminal_status_from_job_status(
+            payload.get("status"),
+            pod_reason=lambda: self._pod_terminal_reason(kubectl_args, pod_name),
+        )
+
+    def _terminal_status_from_job_status(
+        self,
+        status: Any,
+        *,
+        pod_reason: Callable[[], str | None],
+    ) -> tuple[str, str | None]:
         if not isinstance(status, dict):
             return "", None
         if int(status.get("succeeded") or 0) > 0:
             return "complete", self._normalize_terminal_reason(
-                kubectl_args=kubectl_args,
-                job_name=job_name,
-                pod_name=pod_name,
                 job_status=status,
+                pod_reason=pod_reason,
             )
         if int(status.get("failed") or 0) > 0:
             return "failed", self._normalize_terminal_reason(
-                kubectl_args=kubectl_args,
-                job_name=job_name,
-                pod_name=pod_name,
                 job_status=status,
+                pod_reason=pod_reason,
             )
         conditions = status.get("conditions")
         if not isinstance(conditions, list):
@@ -1346,27 +1897,21 @@ class KubernetesExecutor:
             condition_type = str(condition.get("type") or "").strip().lower()
             if condition_type == "complete":
                 return "complete", self._normalize_terminal_reason(
-                    kubectl_args=kubectl_args,
-                    job_name=job_name,
-                    pod_name=pod_name,
                     job_status=status,
+                    pod_reason=pod_reason,
                 )
             if condition_type == "failed":
                 return "failed", self._normalize_terminal_reason(
-                    kubectl_args=kubectl_args,
-                    job_name=job_name,
-                    pod_name=pod_name,
                     job_status=status,
+                    pod_reason=pod_reason,
                 )
         return "", None
 
     def _normalize_terminal_reason(
         self,
         *,
-        kubectl_args: list[str],
-        job_name: str,
-        pod_name: str | None,
         job_status: dict[str, Any],
+        pod_reason: Callable[[], str | None],
     ) -> str | None:
         conditions = job_status.get("conditions")
         if isinstance(conditions, list):
@@ -1381,9 +1926,9 @@ class KubernetesExecutor:
                 parts = [part for part in [condition_type, reason, message] if part]
                 if parts:
                     return " | ".join(parts)
-        pod_reason = self._pod_terminal_reason(kubectl_args, pod_name)
-        if pod_reason:
-            return pod_reason
+        resolved_pod_reason = pod_reason()
+        if resolved_pod_reason:
+            return resolved_pod_reason
         if int(job_status.get("succeeded") or 0) > 0:
             return "Complete"
         if int(job_status.get("failed") or 0) > 0:
@@ -1401,6 +1946,14 @@ class KubernetesExecutor:
             payload = self._kubectl_json(kubectl_args, ["get", "pod", pod_name])
         except _KubernetesDispatchFailure:
             return None
+        return self._pod_terminal_reason_from_payload(payload)
+
+    def _pod_terminal_reason_from_payload(
+        self,
+        payload: dict[str, Any] | None,
+    ) -> str | None:
+        if not isinstance(payload, dict):
+            return None
         status = payload.get("status")
         if not isinstance(status, dict):
             return None
@@ -1549,33 +2102,9 @@ class KubernetesExecutor:
         stdout: str,
         stderr: str,
     ) -> tuple[bool, dict[str, Any] | None]:
-        startup_seen = False
-        executor_result: dict[str, Any] | None = None
-        for line in [*(stdout or "").splitlines(), *(stderr or "").splitlines()]:
-            cleaned = line.strip()
-            if not cleaned:
-                continue
-            if cleaned == _START_MARKER_LITERAL:
-                startup_seen = True
-                continue
-            if cleaned.startswith("{") and '"event"' in cleaned:
-                try:
-                    payload = json.loads(cleaned)
-                except json.JSONDecodeError:
-                    payload = {}
-                if (
-                    str(payload.get("event") or "").strip() == "executor_started"
-                    and str(payload.get("contract_version") or "").strip() == "v1"
-                ):
-                    startup_seen = True
-                continue
-            if cleaned.startswith(_RESULT_PREFIX):
-                raw_payload = cleaned[len(_RESULT_PREFIX) :]
-                try:
-                    executor_result = json.loads(raw_payload)
-                except json.JSONDecodeError:
-                    executor_result = None
-        return startup_seen, executor_result
+        log_scan = _ExecutorLogScan()
+        log_scan.reset(f"{stdout or ''}\n{stderr or ''}")
+        return log_scan.startup_seen, log_scan.executor_result
 
     def _extract_remote_node_states(
         self,
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import json
+import logging
+import secrets
+import subprocess
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+POOL_LABEL_KEY = "llmctl.executor.pool"
+POOL_STATE_LABEL_KEY = "llmctl.executor.pool-state"
+POOL_SPEC_LABEL_KEY = "llmctl.executor.pool-spec"
+POOL_LAST_USED_ANNOTATION_KEY = "llmctl.executor.pool/last-used-at"
+POOL_LEASE_EXPIRES_ANNOTATION_KEY = "llmctl.executor.pool/lease-expires-at"
+POOL_STATE_IDLE = "idle"
+POOL_STATE_BUSY = "busy"
+POOL_HEARTBEAT_PATH = "/tmp/llmctl/runtime/.warm-pool-heartbeat"
+POOL_EXECUTOR_ENTRYPOINT = "app/llmctl-executor/run.py"
+_KUBECTL_TIMEOUT_SECONDS = 30
+# A lease outlives the run by the time the worker needs to release the pod.
+_LEASE_GRACE_SECONDS = _KUBECTL_TIMEOUT_SECONDS
+
+# Keeps the container alive until the heartbeat file has not been touched for
+# the idle TTL. A payload in flight holds the ``.busy`` marker so long runs are
+# never cut off; once the pod exits, or its lease expires, the next reconcile
+# removes it.
+_IDLE_SCRIPT = """
+import os, sys, time
+path, ttl = sys.argv[1], int(sys.argv[2])
+os.makedirs(os.path.dirname(path), exist_ok=True)
+open(path, "a").close()
+while True:
+    time.sleep(5)
+    if os.path.exists(path + ".busy"):
+        continue
+    try:
+        idle_for = time.time() - os.stat(path).st_mtime
+    except OSError:
+        idle_for = 0
+    if idle_for > ttl:
+        break
+""".strip()
+
+# The payload arrives on stdin and is written to a file so the executor reads
+# it the same way it does inside a Job. The per-run runtime root is removed
+# afterwards so reused pods do not accumulate workspaces.
+_EXEC_SCRIPT = """
+root="$1"
+heartbeat="$2"
+touch "$heartbeat.busy"
+mkdir -p "$root"
+cat > "$root.payload.json"
+LLMCTL_EXECUTOR_PAYLOAD_FILE="$root.payload.json" python3 "$3"
+rc=$?
+rm -rf "$root" "$root.payload.json"
+rm -f "$heartbeat.busy"
+touch "$heartbeat"
+exit $rc
+""".strip()
+
+
+def warm_pod_idle_command(idle_ttl_seconds: int) -> list[str]:
+    return [
+        "python3",
+        "-c",
+        _IDLE_SCRIPT,
+        POOL_HEARTBEAT_PATH,
+        str(max(1, int(idle_ttl_seconds))),
+    ]
+
+
+def warm_pod_exec_command(runtime_root: str) -> list[str]:
+    return [
+        "sh",
+        "-c",
+        _EXEC_SCRIPT,
+        "llmctl-warm-exec",
+        runtime_root,
+        POOL_HEARTBEAT_PATH,
+        POOL_EXECUTOR_ENTRYPOINT,
+    ]
+
+
+def _metadata(pod: dict[str, Any]) -> dict[str, Any]:
+    metadata = pod.get("metadata")
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def _labels(pod: dict[str, Any]) -> dict[str, Any]:
+    labels = _metadata(pod).get("labels")
+    return labels if isinstance(labels, dict) else {}
+
+
+def _status(pod: dict[str, Any]) -> dict[str, Any]:
+    status = pod.get("status")
+    return status if isinstance(status, dict) else {}
+
+
+def _pod_name(pod: dict[str, Any]) -> str:
+    return str(_metadata(pod).get("name") or "").strip()
+
+
+def _pod_terminated(pod: dict[str, Any]) -> bool:
+    if _metadata(pod).get("deletionTimestamp"):
+        return True
+    return str(_status(pod).get("phase") or "") in {"Succeeded", "Failed"}
+
+
+def _pod_ready(pod: dict[str, Any]) -> bool:
+    status = _status(pod)
+    if str(status.get("phase") or "") != "Running":
+        return False
+    container_statuses = status.get("containerStatuses")
+    if not isinstance(container_statuses, list) or not container_statuses:
+        return False
+    return all(
+        isinstance(item, dict) and bool(item.get("ready"))
+        for item in container_statuses
+    )
+
+
+def _timestamp(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _lease_expired(pod: dict[str, Any], now: datetime) -> bool:
+    annotations = _metadata(pod).get("annotations")
+    raw = ""
+    if isinstance(annotations, dict):
+        raw = str(annotations.get(POOL_LEASE_EXPIRES_ANNOTATION_KEY) or "").strip()
+    if not raw:
+        return False
+    try:
+        expires_at = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at <= now
+
+
+def _last_used_at(pod: dict[str, Any]) -> str:
+    metadata = _metadata(pod)
+    annotations = metadata.get("annotations")
+    if isinstance(annotations, dict) and annotations.get(POOL_LAST_USED_ANNOTATION_KEY):
+        return str(annotations[POOL_LAST_USED_ANNOTATION_KEY])
+    return str(metadata.get("creationTimestamp") or "")
+
+
+class WarmPodPool:
+    """Pre-started executor pods for one image class.
+
+    Pool state lives on the pods themselves (labels and annotations), so every
+    worker process sees the same pool. Leasing patches the pod with its current
+    ``resourceVersion``; if another worker claimed it first the patch conflicts
+    and the next candidate is tried.
+    """
+
+    def __init__(
+        self,
+        kubectl_args: list[str],
+        *,
+        image_class: str,
+        spec_hash: str,
+        run: Callable[..., subprocess.CompletedProcess] | None = None,
+    ) -> None:
+        self.kubectl_args = list(kubectl_args)
+        self.image_class = image_class
+        self.spec_hash = spec_hash
+        self._run = run or subprocess.run
+
+    @property
+    def label_selector(self) -> str:
+        return f"{POOL_LABEL_KEY}={self.image_class}"
+
+    def pod_labels(self) -> dict[str, str]:
+        return {
+            POOL_LABEL_KEY: self.image_class,
+            POOL_STATE_LABEL_KEY: POOL_STATE_IDLE,
+            POOL_SPEC_LABEL_KEY: self.spec_hash,
+        }
+
+    def new_pod_name(self) -> str:
+        return f"llmctl-warm-{self.image_class}-{secrets.token_hex(4)}"
+
+    def list_pods(self) -> list[dict[str, Any]] | None:
+        completed = self._kubectl(
+            ["get", "pods", "-l", self.label_selector, "-o", "json"],
+        )
+        if completed is None or completed.returncode != 0:
+            return None
+        try:
+            payload = json.loads(completed.stdout or "{}")
+        except json.JSONDecodeError:
+            return None
+        items = payload.get("items") if isinstance(payload, dict) else None
+        if not isinstance(items, list):
+            return []
+        return [item for item in items if isinstance(item, dict)]
+
+    def lease(self, pods: list[dict[str, Any]], *, execution_timeout: int) -> str | None:
+        """Claim an idle pod for one run of at most ``execution_timeout`` seconds.
+
+        The lease expiry is written on the pod so ``reconcile`` can reclaim it
+        if this worker dies before releasing it.
+        """
+        candidates = [
+            pod
+            for pod in pods
+            if _labels(pod).get(POOL_STATE_LABEL_KEY) == POOL_STATE_IDLE
+            and _labels(pod).get(POOL_SPEC_LABEL_KEY) == self.spec_hash
+            and not _pod_terminated(pod)
+            and _pod_ready(pod)
+        ]
+        # Most recently used first keeps the hot set small and lets the rest
+        # reach their idle TTL.
+        candidates.sort(key=_last_used_at, reverse=True)
+        expires_at = _timestamp(
+            datetime.now(timezone.utc)
+            + timedelta(seconds=max(0, int(execution_timeout)) + _LEASE_GRACE_SECONDS)
+        )
+        for pod in candidates:
+            name = _pod_name(pod)
+            resource_version = str(_metadata(pod).get("resourceVersion") or "")
+            if not name or not resource_version:
+                continue
+            patch = {
+                "metadata": {
+                    "resourceVersion": resource_version,
+                    "labels": {POOL_STATE_LABEL_KEY: POOL_STATE_BUSY},
+                    "annotations": {POOL_LEASE_EXPIRES_ANNOTATION_KEY: expires_at},
+                }
+            }
+            completed = self._kubectl(
+                ["patch", "pod", name, "--type", "merge", "-p", json.dumps(patch)],
+            )
+            if completed is not None and completed.returncode == 0:
+                return name
+        return None
+
+    def release(self, pod_name: str) -> None:
+        patch = {
+            "metadata": {
+                "labels": {POOL_STATE_LABEL_KEY: POOL_STATE_IDLE},
+                "annotations": {
+                    POOL_LAST_USED_ANNOTATION_KEY: _timestamp(datetime.now(timezone.utc)),
+                    POOL_LEASE_EXPIRES_ANNOTATION_KEY: None,
+                },
+            }
+        }
+        completed = self._kubectl(
+            ["patch", "pod", pod_name, "--type", "merge", "-p", json.dumps(patch)],
+        )
+        if completed is None or completed.returncode != 0:
+            self.discard(pod_name)
+
+    def discard(self, *pod_names: str) -> None:
+        names = [name for name in pod_names if name]
+        if not names:
+            return
+        self._kubectl(
+            ["delete", "pod", *names, "--ignore-not-found=true", "--wait=false"],
+        )
+
+    def reconcile(
+        self,
+        pods: list[dict[str, Any]],
+        *,
+        leased: str | None,
+        target_idle: int,
+        max_pods: int,
+        build_manifest: Callable[[str], dict[str, Any]],
+    ) -> list[str]:
+        """Drop dead or outdated pods and start enough new ones to refill the pool.
+
+        Busy pods whose lease expired belonged to a worker that never released
+        them (or a run that hung) and are dropped as well. Returns the names of
+        pods that were created.
+        """
+        now = datetime.now(timezone.utc)
+        stale: list[str] = []
+        idle = 0
+        alive = 0
+        for pod in pods:
+            name = _pod_name(pod)
+            if not name:
+                continue
+            labels = _labels(pod)
+            state = POOL_STATE_BUSY if name == leased else labels.get(POOL_STATE_LABEL_KEY)
+            if _pod_terminated(pod):
+                stale.append(name)
+                continue
+            if state == POOL_STATE_IDLE and labels.get(POOL_SPEC_LABEL_KEY) != self.spec_hash:
+                stale.append(name)
+                continue
+            if name != leased and state == POOL_STATE_BUSY and _lease_expired(pod, now):
+                stale.append(name)
+                continue
+            alive += 1
+            if state == POOL_STATE_IDLE:
+                idle += 1
+        self.discard(*stale)
+        create_count = max(0, min(target_idle - idle, max_pods - alive))
+        if create_count <= 0:
+            return []
+        names = [self.new_pod_name() for _ in range(create_count)]
+        manifest = {
+            "apiVersion": "v1",
+            "kind": "List",
+            "items": [build_manifest(name) for name in names],
+        }
+        completed = self._kubectl(["apply", "-f", "-"], input=json.dumps(manifest))
+        if completed is None or completed.returncode != 0:
+            logger.warning(
+                "Warm executor pool for %s could not start pods: %s",
+                self.image_class,
+                ((completed.stderr or completed.stdout) if completed else "").strip(),
+            )
+            return []
+        return names
+
+    def _kubectl(
+        self,
+        command: list[str],
+        *,
+        input: str | None = None,
+    ) -> subprocess.CompletedProcess | None:
+        try:
+            return self._run(
+                ["kubectl", *self.kubectl_args, *command],
+                capture_output=True,
+                text=True,
+                input=input,
+                timeout=_KUBECTL_TIMEOUT_SECONDS,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            logger.warning("Warm executor pool kubectl call failed: %s", exc)
+            return None
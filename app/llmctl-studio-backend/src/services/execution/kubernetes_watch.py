@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import subprocess
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+_WATCH_RESTART_BACKOFF_SECONDS = (1.0, 2.0, 5.0, 10.0, 30.0)
+_WATCH_UNHEALTHY_AFTER_FAILURES = 3
+# Late events for finished jobs are dropped; remember this many names.
+_FORGOTTEN_JOBS_MAX = 1024
+_LOG_FOLLOW_RETRY_SECONDS = 1.0
+_JSON_DECODER = json.JSONDecoder()
+
+_watches: dict[tuple[str, ...], "KubernetesJobWatch"] = {}
+_watches_lock = threading.Lock()
+
+
+def watch_registry_key(*, namespace: str, in_cluster: bool, kubeconfig: str) -> tuple[str, ...]:
+    kubeconfig_digest = hashlib.sha256(str(kubeconfig or "").encode("utf-8")).hexdigest()
+    return (namespace, "in-cluster" if in_cluster else kubeconfig_digest)
+
+
+def get_job_watch(
+    key: tuple[str, ...],
+    factory: Callable[[], "KubernetesJobWatch"],
+) -> "KubernetesJobWatch":
+    with _watches_lock:
+        watch = _watches.get(key)
+        if watch is None or watch.closed:
+            watch = factory()
+            watch.start()
+            _watches[key] = watch
+        return watch
+
+
+def close_job_watches() -> None:
+    with _watches_lock:
+        watches = list(_watches.values())
+        _watches.clear()
+    for watch in watches:
+        watch.close()
+
+
+def _started_at(item: dict[str, Any]) -> datetime:
+    status = item.get("status") if isinstance(item.get("status"), dict) else {}
+    raw = str(status.get("startTime") or "").strip()
+    if raw:
+        try:
+            return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    return datetime.min.replace(tzinfo=timezone.utc)
+
+
+class KubernetesJobWatch:
+    """Shared job/pod status cache fed by one ``kubectl --watch`` per kind.
+
+    Every dispatch in the worker that targets the same namespace and cluster
+    reads from the same watch instead of polling ``kubectl get`` itself.
+    """
+
+    def __init__(
+        self,
+        kubectl_args: list[str],
+        *,
+        label_selector: str,
+        cleanup: Callable[[], None] | None = None,
+        popen: Callable[..., subprocess.Popen] = subprocess.Popen,
+    ) -> None:
+        self.kubectl_args = list(kubectl_args)
+        self.label_selector = label_selector
+        self._cleanup = cleanup
+        self._popen = popen
+        self._condition = threading.Condition()
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._pods: dict[str, dict[str, dict[str, Any]]] = {}
+        self._versions: dict[str, int] = {}
+        self._forgotten: OrderedDict[str, None] = OrderedDict()
+        self._failures = {"jobs": 0, "pods": 0}
+        self._processes: dict[str, subprocess.Popen] = {}
+        self._threads: list[threading.Thread] = []
+        self._stop = threading.Event()
+        self.closed = False
+
+    @property
+    def healthy(self) -> bool:
+        if self.closed:
+            return False
+        with self._condition:
+            return all(
+                count < _WATCH_UNHEALTHY_AFTER_FAILURES
+                for count in self._failures.values()
+            )
+
+    def start(self) -> None:
+        for kind in ("jobs", "pods"):
+            thread = threading.Thread(
+                target=self._run_stream,
+                args=(kind,),
+                name=f"k8s-watch-{kind}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def close(self) -> None:
+        self.closed = True
+        self._stop.set()
+        for process in list(self._processes.values()):
+            _terminate(process)
+        with self._condition:
+            self._condition.notify_all()
+        if self._cleanup is not None:
+            self._cleanup()
+
+    def snapshot(self, job_name: str) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        with self._condition:
+            job = self._jobs.get(job_name)
+            pods = list(self._pods.get(job_name, {}).values())
+        pod = max(pods, key=_started_at) if pods else None
+        return job, pod
+
+    def version(self, job_name: str) -> int:
+        with self._condition:
+            return self._versions.get(job_name, 0)
+
+    def wait_for_update(self, job_name: str, *, since_version: int, timeout: float) -> int:
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._condition:
+            while self._versions.get(job_name, 0) == since_version and not self._stop.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            return self._versions.get(job_name, 0)
+
+    def track(self, job_name: str) -> None:
+        with self._condition:
+            self._forgotten.pop(job_name, None)
+
+    def forget(self, job_name: str) -> None:
+        with self._condition:
+            self._jobs.pop(job_name, None)
+            self._pods.pop(job_name, None)
+            self._versions.pop(job_name, None)
+            self._forgotten[job_name] = None
+            self._forgotten.move_to_end(job_name)
+            while len(self._forgotten) > _FORGOTTEN_JOBS_MAX:
+                self._forgotten.popitem(last=False)
+
+    def handle_event(self, kind: str, event: dict[str, Any]) -> None:
+        event_type = str(event.get("type") or "").strip().upper()
+        item = event.get("object")
+        if not isinstance(item, dict):
+            return
+        metadata = item.get("metadata") if isinstance(item.get("metadata"), dict) else {}
+        name = str(metadata.get("name") or "").strip()
+        if not name:
+            return
+        if kind == "jobs":
+            job_name = name
+        else:
+            labels = metadata.get("labels") if isinstance(metadata.get("labels"), dict) else {}
+            job_name = str(labels.get("job-name") or "").strip()
+            if not job_name:
+                return
+        with self._condition:
+            self._failures[kind] = 0
+            if job_name in self._forgotten:
+                return
+            if kind == "jobs":
+                if event_type == "DELETED":
+                    self._jobs.pop(job_name, None)
+                else:
+                    self._jobs[job_name] = item
+            else:
+                pods = self._pods.setdefault(job_name, {})
+                if event_type == "DELETED":
+                    pods.pop(name, None)
+                else:
+                    pods[name] = item
+            self._versions[job_name] = self._versions.get(job_name, 0) + 1
+            self._condition.notify_all()
+
+    def _run_stream(self, kind: str) -> None:
+        command = [
+            "kubectl",
+            *self.kubectl_args,
+            "get",
+            kind,
+            "-l",
+            self.label_selector,
+            "--watch",
+            "--output-watch-events",
+            "-o",
+            "json",
+        ]
+        attempt = 0
+        while not self._stop.is_set():
+            received = False
+            returncode: int | None = None
+            try:
+                process = self._popen(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1,
+                    errors="replace",
+                )
+            except OSError as exc:
+                logger.warning("Kubernetes %s watch failed to start: %s", kind, exc)
+                process = None
+            if process is not None:
+                self._processes[kind] = process
+                buffer = ""
+                for line in process.stdout or []:
+                    buffer += line
+                    stripped = line.strip()
+                    if not stripped.endswith("}") or not (
+                        line.startswith("}") or stripped.startswith("{")
+                    ):
+                        continue
+                    buffer = buffer.lstrip()
+                    while buffer:
+                        try:
+                            event, end = _JSON_DECODER.raw_decode(buffer)
+                        except json.JSONDecodeError:
+                            break
+                        buffer = buffer[end:].lstrip()
+                        if isinstance(event, dict):
+                            received = True
+                            self.handle_event(kind, event)
+                returncode = process.wait()
+            if self._stop.is_set():
+                break
+            if received or returncode == 0:
+                # A clean exit without events is the API server closing an
+                # idle watch, not a failure.
+                attempt = 0
+            else:
+                with self._condition:
+                    self._failures[kind] += 1
+                attempt += 1
+            backoff = _WATCH_RESTART_BACKOFF_SECONDS[
+                min(attempt, len(_WATCH_RESTART_BACKOFF_SECONDS) - 1)
+            ]
+            self._stop.wait(backoff)
+
+
+def _terminate(process: subprocess.Popen) -> None:
+    try:
+        if process.poll() is None:
+            process.terminate()
+            process.wait(timeout=5)
+    except Exception:
+        try:
+            process.kill()
+        except Exception:
+            pass
+
+
+def _timestamp_key(value: str) -> str:
+    # kubelet emits RFC3339Nano with trailing zeros trimmed; pad the fraction so
+    # timestamps compare correctly as strings.
+    text = value.rstrip("Z")
+    if "." in text:
+        whole, fraction = text.split(".", 1)
+    else:
+        whole, fraction = text, ""
+    return f"{whole}.{fraction.ljust(9, '0')[:9]}"
+
+
+class PodLogFollower:
+    """Follows one pod's logs and hands each new line to ``on_line`` once.
+
+    If the stream drops while the pod is still running it is reopened with
+    ``--since-time`` and lines already delivered are skipped.
+    """
+
+    def __init__(
+        self,
+        kubectl_args: list[str],
+        *,
+        pod_name: str,
+        on_line: Callable[[str], None],
+        pod_terminated: Callable[[], bool],
+        popen: Callable[..., subprocess.Popen] = subprocess.Popen,
+    ) -> None:
+        self.kubectl_args = list(kubectl_args)
+        self.pod_name = pod_name
+        self._on_line = on_line
+        self._pod_terminated = pod_terminated
+        self._popen = popen
+        self._stop = threading.Event()
+        self._closed = threading.Event()
+        self._process: subprocess.Popen | None = None
+        self._thread: threading.Thread | None = None
+        self._last_timestamp = ""
+        self._last_key = ""
+        self._lines_at_last_key = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"k8s-logs-{self.pod_name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        process = self._process
+        if process is not None:
+            _terminate(process)
+
+    def wait_closed(self, timeout: float) -> bool:
+        return self._closed.wait(max(0.0, timeout))
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                command = [
+                    "kubectl",
+                    *self.kubectl_args,
+                    "logs",
+                    "-f",
+                    "--timestamps",
+                    self.pod_name,
+                ]
+                if self._last_timestamp:
+                    command.extend(["--since-time", self._last_timestamp])
+                try:
+                    process = self._popen(
+                        command,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        bufsize=1,
+                        errors="replace",
+                    )
+                except OSError as exc:
+                    logger.warning("Kubernetes log follow failed to start: %s", exc)
+                    return
+                self._process = process
+                skip_at_boundary = self._lines_at_last_key
+                for raw_line in process.stdout or []:
+                    timestamp, _, line = raw_line.partition(" ")
+                    key = _timestamp_key(timestamp)
+                    if self._last_key and key < self._last_key:
+                        continue
+                    if key == self._last_key and skip_at_boundary > 0:
+                        skip_at_boundary -= 1
+                        continue
+                    if key == self._last_key:
+                        self._lines_at_last_key += 1
+                    else:
+                        self._last_key = key
+                        self._last_timestamp = timestamp
+                        self._lines_at_last_key = 1
+                    self._on_line(line)
+                returncode = process.wait()
+                if self._stop.is_set():
+                    return
+                if returncode == 0 and self._pod_terminated():
+                    return
+                self._stop.wait(_LOG_FOLLOW_RETRY_SECONDS)
+        finally:
+            self._closed.set()
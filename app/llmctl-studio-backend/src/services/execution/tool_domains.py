@@ -76,6 +76,11 @@ RAG_OPERATIONS = {
     "index",
     "query",
 }
+# Read-only operations that may run concurrently within one agent tool cycle.
+# Everything else, including all git and command operations, is serialized.
+PARALLEL_SAFE_OPERATIONS = {
+    TOOL_DOMAIN_WORKSPACE: frozenset({"list", "read", "search"}),
+}
 
 
 class ToolDomainError(RuntimeError):
@@ -128,6 +133,11 @@ def _normalize_operation(value: Any) -> str:
     return _normalize_text(value).lower()
 
 
+def is_parallel_safe_operation(domain: str, operation: str) -> bool:
+    allowed = PARALLEL_SAFE_OPERATIONS.get(_normalize_operation(domain), frozenset())
+    return _normalize_operation(operation) in allowed
+
+
 def _parse_positive_int(value: Any, *, default: int, minimum: int = 1) -> int:
     try:
         parsed = int(value)
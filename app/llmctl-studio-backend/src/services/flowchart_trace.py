@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from core.db import utcnow
+from core.models import FlowchartRunNode, FlowchartRunTraceEntry
+
+FLOWCHART_TRACE_FAILURE_STATUSES = frozenset({"failed", "error"})
+FLOWCHART_TRACE_REFRESH_BATCH_SIZE = 200
+
+
+def _trace_text(value: object) -> str | None:
+    text = str(value or "").strip()
+    return text or None
+
+
+def _parse_state(raw: str | None) -> dict[str, Any]:
+    if not raw:
+        return {}
+    try:
+        payload = json.loads(raw)
+    except (TypeError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _tooling_payload(
+    output_state: dict[str, Any],
+    routing_state: dict[str, Any],
+) -> dict[str, Any]:
+    if isinstance(output_state.get("deterministic_tooling"), dict):
+        return output_state["deterministic_tooling"]
+    if isinstance(routing_state.get("deterministic_tooling"), dict):
+        return routing_state["deterministic_tooling"]
+    return {}
+
+
+def flowchart_trace_request_identity(
+    *,
+    output_state: dict[str, Any] | None,
+    routing_state: dict[str, Any] | None,
+) -> tuple[str | None, str | None]:
+    output_payload = output_state if isinstance(output_state, dict) else {}
+    routing_payload = routing_state if isinstance(routing_state, dict) else {}
+
+    def _tooling(source: dict[str, Any]) -> dict[str, Any]:
+        tooling = source.get("deterministic_tooling")
+        return tooling if isinstance(tooling, dict) else {}
+
+    output_tooling = _tooling(output_payload)
+    routing_tooling = _tooling(routing_payload)
+    request_id = _trace_text(
+        output_tooling.get("request_id")
+        or routing_tooling.get("request_id")
+        or output_payload.get("request_id")
+        or routing_payload.get("request_id")
+    )
+    correlation_id = _trace_text(
+        output_tooling.get("correlation_id")
+        or routing_tooling.get("correlation_id")
+        or output_payload.get("correlation_id")
+        or routing_payload.get("correlation_id")
+    )
+    return request_id, correlation_id
+
+
+def flowchart_trace_warning_entries(
+    *,
+    node_run: FlowchartRunNode,
+    output_state: dict[str, Any] | None,
+    routing_state: dict[str, Any] | None,
+) -> list[dict[str, Any]]:
+    warnings: list[dict[str, Any]] = []
+    if bool(node_run.degraded_status):
+        warnings.append(
+            {
+                "kind": "degraded",
+                "message": str(node_run.degraded_reason or "degraded_execution"),
+            }
+        )
+    tooling_payload = _tooling_payload(
+        output_state if isinstance(output_state, dict) else {},
+        routing_state if isinstance(routing_state, dict) else {},
+    )
+    tool_warnings = tooling_payload.get("warnings")
+    if isinstance(tool_warnings, list):
+        for item in tool_warnings:
+            if isinstance(item, dict):
+                warnings.append(
+                    {
+                        "kind": str(item.get("code") or item.get("kind") or "tool_warning"),
+                        "message": str(item.get("message") or "warning").strip(),
+                        "details": item.get("details") if isinstance(item.get("details"), dict) else {},
+                    }
+                )
+            else:
+                text = str(item or "").strip()
+                if text:
+                    warnings.append({"kind": "tool_warning", "message": text})
+    return warnings
+
+
+def _trace_entry_values(node_run: FlowchartRunNode) -> dict[str, Any]:
+    output_state = _parse_state(node_run.output_state_json)
+    routing_state = _parse_state(node_run.routing_state_json)
+    request_id, correlation_id = flowchart_trace_request_identity(
+        output_state=output_state,
+        routing_state=routing_state,
+    )
+    warnings = flowchart_trace_warning_entries(
+        node_run=node_run,
+        output_state=output_state,
+        routing_state=routing_state,
+    )
+    tooling_payload = _tooling_payload(output_state, routing_state)
+    tooling = None
+    if tooling_payload:
+        tooling = {
+            "tool_name": tooling_payload.get("tool_name"),
+            "operation": tooling_payload.get("operation"),
+            "execution_status": tooling_payload.get("execution_status"),
+            "fallback_used": bool(tooling_payload.get("fallback_used")),
+            "warnings": list(tooling_payload.get("warnings") or []),
+            "request_id": _trace_text(tooling_payload.get("request_id") or request_id),
+            "correlation_id": _trace_text(
+                tooling_payload.get("correlation_id") or correlation_id
+            ),
+        }
+    status = str(node_run.status or "").strip().lower()
+    return {
+        "flowchart_run_id": node_run.flowchart_run_id,
+        "flowchart_run_node_id": node_run.id,
+        "flowchart_node_id": node_run.flowchart_node_id,
+        "agent_task_id": node_run.agent_task_id,
+        "sequence": int(node_run.execution_index or 0),
+        "node_created_at": node_run.created_at,
+        "status": status,
+        "degraded_status": bool(node_run.degraded_status),
+        # Identifiers longer than the indexed column cannot be matched by the
+        # trace filters anyway; truncating keeps the row writable.
+        "request_id": request_id[:128] if request_id else None,
+        "correlation_id": correlation_id[:128] if correlation_id else None,
+        "has_tooling": tooling is not None,
+        "is_failure": status in FLOWCHART_TRACE_FAILURE_STATUSES
+        or bool(str(node_run.error or "").strip()),
+        "warning_count": len(warnings),
+        "warnings_json": json.dumps(warnings, sort_keys=True) if warnings else None,
+        "tooling_json": json.dumps(tooling, sort_keys=True) if tooling else None,
+        "timeline_at": (
+            node_run.finished_at
+            or node_run.started_at
+            or node_run.updated_at
+            or node_run.created_at
+        ),
+        "source_updated_at": node_run.updated_at,
+    }
+
+
+def project_flowchart_run_node(session: Session, node_run: FlowchartRunNode | None) -> None:
+    """Upsert the trace projection row for ``node_run``.
+
+    Called from the places that emit ``flowchart.node.*`` events so the trace
+    endpoint finds rows already projected; anything missed is picked up by
+    :func:`refresh_flowchart_run_trace` on read.
+    """
+    if node_run is None:
+        return
+    # Flush so ids, defaults and ``updated_at`` reflect what will be committed.
+    session.flush()
+    values = _trace_entry_values(node_run)
+    now = utcnow()
+    statement = pg_insert(FlowchartRunTraceEntry).values(
+        **values,
+        created_at=now,
+        updated_at=now,
+    )
+    update_values = {
+        key: statement.excluded[key]
+        for key in values
+        if key != "flowchart_run_node_id"
+    }
+    update_values["updated_at"] = now
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[FlowchartRunTraceEntry.flowchart_run_node_id],
+            set_=update_values,
+        )
+    )
+
+
+def refresh_flowchart_run_trace(session: Session, flowchart_run_id: int) -> int:
+    """Project node runs of a run whose trace row is missing or stale.
+
+    Returns the number of node runs that were (re)projected.
+    """
+    stale_ids = (
+        session.execute(
+            select(FlowchartRunNode.id)
+            .outerjoin(
+                FlowchartRunTraceEntry,
+                FlowchartRunTraceEntry.flowchart_run_node_id == FlowchartRunNode.id,
+            )
+            .where(FlowchartRunNode.flowchart_run_id == flowchart_run_id)
+            .where(
+                or_(
+                    FlowchartRunTraceEntry.id.is_(None),
+                    FlowchartRunTraceEntry.source_updated_at.is_distinct_from(
+                        FlowchartRunNode.updated_at
+                    ),
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    for start in range(0, len(stale_ids), FLOWCHART_TRACE_REFRESH_BATCH_SIZE):
+        batch_ids = stale_ids[start : start + FLOWCHART_TRACE_REFRESH_BATCH_SIZE]
+        node_runs = (
+            session.execute(
+                select(FlowchartRunNode).where(FlowchartRunNode.id.in_(batch_ids))
+            )
+            .scalars()
+            .all()
+        )
+        for node_run in node_runs:
+            project_flowchart_run_node(session, node_run)
+    return len(stale_ids)
+
+
+def flowchart_trace_entry_warnings(entry: FlowchartRunTraceEntry) -> list[dict[str, Any]]:
+    payload = _load_json(entry.warnings_json)
+    return payload if isinstance(payload, list) else []
+
+
+def flowchart_trace_entry_tooling(entry: FlowchartRunTraceEntry) -> dict[str, Any]:
+    payload = _load_json(entry.tooling_json)
+    return payload if isinstance(payload, dict) else {}
+
+
+def _load_json(raw: str | None) -> Any:
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return None
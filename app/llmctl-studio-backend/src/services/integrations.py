@@ -3,19 +3,29 @@ from __future__ import annotations
 import base64
 import hashlib
 import json
+import logging
+import os
 import re
+import threading
+import time
+from typing import Any, Callable
 
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 
+from core import db as core_db
 from core.config import Config
-from core.db import session_scope
-from core.models import IntegrationSetting
+from core.db import session_scope, utcnow
+from core.models import IntegrationSetting, IntegrationSettingVersion
 try:
     from cryptography.fernet import Fernet, InvalidToken
 except Exception:  # pragma: no cover
     Fernet = None  # type: ignore[assignment]
     InvalidToken = Exception  # type: ignore[assignment]
 
+logger = logging.getLogger(__name__)
+
 LLM_PROVIDERS = (
     "codex",
     "gemini",
@@ -92,6 +102,10 @@ NODE_EXECUTOR_PROVIDER_DISPATCH_ID_PATTERN = re.compile(
 )
 NODE_EXECUTOR_K8S_JOB_TTL_SECONDS_MIN = 60
 NODE_EXECUTOR_K8S_JOB_TTL_SECONDS_MAX = 86400
+NODE_EXECUTOR_K8S_WARM_POOL_SIZE_MAX = 16
+NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS_MIN = 60
+NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS_MAX = 86400
+NODE_EXECUTOR_K8S_WARM_POOL_CLASS_MAX = 32
 NODE_EXECUTOR_SETTING_KEYS = (
     "provider",
     "dispatch_timeout_seconds",
@@ -112,6 +126,11 @@ NODE_EXECUTOR_SETTING_KEYS = (
     "k8s_gpu_limit",
     "k8s_job_ttl_seconds",
     "k8s_image_pull_secrets_json",
+    "k8s_warm_pool_enabled",
+    "k8s_warm_pool_size",
+    "k8s_warm_pool_idle_ttl_seconds",
+    "k8s_warm_pool_frontier_max",
+    "k8s_warm_pool_vllm_max",
 )
 NODE_EXECUTOR_K8S_KUBECONFIG_ENCRYPTED_PREFIX = "enc:v1:"
 
@@ -593,6 +612,33 @@ def node_executor_default_settings() -> dict[str, str]:
         "k8s_image_pull_secrets_json": (
             (Config.NODE_EXECUTOR_K8S_IMAGE_PULL_SECRETS_JSON or "").strip()
         ),
+        "k8s_warm_pool_enabled": _bool_string(
+            Config.NODE_EXECUTOR_K8S_WARM_POOL_ENABLED
+        ),
+        "k8s_warm_pool_size": _coerce_int_setting(
+            str(Config.NODE_EXECUTOR_K8S_WARM_POOL_SIZE),
+            default=1,
+            minimum=0,
+            maximum=NODE_EXECUTOR_K8S_WARM_POOL_SIZE_MAX,
+        ),
+        "k8s_warm_pool_idle_ttl_seconds": _coerce_int_setting(
+            str(Config.NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS),
+            default=600,
+            minimum=NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS_MIN,
+            maximum=NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS_MAX,
+        ),
+        "k8s_warm_pool_frontier_max": _coerce_int_setting(
+            str(Config.NODE_EXECUTOR_K8S_WARM_POOL_FRONTIER_MAX),
+            default=4,
+            minimum=0,
+            maximum=NODE_EXECUTOR_K8S_WARM_POOL_CLASS_MAX,
+        ),
+        "k8s_warm_pool_vllm_max": _coerce_int_setting(
+            str(Config.NODE_EXECUTOR_K8S_WARM_POOL_VLLM_MAX),
+            default=0,
+            minimum=0,
+            maximum=NODE_EXECUTOR_K8S_WARM_POOL_CLASS_MAX,
+        ),
     }
 
 
@@ -655,6 +701,14 @@ def migrate_node_executor_to_kubernetes_only_settings() -> dict[str, int]:
 
 
 def load_node_executor_settings(*, include_secrets: bool = False) -> dict[str, str]:
+    return get_integration_settings_cache().get(
+        NODE_EXECUTOR_PROVIDER,
+        f"node_executor:{'secrets' if include_secrets else 'public'}",
+        lambda: _load_node_executor_settings_uncached(include_secrets=include_secrets),
+    )
+
+
+def _load_node_executor_settings_uncached(*, include_secrets: bool) -> dict[str, str]:
     defaults = node_executor_default_settings()
     try:
         ensure_node_executor_setting_defaults(defaults)
@@ -791,6 +845,31 @@ def load_node_executor_settings(*, include_secrets: bool = False) -> dict[str, s
         minimum=NODE_EXECUTOR_K8S_JOB_TTL_SECONDS_MIN,
         maximum=NODE_EXECUTOR_K8S_JOB_TTL_SECONDS_MAX,
     )
+    settings["k8s_warm_pool_enabled"] = _bool_string(
+        _as_bool_flag(
+            settings.get("k8s_warm_pool_enabled"),
+            default=_as_bool_flag(defaults["k8s_warm_pool_enabled"]),
+        )
+    )
+    settings["k8s_warm_pool_size"] = _coerce_int_setting(
+        settings.get("k8s_warm_pool_size"),
+        default=int(defaults["k8s_warm_pool_size"]),
+        minimum=0,
+        maximum=NODE_EXECUTOR_K8S_WARM_POOL_SIZE_MAX,
+    )
+    settings["k8s_warm_pool_idle_ttl_seconds"] = _coerce_int_setting(
+        settings.get("k8s_warm_pool_idle_ttl_seconds"),
+        default=int(defaults["k8s_warm_pool_idle_ttl_seconds"]),
+        minimum=NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS_MIN,
+        maximum=NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS_MAX,
+    )
+    for class_max_key in ("k8s_warm_pool_frontier_max", "k8s_warm_pool_vllm_max"):
+        settings[class_max_key] = _coerce_int_setting(
+            settings.get(class_max_key),
+            default=int(defaults[class_max_key]),
+            minimum=0,
+            maximum=NODE_EXECUTOR_K8S_WARM_POOL_CLASS_MAX,
+        )
     kubeconfig_value = (settings.get("k8s_kubeconfig") or "").strip()
     kubeconfig_fingerprint = ""
     if kubeconfig_value:
@@ -886,6 +965,33 @@ def save_node_executor_settings(payload: dict[str, str]) -> dict[str, str]:
         "k8s_image_pull_secrets_json": (
             candidate.get("k8s_image_pull_secrets_json") or ""
         ).strip(),
+        "k8s_warm_pool_enabled": _bool_string(
+            _as_bool_flag(candidate.get("k8s_warm_pool_enabled"), default=False)
+        ),
+        "k8s_warm_pool_size": _coerce_int_setting(
+            candidate.get("k8s_warm_pool_size"),
+            default=1,
+            minimum=0,
+            maximum=NODE_EXECUTOR_K8S_WARM_POOL_SIZE_MAX,
+        ),
+        "k8s_warm_pool_idle_ttl_seconds": _coerce_int_setting(
+            candidate.get("k8s_warm_pool_idle_ttl_seconds"),
+            default=600,
+            minimum=NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS_MIN,
+            maximum=NODE_EXECUTOR_K8S_WARM_POOL_IDLE_TTL_SECONDS_MAX,
+        ),
+        "k8s_warm_pool_frontier_max": _coerce_int_setting(
+            candidate.get("k8s_warm_pool_frontier_max"),
+            default=4,
+            minimum=0,
+            maximum=NODE_EXECUTOR_K8S_WARM_POOL_CLASS_MAX,
+        ),
+        "k8s_warm_pool_vllm_max": _coerce_int_setting(
+            candidate.get("k8s_warm_pool_vllm_max"),
+            default=0,
+            minimum=0,
+            maximum=NODE_EXECUTOR_K8S_WARM_POOL_CLASS_MAX,
+        ),
     }
     default_frontier_image = (
         (Config.NODE_EXECUTOR_K8S_FRONTIER_IMAGE or "").strip()
@@ -970,6 +1076,12 @@ def node_executor_effective_config_summary() -> dict[str, str]:
         or "",
         "k8s_kubeconfig_updated_at": settings.get("k8s_kubeconfig_updated_at") or "",
         "k8s_image_pull_secrets_json": settings.get("k8s_image_pull_secrets_json") or "",
+        "k8s_warm_pool_enabled": settings.get("k8s_warm_pool_enabled") or "false",
+        "k8s_warm_pool_size": settings.get("k8s_warm_pool_size") or "1",
+        "k8s_warm_pool_idle_ttl_seconds": settings.get("k8s_warm_pool_idle_ttl_seconds")
+        or "600",
+        "k8s_warm_pool_frontier_max": settings.get("k8s_warm_pool_frontier_max") or "4",
+        "k8s_warm_pool_vllm_max": settings.get("k8s_warm_pool_vllm_max") or "0",
     }
 
 
@@ -1001,6 +1113,12 @@ def load_node_executor_runtime_settings() -> dict[str, str]:
         "k8s_gpu_limit": settings.get("k8s_gpu_limit") or "0",
         "k8s_job_ttl_seconds": settings.get("k8s_job_ttl_seconds") or "1800",
         "k8s_image_pull_secrets_json": settings.get("k8s_image_pull_secrets_json") or "",
+        "k8s_warm_pool_enabled": settings.get("k8s_warm_pool_enabled") or "false",
+        "k8s_warm_pool_size": settings.get("k8s_warm_pool_size") or "1",
+        "k8s_warm_pool_idle_ttl_seconds": settings.get("k8s_warm_pool_idle_ttl_seconds")
+        or "600",
+        "k8s_warm_pool_frontier_max": settings.get("k8s_warm_pool_frontier_max") or "4",
+        "k8s_warm_pool_vllm_max": settings.get("k8s_warm_pool_vllm_max") or "0",
     }
 
 
@@ -1024,10 +1142,225 @@ def resolve_llm_provider(
     return None
 
 
+def _settings_version_key(provider: str | None) -> str:
+    provider_key = normalize_provider(provider)
+    # Legacy Google rows migrate into the split providers on read, so the
+    # Google providers share one version.
+    if provider_key in GOOGLE_PROVIDER_SET:
+        return "google"
+    return provider_key
+
+
+def _read_settings_version(version_key: str) -> int:
+    with session_scope() as session:
+        version = session.execute(
+            select(IntegrationSettingVersion.version).where(
+                IntegrationSettingVersion.provider == version_key
+            )
+        ).scalar()
+    return int(version or 0)
+
+
+class IntegrationSettingsCache:
+    """Per-process cache of integration settings, invalidated by version rows.
+
+    Integration settings are read far more often than they change. Entries are
+    cached per process under their provider's version key; the version row is
+    re-read at most every ``version_check_interval_s`` and an entry is reloaded
+    when it changed or is older than ``ttl_s``. Writes from this process drop
+    their entries on commit; writes from other workers are seen through the
+    version row, which every flush of integration_settings rows bumps.
+    """
+
+    def __init__(self, *, ttl_s: float = 300.0, version_check_interval_s: float = 1.0) -> None:
+        self.ttl_s = max(0.0, float(ttl_s))
+        self.version_check_interval_s = max(0.0, float(version_check_interval_s))
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], dict[str, Any]] = {}
+        self._generations: dict[str, int] = {}
+        self._pid = os.getpid()
+        self._engine = core_db._engine
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "version_checks": 0,
+            "version_changes": 0,
+            "expired": 0,
+            "invalidations": 0,
+            "bypassed": 0,
+        }
+
+    def get(
+        self,
+        provider: str,
+        variant: str,
+        loader: Callable[[], dict[str, str]],
+    ) -> dict[str, str]:
+        if self.ttl_s <= 0:
+            return loader()
+        version_key = _settings_version_key(provider)
+        slot = (version_key, variant)
+        now = time.monotonic()
+        with self._lock:
+            self._reset_if_stale_locked()
+            entry = self._entries.get(slot)
+            if entry is not None and now - entry["loaded_at"] >= self.ttl_s:
+                self._entries.pop(slot, None)
+                self._counters["expired"] += 1
+                entry = None
+            if (
+                entry is not None
+                and now - entry["checked_at"] < self.version_check_interval_s
+            ):
+                self._counters["hits"] += 1
+                return dict(entry["value"])
+            generation = self._generations.get(version_key, 0)
+        try:
+            version = _read_settings_version(version_key)
+        except Exception as exc:
+            logger.warning("Integration settings version check failed: %s", exc)
+            with self._lock:
+                self._counters["bypassed"] += 1
+            return loader()
+        with self._lock:
+            self._counters["version_checks"] += 1
+            entry = self._entries.get(slot)
+            if entry is not None and entry["version"] == version:
+                entry["checked_at"] = now
+                self._counters["hits"] += 1
+                return dict(entry["value"])
+            if entry is not None:
+                self._counters["version_changes"] += 1
+            self._counters["misses"] += 1
+        # The version is read before the rows, so a concurrent write can only
+        # leave newer rows under an older version, which the next check reloads.
+        value = loader()
+        with self._lock:
+            if self._generations.get(version_key, 0) == generation:
+                self._entries[slot] = {
+                    "value": dict(value),
+                    "version": version,
+                    "loaded_at": now,
+                    "checked_at": now,
+                }
+        return dict(value)
+
+    def invalidate(self, version_keys: set[str] | None = None) -> None:
+        with self._lock:
+            if version_keys is None:
+                version_keys = {key for key, _variant in self._entries}
+                self._entries.clear()
+            else:
+                for slot in [slot for slot in self._entries if slot[0] in version_keys]:
+                    self._entries.pop(slot, None)
+            for version_key in version_keys:
+                self._generations[version_key] = self._generations.get(version_key, 0) + 1
+            self._counters["invalidations"] += len(version_keys)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                "entries": len(self._entries),
+                "ttl_s": self.ttl_s,
+                "version_check_interval_s": self.version_check_interval_s,
+                "hit_rate": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+                **self._counters,
+            }
+
+    def _reset_if_stale_locked(self) -> None:
+        # A forked worker or a re-initialized engine (a different database)
+        # must not serve rows read through another connection.
+        pid = os.getpid()
+        if pid != self._pid or core_db._engine is not self._engine:
+            self._pid = pid
+            self._engine = core_db._engine
+            self._entries.clear()
+
+
+_settings_cache: IntegrationSettingsCache | None = None
+_settings_cache_lock = threading.Lock()
+_PENDING_SETTINGS_VERSION_KEYS = "llmctl_integration_settings_version_keys"
+
+
+def get_integration_settings_cache() -> IntegrationSettingsCache:
+    global _settings_cache
+    with _settings_cache_lock:
+        if _settings_cache is None:
+            _settings_cache = IntegrationSettingsCache(
+                ttl_s=Config.INTEGRATION_SETTINGS_CACHE_TTL_SECONDS,
+                version_check_interval_s=Config.INTEGRATION_SETTINGS_CACHE_VERSION_CHECK_SECONDS,
+            )
+        return _settings_cache
+
+
+def integration_settings_cache_stats() -> dict[str, Any]:
+    return get_integration_settings_cache().stats()
+
+
+def clear_integration_settings_cache() -> None:
+    get_integration_settings_cache().invalidate()
+
+
+def _bump_settings_versions(session: Session, version_keys: set[str]) -> None:
+    table = IntegrationSettingVersion.__table__
+    now = utcnow()
+    connection = session.connection()
+    for version_key in sorted(version_keys):
+        statement = pg_insert(table).values(provider=version_key, version=1, updated_at=now)
+        connection.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.provider],
+                set_={"version": table.c.version + 1, "updated_at": now},
+            )
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def _track_integration_setting_writes(session: Session, _flush_context: Any) -> None:
+    version_keys = {
+        _settings_version_key(item.provider)
+        for item in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(item, IntegrationSetting)
+    }
+    version_keys.discard("")
+    if not version_keys:
+        return
+    try:
+        with session.connection().begin_nested():
+            _bump_settings_versions(session, version_keys)
+    except Exception as exc:
+        # Never fail the settings write itself; other workers then pick the
+        # change up when their entries expire.
+        logger.warning("Failed to bump integration settings version: %s", exc)
+    session.info.setdefault(_PENDING_SETTINGS_VERSION_KEYS, set()).update(version_keys)
+    get_integration_settings_cache().invalidate(version_keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_integration_settings(session: Session) -> None:
+    version_keys = session.info.pop(_PENDING_SETTINGS_VERSION_KEYS, None)
+    if version_keys:
+        get_integration_settings_cache().invalidate(version_keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_integration_settings(session: Session) -> None:
+    session.info.pop(_PENDING_SETTINGS_VERSION_KEYS, None)
+
+
 def load_integration_settings(provider: str) -> dict[str, str]:
     provider_key = normalize_provider(provider)
     if not provider_key:
         return {}
+    return get_integration_settings_cache().get(
+        provider_key,
+        provider_key,
+        lambda: _load_integration_settings_uncached(provider_key),
+    )
+
+
+def _load_integration_settings_uncached(provider_key: str) -> dict[str, str]:
     if provider_key in GOOGLE_PROVIDER_SET:
         migrate_legacy_google_integration_settings()
     if provider_key == GOOGLE_DRIVE_LEGACY_PROVIDER:
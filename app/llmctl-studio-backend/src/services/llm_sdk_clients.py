@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import os
+import threading
+from typing import Any, Callable
+
+from core.config import Config
+
+_HTTPX_PROVIDERS = {"openai", "anthropic"}
+
+
+def api_key_fingerprint(api_key: str | None) -> str:
+    value = str(api_key or "")
+    if not value:
+        return ""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
+def _frozen_kwargs(kwargs: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((str(key), repr(value)) for key, value in kwargs.items()))
+
+
+class SdkClientRegistry:
+    """Process-wide LRU of provider SDK clients.
+
+    SDK clients own an HTTP connection pool, so building one per call throws
+    away keep-alive connections and TLS sessions. Clients are shared per
+    (provider, client factory, API key fingerprint, base url, options) slot, so
+    callers holding different keys never swap each other's client out; after a
+    credential rotation the old key's slot ages out of the LRU. The httpx client
+    the registry built for a slot is closed when that slot is evicted.
+    """
+
+    def __init__(self, *, max_entries: int = 32) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[Any, ...], dict[str, Any]] = OrderedDict()
+        self._pid = os.getpid()
+        self._counters = {
+            "created": 0,
+            "reused": 0,
+            "evicted": 0,
+        }
+
+    def get(
+        self,
+        provider: str,
+        factory: Callable[..., Any],
+        *,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        **client_kwargs: Any,
+    ) -> Any:
+        slot = (
+            str(provider or "").strip().lower(),
+            factory,
+            api_key_fingerprint(api_key),
+            str(base_url or ""),
+            _frozen_kwargs(client_kwargs),
+        )
+        evicted: list[dict[str, Any]] = []
+        with self._lock:
+            self._reset_after_fork_locked()
+            entry = self._entries.get(slot)
+            if entry is not None:
+                entry["uses"] += 1
+                self._counters["reused"] += 1
+                self._entries.move_to_end(slot)
+                return entry["client"]
+            kwargs = dict(client_kwargs)
+            if api_key:
+                kwargs["api_key"] = api_key
+            if base_url:
+                kwargs["base_url"] = base_url
+            http_client = _http_client(slot[0])
+            if http_client is not None:
+                kwargs["http_client"] = http_client
+            client = factory(**kwargs)
+            self._entries[slot] = {
+                "client": client,
+                "http_client": http_client,
+                "provider": slot[0],
+                "uses": 1,
+            }
+            self._entries.move_to_end(slot)
+            self._counters["created"] += 1
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False)[1])
+                self._counters["evicted"] += 1
+        _close_http_clients(evicted)
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        _close_http_clients(entries)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            providers: dict[str, dict[str, int]] = {}
+            for entry in self._entries.values():
+                bucket = providers.setdefault(entry["provider"], {"clients": 0, "uses": 0})
+                bucket["clients"] += 1
+                bucket["uses"] += int(entry["uses"])
+            lookups = self._counters["created"] + self._counters["reused"]
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "reuse_rate": (
+                    round(self._counters["reused"] / lookups, 4) if lookups else 0.0
+                ),
+                "providers": providers,
+                **self._counters,
+            }
+
+    def _reset_after_fork_locked(self) -> None:
+        # A forked worker must not share sockets with its parent.
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._entries.clear()
+
+
+def _close_http_clients(entries: list[dict[str, Any]]) -> None:
+    for entry in entries:
+        http_client = entry.get("http_client")
+        if http_client is None:
+            continue
+        try:
+            http_client.close()
+        except Exception:
+            pass
+
+
+def _http_client(provider: str) -> Any | None:
+    max_connections = int(Config.LLM_SDK_MAX_CONNECTIONS)
+    if provider not in _HTTPX_PROVIDERS or max_connections <= 0:
+        return None
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover
+        return None
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(
+                max_connections,
+                int(Config.LLM_SDK_MAX_KEEPALIVE_CONNECTIONS),
+            ),
+        ),
+        timeout=httpx.Timeout(float(Config.LLM_SDK_TIMEOUT_SECONDS)),
+    )
+
+
+_registry: SdkClientRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_sdk_client_registry() -> SdkClientRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SdkClientRegistry(max_entries=Config.LLM_SDK_CLIENT_MAX_ENTRIES)
+        return _registry
+
+
+def get_sdk_client(
+    provider: str,
+    factory: Callable[..., Any],
+    *,
+    api_key: str | None = None,
+    base_url: str | None = None,
+    **client_kwargs: Any,
+) -> Any:
+    """Return a shared SDK client built by ``factory`` for these credentials."""
+    return get_sdk_client_registry().get(
+        provider,
+        factory,
+        api_key=api_key,
+        base_url=base_url,
+        **client_kwargs,
+    )
+
+
+def sdk_client_stats() -> dict[str, Any]:
+    return get_sdk_client_registry().stats()
+
+
+def clear_sdk_clients() -> None:
+    get_sdk_client_registry().clear()
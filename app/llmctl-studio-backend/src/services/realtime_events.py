@@ -1,18 +1,43 @@
 from __future__ import annotations
 
+import atexit
+import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from threading import Lock
-from typing import Any
+from typing import Any, Callable
 
+from core.config import Config
 from services.runtime_contracts import (
     SOCKET_EVENT_CONTRACT_VERSION,
     canonical_socket_event_type,
 )
-from web.realtime import REALTIME_NAMESPACE, emit_realtime
+from web.realtime import (
+    REALTIME_BATCH_EVENT,
+    REALTIME_NAMESPACE,
+    batch_room_key,
+    batch_subscribed_rooms,
+    emit_realtime,
+)
 
 EVENT_CONTRACT_VERSION = SOCKET_EVENT_CONTRACT_VERSION
 
+# State-snapshot events where a later event for the same entity supersedes
+# earlier ones; everything else (completions, artifacts) is never dropped.
+# ``flowchart:run:updated`` is excluded because it carries one-off
+# ``transition`` payloads (paused, resumed, failed) rather than snapshots.
+COALESCIBLE_EVENT_TYPES = frozenset(
+    {
+        "node:task:updated",
+        "node:task:stage_updated",
+        "flowchart:node:updated",
+        "download:job:updated",
+    }
+)
+
 _sequence_lock = Lock()
 _sequence_counters: dict[str, int] = {}
 
@@ -250,8 +275,234 @@ def emit_contract_event(
     )
     event_name = str(envelope.get("event_type") or "")
     if envelope["room_keys"]:
-        for room in envelope["room_keys"]:
-            emit_realtime(event_name, envelope, room=room, namespace=namespace)
+        get_event_coalescer().submit(envelope, namespace=namespace)
     else:
         emit_realtime(event_name, envelope, namespace=namespace)
     return envelope
+
+
+def _batch_payload(room: str, events: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "contract_version": EVENT_CONTRACT_VERSION,
+        "room": room,
+        "flushed_at": _utcnow_iso(),
+        "count": len(events),
+        "events": events,
+    }
+
+
+def _coalesce_key(envelope: dict[str, Any]) -> tuple[str, str] | None:
+    event_type = str(envelope.get("event_type") or "")
+    if event_type not in COALESCIBLE_EVENT_TYPES:
+        return None
+    return event_type, str(envelope.get("sequence_stream") or "")
+
+
+class RealtimeEventCoalescer:
+    """Throttle superseded realtime events per room and build ``rt.batch`` messages.
+
+    Plain room subscribers get the first event per entity immediately; later
+    coalescible events for that entity within ``window_s`` are held and only the
+    newest is emitted when the window closes. Any other event for the room first
+    releases what is held, so per-room ordering is kept. Clients subscribed in
+    batch mode receive one ``rt.batch`` per room per window carrying every
+    surviving event with its sequence number unchanged; rooms without batch
+    subscribers are not batched. With a zero window every event, and its
+    single-event batch, is emitted inline.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_s: float,
+        batch_rooms: Callable[[], frozenset[str] | None] = batch_subscribed_rooms,
+    ) -> None:
+        self.window_s = max(0.0, float(window_s))
+        self._batch_rooms = batch_rooms
+        self._lock = threading.Lock()
+        self._last_emitted: dict[tuple[str, str, tuple[str, str]], float] = {}
+        self._held: dict[tuple[str, str], OrderedDict[Any, dict[str, Any]]] = {}
+        self._batches: dict[tuple[str, str], OrderedDict[Any, dict[str, Any]]] = {}
+        self._timer: threading.Timer | None = None
+        self._timer_pid: int | None = None
+        self._counters = {
+            "submitted": 0,
+            "emitted": 0,
+            "coalesced": 0,
+            "batches_emitted": 0,
+            "batch_events": 0,
+            "batch_coalesced": 0,
+        }
+
+    def submit(self, envelope: dict[str, Any], *, namespace: str) -> None:
+        event_name = str(envelope.get("event_type") or "")
+        batch_rooms = self._batch_rooms()
+        if self.window_s <= 0:
+            self._emit_inline(envelope, namespace=namespace, batch_rooms=batch_rooms)
+            return
+        key = _coalesce_key(envelope)
+        outgoing: list[tuple[str, dict[str, Any], str]] = []
+        now = time.monotonic()
+        with self._lock:
+            self._counters["submitted"] += 1
+            for room in envelope["room_keys"]:
+                room_id = (namespace, room)
+                held = self._held.get(room_id)
+                if key is None:
+                    if held:
+                        outgoing.extend(
+                            (str(item.get("event_type") or ""), item, room)
+                            for item in held.values()
+                        )
+                        held.clear()
+                    outgoing.append((event_name, envelope, room))
+                else:
+                    throttle_key = (namespace, room, key)
+                    last = self._last_emitted.get(throttle_key)
+                    if last is None or now - last >= self.window_s:
+                        if held and key in held:
+                            held.pop(key)
+                            self._counters["coalesced"] += 1
+                        self._last_emitted[throttle_key] = now
+                        outgoing.append((event_name, envelope, room))
+                    else:
+                        held = self._held.setdefault(room_id, OrderedDict())
+                        if held.pop(key, None) is not None:
+                            self._counters["coalesced"] += 1
+                        held[key] = envelope
+                if batch_rooms is not None and room not in batch_rooms:
+                    continue
+                batch = self._batches.setdefault(room_id, OrderedDict())
+                batch_key = key if key is not None else envelope["event_id"]
+                if batch.pop(batch_key, None) is not None:
+                    self._counters["batch_coalesced"] += 1
+                batch[batch_key] = envelope
+            self._counters["emitted"] += len(outgoing)
+            self._schedule_locked()
+        for name, item, room in outgoing:
+            emit_realtime(name, item, room=room, namespace=namespace)
+
+    def _emit_inline(
+        self,
+        envelope: dict[str, Any],
+        *,
+        namespace: str,
+        batch_rooms: frozenset[str] | None,
+    ) -> None:
+        event_name = str(envelope.get("event_type") or "")
+        rooms = list(envelope["room_keys"])
+        batched = [room for room in rooms if batch_rooms is None or room in batch_rooms]
+        with self._lock:
+            self._counters["submitted"] += 1
+            self._counters["emitted"] += len(rooms)
+            self._counters["batches_emitted"] += len(batched)
+            self._counters["batch_events"] += len(batched)
+        for room in rooms:
+            emit_realtime(event_name, envelope, room=room, namespace=namespace)
+        for room in batched:
+            emit_realtime(
+                REALTIME_BATCH_EVENT,
+                _batch_payload(room, [envelope]),
+                room=batch_room_key(room),
+                namespace=namespace,
+            )
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            held = self._held
+            batches = self._batches
+            self._held = {}
+            self._batches = {}
+            now = time.monotonic()
+            for (namespace, room), items in held.items():
+                for key in items:
+                    self._last_emitted[(namespace, room, key)] = now
+            expired_before = now - self.window_s
+            for throttle_key in [
+                throttle_key
+                for throttle_key, emitted_at in self._last_emitted.items()
+                if emitted_at < expired_before
+            ]:
+                self._last_emitted.pop(throttle_key, None)
+            held_count = sum(len(items) for items in held.values())
+            batch_count = sum(len(items) for items in batches.values())
+            self._counters["emitted"] += held_count
+            self._counters["batches_emitted"] += sum(1 for items in batches.values() if items)
+            self._counters["batch_events"] += batch_count
+        for (namespace, room), items in held.items():
+            for item in items.values():
+                emit_realtime(
+                    str(item.get("event_type") or ""),
+                    item,
+                    room=room,
+                    namespace=namespace,
+                )
+        for (namespace, room), items in batches.items():
+            if not items:
+                continue
+            emit_realtime(
+                REALTIME_BATCH_EVENT,
+                _batch_payload(room, list(items.values())),
+                room=batch_room_key(room),
+                namespace=namespace,
+            )
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "window_ms": int(self.window_s * 1000),
+                "held": sum(len(items) for items in self._held.values()),
+                "pending_batch_events": sum(len(items) for items in self._batches.values()),
+                **self._counters,
+            }
+
+    def _schedule_locked(self) -> None:
+        pid = os.getpid()
+        # A forked worker inherits the timer object but not its thread.
+        if self._timer is not None and self._timer_pid == pid:
+            return
+        self._timer_pid = pid
+        self._timer = threading.Timer(self.window_s, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+
+_coalescer: RealtimeEventCoalescer | None = None
+_coalescer_lock = Lock()
+
+
+def get_event_coalescer() -> RealtimeEventCoalescer:
+    global _coalescer
+    with _coalescer_lock:
+        if _coalescer is None:
+            _coalescer = RealtimeEventCoalescer(
+                window_s=Config.REALTIME_COALESCE_WINDOW_MS / 1000.0
+            )
+            atexit.register(flush_realtime_events)
+        return _coalescer
+
+
+def flush_realtime_events() -> None:
+    coalescer = _coalescer
+    if coalescer is not None:
+        coalescer.flush()
+
+
+def realtime_emit_stats() -> dict[str, Any]:
+    coalescer = _coalescer
+    if coalescer is None:
+        return {
+            "window_ms": int(Config.REALTIME_COALESCE_WINDOW_MS),
+            "held": 0,
+            "pending_batch_events": 0,
+            "submitted": 0,
+            "emitted": 0,
+            "coalesced": 0,
+            "batches_emitted": 0,
+            "batch_events": 0,
+            "batch_coalesced": 0,
+        }
+    return coalescer.stats()
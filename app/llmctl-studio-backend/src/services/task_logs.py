@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session, object_session
+
+from core.models import AgentTask, AgentTaskLogSegment
+
+TASK_LOG_STREAM_OUTPUT = "output"
+TASK_LOG_STREAM_ERROR = "error"
+TASK_LOG_STREAMS = (TASK_LOG_STREAM_OUTPUT, TASK_LOG_STREAM_ERROR)
+TASK_LOG_ACTIVE_STATUSES = frozenset({"queued", "running"})
+TASK_LOG_READ_MAX_CHARS = 256 * 1024
+
+
+class TaskLogWriter:
+    """Append-only writer for the live output/error streams of one agent task.
+
+    Each flush only inserts the text produced since the previous flush, so the
+    bytes written per run grow linearly with the output instead of rewriting
+    the accumulated text on every update.
+    """
+
+    def __init__(self, task_id: int) -> None:
+        self.task_id = task_id
+        self._started = False
+        self._next_seq: dict[str, int] = {}
+        self._lengths: dict[str, int] = {}
+        self._snapshots: dict[str, str] = {}
+
+    def append(
+        self,
+        session: Session,
+        stream: str,
+        content: str,
+        *,
+        stage: str | None = None,
+    ) -> None:
+        if not content:
+            return
+        self._start(session)
+        seq = self._next_seq.get(stream, 0)
+        start_offset = self._lengths.get(stream, 0)
+        end_offset = start_offset + len(content)
+        session.add(
+            AgentTaskLogSegment(
+                agent_task_id=self.task_id,
+                stream=stream,
+                seq=seq,
+                start_offset=start_offset,
+                end_offset=end_offset,
+                stage=stage,
+                content=content,
+            )
+        )
+        self._next_seq[stream] = seq + 1
+        self._lengths[stream] = end_offset
+
+    def sync(
+        self,
+        session: Session,
+        stream: str,
+        snapshot: str,
+        *,
+        stage: str | None = None,
+    ) -> None:
+        previous = self._snapshots.get(stream, "")
+        if snapshot.startswith(previous):
+            delta = snapshot[len(previous):]
+        else:
+            # The producer rewrote earlier text; restart the stream so offsets
+            # stay consistent with the snapshot readers will reconstruct.
+            self._start(session)
+            session.execute(
+                delete(AgentTaskLogSegment).where(
+                    AgentTaskLogSegment.agent_task_id == self.task_id,
+                    AgentTaskLogSegment.stream == stream,
+                )
+            )
+            self._next_seq[stream] = 0
+            self._lengths[stream] = 0
+            delta = snapshot
+        self._snapshots[stream] = snapshot
+        self.append(session, stream, delta, stage=stage)
+
+    def _start(self, session: Session) -> None:
+        if self._started:
+            return
+        self._started = True
+        # A redelivered task starts its streams from scratch.
+        clear_task_log_segments(session, self.task_id)
+
+
+def clear_task_log_segments(session: Session, task_id: int) -> None:
+    session.execute(
+        delete(AgentTaskLogSegment).where(AgentTaskLogSegment.agent_task_id == task_id)
+    )
+
+
+def has_task_log_segments(session: Session, task_id: int) -> bool:
+    return (
+        session.execute(
+            select(AgentTaskLogSegment.id)
+            .where(AgentTaskLogSegment.agent_task_id == task_id)
+            .limit(1)
+        ).first()
+        is not None
+    )
+
+
+def _segment_rows(session: Session, task_id: int) -> list[AgentTaskLogSegment]:
+    return list(
+        session.execute(
+            select(AgentTaskLogSegment)
+            .where(AgentTaskLogSegment.agent_task_id == task_id)
+            .order_by(AgentTaskLogSegment.id.asc())
+        )
+        .scalars()
+        .all()
+    )
+
+
+def materialize_task_logs(session: Session, task_id: int) -> dict[str, Any] | None:
+    segments = _segment_rows(session, task_id)
+    if not segments:
+        return None
+    chunks: dict[str, list[str]] = {stream: [] for stream in TASK_LOG_STREAMS}
+    stage_chunks: dict[str, list[str]] = {}
+    for segment in segments:
+        chunks.setdefault(segment.stream, []).append(segment.content)
+        if segment.stream == TASK_LOG_STREAM_ERROR and segment.stage:
+            stage_chunks.setdefault(segment.stage, []).append(segment.content)
+    return {
+        "output": "".join(chunks[TASK_LOG_STREAM_OUTPUT]),
+        "error": "".join(chunks[TASK_LOG_STREAM_ERROR]),
+        "stage_logs": json.dumps(
+            {
+                stage_key: "".join(stage_parts)
+                for stage_key, stage_parts in stage_chunks.items()
+                if stage_parts
+            },
+            sort_keys=True,
+        ),
+    }
+
+
+def resolve_task_logs(session: Session, task: AgentTask) -> dict[str, Any]:
+    """Return output/error/stage_logs for display without writing anything.
+
+    Running tasks are read from their segments. A terminal task that still has
+    segments (for example after a worker was killed) shows its snapshot
+    columns, with any column the worker never wrote filled from the segments.
+    """
+    snapshot = {
+        "output": task.output,
+        "error": task.error,
+        "stage_logs": task.stage_logs,
+    }
+    if (
+        task.status not in TASK_LOG_ACTIVE_STATUSES
+        and task.output is not None
+        and task.error
+        and task.stage_logs
+    ):
+        return snapshot
+    live = materialize_task_logs(session, task.id)
+    if live is None:
+        return snapshot
+    if task.status in TASK_LOG_ACTIVE_STATUSES:
+        return live
+    return {
+        "output": task.output if task.output is not None else live["output"],
+        "error": task.error or live["error"],
+        "stage_logs": task.stage_logs or live["stage_logs"],
+    }
+
+
+def resolve_task_output(task: AgentTask) -> str:
+    """Return the task's current output text, live while it is still running."""
+    session = object_session(task)
+    if session is None or (
+        task.status not in TASK_LOG_ACTIVE_STATUSES and task.output is not None
+    ):
+        return str(task.output or "")
+    return str(resolve_task_logs(session, task)["output"] or "")
+
+
+def _snapshot_text(task: AgentTask, stream: str) -> str:
+    if stream == TASK_LOG_STREAM_OUTPUT:
+        return task.output or ""
+    return task.error or ""
+
+
+def read_task_log(
+    session: Session,
+    task: AgentTask,
+    stream: str,
+    *,
+    offset: int = 0,
+    limit: int | None = None,
+    tail: int | None = None,
+) -> dict[str, Any]:
+    if stream not in TASK_LOG_STREAMS:
+        raise ValueError(f"Unknown task log stream: {stream}")
+    max_chars = TASK_LOG_READ_MAX_CHARS
+    if limit is not None:
+        max_chars = max(0, min(int(limit), TASK_LOG_READ_MAX_CHARS))
+    total_length = session.execute(
+        select(func.max(AgentTaskLogSegment.end_offset)).where(
+            AgentTaskLogSegment.agent_task_id == task.id,
+            AgentTaskLogSegment.stream == stream,
+        )
+    ).scalar()
+    live = total_length is not None
+    if not live:
+        text = _snapshot_text(task, stream)
+        total_length = len(text)
+    total_length = int(total_length)
+    if tail is not None:
+        tail_chars = max(0, min(int(tail), TASK_LOG_READ_MAX_CHARS))
+        start = max(0, total_length - tail_chars)
+        max_chars = tail_chars
+    else:
+        start = min(max(0, int(offset)), total_length)
+    stop = min(total_length, start + max_chars)
+    if not live:
+        content = text[start:stop]
+    elif stop <= start:
+        content = ""
+    else:
+        segments = (
+            session.execute(
+                select(AgentTaskLogSegment)
+                .where(
+                    AgentTaskLogSegment.agent_task_id == task.id,
+                    AgentTaskLogSegment.stream == stream,
+                    AgentTaskLogSegment.end_offset > start,
+                    AgentTaskLogSegment.start_offset < stop,
+                )
+                .order_by(AgentTaskLogSegment.seq.asc())
+            )
+            .scalars()
+            .all()
+        )
+        parts: list[str] = []
+        for segment in segments:
+            begin = max(start, segment.start_offset) - segment.start_offset
+            end = min(stop, segment.end_offset) - segment.start_offset
+            parts.append(segment.content[begin:end])
+        content = "".join(parts)
+    return {
+        "task_id": task.id,
+        "stream": stream,
+        "offset": start,
+        "next_offset": start + len(content),
+        "total_length": total_length,
+        "content": content,
+        "live": live,
+        "complete": task.status not in TASK_LOG_ACTIVE_STATUSES,
+    }
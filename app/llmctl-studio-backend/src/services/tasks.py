@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
 from contextlib import contextmanager
 from contextvars import ContextVar
 import json
@@ -16,17 +17,15 @@ import tempfile
 import time
 import uuid
 from collections import deque
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import selectinload
 
-from services.celery_app import celery_app
+from services.celery_app import celery_app, node_artifact_retention_sweep_scheduled
 from services.huggingface_downloads import (
     run_huggingface_model_download,
     summarize_subprocess_error,
@@ -54,6 +53,7 @@ from services.execution.router import ExecutionRouter
 from services.execution.tool_domains import (
     ToolDomainContext,
     ToolDomainError,
+    is_parallel_safe_operation,
     run_command_tool,
     run_git_tool,
     run_workspace_tool,
@@ -72,6 +72,21 @@ from services.realtime_events import (
     flowchart_scope_rooms,
     task_scope_rooms,
 )
+from services.flowchart_trace import (
+    flowchart_trace_request_identity,
+    project_flowchart_run_node,
+)
+from services.task_logs import (
+    TASK_LOG_STREAM_ERROR,
+    TASK_LOG_STREAM_OUTPUT,
+    TaskLogWriter,
+    clear_task_log_segments,
+)
+from services.vllm_remote_client import (
+    VllmPoolTimeout,
+    get_vllm_connection_pool,
+    stream_chat_completion,
+)
 from services.runtime_contracts import (
     NODE_ARTIFACT_CONTRACT_VERSION,
     NODE_ARTIFACT_PAYLOAD_VERSION,
@@ -223,6 +238,7 @@ OUTPUT_INSTRUCTIONS_MARKDOWN = (
 )
 INSTRUCTION_SIZE_WARNING_BYTES = 64 * 1024
 INSTRUCTION_TOTAL_SIZE_WARNING_BYTES = 96 * 1024
+VLLM_STREAM_UPDATE_INTERVAL_SECONDS = 0.5
 INSTRUCTION_NATIVE_ENABLED_DEFAULTS: dict[str, bool] = {
     "codex": True,
     "gemini": True,
@@ -560,6 +576,9 @@ def _sdk_tooling_evidence_payload(
         "tool_call_count": len(tool_calls),
         "tool_calls": tool_calls,
     }
+    cycle_usage = getattr(llm_result, "_llmctl_cycle_usage", None)
+    if isinstance(cycle_usage, list) and cycle_usage:
+        payload["cycle_usage"] = _json_safe(cycle_usage)
     resolved_provider = str(provider or "").strip().lower()
     if resolved_provider:
         payload["provider"] = resolved_provider
@@ -1002,6 +1021,7 @@ def _llm_dispatch_scope(
     node_id: int,
     execution_id: int,
     mcp_server_keys: list[str] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
 ):
     token = _llm_dispatch_context.set(
         {
@@ -1014,6 +1034,7 @@ def _llm_dispatch_scope(
             for item in (mcp_server_keys or [])
             if str(item).strip()
         ],
+        "should_cancel": should_cancel,
     }
     )
     try:
@@ -1168,12 +1189,16 @@ def llm_completed_process_from_execution_result(
         else execution_result.stderr
         or ""
     )
-    return subprocess.CompletedProcess(
+    completed = subprocess.CompletedProcess(
         [f"executor:{provider}"],
         returncode,
         stdout,
         stderr,
     )
+    stream_metrics = output_state.get("llm_stream_metrics")
+    if isinstance(stream_metrics, dict) and stream_metrics:
+        setattr(completed, "_llmctl_stream_metrics", dict(stream_metrics))
+    return completed
 
 
 def execute_rag_chat_completion_via_execution_router(
@@ -1335,32 +1360,10 @@ def _emit_flowchart_node_event(
     finished_at: datetime | None = None,
     runtime: dict[str, Any] | None = None,
 ) -> None:
-    output_payload = output_state if isinstance(output_state, dict) else {}
-    routing_payload = routing_state if isinstance(routing_state, dict) else {}
-    output_tooling = (
-        output_payload.get("deterministic_tooling")
-        if isinstance(output_payload.get("deterministic_tooling"), dict)
-        else {}
-    )
-    routing_tooling = (
-        routing_payload.get("deterministic_tooling")
-        if isinstance(routing_payload.get("deterministic_tooling"), dict)
-        else {}
+    request_id, correlation_id = flowchart_trace_request_identity(
+        output_state=output_state,
+        routing_state=routing_state,
     )
-    request_id = str(
-        output_tooling.get("request_id")
-        or routing_tooling.get("request_id")
-        or output_payload.get("request_id")
-        or routing_payload.get("request_id")
-        or ""
-    ).strip() or None
-    correlation_id = str(
-        output_tooling.get("correlation_id")
-        or routing_tooling.get("correlation_id")
-        or output_payload.get("correlation_id")
-        or routing_payload.get("correlation_id")
-        or ""
-    ).strip() or None
     payload = {
         "flowchart_id": flowchart_id,
         "flowchart_run_id": flowchart_run_id,
@@ -2625,36 +2628,87 @@ def _run_vllm_remote_chat_completion(
         "temperature": settings.get("temperature"),
         "max_tokens": settings.get("max_tokens"),
     }
-    data = json.dumps(payload).encode("utf-8")
     headers = {"Content-Type": "application/json"}
     api_key = str(settings.get("api_key") or "").strip()
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
-    request_obj = Request(endpoint, data=data, headers=headers, method="POST")
     cmd = [provider, endpoint]
     timeout = _safe_float(settings.get("request_timeout_seconds"), 180.0)
+
+    output_chunks: list[str] = []
+    last_emit = 0.0
+    last_emit_chunks = 0
+
+    def emit_update(force: bool = False) -> None:
+        nonlocal last_emit, last_emit_chunks
+        if on_update is None or len(output_chunks) == last_emit_chunks:
+            return
+        now = time.monotonic()
+        # The first token goes out immediately; later ones are batched so a
+        # fast stream does not turn into one log write per token.
+        if (
+            not force
+            and last_emit_chunks
+            and now - last_emit < VLLM_STREAM_UPDATE_INTERVAL_SECONDS
+        ):
+            return
+        on_update("".join(output_chunks), "")
+        last_emit = now
+        last_emit_chunks = len(output_chunks)
+
+    def on_delta(text: str) -> None:
+        output_chunks.append(text)
+        emit_update()
+
     try:
-        with urlopen(request_obj, timeout=timeout) as response:
-            body = response.read().decode("utf-8", errors="replace")
+        pool = get_vllm_connection_pool(
+            base_url,
+            max_connections=Config.VLLM_REMOTE_MAX_CONNECTIONS,
+        )
+        stream_result = stream_chat_completion(
+            pool,
+            payload,
+            headers=headers,
+            timeout=timeout,
+            on_delta=on_delta,
+        )
+    except (ValueError, VllmPoolTimeout) as exc:
+        message = str(exc)
+        if on_update:
+            on_update("", message)
+        return subprocess.CompletedProcess(cmd, 1, "", message)
+    if not stream_result.ok:
+        message = stream_result.error
+        if on_update:
+            on_update("".join(output_chunks), message)
+        returncode = stream_result.status if stream_result.status >= 400 else 1
+        completed = subprocess.CompletedProcess(
+            cmd, returncode, "".join(output_chunks), message
+        )
+    elif stream_result.streamed:
+        emit_update(force=True)
+        completed = subprocess.CompletedProcess(cmd, 0, stream_result.content, "")
+    else:
         try:
-            decoded = json.loads(body)
+            decoded = json.loads(stream_result.body)
         except json.JSONDecodeError:
             decoded = {}
-        output = _extract_vllm_message_content(decoded) or body
+        output = (
+            _extract_vllm_message_content(decoded) if isinstance(decoded, dict) else ""
+        ) or stream_result.body
         if on_update:
             on_update(output, "")
-        return subprocess.CompletedProcess(cmd, 0, output, "")
-    except HTTPError as exc:
-        error_body = exc.read().decode("utf-8", errors="replace")
-        message = error_body or str(exc)
-        if on_update:
-            on_update("", message)
-        return subprocess.CompletedProcess(cmd, exc.code or 1, "", message)
-    except URLError as exc:
-        message = str(exc)
-        if on_update:
-            on_update("", message)
-        return subprocess.CompletedProcess(cmd, 1, "", message)
+        completed = subprocess.CompletedProcess(cmd, 0, output, "")
+    if stream_result.metrics:
+        setattr(completed, "_llmctl_stream_metrics", dict(stream_result.metrics))
+    return completed
+
+
+def _llm_stream_metrics(
+    llm_result: subprocess.CompletedProcess[str] | None,
+) -> dict[str, Any]:
+    raw = getattr(llm_result, "_llmctl_stream_metrics", None)
+    return dict(raw) if isinstance(raw, dict) else {}
 
 
 def _extract_list_config(value: Any, label: str) -> list[str]:
@@ -3287,6 +3341,26 @@ def cleanup_workspaces(self) -> dict[str, int]:
     }
 
 
+@celery_app.task(bind=True)
+def sweep_node_artifact_retention(self) -> dict[str, int | bool]:
+    init_engine(Config.SQLALCHEMY_DATABASE_URI)
+    init_db()
+
+    summary = _sweep_node_artifact_retention(
+        batch_size=Config.NODE_ARTIFACT_RETENTION_SWEEP_BATCH_SIZE,
+        max_batches=Config.NODE_ARTIFACT_RETENTION_SWEEP_MAX_BATCHES,
+    )
+    logger.info(
+        "Node artifact retention sweep scanned %s nodes; expired=%s overflow=%s batches=%s drained=%s",
+        summary["nodes_scanned"],
+        summary["expired_deleted"],
+        summary["overflow_deleted"],
+        summary["batches"],
+        summary["drained"],
+    )
+    return summary
+
+
 @celery_app.task(bind=True, name="services.tasks.run_huggingface_download_task")
 def run_huggingface_download_task(
     self,
@@ -4408,6 +4482,22 @@ def _resolve_frontier_tool_workspace_root(
     return None
 
 
+# SDK tool names the frontier tool loop can dispatch, mapped to their domain.
+_FRONTIER_TOOL_DOMAINS = {
+    "deterministic.workspace": "workspace",
+    "deterministic.git": "git",
+    "deterministic.command": "command",
+}
+
+
+def _frontier_tool_call_is_parallel_safe(tool_call: FrontierToolCall) -> bool:
+    domain = _FRONTIER_TOOL_DOMAINS.get(str(tool_call.tool_name or "").strip().lower())
+    if not domain:
+        return False
+    operation = (tool_call.arguments or {}).get("operation")
+    return is_parallel_safe_operation(domain, str(operation or ""))
+
+
 def _dispatch_frontier_tool_call(
     *,
     tool_call: FrontierToolCall,
@@ -4417,14 +4507,8 @@ def _dispatch_frontier_tool_call(
     execution_id: int | None,
 ) -> dict[str, Any]:
     tool_name = str(tool_call.tool_name or "").strip().lower()
-    domain = ""
-    if tool_name == "deterministic.workspace":
-        domain = "workspace"
-    elif tool_name == "deterministic.git":
-        domain = "git"
-    elif tool_name == "deterministic.command":
-        domain = "command"
-    else:
+    domain = _FRONTIER_TOOL_DOMAINS.get(tool_name, "")
+    if not domain:
         raise FrontierToolDispatchError(
             code="unsupported_tool_name",
             message=f"Unsupported SDK tool '{tool_call.tool_name}'.",
@@ -4530,6 +4614,7 @@ def _run_frontier_llm_sdk(
     correlation_id: str | None = None,
     execution_id: int | None = None,
     env: dict[str, str] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
 ) -> subprocess.CompletedProcess[str]:
     resolved_workspace_root = _resolve_frontier_tool_workspace_root(
         workspace_root=workspace_root,
@@ -4558,6 +4643,7 @@ def _run_frontier_llm_sdk(
             default_claude_model=Config.CLAUDE_MODEL or "claude-sonnet-4-0",
             require_claude_api_key=bool(Config.CLAUDE_AUTH_REQUIRE_API_KEY),
             dispatch_tool_call=_dispatch_tool_call,
+            tool_call_is_parallel_safe=_frontier_tool_call_is_parallel_safe,
         )
     )
     return runtime.run(
@@ -4573,6 +4659,7 @@ def _run_frontier_llm_sdk(
         ),
         on_update=on_update,
         on_log=on_log,
+        should_cancel=should_cancel,
     )
 
 
@@ -4672,6 +4759,7 @@ def _run_llm(
             correlation_id=dispatch_correlation_id,
             execution_id=dispatch_execution_id,
             env=env,
+            should_cancel=dispatch_context.get("should_cancel"),
         )
     provider_label = _provider_label(provider)
     if provider == "vllm_local":
@@ -4731,24 +4819,31 @@ def _run_llm(
         raise ValueError(f"Unknown LLM provider: {provider}")
 
 
+def _agent_task_cancel_requested(task_id: int) -> bool:
+    with session_scope() as session:
+        task = session.get(AgentTask, task_id)
+        return task is not None and task.status == "canceled"
+
+
 def _update_task_logs(
     task_id: int,
-    output: str,
-    error: str,
+    log_writer: TaskLogWriter,
+    *,
+    output: str | None = None,
+    error_delta: str | None = None,
     stage: str | None = None,
-    stage_logs: str | None = None,
 ) -> None:
     with session_scope() as session:
         task = session.get(AgentTask, task_id)
         if task is None:
             return
         previous_stage = task.current_stage
-        task.output = output
-        task.error = error
+        if output is not None:
+            log_writer.sync(session, TASK_LOG_STREAM_OUTPUT, output, stage=stage)
+        if error_delta:
+            log_writer.append(session, TASK_LOG_STREAM_ERROR, error_delta, stage=stage)
         if stage is not None:
             task.current_stage = stage
-        if stage_logs is not None:
-            task.stage_logs = stage_logs
         if stage is not None and stage != previous_stage:
             _emit_task_event(
                 "node.task.stage.updated",
@@ -5640,9 +5735,9 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
     ) = _split_scripts(ordered_scripts)
     combined_scripts = pre_init_scripts + init_scripts + post_init_scripts + post_run_scripts
 
-    log_prefix_chunks: list[str] = []
+    log_writer = TaskLogWriter(task_id)
+    error_chunks: list[str] = []
     last_output = ""
-    last_error = ""
     last_llm_error = ""
     stage_log_chunks: dict[str, list[str]] = {}
     current_stage: str | None = None
@@ -5652,37 +5747,37 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
     total_stages = len(TASK_STAGE_ORDER)
 
     def _persist_logs(output: str, error: str) -> None:
-        nonlocal last_output, last_error, last_llm_error
+        nonlocal last_output, last_llm_error
+        if error.startswith(last_llm_error):
+            delta = error[len(last_llm_error):]
+        else:
+            delta = error
+        last_llm_error = error
+        if output == last_output and not delta:
+            return
         last_output = output
-        last_error = error
-        if current_stage:
-            if error.startswith(last_llm_error):
-                delta = error[len(last_llm_error):]
-            else:
-                delta = error
-            if delta:
+        if delta:
+            error_chunks.append(delta)
+            if current_stage:
                 stage_log_chunks.setdefault(current_stage, []).append(delta)
-                last_llm_error = error
         _update_task_logs(
             task_id,
-            output,
-            "".join(log_prefix_chunks) + error,
+            log_writer,
+            output=output,
+            error_delta=delta,
             stage=current_stage,
-            stage_logs=_serialize_stage_logs(),
         )
 
     def _append_task_log(message: str) -> None:
-        nonlocal log_prefix_chunks
         line = message.rstrip("\n") + "\n"
-        log_prefix_chunks.append(line)
+        error_chunks.append(line)
         if current_stage:
             stage_log_chunks.setdefault(current_stage, []).append(line)
         _update_task_logs(
             task_id,
-            last_output,
-            "".join(log_prefix_chunks) + last_error,
+            log_writer,
+            error_delta=line,
             stage=current_stage,
-            stage_logs=_serialize_stage_logs(),
         )
 
     def _serialize_stage_logs() -> str:
@@ -5718,6 +5813,7 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
     skill_adapter_name: str | None = None
     skill_materialized_paths: list[str] = []
     llm_failed = False
+    llm_canceled = False
     llm_message = ""
     post_run_failed = False
     post_run_message = ""
@@ -5731,9 +5827,11 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
             run = session.get(Run, run_id) if run_id is not None else None
             if task is not None:
                 task.status = "failed"
-                task.error = "".join(log_prefix_chunks) + last_error
+                task.output = last_output or task.output
+                task.error = "".join(error_chunks)
                 task.current_stage = current_stage
                 task.stage_logs = _serialize_stage_logs()
+                clear_task_log_segments(session, task_id)
                 task.resolved_role_id = resolved_role_id
                 task.resolved_role_version = resolved_role_version
                 task.resolved_agent_id = resolved_agent_id
@@ -6085,6 +6183,7 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
                 node_id=dispatch_node_id,
                 execution_id=dispatch_execution_id,
                 mcp_server_keys=sorted(mcp_configs),
+                should_cancel=lambda: _agent_task_cancel_requested(task_id),
             ):
                 result = _run_llm(
                     provider,
@@ -6109,8 +6208,7 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
             logger.exception("%s run failed", provider_label)
 
         if result is not None:
-            last_output = result.stdout
-            last_error = result.stderr
+            _persist_logs(result.stdout, result.stderr)
             now = _utcnow()
             with session_scope() as session:
                 task = session.get(AgentTask, task_id)
@@ -6119,7 +6217,7 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
                 if task is None:
                     return
                 task.output = result.stdout
-                task.error = "".join(log_prefix_chunks) + result.stderr
+                task.error = "".join(error_chunks)
                 task.current_stage = current_stage
                 task.stage_logs = _serialize_stage_logs()
                 if agent is not None:
@@ -6129,7 +6227,10 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
                     run.last_run_at = now
                     run.last_output = result.stdout
                     run.last_error = result.stderr
-            if result.returncode != 0:
+            # A run the frontier loop stopped for a cancel request is not a
+            # provider failure; the task row already says canceled.
+            llm_canceled = bool(getattr(result, "_llmctl_canceled", False))
+            if result.returncode != 0 and not llm_canceled:
                 llm_failed = True
                 llm_message = (
                     result.stderr.strip()
@@ -6145,17 +6246,20 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
                     )
 
         _set_stage("post_run")
-        try:
-            _run_stage_scripts(
-                "post-run",
-                post_run_scripts,
-                script_entries,
-                _append_task_log,
-            )
-        except Exception as exc:
-            post_run_failed = True
-            post_run_message = str(exc)
-            _append_task_log(str(exc))
+        if llm_canceled:
+            _append_task_log("Run canceled; skipping post-run scripts.")
+        else:
+            try:
+                _run_stage_scripts(
+                    "post-run",
+                    post_run_scripts,
+                    script_entries,
+                    _append_task_log,
+                )
+            except Exception as exc:
+                post_run_failed = True
+                post_run_message = str(exc)
+                _append_task_log(str(exc))
 
         final_failed = llm_failed or post_run_failed
         failure_message = llm_message or post_run_message
@@ -6168,10 +6272,11 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
                 return
             if task.status == "canceled":
                 task.finished_at = task.finished_at or now
-                if not task.error:
-                    task.error = "Canceled by user."
+                task.output = last_output or task.output
+                task.error = "".join(error_chunks) or task.error or "Canceled by user."
                 task.current_stage = current_stage
                 task.stage_logs = _serialize_stage_logs()
+                clear_task_log_segments(session, task_id)
                 task.resolved_role_id = resolved_role_id
                 task.resolved_role_version = resolved_role_version
                 task.resolved_agent_id = resolved_agent_id
@@ -6199,9 +6304,11 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
                 return
             task.status = "failed" if final_failed else "succeeded"
             task.finished_at = now
-            task.error = "".join(log_prefix_chunks) + last_error
+            task.output = last_output or task.output
+            task.error = "".join(error_chunks)
             task.current_stage = current_stage
             task.stage_logs = _serialize_stage_logs()
+            clear_task_log_segments(session, task_id)
             task.resolved_role_id = resolved_role_id
             task.resolved_role_version = resolved_role_version
             task.resolved_agent_id = resolved_agent_id
@@ -6217,6 +6324,7 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
             task.instruction_materialized_paths_json = _serialize_materialized_paths(
                 instruction_materialized_paths
             )
+            stream_metrics = _llm_stream_metrics(result)
             _emit_task_event(
                 "node.task.completed",
                 task=task,
@@ -6224,6 +6332,11 @@ def _execute_agent_task(task_id: int, celery_task_id: str | None = None) -> None
                     "terminal_status": str(task.status),
                     "failure_message": failure_message if final_failed else None,
                 },
+                runtime_override=(
+                    {**_task_runtime_metadata(task), "llm_stream": stream_metrics}
+                    if stream_metrics
+                    else None
+                ),
             )
             if agent is not None:
                 agent.last_run_at = now
@@ -6980,6 +7093,10 @@ def _prune_node_artifact_history(
     retention_mode: str,
     max_count: int,
 ) -> None:
+    if node_artifact_retention_sweep_scheduled():
+        # sweep_node_artifact_retention enforces retention in bulk, off the
+        # node's transaction.
+        return
     now = _utcnow()
     if retention_mode in {
         NODE_ARTIFACT_RETENTION_TTL,
@@ -7021,6 +7138,120 @@ def _prune_node_artifact_history(
             session.delete(item)
 
 
+def _delete_node_artifact_batches(
+    id_query,
+    *,
+    batch_size: int,
+    max_batches: int,
+) -> tuple[int, int, bool]:
+    """Delete the rows selected by ``id_query`` in committed batches.
+
+    Returns ``(deleted, batches, drained)``; ``drained`` is false when the
+    batch budget ran out before the query came back short. Once the budget is
+    spent, further calls return immediately.
+    """
+    deleted = 0
+    batches = 0
+    while batches < max_batches:
+        with session_scope() as session:
+            result = session.execute(
+                delete(NodeArtifact)
+                .where(NodeArtifact.id.in_(id_query.limit(batch_size)))
+                .execution_options(synchronize_session=False)
+            )
+        batches += 1
+        count = int(result.rowcount or 0)
+        deleted += count
+        if count < batch_size:
+            return deleted, batches, True
+    return deleted, batches, False
+
+
+def _sweep_node_artifact_retention(
+    *,
+    batch_size: int,
+    max_batches: int,
+) -> dict[str, int | bool]:
+    now = _utcnow()
+    with session_scope() as session:
+        node_rows = session.execute(
+            select(FlowchartNode.id, FlowchartNode.config_json).where(
+                FlowchartNode.id.in_(select(NodeArtifact.flowchart_node_id).distinct())
+            )
+        ).all()
+    ttl_node_ids: list[int] = []
+    max_count_node_ids: dict[int, list[int]] = {}
+    for node_id, config_json in node_rows:
+        retention_mode, _ttl_seconds, max_count = _node_artifact_retention_settings(
+            _parse_json_object(config_json)
+        )
+        if retention_mode in {
+            NODE_ARTIFACT_RETENTION_TTL,
+            NODE_ARTIFACT_RETENTION_TTL_MAX_COUNT,
+        }:
+            ttl_node_ids.append(int(node_id))
+        if retention_mode in {
+            NODE_ARTIFACT_RETENTION_MAX_COUNT,
+            NODE_ARTIFACT_RETENTION_TTL_MAX_COUNT,
+        }:
+            max_count_node_ids.setdefault(max_count, []).append(int(node_id))
+
+    expired_deleted = 0
+    overflow_deleted = 0
+    batches = 0
+    drained = True
+    chunk_size = 500
+    for start in range(0, len(ttl_node_ids), chunk_size):
+        node_ids = ttl_node_ids[start : start + chunk_size]
+        count, used, chunk_drained = _delete_node_artifact_batches(
+            select(NodeArtifact.id).where(
+                NodeArtifact.flowchart_node_id.in_(node_ids),
+                NodeArtifact.expires_at.is_not(None),
+                NodeArtifact.expires_at <= now,
+            ),
+            batch_size=batch_size,
+            max_batches=max_batches - batches,
+        )
+        expired_deleted += count
+        batches += used
+        drained = drained and chunk_drained
+    for max_count, grouped_node_ids in sorted(max_count_node_ids.items()):
+        for start in range(0, len(grouped_node_ids), chunk_size):
+            node_ids = grouped_node_ids[start : start + chunk_size]
+            ranked = (
+                select(
+                    NodeArtifact.id.label("id"),
+                    func.row_number()
+                    .over(
+                        partition_by=(
+                            NodeArtifact.flowchart_node_id,
+                            NodeArtifact.artifact_type,
+                        ),
+                        order_by=(NodeArtifact.created_at.desc(), NodeArtifact.id.desc()),
+                    )
+                    .label("position"),
+                )
+                .where(NodeArtifact.flowchart_node_id.in_(node_ids))
+                .subquery()
+            )
+            count, used, chunk_drained = _delete_node_artifact_batches(
+                select(ranked.c.id).where(ranked.c.position > max_count),
+                batch_size=batch_size,
+                max_batches=max_batches - batches,
+            )
+            overflow_deleted += count
+            batches += used
+            drained = drained and chunk_drained
+    return {
+        "nodes_scanned": len(node_rows),
+        "expired_deleted": expired_deleted,
+        "overflow_deleted": overflow_deleted,
+        "deleted": expired_deleted + overflow_deleted,
+        "batches": batches,
+        "drained": drained,
+    }
+
+
 def _flowchart_node_artifact_type(node_type: str) -> str:
     normalized = str(node_type or "").strip().lower()
     node_type_to_artifact_type = {
@@ -8325,6 +8556,7 @@ def _finalize_flowchart_node_failure(
                 },
                 runtime_override=runtime_payload,
             )
+        project_flowchart_run_node(session, failed_node_run)
         _emit_flowchart_node_event(
             "flowchart.node.updated",
             flowchart_id=flowchart_id,
@@ -8703,6 +8935,7 @@ def _record_flowchart_guardrail_failure(
                 "guardrail_failure": True,
             },
         )
+        project_flowchart_run_node(session, node_run)
         _emit_flowchart_node_event(
             "flowchart.node.updated",
             flowchart_id=flowchart_id,
@@ -9611,6 +9844,9 @@ def _execute_flowchart_task_node(
     }
     if sdk_tooling:
         output_state["sdk_tooling"] = sdk_tooling
+    stream_metrics = _llm_stream_metrics(llm_result)
+    if stream_metrics:
+        output_state["llm_stream_metrics"] = stream_metrics
     routing_state: dict[str, Any] = {}
     if route_key is not None and str(route_key).strip():
         routing_state["route_key"] = str(route_key).strip()
@@ -11960,6 +12196,9 @@ def _execute_executor_llm_call_node(
     }
     if sdk_tooling:
         output_state["sdk_tooling"] = sdk_tooling
+    stream_metrics = _llm_stream_metrics(llm_result)
+    if stream_metrics:
+        output_state["llm_stream_metrics"] = stream_metrics
     return (
         output_state,
         {},
@@ -12422,348 +12661,356 @@ def run_flowchart(
     ready_queue: deque[dict[str, Any]] = deque(
         [{"node_id": run_entry_node_id, "upstream_results": []}]
     )
+    in_flight_records: list[dict[str, Any]] = []
     started_monotonic = time.monotonic()
     final_status = "completed"
     failure_message: str | None = None
-    terminate_run = False
     pause_event_emitted = False
+    failure_transition = "completed"
+    # Once draining, no new activations are dispatched; nodes already in flight
+    # are still collected and persisted so none are left in a running state.
+    draining = False
 
-    while ready_queue:
-        with session_scope() as session:
-            run = session.get(FlowchartRun, run_id)
-            if run is None:
-                return
-            run_status = str(run.status or "").strip().lower()
-            if run_status == "running" and pause_event_emitted:
-                _emit_flowchart_run_event(
-                    "flowchart.run.updated",
-                    run=run,
-                    flowchart_id=flowchart_id,
-                    payload={"transition": "resumed"},
-                    request_id=flowchart_run_request_id,
-                    correlation_id=flowchart_run_correlation_id,
-                )
-                pause_event_emitted = False
-            if run_status == "canceled":
-                run.finished_at = run.finished_at or _utcnow()
-                return
-            if run_status == "stopping":
-                final_status = "stopped"
-                break
-            if run_status == "pausing":
-                run.status = "paused"
-                run.updated_at = _utcnow()
-                run_status = "paused"
-                pause_event_emitted = False
-            if run_status == "paused":
-                if not pause_event_emitted:
-                    _emit_flowchart_run_event(
-                        "flowchart.run.updated",
-                        run=run,
-                        flowchart_id=flowchart_id,
-                        payload={"transition": "paused"},
-                        request_id=flowchart_run_request_id,
-                        correlation_id=flowchart_run_correlation_id,
-                    )
-                    pause_event_emitted = True
-                time.sleep(0.25)
-                continue
+    executor = ThreadPoolExecutor(max_workers=max_parallel_nodes)
+    try:
+        while ready_queue or in_flight_records:
+            dispatch_paused = False
+            if not draining:
+                with session_scope() as session:
+                    run = session.get(FlowchartRun, run_id)
+                    if run is None:
+                        return
+                    run_status = str(run.status or "").strip().lower()
+                    if run_status == "running" and pause_event_emitted:
+                        _emit_flowchart_run_event(
+                            "flowchart.run.updated",
+                            run=run,
+                            flowchart_id=flowchart_id,
+                            payload={"transition": "resumed"},
+                            request_id=flowchart_run_request_id,
+                            correlation_id=flowchart_run_correlation_id,
+                        )
+                        pause_event_emitted = False
+                    if run_status == "canceled":
+                        run.finished_at = run.finished_at or _utcnow()
+                        return
+                    if run_status == "stopping":
+                        final_status = "stopped"
+                        draining = True
+                    if run_status == "pausing":
+                        run.status = "paused"
+                        run.updated_at = _utcnow()
+                        run_status = "paused"
+                        pause_event_emitted = False
+                    if run_status == "paused":
+                        if not pause_event_emitted:
+                            _emit_flowchart_run_event(
+                                "flowchart.run.updated",
+                                run=run,
+                                flowchart_id=flowchart_id,
+                                payload={"transition": "paused"},
+                                request_id=flowchart_run_request_id,
+                                correlation_id=flowchart_run_correlation_id,
+                            )
+                            pause_event_emitted = True
+                        dispatch_paused = True
 
-        if max_runtime_minutes is not None:
-            elapsed_minutes = (time.monotonic() - started_monotonic) / 60.0
-            if elapsed_minutes > float(max_runtime_minutes):
-                next_activation = ready_queue[0]
-                next_node_id_raw = _parse_optional_int(
-                    next_activation.get("node_id"),
+            if (
+                max_runtime_minutes is not None
+                and ready_queue
+                and not draining
+                and not dispatch_paused
+            ):
+                elapsed_minutes = (time.monotonic() - started_monotonic) / 60.0
+                if elapsed_minutes > float(max_runtime_minutes):
+                    next_activation = ready_queue[0]
+                    next_node_id_raw = _parse_optional_int(
+                        next_activation.get("node_id"),
+                        default=0,
+                        minimum=0,
+                    )
+                    next_node_id = next_node_id_raw if next_node_id_raw > 0 else None
+                    next_node_spec = node_specs.get(next_node_id)
+                    if next_node_spec is not None:
+                        execution_index = node_execution_counts.get(next_node_id, 0) + 1
+                        failure_message = (
+                            f"Flowchart exceeded max_runtime_minutes ({max_runtime_minutes})."
+                        )
+                        _record_flowchart_guardrail_failure(
+                            flowchart_id=flowchart_id,
+                            run_id=run_id,
+                            node_id=next_node_id,
+                            node_type=str(next_node_spec["node_type"]),
+                            node_ref_id=_parse_optional_int(
+                                next_node_spec.get("ref_id"), default=0, minimum=0
+                            )
+                            or None,
+                            node_config=(
+                                next_node_spec.get("config")
+                                if isinstance(next_node_spec.get("config"), dict)
+                                else None
+                            ),
+                            execution_index=execution_index,
+                            total_execution_count=total_execution_count,
+                            incoming_edges=incoming_by_target.get(next_node_id, []),
+                            latest_results=latest_results,
+                            upstream_results=list(next_activation.get("upstream_results") or []),
+                            message=failure_message,
+                        )
+                    final_status = "failed"
+                    draining = True
+
+            while (
+                ready_queue
+                and not draining
+                and not dispatch_paused
+                and len(in_flight_records) < max_parallel_nodes
+            ):
+                activation = ready_queue.popleft()
+                node_id = _parse_optional_int(
+                    activation.get("node_id"),
                     default=0,
                     minimum=0,
                 )
-                next_node_id = next_node_id_raw if next_node_id_raw > 0 else None
-                next_node_spec = node_specs.get(next_node_id)
-                if next_node_spec is not None:
-                    execution_index = node_execution_counts.get(next_node_id, 0) + 1
+                if node_id <= 0:
+                    failure_message = "Flowchart activation referenced an invalid node id."
+                    final_status = "failed"
+                    draining = True
+                    break
+                node_spec = node_specs.get(node_id)
+                if node_spec is None:
+                    failure_message = f"Flowchart referenced missing node id {node_id}."
+                    final_status = "failed"
+                    draining = True
+                    break
+
+                execution_index = node_execution_counts.get(node_id, 0) + 1
+                if max_node_executions is not None and total_execution_count >= max_node_executions:
                     failure_message = (
-                        f"Flowchart exceeded max_runtime_minutes ({max_runtime_minutes})."
+                        f"Flowchart exceeded max_node_executions ({max_node_executions})."
                     )
                     _record_flowchart_guardrail_failure(
                         flowchart_id=flowchart_id,
                         run_id=run_id,
-                        node_id=next_node_id,
-                        node_type=str(next_node_spec["node_type"]),
+                        node_id=node_id,
+                        node_type=str(node_spec["node_type"]),
                         node_ref_id=_parse_optional_int(
-                            next_node_spec.get("ref_id"), default=0, minimum=0
+                            node_spec.get("ref_id"), default=0, minimum=0
                         )
                         or None,
                         node_config=(
-                            next_node_spec.get("config")
-                            if isinstance(next_node_spec.get("config"), dict)
+                            node_spec.get("config")
+                            if isinstance(node_spec.get("config"), dict)
                             else None
                         ),
                         execution_index=execution_index,
                         total_execution_count=total_execution_count,
-                        incoming_edges=incoming_by_target.get(next_node_id, []),
+                        incoming_edges=incoming_by_target.get(node_id, []),
                         latest_results=latest_results,
-                        upstream_results=list(next_activation.get("upstream_results") or []),
+                        upstream_results=list(activation.get("upstream_results") or []),
                         message=failure_message,
                     )
-                final_status = "failed"
-                break
-
-        batch_size = min(max_parallel_nodes, len(ready_queue))
-        batch: list[dict[str, Any]] = [
-            ready_queue.popleft() for _ in range(batch_size)
-        ]
-        activation_records: list[dict[str, Any]] = []
-        batch_paused = False
-
-        for batch_index, activation in enumerate(batch):
-            with session_scope() as session:
-                run = session.get(FlowchartRun, run_id)
-                if run is None:
-                    return
-                run_status = str(run.status or "").strip().lower()
-                if run_status == "canceled":
-                    run.finished_at = run.finished_at or _utcnow()
-                    return
-                if run_status == "stopping":
-                    final_status = "stopped"
+                    final_status = "failed"
+                    draining = True
                     break
-                if run_status in {"pausing", "paused"}:
-                    for pending_activation in reversed(batch[batch_index:]):
-                        ready_queue.appendleft(pending_activation)
-                    batch_paused = True
+                if total_execution_count >= 10000:
+                    failure_message = "Flowchart exceeded hard safety limit (10000 node executions)."
+                    _record_flowchart_guardrail_failure(
+                        flowchart_id=flowchart_id,
+                        run_id=run_id,
+                        node_id=node_id,
+                        node_type=str(node_spec["node_type"]),
+                        node_ref_id=_parse_optional_int(
+                            node_spec.get("ref_id"), default=0, minimum=0
+                        )
+                        or None,
+                        node_config=(
+                            node_spec.get("config")
+                            if isinstance(node_spec.get("config"), dict)
+                            else None
+                        ),
+                        execution_index=execution_index,
+                        total_execution_count=total_execution_count,
+                        incoming_edges=incoming_by_target.get(node_id, []),
+                        latest_results=latest_results,
+                        upstream_results=list(activation.get("upstream_results") or []),
+                        message=failure_message,
+                    )
+                    final_status = "failed"
+                    draining = True
                     break
 
-            node_id = _parse_optional_int(
-                activation.get("node_id"),
-                default=0,
-                minimum=0,
-            )
-            if node_id <= 0:
-                failure_message = "Flowchart activation referenced an invalid node id."
-                final_status = "failed"
-                break
-            node_spec = node_specs.get(node_id)
-            if node_spec is None:
-                failure_message = f"Flowchart referenced missing node id {node_id}."
-                final_status = "failed"
-                break
+                total_execution_count += 1
+                node_execution_counts[node_id] = execution_index
 
-            execution_index = node_execution_counts.get(node_id, 0) + 1
-            if max_node_executions is not None and total_execution_count >= max_node_executions:
-                failure_message = (
-                    f"Flowchart exceeded max_node_executions ({max_node_executions})."
-                )
-                _record_flowchart_guardrail_failure(
+                input_context = _build_flowchart_input_context(
                     flowchart_id=flowchart_id,
                     run_id=run_id,
                     node_id=node_id,
                     node_type=str(node_spec["node_type"]),
-                    node_ref_id=_parse_optional_int(
-                        node_spec.get("ref_id"), default=0, minimum=0
-                    )
-                    or None,
-                    node_config=(
-                        node_spec.get("config")
-                        if isinstance(node_spec.get("config"), dict)
-                        else None
-                    ),
                     execution_index=execution_index,
                     total_execution_count=total_execution_count,
                     incoming_edges=incoming_by_target.get(node_id, []),
                     latest_results=latest_results,
                     upstream_results=list(activation.get("upstream_results") or []),
-                    message=failure_message,
                 )
-                final_status = "failed"
-                break
-            if total_execution_count >= 10000:
-                failure_message = "Flowchart exceeded hard safety limit (10000 node executions)."
-                _record_flowchart_guardrail_failure(
-                    flowchart_id=flowchart_id,
-                    run_id=run_id,
-                    node_id=node_id,
-                    node_type=str(node_spec["node_type"]),
-                    node_ref_id=_parse_optional_int(
-                        node_spec.get("ref_id"), default=0, minimum=0
+                node_config = node_spec.get("config") or {}
+                node_agent_id: int | None = None
+                if str(node_spec["node_type"]) == FLOWCHART_NODE_TYPE_TASK:
+                    parsed_agent_id = _parse_optional_int(
+                        node_config.get("agent_id"),
+                        default=0,
+                        minimum=0,
                     )
-                    or None,
-                    node_config=(
-                        node_spec.get("config")
-                        if isinstance(node_spec.get("config"), dict)
-                        else None
-                    ),
-                    execution_index=execution_index,
-                    total_execution_count=total_execution_count,
-                    incoming_edges=incoming_by_target.get(node_id, []),
-                    latest_results=latest_results,
-                    upstream_results=list(activation.get("upstream_results") or []),
-                    message=failure_message,
-                )
-                final_status = "failed"
-                break
+                    if parsed_agent_id > 0:
+                        node_agent_id = parsed_agent_id
 
-            total_execution_count += 1
-            node_execution_counts[node_id] = execution_index
-
-            input_context = _build_flowchart_input_context(
-                flowchart_id=flowchart_id,
-                run_id=run_id,
-                node_id=node_id,
-                node_type=str(node_spec["node_type"]),
-                execution_index=execution_index,
-                total_execution_count=total_execution_count,
-                incoming_edges=incoming_by_target.get(node_id, []),
-                latest_results=latest_results,
-                upstream_results=list(activation.get("upstream_results") or []),
-            )
-            node_config = node_spec.get("config") or {}
-            node_agent_id: int | None = None
-            if str(node_spec["node_type"]) == FLOWCHART_NODE_TYPE_TASK:
-                parsed_agent_id = _parse_optional_int(
-                    node_config.get("agent_id"),
-                    default=0,
-                    minimum=0,
-                )
-                if parsed_agent_id > 0:
-                    node_agent_id = parsed_agent_id
-
-            routed_execution_request: ExecutionRequest | None = None
-            execution_result = None
-            node_task_id: int | None = None
-            runtime_evidence: dict[str, Any] = {}
-            with session_scope() as session:
-                node_run_started_at = _utcnow()
-                node_task = _create_flowchart_node_task(
-                    session,
-                    flowchart_id=flowchart_id,
-                    run_id=run_id,
-                    node_id=node_id,
-                    node_type=str(node_spec["node_type"]),
-                    node_ref_id=_parse_optional_int(
-                        node_spec.get("ref_id"), default=0, minimum=0
+                routed_execution_request: ExecutionRequest | None = None
+                execution_result = None
+                node_task_id: int | None = None
+                runtime_evidence: dict[str, Any] = {}
+                with session_scope() as session:
+                    node_run_started_at = _utcnow()
+                    node_task = _create_flowchart_node_task(
+                        session,
+                        flowchart_id=flowchart_id,
+                        run_id=run_id,
+                        node_id=node_id,
+                        node_type=str(node_spec["node_type"]),
+                        node_ref_id=_parse_optional_int(
+                            node_spec.get("ref_id"), default=0, minimum=0
+                        )
+                        or None,
+                        node_config=node_config,
+                        agent_id=node_agent_id,
+                        execution_index=execution_index,
+                        input_context=input_context,
+                        status="running",
+                        started_at=node_run_started_at,
                     )
-                    or None,
-                    node_config=node_config,
-                    agent_id=node_agent_id,
-                    execution_index=execution_index,
-                    input_context=input_context,
-                    status="running",
-                    started_at=node_run_started_at,
-                )
-                node_task_id = node_task.id
-                node_run = FlowchartRunNode.create(
-                    session,
-                    flowchart_run_id=run_id,
-                    flowchart_node_id=node_id,
-                    execution_index=execution_index,
-                    agent_task_id=node_task.id,
-                    status="running",
-                    input_context_json=_json_dumps(input_context),
-                    output_contract_version=NODE_OUTPUT_CONTRACT_VERSION,
-                    routing_contract_version=ROUTING_OUTPUT_CONTRACT_VERSION,
-                    degraded_status=False,
-                    degraded_reason=None,
-                    idempotency_key=build_node_run_idempotency_key(
+                    node_task_id = node_task.id
+                    node_run = FlowchartRunNode.create(
+                        session,
                         flowchart_run_id=run_id,
                         flowchart_node_id=node_id,
                         execution_index=execution_index,
-                    ),
-                    started_at=node_run_started_at,
-                )
-                node_run_id = node_run.id
-                runtime_node_config = dict(node_config)
-                runtime_node_config[AGENT_RUNTIME_CUTOVER_FLAG_KEY] = (
-                    "true" if agent_runtime_cutover_enabled else "false"
-                )
-                runtime_node_config[TASK_SCHEMA_VALIDATION_FLAG_KEY] = (
-                    "true" if task_schema_validation_enabled else "false"
-                )
-                execution_request = ExecutionRequest(
-                    node_id=node_id,
-                    node_type=str(node_spec["node_type"]),
-                    node_ref_id=node_spec.get("ref_id"),
-                    node_config=runtime_node_config,
-                    input_context=input_context,
-                    execution_id=node_run_id,
-                    execution_task_id=node_task_id,
-                    execution_index=execution_index,
-                    enabled_providers=enabled_providers,
-                    default_model_id=default_model_id,
-                    mcp_server_keys=list(node_spec.get("mcp_server_keys") or []),
-                    execution_mode=(
-                        _flowchart_rag_execution_mode_from_node_config(node_config)
-                        if str(node_spec["node_type"]) == FLOWCHART_NODE_TYPE_RAG
-                        else None
-                    ),
-                )
-                routed_execution_request = execution_router.route_request(execution_request)
-                _apply_flowchart_node_task_run_metadata(
-                    node_task,
-                    routed_execution_request.run_metadata_payload(),
-                )
-                runtime_payload = routed_execution_request.run_metadata_payload()
-                _apply_node_run_contract_metadata(
-                    node_run,
-                    runtime_payload=runtime_payload,
-                )
-                _emit_task_event(
-                    "node.task.updated",
-                    task=node_task,
-                    payload={
-                        "transition": "started",
+                        agent_task_id=node_task.id,
+                        status="running",
+                        input_context_json=_json_dumps(input_context),
+                        output_contract_version=NODE_OUTPUT_CONTRACT_VERSION,
+                        routing_contract_version=ROUTING_OUTPUT_CONTRACT_VERSION,
+                        degraded_status=False,
+                        degraded_reason=None,
+                        idempotency_key=build_node_run_idempotency_key(
+                            flowchart_run_id=run_id,
+                            flowchart_node_id=node_id,
+                            execution_index=execution_index,
+                        ),
+                        started_at=node_run_started_at,
+                    )
+                    node_run_id = node_run.id
+                    runtime_node_config = dict(node_config)
+                    runtime_node_config[AGENT_RUNTIME_CUTOVER_FLAG_KEY] = (
+                        "true" if agent_runtime_cutover_enabled else "false"
+                    )
+                    runtime_node_config[TASK_SCHEMA_VALIDATION_FLAG_KEY] = (
+                        "true" if task_schema_validation_enabled else "false"
+                    )
+                    execution_request = ExecutionRequest(
+                        node_id=node_id,
+                        node_type=str(node_spec["node_type"]),
+                        node_ref_id=node_spec.get("ref_id"),
+                        node_config=runtime_node_config,
+                        input_context=input_context,
+                        execution_id=node_run_id,
+                        execution_task_id=node_task_id,
+                        execution_index=execution_index,
+                        enabled_providers=enabled_providers,
+                        default_model_id=default_model_id,
+                        mcp_server_keys=list(node_spec.get("mcp_server_keys") or []),
+                        execution_mode=(
+                            _flowchart_rag_execution_mode_from_node_config(node_config)
+                            if str(node_spec["node_type"]) == FLOWCHART_NODE_TYPE_RAG
+                            else None
+                        ),
+                    )
+                    routed_execution_request = execution_router.route_request(execution_request)
+                    _apply_flowchart_node_task_run_metadata(
+                        node_task,
+                        routed_execution_request.run_metadata_payload(),
+                    )
+                    runtime_payload = routed_execution_request.run_metadata_payload()
+                    _apply_node_run_contract_metadata(
+                        node_run,
+                        runtime_payload=runtime_payload,
+                    )
+                    _emit_task_event(
+                        "node.task.updated",
+                        task=node_task,
+                        payload={
+                            "transition": "started",
+                            "execution_index": execution_index,
+                            "flowchart_node_run_id": node_run_id,
+                        },
+                        runtime_override=runtime_payload,
+                    )
+                    project_flowchart_run_node(session, node_run)
+                    _emit_flowchart_node_event(
+                        "flowchart.node.updated",
+                        flowchart_id=flowchart_id,
+                        flowchart_run_id=run_id,
+                        flowchart_node_id=node_id,
+                        node_type=str(node_spec["node_type"]),
+                        status="running",
+                        execution_index=execution_index,
+                        node_run_id=node_run_id,
+                        agent_task_id=node_task_id,
+                        started_at=node_run_started_at,
+                        runtime=runtime_payload,
+                    )
+                in_flight_records.append(
+                    {
+                        "activation": activation,
+                        "node_id": node_id,
+                        "node_spec": node_spec,
                         "execution_index": execution_index,
-                        "flowchart_node_run_id": node_run_id,
-                    },
-                    runtime_override=runtime_payload,
-                )
-                _emit_flowchart_node_event(
-                    "flowchart.node.updated",
-                    flowchart_id=flowchart_id,
-                    flowchart_run_id=run_id,
-                    flowchart_node_id=node_id,
-                    node_type=str(node_spec["node_type"]),
-                    status="running",
-                    execution_index=execution_index,
-                    node_run_id=node_run_id,
-                    agent_task_id=node_task_id,
-                    started_at=node_run_started_at,
-                    runtime=runtime_payload,
+                        "node_run_id": node_run_id,
+                        "node_task_id": node_task_id,
+                        "routed_execution_request": routed_execution_request,
+                        "sequence": total_execution_count,
+                        "execution_future": executor.submit(
+                            execution_router.execute_routed,
+                            routed_execution_request,
+                            _execute_flowchart_node_request,
+                        ),
+                    }
                 )
-            activation_records.append(
-                {
-                    "activation": activation,
-                    "node_id": node_id,
-                    "node_spec": node_spec,
-                    "execution_index": execution_index,
-                    "node_run_id": node_run_id,
-                    "node_task_id": node_task_id,
-                    "routed_execution_request": routed_execution_request,
-                    "sequence": total_execution_count,
-                }
-            )
 
-        if final_status in {"failed", "stopped"}:
-            break
-        if batch_paused:
-            time.sleep(0.25)
-            continue
-        if not activation_records:
-            continue
-
-        with ThreadPoolExecutor(max_workers=len(activation_records)) as executor:
-            for record in activation_records:
-                routed_execution_request = record.get("routed_execution_request")
-                if isinstance(routed_execution_request, ExecutionRequest):
-                    record["execution_future"] = executor.submit(
-                        execution_router.execute_routed,
-                        routed_execution_request,
-                        _execute_flowchart_node_request,
-                    )
+            if not in_flight_records:
+                if draining:
+                    break
+                if dispatch_paused:
+                    time.sleep(0.25)
+                continue
 
-            batch_failed = False
-            pending_emissions: list[dict[str, Any]] = []
-            for record in activation_records:
+            # Collect whichever nodes finish first so their successors can be
+            # dispatched immediately instead of waiting on slower siblings.
+            completed_futures, _ = wait_for_futures(
+                [record["execution_future"] for record in in_flight_records],
+                timeout=0.25 if dispatch_paused else None,
+                return_when=FIRST_COMPLETED,
+            )
+            completed_records = [
+                record
+                for record in in_flight_records
+                if record["execution_future"] in completed_futures
+            ]
+            in_flight_records = [
+                record
+                for record in in_flight_records
+                if record["execution_future"] not in completed_futures
+            ]
+            for record in completed_records:
                 node_id = int(record.get("node_id") or 0)
                 node_spec = dict(record.get("node_spec") or {})
                 execution_index = int(record.get("execution_index") or 0)
@@ -12885,7 +13132,8 @@ def run_flowchart(
                             node_task_id=node_task_id,
                             failure_message=failure_message,
                         )
-                    batch_failed = True
+                    final_status = "failed"
+                    draining = True
                     continue
 
                 latest_results[node_id] = {
@@ -13022,6 +13270,7 @@ def run_flowchart(
                                 },
                                 runtime_override=runtime_payload,
                             )
+                        project_flowchart_run_node(session, succeeded_node_run)
                         _emit_flowchart_node_event(
                             "flowchart.node.updated",
                             flowchart_id=flowchart_id,
@@ -13163,11 +13412,15 @@ def run_flowchart(
                             node_task_id=node_task_id,
                             failure_message=failure_message,
                         )
-                    batch_failed = True
+                    final_status = "failed"
+                    draining = True
+                    continue
+
+                if draining:
                     continue
 
                 if _coerce_bool(routing_state.get("terminate_run")):
-                    terminate_run = True
+                    draining = True
                     continue
 
                 try:
@@ -13184,22 +13437,7 @@ def run_flowchart(
                         node_id,
                     )
                     with session_scope() as session:
-                        run = session.get(FlowchartRun, run_id)
-                        if run is not None and run.status != "canceled":
-                            run.status = "failed"
-                            run.finished_at = _utcnow()
-                        failed_node_run = (
-                            session.execute(
-                                select(FlowchartRunNode)
-                                .where(
-                                    FlowchartRunNode.flowchart_run_id == run_id,
-                                    FlowchartRunNode.flowchart_node_id == node_id,
-                                )
-                                .order_by(FlowchartRunNode.id.desc())
-                            )
-                            .scalars()
-                            .first()
-                        )
+                        failed_node_run = session.get(FlowchartRunNode, node_run_id)
                         if failed_node_run is not None:
                             failed_node_run.status = "failed"
                             failed_node_run.error = str(exc)
@@ -13245,6 +13483,7 @@ def run_flowchart(
                                     else execution_index,
                                 },
                             )
+                        project_flowchart_run_node(session, failed_node_run)
                         _emit_flowchart_node_event(
                             "flowchart.node.updated",
                             flowchart_id=flowchart_id,
@@ -13286,17 +13525,13 @@ def run_flowchart(
                                 else None
                             ),
                         )
-                        if run is not None:
-                            _emit_flowchart_run_event(
-                                "flowchart.run.updated",
-                                run=run,
-                                flowchart_id=flowchart_id,
-                                payload={
-                                    "transition": "failed",
-                                    "failure_message": str(exc),
-                                },
-                            )
-                    return
+                    # The run itself is failed once the nodes still in flight
+                    # have been drained and persisted below.
+                    failure_message = str(exc)
+                    failure_transition = "failed"
+                    final_status = "failed"
+                    draining = True
+                    continue
 
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
@@ -13315,36 +13550,15 @@ def run_flowchart(
                         ],
                     )
 
-                pending_emissions.append(
-                    {
-                        "node_id": node_id,
-                        "node_type": node_spec.get("node_type"),
-                        "execution_index": execution_index,
-                        "sequence": int(record.get("sequence") or total_execution_count),
-                        "output_state": output_state,
-                        "routing_state": routing_state,
-                        "selected_edges": selected_edges,
-                    }
-                )
-
-            if batch_failed:
-                final_status = "failed"
-                break
-            if terminate_run:
-                final_status = "completed"
-                break
-
-            for emission in pending_emissions:
-                source_node_id = int(emission["node_id"])
                 emitted = {
-                    "source_node_id": source_node_id,
-                    "node_type": emission["node_type"],
-                    "execution_index": emission["execution_index"],
-                    "sequence": emission["sequence"],
-                    "output_state": emission["output_state"],
-                    "routing_state": emission["routing_state"],
+                    "source_node_id": node_id,
+                    "node_type": node_spec.get("node_type"),
+                    "execution_index": execution_index,
+                    "sequence": int(record.get("sequence") or total_execution_count),
+                    "output_state": output_state,
+                    "routing_state": routing_state,
                 }
-                for edge in emission["selected_edges"]:
+                for edge in selected_edges:
                     target_node_id = int(edge["target_node_id"])
                     if target_node_id == canonical_start_node_id:
                         next_run_id, skipped_followup = _queue_followup_flowchart_run(
@@ -13356,19 +13570,20 @@ def run_flowchart(
                                 "Flowchart run %s reached Start with stop requested; skipped follow-up run.",
                                 run_id,
                             )
-                            terminate_run = True
+                            draining = True
                         elif next_run_id is None:
                             failure_message = (
                                 "Flowchart reached Start node but failed to queue a follow-up run."
                             )
                             final_status = "failed"
+                            draining = True
                         else:
                             logger.info(
                                 "Flowchart run %s reached Start; queued follow-up run %s.",
                                 run_id,
                                 next_run_id,
                             )
-                            terminate_run = True
+                            draining = True
                         break
                     parent_ids = incoming_parent_ids.get(target_node_id, [])
                     token = {
@@ -13388,7 +13603,7 @@ def run_flowchart(
                     parent_tokens = parent_tokens_by_target.setdefault(target_node_id, {})
                     for parent_id in parent_ids:
                         parent_tokens.setdefault(parent_id, deque())
-                    parent_tokens.setdefault(source_node_id, deque()).append(token)
+                    parent_tokens.setdefault(node_id, deque()).append(token)
                     required_parent_count = required_parent_counts_by_target.get(
                         target_node_id,
                         len(parent_ids),
@@ -13411,16 +13626,8 @@ def run_flowchart(
                                 "upstream_results": upstream_results,
                             }
                         )
-                if final_status == "failed" or terminate_run:
-                    break
-            if final_status == "failed" or terminate_run:
-                break
-
-        if final_status in {"failed", "stopped"}:
-            break
-        if terminate_run:
-            final_status = "completed"
-            break
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
     with session_scope() as session:
         run = session.get(FlowchartRun, run_id)
@@ -13444,7 +13651,7 @@ def run_flowchart(
             run=run,
             flowchart_id=flowchart_id,
             payload={
-                "transition": "completed",
+                "transition": failure_transition,
                 "failure_message": failure_message if final_status == "failed" else None,
             },
             request_id=flowchart_run_request_id,
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import http.client
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from core.http_pool import (
+    DEFAULT_MAX_CONNECTIONS,
+    HTTPConnectionPool,
+    HTTPConnectionPoolRegistry,
+)
+
+logger = logging.getLogger(__name__)
+
+_SSE_DATA_PREFIX = "data:"
+_SSE_DONE = "[DONE]"
+
+
+class VllmPoolTimeout(RuntimeError):
+    pass
+
+
+@dataclass
+class VllmStreamResult:
+    status: int
+    content: str = ""
+    error: str = ""
+    body: str = ""
+    streamed: bool = False
+    metrics: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300 and not self.error
+
+
+class VllmConnectionPool(HTTPConnectionPool):
+    """Keep-alive HTTP connections to one vLLM base URL."""
+
+    service_name = "vLLM"
+    timeout_error = VllmPoolTimeout
+
+
+_pools = HTTPConnectionPoolRegistry(VllmConnectionPool)
+
+
+def get_vllm_connection_pool(
+    base_url: str,
+    *,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> VllmConnectionPool:
+    return _pools.get(base_url, max_connections=max_connections)
+
+
+def close_vllm_connection_pools() -> None:
+    _pools.close_all()
+
+
+def _delta_text(chunk: dict[str, Any]) -> str:
+    choices = chunk.get("choices")
+    if not isinstance(choices, list) or not choices:
+        return ""
+    first = choices[0]
+    if not isinstance(first, dict):
+        return ""
+    delta = first.get("delta")
+    if not isinstance(delta, dict):
+        return ""
+    content = delta.get("content")
+    return content if isinstance(content, str) else ""
+
+
+def _stream_metrics(
+    *,
+    started: float,
+    first_token_at: float | None,
+    finished: float,
+    chunk_count: int,
+    usage: dict[str, Any] | None,
+    connection_reused: bool,
+) -> dict[str, Any]:
+    completion_tokens = chunk_count
+    if isinstance(usage, dict):
+        try:
+            completion_tokens = int(usage.get("completion_tokens"))
+        except (TypeError, ValueError):
+            completion_tokens = chunk_count
+    metrics: dict[str, Any] = {
+        "streamed": True,
+        "connection_reused": connection_reused,
+        "duration_ms": round((finished - started) * 1000.0, 1),
+        "completion_tokens": completion_tokens,
+        "time_to_first_token_ms": None,
+        "tokens_per_second": None,
+    }
+    if first_token_at is not None:
+        metrics["time_to_first_token_ms"] = round((first_token_at - started) * 1000.0, 1)
+        generation_seconds = finished - first_token_at
+        if generation_seconds > 0 and completion_tokens > 1:
+            # The first token's latency is reported separately as TTFT.
+            metrics["tokens_per_second"] = round(
+                (completion_tokens - 1) / generation_seconds, 2
+            )
+    if isinstance(usage, dict) and usage.get("prompt_tokens") is not None:
+        metrics["prompt_tokens"] = usage.get("prompt_tokens")
+    return metrics
+
+
+def stream_chat_completion(
+    pool: VllmConnectionPool,
+    payload: dict[str, Any],
+    *,
+    headers: dict[str, str],
+    timeout: float,
+    on_delta: Callable[[str], None] | None = None,
+) -> VllmStreamResult:
+    """POST a streaming chat completion and relay each content delta.
+
+    ``on_delta`` receives each content delta as it arrives. A server that
+    ignores ``stream`` and answers with a plain JSON body is returned as
+    ``body`` with ``streamed=False``.
+    """
+    request_payload = dict(payload)
+    request_payload["stream"] = True
+    request_payload["stream_options"] = {"include_usage": True}
+    data = json.dumps(request_payload).encode("utf-8")
+    request_headers = {
+        **headers,
+        "Accept": "text/event-stream",
+        "Connection": "keep-alive",
+        "Content-Length": str(len(data)),
+    }
+    path = pool.path("chat/completions")
+    started = time.monotonic()
+    for attempt in range(2):
+        connection, reused = pool.acquire(timeout)
+        reusable = False
+        received = False
+        try:
+            connection.request("POST", path, body=data, headers=request_headers)
+            response = connection.getresponse()
+            received = True
+            result = _read_response(
+                response,
+                started=started,
+                connection_reused=reused,
+                on_delta=on_delta,
+            )
+            reusable = not response.will_close
+            return result
+        except (OSError, http.client.HTTPException) as exc:
+            # A keep-alive connection the server already closed is reset
+            # before any response; retry that once on a fresh connection. A
+            # read timeout is not retried: the server may still be generating,
+            # and re-sending would repeat the work and double the wait.
+            if isinstance(exc, ConnectionError) and reused and not received and attempt == 0:
+                logger.debug("Retrying vLLM request on a fresh connection: %s", exc)
+                continue
+            return VllmStreamResult(status=0, error=str(exc) or exc.__class__.__name__)
+        finally:
+            pool.release(connection, reusable=reusable)
+    return VllmStreamResult(status=0, error="vLLM request failed.")
+
+
+def _read_response(
+    response: http.client.HTTPResponse,
+    *,
+    started: float,
+    connection_reused: bool,
+    on_delta: Callable[[str], None] | None,
+) -> VllmStreamResult:
+    status = int(response.status)
+    content_type = str(response.getheader("Content-Type") or "").lower()
+    if status >= 400 or "text/event-stream" not in content_type:
+        body = response.read().decode("utf-8", errors="replace")
+        return VllmStreamResult(
+            status=status,
+            error=(body or response.reason or f"HTTP {status}") if status >= 400 else "",
+            body=body,
+            metrics={
+                "streamed": False,
+                "connection_reused": connection_reused,
+                "duration_ms": round((time.monotonic() - started) * 1000.0, 1),
+            },
+        )
+    parts: list[str] = []
+    chunk_count = 0
+    first_token_at: float | None = None
+    usage: dict[str, Any] | None = None
+    error = ""
+    while True:
+        raw_line = response.readline()
+        if not raw_line:
+            break
+        line = raw_line.decode("utf-8", errors="replace").strip()
+        if not line.startswith(_SSE_DATA_PREFIX):
+            continue
+        data = line[len(_SSE_DATA_PREFIX):].strip()
+        if data == _SSE_DONE:
+            break
+        try:
+            chunk = json.loads(data)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(chunk, dict):
+            continue
+        if chunk.get("error"):
+            raw_error = chunk["error"]
+            error = (
+                raw_error.get("message") or json.dumps(raw_error, ensure_ascii=False)
+                if isinstance(raw_error, dict)
+                else str(raw_error)
+            )
+            break
+        if isinstance(chunk.get("usage"), dict):
+            usage = chunk["usage"]
+        text = _delta_text(chunk)
+        if not text:
+            continue
+        if first_token_at is None:
+            first_token_at = time.monotonic()
+        chunk_count += 1
+        parts.append(text)
+        if on_delta is not None:
+            on_delta(text)
+    # Drain the chunked terminator so the connection can be reused.
+    response.read()
+    return VllmStreamResult(
+        status=status,
+        content="".join(parts),
+        error=error,
+        streamed=True,
+        metrics=_stream_metrics(
+            started=started,
+            first_token_at=first_token_at,
+            finished=time.monotonic(),
+            chunk_count=chunk_count,
+            usage=usage,
+            connection_reused=connection_reused,
+        ),
+    )
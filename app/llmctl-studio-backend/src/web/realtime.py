@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from datetime import datetime, timezone
 from threading import Lock
 from typing import Any
@@ -10,6 +11,10 @@ from flask import Flask, request
 from flask_socketio import SocketIO, emit, join_room, leave_room
 
 REALTIME_NAMESPACE = "/rt"
+REALTIME_BATCH_EVENT = "rt.batch"
+REALTIME_BATCH_ROOM_PREFIX = "batch:"
+REALTIME_BATCH_ROOMS_KEY = "llmctl:rt:batch_rooms"
+_BATCH_ROOMS_REFRESH_SECONDS = 1.0
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +34,11 @@ def _default_message_queue_url() -> str | None:
     return f"redis://{redis_host}:{redis_port}/{redis_db}"
 
 
+_message_queue_url = _default_message_queue_url()
+
 socketio = SocketIO(
     async_mode=str(os.getenv("LLMCTL_STUDIO_SOCKETIO_ASYNC_MODE", "threading")),
-    message_queue=_default_message_queue_url(),
+    message_queue=_message_queue_url,
 )
 
 _metrics_lock = Lock()
@@ -98,6 +105,102 @@ def _normalize_room_keys(payload: dict[str, Any] | None) -> list[str]:
     return normalized
 
 
+def batch_room_key(room: str) -> str:
+    return f"{REALTIME_BATCH_ROOM_PREFIX}{room}"
+
+
+def _batch_requested(payload: dict[str, Any] | None) -> bool:
+    if not isinstance(payload, dict):
+        return False
+    value = payload.get("batch")
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+# Emitting processes (web and Celery workers) cannot see which sockets joined
+# a batch room, so subscriptions are counted per room in a Redis hash on the
+# Socket.IO message queue. Emitters read it at most once per second; when it is
+# unavailable they treat every room as batch-subscribed.
+_batch_lock = Lock()
+_batch_sid_rooms: dict[str, set[str]] = {}
+_batch_client: Any = None
+_batch_rooms_cache: tuple[float, frozenset[str] | None] | None = None
+
+
+def _batch_registry() -> Any:
+    global _batch_client
+    url = str(_message_queue_url or "").strip()
+    if not url.startswith(("redis://", "rediss://", "unix://")):
+        return None
+    if _batch_client is None:
+        try:
+            import redis
+        except ImportError:
+            return None
+        _batch_client = redis.Redis.from_url(
+            url,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+    return _batch_client
+
+
+def _update_batch_registry(rooms: set[str], delta: int) -> None:
+    if not rooms:
+        return
+    client = _batch_registry()
+    if client is None:
+        return
+    try:
+        for room in rooms:
+            if client.hincrby(REALTIME_BATCH_ROOMS_KEY, room, delta) <= 0:
+                client.hdel(REALTIME_BATCH_ROOMS_KEY, room)
+    except Exception:
+        logger.warning("Realtime batch subscription registry update failed", exc_info=True)
+
+
+def _track_batch_rooms(sid: str, *, joined: list[str], left: list[str]) -> None:
+    with _batch_lock:
+        current = _batch_sid_rooms.setdefault(sid, set())
+        added = set(joined) - current
+        removed = set(left) & current
+        current.update(added)
+        current.difference_update(removed)
+        if not current:
+            _batch_sid_rooms.pop(sid, None)
+    _update_batch_registry(added, 1)
+    _update_batch_registry(removed, -1)
+
+
+def _release_batch_rooms(sid: str) -> None:
+    with _batch_lock:
+        rooms = _batch_sid_rooms.pop(sid, set())
+    _update_batch_registry(rooms, -1)
+
+
+def batch_subscribed_rooms() -> frozenset[str] | None:
+    """Rooms with at least one batch subscriber, or None when unknown."""
+    global _batch_rooms_cache
+    now = time.monotonic()
+    cached = _batch_rooms_cache
+    if cached is not None and now - cached[0] < _BATCH_ROOMS_REFRESH_SECONDS:
+        return cached[1]
+    rooms: frozenset[str] | None = None
+    client = _batch_registry()
+    if client is not None:
+        try:
+            rooms = frozenset(
+                (room.decode("utf-8") if isinstance(room, bytes) else str(room))
+                for room, count in client.hgetall(REALTIME_BATCH_ROOMS_KEY).items()
+                if int(count) > 0
+            )
+        except Exception:
+            rooms = None
+    _batch_rooms_cache = (now, rooms)
+    return rooms
+
+
 def _increment_metric(name: str, delta: int = 1) -> dict[str, int]:
     with _metrics_lock:
         _metrics[name] = int(_metrics.get(name, 0)) + delta
@@ -109,10 +212,13 @@ def _increment_metric(name: str, delta: int = 1) -> dict[str, int]:
 
 
 def init_socketio(app: Flask) -> None:
+    global _message_queue_url, _batch_client
+    _message_queue_url = str(app.config.get("SOCKETIO_MESSAGE_QUEUE", "")).strip() or None
+    _batch_client = None
     socketio.init_app(
         app,
         async_mode=str(app.config.get("SOCKETIO_ASYNC_MODE", "threading")),
-        message_queue=str(app.config.get("SOCKETIO_MESSAGE_QUEUE", "")).strip() or None,
+        message_queue=_message_queue_url,
         cors_allowed_origins=_parse_cors_allowed_origins(
             str(app.config.get("SOCKETIO_CORS_ALLOWED_ORIGINS", "*"))
         ),
@@ -174,6 +280,7 @@ def _on_connect(auth: dict[str, Any] | None = None):
 @socketio.on("disconnect", namespace=REALTIME_NAMESPACE)
 def _on_disconnect(*_args: Any):
     metrics = _increment_metric("disconnect_total")
+    _release_batch_rooms(request.sid)
     logger.info(
         "Socket disconnect sid=%s namespace=%s open=%s",
         request.sid,
@@ -197,21 +304,40 @@ def _on_health(payload: dict[str, Any] | None = None):
 @socketio.on("rt.subscribe", namespace=REALTIME_NAMESPACE)
 def _on_subscribe(payload: dict[str, Any] | None = None):
     rooms = _normalize_room_keys(payload)
+    batch = _batch_requested(payload)
     for room in rooms:
-        join_room(room)
+        # Batch clients get one ``rt.batch`` per room per coalescing window
+        # instead of the individual events, so they join only the batch room.
+        if batch:
+            leave_room(room)
+            join_room(batch_room_key(room))
+        else:
+            leave_room(batch_room_key(room))
+            join_room(room)
+    _track_batch_rooms(
+        request.sid,
+        joined=rooms if batch else [],
+        left=[] if batch else rooms,
+    )
     if rooms:
         logger.info(
-            "Socket subscribe sid=%s namespace=%s rooms=%s",
+            "Socket subscribe sid=%s namespace=%s rooms=%s batch=%s",
             request.sid,
             REALTIME_NAMESPACE,
             ",".join(rooms),
+            batch,
         )
-    return {
+    response = {
         "ok": True,
         "rooms": rooms,
         "namespace": REALTIME_NAMESPACE,
         "server_time": _utcnow_iso(),
+        "batch": batch,
     }
+    if batch:
+        response["batch_event"] = REALTIME_BATCH_EVENT
+        response["window_ms"] = _emit_stats().get("window_ms")
+    return response
 
 
 @socketio.on("rt.unsubscribe", namespace=REALTIME_NAMESPACE)
@@ -219,6 +345,8 @@ def _on_unsubscribe(payload: dict[str, Any] | None = None):
     rooms = _normalize_room_keys(payload)
     for room in rooms:
         leave_room(room)
+        leave_room(batch_room_key(room))
+    _track_batch_rooms(request.sid, joined=[], left=rooms)
     if rooms:
         logger.info(
             "Socket unsubscribe sid=%s namespace=%s rooms=%s",
@@ -234,10 +362,18 @@ def _on_unsubscribe(payload: dict[str, Any] | None = None):
     }
 
 
+def _emit_stats() -> dict[str, Any]:
+    # Imported lazily: services.realtime_events builds on this module.
+    from services.realtime_events import realtime_emit_stats
+
+    return realtime_emit_stats()
+
+
 def realtime_status_payload() -> dict[str, Any]:
     return {
         "ok": True,
         "namespace": REALTIME_NAMESPACE,
         "server_time": _utcnow_iso(),
         "metrics": _metrics_snapshot(),
+        "emit": _emit_stats(),
     }
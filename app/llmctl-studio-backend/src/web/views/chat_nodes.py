@@ -1,6 +1,6 @@
 from .shared import *  # noqa: F401,F403
 
-__all__ = ['chat_page', 'chat_activity', 'create_chat_thread_route', 'update_chat_thread_route', 'archive_chat_thread_route', 'restore_chat_thread_route', 'clear_chat_thread_route', 'delete_chat_thread_route', 'api_health', 'api_chat_runtime', 'api_create_chat_thread', 'api_chat_thread', 'api_archive_chat_thread', 'api_clear_chat_thread', 'api_chat_thread_config', 'api_chat_activity', 'api_chat_turn', 'list_nodes', 'view_node', 'remove_node_attachment', 'node_status', 'cancel_node', 'retry_node', 'delete_node', 'new_node', 'create_node']
+__all__ = ['chat_page', 'chat_activity', 'create_chat_thread_route', 'update_chat_thread_route', 'archive_chat_thread_route', 'restore_chat_thread_route', 'clear_chat_thread_route', 'delete_chat_thread_route', 'api_health', 'api_chat_runtime', 'api_create_chat_thread', 'api_chat_thread', 'api_archive_chat_thread', 'api_clear_chat_thread', 'api_chat_thread_config', 'api_chat_activity', 'api_chat_turn', 'list_nodes', 'view_node', 'remove_node_attachment', 'node_status', 'node_logs', 'cancel_node', 'retry_node', 'delete_node', 'new_node', 'create_node']
 
 
 def _chat_selected_mcp_server_keys(thread_payload: object) -> list[str]:
@@ -438,6 +438,14 @@ def delete_chat_thread_route(thread_id: int):
 def api_health():
     return {"ok": True, "service": "llmctl-studio-backend"}
 
+@bp.get("/api/health/sdk-clients")
+def api_health_sdk_clients():
+    return {"ok": True, "sdk_clients": sdk_client_stats()}
+
+@bp.get("/api/health/settings-cache")
+def api_health_settings_cache():
+    return {"ok": True, "integration_settings": integration_settings_cache_stats()}
+
 @bp.get("/api/chat/runtime")
 def api_chat_runtime():
     models = _load_llm_models()
@@ -983,6 +991,7 @@ def view_node(task_id: int):
         if task is None:
             abort(404)
         _sync_quick_rag_task_from_index_job(session, task)
+        task_logs = resolve_task_logs(session, task)
         agent = None
         if task.agent_id is not None:
             agent = (
@@ -993,14 +1002,15 @@ def view_node(task_id: int):
                 .scalars()
                 .first()
             )
-        stage_entries = _build_stage_entries(task)
+        stage_entries = _build_stage_entries(task, task_logs["stage_logs"])
         prompt_text, prompt_json = _parse_task_prompt(task.prompt)
         incoming_connector_context = _task_incoming_connector_context(
             session,
             task=task,
             prompt_json=prompt_json,
         )
-        task_output = _task_output_for_display(task.output)
+        task_output = _task_output_for_display(task_logs["output"])
+        task_error = task_logs["error"] or ""
         selected_integration_keys = parse_task_integration_keys(task.integration_keys_json)
         if selected_integration_keys is None:
             task_integrations_legacy_default = True
@@ -1038,7 +1048,7 @@ def view_node(task_id: int):
                 "started_at": _human_time(task.started_at),
                 "finished_at": _human_time(task.finished_at),
                 "current_stage": task.current_stage or "",
-                "error": task.error or "",
+                "error": task_error,
                 "output": task_output,
                 **task_runtime,
             },
@@ -1138,6 +1148,7 @@ def node_status(task_id: int):
         if task is None:
             abort(404)
         _sync_quick_rag_task_from_index_job(session, task)
+        task_logs = resolve_task_logs(session, task)
         task_runtime = _serialize_node_executor_metadata(task)
         return {
             "id": task.id,
@@ -1145,17 +1156,53 @@ def node_status(task_id: int):
             "run_task_id": task.run_task_id,
             "celery_task_id": task.celery_task_id,
             "prompt_length": len(task.prompt) if task.prompt else 0,
-            "output": _task_output_for_display(task.output),
-            "error": task.error or "",
+            "output": _task_output_for_display(task_logs["output"]),
+            "error": task_logs["error"] or "",
             "current_stage": task.current_stage or "",
-            "stage_logs": _parse_stage_logs(task.stage_logs),
-            "stage_entries": _build_stage_entries(task),
+            "stage_logs": _parse_stage_logs(task_logs["stage_logs"]),
+            "stage_entries": _build_stage_entries(task, task_logs["stage_logs"]),
             "started_at": _human_time(task.started_at),
             "finished_at": _human_time(task.finished_at),
             "created_at": _human_time(task.created_at),
             **task_runtime,
         }
 
+@bp.get("/nodes/<int:task_id>/logs", endpoint="node_logs")
+def node_logs(task_id: int):
+    stream = (request.args.get("stream") or "output").strip().lower()
+    if stream not in TASK_LOG_STREAMS:
+        return {"error": f"stream must be one of: {', '.join(TASK_LOG_STREAMS)}."}, 400
+    try:
+        offset = _coerce_optional_int(
+            request.args.get("offset"),
+            field_name="offset",
+            minimum=0,
+        )
+        limit = _coerce_optional_int(
+            request.args.get("limit"),
+            field_name="limit",
+            minimum=0,
+        )
+        tail = _coerce_optional_int(
+            request.args.get("tail"),
+            field_name="tail",
+            minimum=0,
+        )
+    except ValueError as exc:
+        return {"error": str(exc)}, 400
+    with session_scope() as session:
+        task = session.get(AgentTask, task_id)
+        if task is None:
+            abort(404)
+        return read_task_log(
+            session,
+            task,
+            stream,
+            offset=offset or 0,
+            limit=limit,
+            tail=tail,
+        )
+
 @bp.post("/nodes/<int:task_id>/cancel", endpoint="cancel_node")
 def cancel_node(task_id: int):
     is_api_request = _stage3_api_request()
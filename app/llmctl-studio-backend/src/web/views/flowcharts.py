@@ -1604,268 +1604,396 @@ def flowchart_run_trace(run_id: int):
         resolved_offset,
     )
 
-    node_rows: list[FlowchartRunNode] = []
-    artifacts: list[NodeArtifact] = []
+    artifact_filters = [NodeArtifact.flowchart_run_id == run_id]
+    if flowchart_node_id is not None:
+        artifact_filters.append(NodeArtifact.flowchart_node_id == flowchart_node_id)
+    if flowchart_run_node_id is not None:
+        artifact_filters.append(NodeArtifact.flowchart_run_node_id == flowchart_run_node_id)
+    if artifact_type_filter:
+        artifact_filters.append(func.lower(NodeArtifact.artifact_type) == artifact_type_filter)
+    if trace_request_filter:
+        artifact_filters.append(NodeArtifact.request_id == trace_request_filter)
+    if trace_correlation_filter:
+        artifact_filters.append(NodeArtifact.correlation_id == trace_correlation_filter)
+
+    # Node-derived surfaces page through the trace projection; only the rows on
+    # the requested page are loaded and serialized.
+    entry_filters = [FlowchartRunTraceEntry.flowchart_run_id == run_id]
+    if flowchart_node_id is not None:
+        entry_filters.append(FlowchartRunTraceEntry.flowchart_node_id == flowchart_node_id)
+    if flowchart_run_node_id is not None:
+        entry_filters.append(
+            FlowchartRunTraceEntry.flowchart_run_node_id == flowchart_run_node_id
+        )
+    if agent_task_id is not None:
+        entry_filters.append(FlowchartRunTraceEntry.agent_task_id == agent_task_id)
+    if degraded_only is True:
+        entry_filters.append(FlowchartRunTraceEntry.degraded_status.is_(True))
+    if degraded_only is False:
+        entry_filters.append(FlowchartRunTraceEntry.degraded_status.is_(False))
+    if trace_request_filter:
+        entry_filters.append(FlowchartRunTraceEntry.request_id == trace_request_filter)
+    if trace_correlation_filter:
+        entry_filters.append(FlowchartRunTraceEntry.correlation_id == trace_correlation_filter)
+    if status_filters:
+        entry_filters.append(FlowchartRunTraceEntry.status.in_(sorted(status_filters)))
+    entry_order = (
+        FlowchartRunTraceEntry.sequence.asc(),
+        FlowchartRunTraceEntry.node_created_at.asc(),
+        FlowchartRunTraceEntry.flowchart_run_node_id.asc(),
+    )
+    window = resolved_offset + resolved_limit
+
+    empty_surface = _flowchart_trace_paginate([], limit=resolved_limit, offset=resolved_offset)
+    node_surface = tool_surface = failure_surface = empty_surface
+    artifact_surface = timeline_surface = empty_surface
     flowchart_run: FlowchartRun | None = None
     with session_scope() as session:
         flowchart_run = session.get(FlowchartRun, run_id)
         if flowchart_run is None:
             abort(404)
-        node_stmt = select(FlowchartRunNode).where(FlowchartRunNode.flowchart_run_id == run_id)
-        if flowchart_node_id is not None:
-            node_stmt = node_stmt.where(FlowchartRunNode.flowchart_node_id == flowchart_node_id)
-        if flowchart_run_node_id is not None:
-            node_stmt = node_stmt.where(FlowchartRunNode.id == flowchart_run_node_id)
-        if agent_task_id is not None:
-            node_stmt = node_stmt.where(FlowchartRunNode.agent_task_id == agent_task_id)
-        if degraded_only is True:
-            node_stmt = node_stmt.where(FlowchartRunNode.degraded_status.is_(True))
-        if degraded_only is False:
-            node_stmt = node_stmt.where(FlowchartRunNode.degraded_status.is_(False))
-        node_rows = (
-            session.execute(
-                node_stmt.order_by(
-                    FlowchartRunNode.execution_index.asc(),
-                    FlowchartRunNode.created_at.asc(),
-                    FlowchartRunNode.id.asc(),
-                )
+        refresh_flowchart_run_trace(session, run_id)
+
+        def _entry_count(*extra_filters) -> int:
+            return int(
+                session.execute(
+                    select(func.count())
+                    .select_from(FlowchartRunTraceEntry)
+                    .where(*entry_filters, *extra_filters)
+                ).scalar_one()
             )
-            .scalars()
-            .all()
-        )
-        artifact_stmt = select(NodeArtifact).where(NodeArtifact.flowchart_run_id == run_id)
-        if flowchart_node_id is not None:
-            artifact_stmt = artifact_stmt.where(NodeArtifact.flowchart_node_id == flowchart_node_id)
-        if flowchart_run_node_id is not None:
-            artifact_stmt = artifact_stmt.where(
-                NodeArtifact.flowchart_run_node_id == flowchart_run_node_id
-            )
-        if artifact_type_filter:
-            artifact_stmt = artifact_stmt.where(
-                func.lower(NodeArtifact.artifact_type) == artifact_type_filter
-            )
-        if trace_request_filter:
-            artifact_stmt = artifact_stmt.where(NodeArtifact.request_id == trace_request_filter)
-        if trace_correlation_filter:
-            artifact_stmt = artifact_stmt.where(
-                NodeArtifact.correlation_id == trace_correlation_filter
+
+        node_count = _entry_count()
+        run_warning_count = _entry_count(
+            FlowchartRunTraceEntry.degraded_status.is_(True)
+        ) + _entry_count(FlowchartRunTraceEntry.warning_count > 0)
+
+        if "node" in include_tokens:
+            entries = (
+                session.execute(
+                    select(FlowchartRunTraceEntry)
+                    .where(*entry_filters)
+                    .order_by(*entry_order)
+                    .offset(resolved_offset)
+                    .limit(resolved_limit)
+                )
+                .scalars()
+                .all()
             )
-        artifacts = (
-            session.execute(
-                artifact_stmt.order_by(NodeArtifact.created_at.desc(), NodeArtifact.id.desc())
+            node_runs_by_id = {
+                node_run.id: node_run
+                for node_run in session.execute(
+                    select(FlowchartRunNode).where(
+                        FlowchartRunNode.id.in_(
+                            [entry.flowchart_run_node_id for entry in entries]
+                        )
+                    )
+                )
+                .scalars()
+                .all()
+            }
+            node_surface = _flowchart_trace_page(
+                [
+                    {
+                        **_serialize_flowchart_run_node(
+                            node_runs_by_id[entry.flowchart_run_node_id]
+                        ),
+                        "request_id": entry.request_id,
+                        "correlation_id": entry.correlation_id,
+                        "warnings": flowchart_trace_entry_warnings(entry),
+                    }
+                    for entry in entries
+                    if entry.flowchart_run_node_id in node_runs_by_id
+                ],
+                total_count=node_count,
+                limit=resolved_limit,
+                offset=resolved_offset,
             )
-            .scalars()
-            .all()
-        )
 
-    node_items: list[dict[str, object]] = []
-    tool_items: list[dict[str, object]] = []
-    failure_items: list[dict[str, object]] = []
-    timeline_buffer: list[tuple[datetime, dict[str, object]]] = []
-    for node_row in node_rows:
-        output_state = _parse_json_dict(node_row.output_state_json)
-        routing_state = _parse_json_dict(node_row.routing_state_json)
-        trace_request_id, trace_correlation_id = _flowchart_trace_request_identity(
-            output_state=output_state,
-            routing_state=routing_state,
-        )
-        warnings = _flowchart_trace_warning_entries(
-            node_run=node_row,
-            output_state=output_state,
-            routing_state=routing_state,
-        )
-        if trace_request_filter and trace_request_filter != trace_request_id:
-            continue
-        if trace_correlation_filter and trace_correlation_filter != trace_correlation_id:
-            continue
-        if status_filters and _normalize_flowchart_run_status(node_row.status) not in status_filters:
-            continue
-        node_item = {
-            **_serialize_flowchart_run_node(node_row),
-            "request_id": trace_request_id,
-            "correlation_id": trace_correlation_id,
-            "warnings": warnings,
-        }
-        node_items.append(node_item)
-        tooling_payload = (
-            output_state.get("deterministic_tooling")
-            if isinstance(output_state.get("deterministic_tooling"), dict)
-            else routing_state.get("deterministic_tooling")
-            if isinstance(routing_state.get("deterministic_tooling"), dict)
-            else {}
-        )
-        if isinstance(tooling_payload, dict) and tooling_payload:
-            tool_items.append(
-                {
-                    "flowchart_run_node_id": node_row.id,
-                    "flowchart_node_id": node_row.flowchart_node_id,
-                    "agent_task_id": node_row.agent_task_id,
-                    "execution_index": node_row.execution_index,
-                    "tool_name": tooling_payload.get("tool_name"),
-                    "operation": tooling_payload.get("operation"),
-                    "execution_status": tooling_payload.get("execution_status"),
-                    "fallback_used": bool(tooling_payload.get("fallback_used")),
-                    "warnings": list(tooling_payload.get("warnings") or []),
-                    "request_id": _flowchart_trace_text(
-                        tooling_payload.get("request_id") or trace_request_id
-                    ),
-                    "correlation_id": _flowchart_trace_text(
-                        tooling_payload.get("correlation_id") or trace_correlation_id
-                    ),
-                    "updated_at": _human_time(node_row.updated_at),
-                }
+        if "tool" in include_tokens:
+            tool_filter = FlowchartRunTraceEntry.has_tooling.is_(True)
+            entries = (
+                session.execute(
+                    select(FlowchartRunTraceEntry)
+                    .where(*entry_filters, tool_filter)
+                    .order_by(*entry_order)
+                    .offset(resolved_offset)
+                    .limit(resolved_limit)
+                )
+                .scalars()
+                .all()
             )
-        if _normalize_flowchart_run_status(node_row.status) in {"failed", "error"} or str(
-            node_row.error or ""
-        ).strip():
-            failure_items.append(
-                {
-                    "flowchart_run_node_id": node_row.id,
-                    "flowchart_node_id": node_row.flowchart_node_id,
-                    "agent_task_id": node_row.agent_task_id,
-                    "status": node_row.status,
-                    "error": node_row.error or "",
-                    "degraded_status": bool(node_row.degraded_status),
-                    "degraded_reason": node_row.degraded_reason,
-                    "request_id": trace_request_id,
-                    "correlation_id": trace_correlation_id,
-                    "updated_at": _human_time(node_row.updated_at),
-                }
+            tool_items: list[dict[str, object]] = []
+            for entry in entries:
+                tooling = flowchart_trace_entry_tooling(entry)
+                tool_items.append(
+                    {
+                        "flowchart_run_node_id": entry.flowchart_run_node_id,
+                        "flowchart_node_id": entry.flowchart_node_id,
+                        "agent_task_id": entry.agent_task_id,
+                        "execution_index": entry.sequence,
+                        "tool_name": tooling.get("tool_name"),
+                        "operation": tooling.get("operation"),
+                        "execution_status": tooling.get("execution_status"),
+                        "fallback_used": bool(tooling.get("fallback_used")),
+                        "warnings": list(tooling.get("warnings") or []),
+                        "request_id": tooling.get("request_id"),
+                        "correlation_id": tooling.get("correlation_id"),
+                        "updated_at": _human_time(entry.source_updated_at),
+                    }
+                )
+            tool_surface = _flowchart_trace_page(
+                tool_items,
+                total_count=_entry_count(tool_filter),
+                limit=resolved_limit,
+                offset=resolved_offset,
             )
-        timeline_timestamp = (
-            node_row.finished_at
-            or node_row.started_at
-            or node_row.updated_at
-            or node_row.created_at
-        )
-        if timeline_timestamp is not None:
-            timeline_buffer.append(
-                (
-                    timeline_timestamp,
+
+        if "failure" in include_tokens:
+            failure_filter = FlowchartRunTraceEntry.is_failure.is_(True)
+            failure_rows = session.execute(
+                select(
+                    FlowchartRunTraceEntry,
+                    FlowchartRunNode.status,
+                    FlowchartRunNode.error,
+                    FlowchartRunNode.degraded_reason,
+                )
+                .join(
+                    FlowchartRunNode,
+                    FlowchartRunNode.id == FlowchartRunTraceEntry.flowchart_run_node_id,
+                )
+                .where(*entry_filters, failure_filter)
+                .order_by(*entry_order)
+                .offset(resolved_offset)
+                .limit(resolved_limit)
+            ).all()
+            failure_surface = _flowchart_trace_page(
+                [
                     {
-                        "event_type": "flowchart_node_status",
-                        "flowchart_run_node_id": node_row.id,
-                        "flowchart_node_id": node_row.flowchart_node_id,
-                        "status": node_row.status,
-                        "error": node_row.error or "",
-                        "warning_count": len(warnings),
-                        "request_id": trace_request_id,
-                        "correlation_id": trace_correlation_id,
-                        "timestamp": _human_time(timeline_timestamp),
-                    },
+                        "flowchart_run_node_id": entry.flowchart_run_node_id,
+                        "flowchart_node_id": entry.flowchart_node_id,
+                        "agent_task_id": entry.agent_task_id,
+                        "status": node_status,
+                        "error": node_error or "",
+                        "degraded_status": bool(entry.degraded_status),
+                        "degraded_reason": degraded_reason,
+                        "request_id": entry.request_id,
+                        "correlation_id": entry.correlation_id,
+                        "updated_at": _human_time(entry.source_updated_at),
+                    }
+                    for entry, node_status, node_error, degraded_reason in failure_rows
+                ],
+                total_count=_entry_count(failure_filter),
+                limit=resolved_limit,
+                offset=resolved_offset,
+            )
+
+        artifact_count = 0
+        if include_tokens.intersection({"artifact", "timeline"}):
+            artifact_count = int(
+                session.execute(
+                    select(func.count()).select_from(NodeArtifact).where(*artifact_filters)
+                ).scalar_one()
+            )
+        if "artifact" in include_tokens:
+            artifacts = (
+                session.execute(
+                    select(NodeArtifact)
+                    .where(*artifact_filters)
+                    .order_by(NodeArtifact.created_at.desc(), NodeArtifact.id.desc())
+                    .offset(resolved_offset)
+                    .limit(resolved_limit)
                 )
+                .scalars()
+                .all()
             )
-            for warning in warnings:
+            artifact_surface = _flowchart_trace_page(
+                [_serialize_node_artifact(item) for item in artifacts],
+                total_count=artifact_count,
+                limit=resolved_limit,
+                offset=resolved_offset,
+            )
+
+        if "timeline" in include_tokens:
+            # Each source is read in its own timeline order and capped at
+            # offset + limit rows, which always covers the merged page. Ties on
+            # timestamp keep node entries in execution order, then artifacts,
+            # then run lifecycle entries.
+            timeline_buffer: list[tuple[datetime, tuple, dict[str, object]]] = []
+            timeline_order = (FlowchartRunTraceEntry.timeline_at.desc(), *entry_order)
+            status_rows = session.execute(
+                select(
+                    FlowchartRunTraceEntry,
+                    FlowchartRunNode.status,
+                    FlowchartRunNode.error,
+                )
+                .join(
+                    FlowchartRunNode,
+                    FlowchartRunNode.id == FlowchartRunTraceEntry.flowchart_run_node_id,
+                )
+                .where(*entry_filters)
+                .order_by(*timeline_order)
+                .limit(window)
+            ).all()
+            for entry, node_status, node_error in status_rows:
                 timeline_buffer.append(
                     (
-                        timeline_timestamp,
+                        entry.timeline_at,
+                        (0, entry.sequence, entry.node_created_at, entry.flowchart_run_node_id, 0),
                         {
-                            "event_type": "flowchart_warning",
-                            "flowchart_run_node_id": node_row.id,
-                            "flowchart_node_id": node_row.flowchart_node_id,
-                            "warning": warning,
-                            "request_id": trace_request_id,
-                            "correlation_id": trace_correlation_id,
-                            "timestamp": _human_time(timeline_timestamp),
+                            "event_type": "flowchart_node_status",
+                            "flowchart_run_node_id": entry.flowchart_run_node_id,
+                            "flowchart_node_id": entry.flowchart_node_id,
+                            "status": node_status,
+                            "error": node_error or "",
+                            "warning_count": entry.warning_count,
+                            "request_id": entry.request_id,
+                            "correlation_id": entry.correlation_id,
+                            "timestamp": _human_time(entry.timeline_at),
                         },
                     )
                 )
-
-    artifact_items = [_serialize_node_artifact(item) for item in artifacts]
-    for artifact in artifacts:
-        timeline_timestamp = artifact.updated_at or artifact.created_at
-        if timeline_timestamp is None:
-            continue
-        timeline_buffer.append(
-            (
-                timeline_timestamp,
-                {
-                    "event_type": "flowchart_node_artifact",
-                    "artifact_id": artifact.id,
-                    "artifact_type": artifact.artifact_type,
-                    "flowchart_node_id": artifact.flowchart_node_id,
-                    "flowchart_run_node_id": artifact.flowchart_run_node_id,
-                    "request_id": _flowchart_trace_text(artifact.request_id),
-                    "correlation_id": _flowchart_trace_text(artifact.correlation_id),
-                    "timestamp": _human_time(timeline_timestamp),
-                },
+            warning_entries = (
+                session.execute(
+                    select(FlowchartRunTraceEntry)
+                    .where(*entry_filters, FlowchartRunTraceEntry.warning_count > 0)
+                    .order_by(*timeline_order)
+                    .limit(window)
+                )
+                .scalars()
+                .all()
             )
-        )
+            for entry in warning_entries:
+                for warning_index, warning in enumerate(
+                    flowchart_trace_entry_warnings(entry),
+                    start=1,
+                ):
+                    timeline_buffer.append(
+                        (
+                            entry.timeline_at,
+                            (
+                                0,
+                                entry.sequence,
+                                entry.node_created_at,
+                                entry.flowchart_run_node_id,
+                                warning_index,
+                            ),
+                            {
+                                "event_type": "flowchart_warning",
+                                "flowchart_run_node_id": entry.flowchart_run_node_id,
+                                "flowchart_node_id": entry.flowchart_node_id,
+                                "warning": warning,
+                                "request_id": entry.request_id,
+                                "correlation_id": entry.correlation_id,
+                                "timestamp": _human_time(entry.timeline_at),
+                            },
+                        )
+                    )
+            warning_total = int(
+                session.execute(
+                    select(func.coalesce(func.sum(FlowchartRunTraceEntry.warning_count), 0))
+                    .where(*entry_filters)
+                ).scalar_one()
+            )
+            timeline_total = node_count + warning_total
+
+            # Artifacts carry no status, so a status filter excludes them.
+            if not status_filters:
+                artifact_timestamp = func.coalesce(
+                    NodeArtifact.updated_at,
+                    NodeArtifact.created_at,
+                ).label("timeline_at")
+                artifact_rows = session.execute(
+                    select(
+                        NodeArtifact.id,
+                        NodeArtifact.artifact_type,
+                        NodeArtifact.flowchart_node_id,
+                        NodeArtifact.flowchart_run_node_id,
+                        NodeArtifact.request_id,
+                        NodeArtifact.correlation_id,
+                        NodeArtifact.created_at,
+                        artifact_timestamp,
+                    )
+                    .where(*artifact_filters)
+                    .order_by(
+                        artifact_timestamp.desc(),
+                        NodeArtifact.created_at.desc(),
+                        NodeArtifact.id.desc(),
+                    )
+                    .limit(window)
+                ).all()
+                for artifact in artifact_rows:
+                    timeline_buffer.append(
+                        (
+                            artifact.timeline_at,
+                            (1, -artifact.created_at.timestamp(), -artifact.id),
+                            {
+                                "event_type": "flowchart_node_artifact",
+                                "artifact_id": artifact.id,
+                                "artifact_type": artifact.artifact_type,
+                                "flowchart_node_id": artifact.flowchart_node_id,
+                                "flowchart_run_node_id": artifact.flowchart_run_node_id,
+                                "request_id": _flowchart_trace_text(artifact.request_id),
+                                "correlation_id": _flowchart_trace_text(
+                                    artifact.correlation_id
+                                ),
+                                "timestamp": _human_time(artifact.timeline_at),
+                            },
+                        )
+                    )
+                timeline_total += artifact_count
+
+            run_events = [
+                ("flowchart_run_created", flowchart_run.created_at),
+                ("flowchart_run_started", flowchart_run.started_at),
+                ("flowchart_run_finished", flowchart_run.finished_at),
+            ]
+            run_items = [
+                (
+                    timestamp,
+                    (2, index),
+                    {
+                        "event_type": event_type,
+                        "status": flowchart_run.status,
+                        "flowchart_run_id": flowchart_run.id,
+                        "timestamp": _human_time(timestamp),
+                        "request_id": request_id,
+                        "correlation_id": correlation_id,
+                    },
+                )
+                for index, (event_type, timestamp) in enumerate(run_events)
+                if timestamp is not None
+            ]
+            if status_filters:
+                run_items = [
+                    row
+                    for row in run_items
+                    if _normalize_flowchart_run_status(row[2].get("status")) in status_filters
+                ]
+            if trace_request_filter:
+                run_items = [
+                    row for row in run_items if trace_request_filter == row[2].get("request_id")
+                ]
+            if trace_correlation_filter:
+                run_items = [
+                    row
+                    for row in run_items
+                    if trace_correlation_filter == row[2].get("correlation_id")
+                ]
+            timeline_buffer.extend(run_items)
+            timeline_total += len(run_items)
 
-    if flowchart_run.created_at is not None:
-        timeline_buffer.append(
-            (
-                flowchart_run.created_at,
-                {
-                    "event_type": "flowchart_run_created",
-                    "status": flowchart_run.status,
-                    "flowchart_run_id": flowchart_run.id,
-                    "timestamp": _human_time(flowchart_run.created_at),
-                    "request_id": request_id,
-                    "correlation_id": correlation_id,
-                },
+            timeline_buffer.sort(key=lambda row: row[1])
+            timeline_buffer.sort(key=lambda row: row[0], reverse=True)
+            timeline_surface = _flowchart_trace_page(
+                [item for _timestamp, _position, item in timeline_buffer][
+                    resolved_offset:window
+                ],
+                total_count=timeline_total,
+                limit=resolved_limit,
+                offset=resolved_offset,
             )
-        )
-    if flowchart_run.started_at is not None:
-        timeline_buffer.append(
-            (
-                flowchart_run.started_at,
-                {
-                    "event_type": "flowchart_run_started",
-                    "status": flowchart_run.status,
-                    "flowchart_run_id": flowchart_run.id,
-                    "timestamp": _human_time(flowchart_run.started_at),
-                    "request_id": request_id,
-                    "correlation_id": correlation_id,
-                },
-            )
-        )
-    if flowchart_run.finished_at is not None:
-        timeline_buffer.append(
-            (
-                flowchart_run.finished_at,
-                {
-                    "event_type": "flowchart_run_finished",
-                    "status": flowchart_run.status,
-                    "flowchart_run_id": flowchart_run.id,
-                    "timestamp": _human_time(flowchart_run.finished_at),
-                    "request_id": request_id,
-                    "correlation_id": correlation_id,
-                },
-            )
-        )
 
-    timeline_items = [
-        item
-        for _timestamp, item in sorted(
-            timeline_buffer,
-            key=lambda payload: payload[0],
-            reverse=True,
-        )
-    ]
-    if status_filters:
-        timeline_items = [
-            item
-            for item in timeline_items
-            if _normalize_flowchart_run_status(item.get("status")) in status_filters
-            or str(item.get("event_type") or "").strip() == "flowchart_warning"
-        ]
-    if trace_request_filter:
-        timeline_items = [
-            item for item in timeline_items if trace_request_filter == item.get("request_id")
-        ]
-    if trace_correlation_filter:
-        timeline_items = [
-            item
-            for item in timeline_items
-            if trace_correlation_filter == item.get("correlation_id")
-        ]
-
-    run_warning_count = sum(1 for item in node_items if bool(item.get("degraded_status"))) + sum(
-        1 for item in node_items if bool(item.get("warnings"))
-    )
-
-    empty_surface = _flowchart_trace_paginate([], limit=resolved_limit, offset=resolved_offset)
     return {
         "ok": True,
         "request_id": request_id,
@@ -1904,41 +2032,11 @@ def flowchart_run_trace(run_id: int):
         )
         if "run" in include_tokens
         else empty_surface,
-        "node_trace": _flowchart_trace_paginate(
-            node_items,
-            limit=resolved_limit,
-            offset=resolved_offset,
-        )
-        if "node" in include_tokens
-        else empty_surface,
-        "tool_trace": _flowchart_trace_paginate(
-            tool_items,
-            limit=resolved_limit,
-            offset=resolved_offset,
-        )
-        if "tool" in include_tokens
-        else empty_surface,
-        "artifact_trace": _flowchart_trace_paginate(
-            artifact_items,
-            limit=resolved_limit,
-            offset=resolved_offset,
-        )
-        if "artifact" in include_tokens
-        else empty_surface,
-        "failure_trace": _flowchart_trace_paginate(
-            failure_items,
-            limit=resolved_limit,
-            offset=resolved_offset,
-        )
-        if "failure" in include_tokens
-        else empty_surface,
-        "timeline": _flowchart_trace_paginate(
-            timeline_items,
-            limit=resolved_limit,
-            offset=resolved_offset,
-        )
-        if "timeline" in include_tokens
-        else empty_surface,
+        "node_trace": node_surface,
+        "tool_trace": tool_surface,
+        "artifact_trace": artifact_surface,
+        "failure_trace": failure_surface,
+        "timeline": timeline_surface,
     }
 
 @bp.post("/flowcharts/runs/<int:run_id>/control")
@@ -706,6 +706,10 @@ def delete_chroma_collection():
                 url_for("agents.chroma_collection_detail", name=collection_name)
             )
         return redirect(url_for("agents.chroma_collections"))
+    try:
+        reset_lexical_index(load_rag_config(), collection_name)
+    except Exception as exc:
+        logger.warning("Failed to reset lexical index for %s: %s", collection_name, exc)
 
     if is_api_request:
         return {"ok": True, "collection_name": collection_name}
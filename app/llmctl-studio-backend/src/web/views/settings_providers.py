@@ -1283,12 +1283,34 @@ def update_node_executor_runtime_settings_route():
             request_payload,
             "k8s_image_pull_secrets_json",
         ),
+        "k8s_warm_pool_enabled": (
+            "true"
+            if _as_bool(_settings_form_value(request_payload, "k8s_warm_pool_enabled"))
+            else "false"
+        ),
+        "k8s_warm_pool_size": _settings_form_value(
+            request_payload, "k8s_warm_pool_size"
+        ),
+        "k8s_warm_pool_idle_ttl_seconds": _settings_form_value(
+            request_payload, "k8s_warm_pool_idle_ttl_seconds"
+        ),
+        "k8s_warm_pool_frontier_max": _settings_form_value(
+            request_payload, "k8s_warm_pool_frontier_max"
+        ),
+        "k8s_warm_pool_vllm_max": _settings_form_value(
+            request_payload, "k8s_warm_pool_vllm_max"
+        ),
     }
     optional_split_image_keys = (
         "k8s_frontier_image",
         "k8s_frontier_image_tag",
         "k8s_vllm_image",
         "k8s_vllm_image_tag",
+        "k8s_warm_pool_enabled",
+        "k8s_warm_pool_size",
+        "k8s_warm_pool_idle_ttl_seconds",
+        "k8s_warm_pool_frontier_max",
+        "k8s_warm_pool_vllm_max",
     )
     for optional_key in optional_split_image_keys:
         if optional_key in request_payload or optional_key in request.form:
@@ -77,6 +77,7 @@ from services.integrations import (
     LLM_PROVIDERS,
     NODE_EXECUTOR_PROVIDER_CHOICES,
     integration_overview as _integration_overview,
+    integration_settings_cache_stats,
     load_integration_settings as _load_integration_settings,
     load_node_executor_settings,
     node_executor_effective_config_summary,
@@ -117,6 +118,7 @@ from core.models import (
     FlowchartNode,
     FlowchartRun,
     FlowchartRunNode,
+    FlowchartRunTraceEntry,
     ChatThread,
     ChatTurn,
     LLMModel,
@@ -199,6 +201,7 @@ from core.quick_node import (
 from core.vllm_models import discover_vllm_local_models
 from rag.engine.chromadb_loader import import_chromadb
 from rag.engine.config import load_config as load_rag_config
+from rag.engine.lexical_index import reset_lexical_index
 from rag.domain import (
     RAG_FLOWCHART_MODE_CHOICES as RAG_NODE_MODE_CHOICES,
     RAG_FLOWCHART_MODE_DELTA_INDEX as RAG_NODE_MODE_DELTA_INDEX,
@@ -260,7 +263,19 @@ from services.huggingface_downloads import (
     vllm_local_model_directory as _shared_vllm_local_model_directory,
 )
 from services.execution.idempotency import register_runtime_idempotency_key
+from services.llm_sdk_clients import sdk_client_stats
 from services.realtime_events import emit_contract_event
+from services.flowchart_trace import (
+    flowchart_trace_entry_tooling,
+    flowchart_trace_entry_warnings,
+    refresh_flowchart_run_trace,
+)
+from services.task_logs import (
+    TASK_LOG_STREAMS,
+    read_task_log,
+    resolve_task_logs,
+    resolve_task_output,
+)
 from services.runtime_contracts import RUNTIME_CONTRACT_VERSION
 from web.api_contracts import (
     build_api_error_envelope,
@@ -787,7 +802,7 @@ def _task_execution_mode(task: AgentTask | None) -> str:
                 if quick_mode:
                     return quick_mode
 
-    raw_output = str(task.output or "").strip()
+    raw_output = resolve_task_output(task).strip()
     if raw_output.startswith("{"):
         try:
             output_payload = json.loads(raw_output)
@@ -815,7 +830,7 @@ def _is_rag_node_task(task: AgentTask | None) -> bool:
         flowchart_node_type = str(prompt_payload.get("flowchart_node_type") or "").strip().lower()
         if flowchart_node_type == FLOWCHART_NODE_TYPE_RAG:
             return True
-    raw_output = str(task.output or "").strip()
+    raw_output = resolve_task_output(task).strip()
     if raw_output.startswith("{"):
         try:
             output_payload = json.loads(raw_output)
@@ -1910,8 +1925,13 @@ def _build_stage_status_map(
     return statuses
 
 
-def _build_stage_entries(task: AgentTask) -> list[dict[str, str]]:
-    stage_logs = _parse_stage_logs(task.stage_logs)
+def _build_stage_entries(
+    task: AgentTask,
+    stage_logs_raw: str | None = None,
+) -> list[dict[str, str]]:
+    stage_logs = _parse_stage_logs(
+        task.stage_logs if stage_logs_raw is None else stage_logs_raw
+    )
     status_map = _build_stage_status_map(task.status, task.current_stage)
     entries: list[dict[str, str]] = []
     for stage_key, default_label in TASK_STAGE_ORDER:
@@ -6729,74 +6749,19 @@ def _flowchart_trace_paginate(
     }
 
 
-def _flowchart_trace_request_identity(
-    *,
-    output_state: dict[str, object] | None,
-    routing_state: dict[str, object] | None,
-) -> tuple[str | None, str | None]:
-    output_payload = output_state if isinstance(output_state, dict) else {}
-    routing_payload = routing_state if isinstance(routing_state, dict) else {}
-
-    def _tooling_payload(source: dict[str, object]) -> dict[str, object]:
-        tooling = source.get("deterministic_tooling")
-        return tooling if isinstance(tooling, dict) else {}
-
-    output_tooling = _tooling_payload(output_payload)
-    routing_tooling = _tooling_payload(routing_payload)
-    request_id = _flowchart_trace_text(
-        output_tooling.get("request_id")
-        or routing_tooling.get("request_id")
-        or output_payload.get("request_id")
-        or routing_payload.get("request_id")
-    )
-    correlation_id = _flowchart_trace_text(
-        output_tooling.get("correlation_id")
-        or routing_tooling.get("correlation_id")
-        or output_payload.get("correlation_id")
-        or routing_payload.get("correlation_id")
-    )
-    return request_id, correlation_id
-
-
-def _flowchart_trace_warning_entries(
+def _flowchart_trace_page(
+    rows: list[dict[str, object]],
     *,
-    node_run: FlowchartRunNode,
-    output_state: dict[str, object] | None,
-    routing_state: dict[str, object] | None,
-) -> list[dict[str, object]]:
-    warnings: list[dict[str, object]] = []
-    if bool(node_run.degraded_status):
-        warnings.append(
-            {
-                "kind": "degraded",
-                "message": str(node_run.degraded_reason or "degraded_execution"),
-            }
-        )
-    output_payload = output_state if isinstance(output_state, dict) else {}
-    routing_payload = routing_state if isinstance(routing_state, dict) else {}
-    tooling_payload = (
-        output_payload.get("deterministic_tooling")
-        if isinstance(output_payload.get("deterministic_tooling"), dict)
-        else routing_payload.get("deterministic_tooling")
-        if isinstance(routing_payload.get("deterministic_tooling"), dict)
-        else {}
-    )
-    tool_warnings = tooling_payload.get("warnings") if isinstance(tooling_payload, dict) else []
-    if isinstance(tool_warnings, list):
-        for item in tool_warnings:
-            if isinstance(item, dict):
-                warnings.append(
-                    {
-                        "kind": str(item.get("code") or item.get("kind") or "tool_warning"),
-                        "message": str(item.get("message") or "warning").strip(),
-                        "details": item.get("details") if isinstance(item.get("details"), dict) else {},
-                    }
-                )
-            else:
-                text = str(item or "").strip()
-                if text:
-                    warnings.append({"kind": "tool_warning", "message": text})
-    return warnings
+    total_count: int,
+    limit: int,
+    offset: int,
+) -> dict[str, object]:
+    return {
+        "items": rows,
+        "total_count": total_count,
+        "limit": limit,
+        "offset": offset,
+    }
 
 
 def _k8s_job_name_from_dispatch_id(provider_dispatch_id: str) -> str:
@@ -6823,7 +6788,7 @@ def _runtime_evidence_from_output(task: AgentTask | None) -> dict[str, str]:
         "k8s_pod_name": "",
         "k8s_terminal_reason": "",
     }
-    raw_output = str(task.output or "").strip()
+    raw_output = resolve_task_output(task).strip()
     if raw_output.startswith("{"):
         try:
             output_payload = json.loads(raw_output)
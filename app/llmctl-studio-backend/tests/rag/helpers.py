@@ -59,8 +59,17 @@ def test_config(tmp_path: Path | None = None) -> RagConfig:
         ocr_include_char_boxes=False,
         drive_sync_workers=4,
         index_parallel_workers=6,
+        index_parse_executor="thread",
+        index_prefetch_files=0,
         pdf_page_workers=6,
+        pdf_page_executor="thread",
         embed_parallel_requests=6,
+        embed_cache_enabled=False,
+        embed_cache_path=root / "embedding-cache.sqlite3",
+        embed_cache_max_entries=1000,
+        ocr_cache_enabled=False,
+        ocr_cache_path=root / "ocr-cache.sqlite3",
+        ocr_cache_max_entries=1000,
         openai_chat_model="gpt-4o-mini",
         gemini_chat_model="gemini-2.5-flash",
         chat_model="gpt-4o-mini",
@@ -71,5 +80,12 @@ def test_config(tmp_path: Path | None = None) -> RagConfig:
         chat_max_context_chars=12000,
         chat_snippet_chars=600,
         chat_context_budget_tokens=8000,
+        retrieval_handle_ttl_s=300.0,
+        retrieval_timeout_s=20.0,
+        lexical_index_enabled=False,
+        lexical_index_dir=root / "lexical",
+        retrieval_lexical_weight=0.4,
+        retrieval_cache_max_entries=0,
+        retrieval_cache_ttl_s=300.0,
         web_port=5050,
     )
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from dataclasses import replace
+import importlib.util
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+STUDIO_SRC = REPO_ROOT / "app" / "llmctl-studio-backend" / "src"
+STUDIO_APP_ROOT = REPO_ROOT / "app" / "llmctl-studio-backend"
+if str(STUDIO_SRC) not in sys.path:
+    sys.path.insert(0, str(STUDIO_SRC))
+if str(STUDIO_APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(STUDIO_APP_ROOT))
+
+from rag.engine import ingest, token_utils
+from rag.engine.embedding_cache import EmbeddingCache, text_sha256
+
+_HELPERS_SPEC = importlib.util.spec_from_file_location(
+    "rag_test_helpers",
+    STUDIO_APP_ROOT / "tests" / "rag" / "helpers.py",
+)
+if _HELPERS_SPEC is None or _HELPERS_SPEC.loader is None:  # pragma: no cover
+    raise RuntimeError("Failed to load rag test helpers.")
+_HELPERS_MODULE = importlib.util.module_from_spec(_HELPERS_SPEC)
+_HELPERS_SPEC.loader.exec_module(_HELPERS_MODULE)
+test_config = _HELPERS_MODULE.test_config
+
+
+class _CountingEmbeddingFunction:
+    def __init__(self) -> None:
+        self.embedded_texts: list[str] = []
+
+    def __call__(self, texts):
+        self.embedded_texts.extend(texts)
+        return [[float(len(text)), 1.0, 0.5] for text in texts]
+
+
+class _RecordingCollection:
+    def __init__(self) -> None:
+        self.upserts: list[dict] = []
+
+    def get(self, **_kwargs):
+        return {"metadatas": []}
+
+    def delete(self, **_kwargs):
+        return None
+
+    def upsert(self, **kwargs):
+        self.upserts.append(kwargs)
+
+
+class EmbeddingCacheTests(unittest.TestCase):
+    def test_get_many_returns_stored_vectors_per_model(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = EmbeddingCache(Path(tmpdir) / "cache.sqlite3", max_entries=10)
+            digest = text_sha256("hello")
+            cache.put_many("openai", "model-a", {digest: [0.25, 0.5]})
+
+            self.assertEqual(
+                {digest: [0.25, 0.5]},
+                cache.get_many("openai", "model-a", [digest]),
+            )
+            self.assertEqual({}, cache.get_many("openai", "model-b", [digest]))
+            stats = cache.stats()
+            self.assertEqual(1, stats["hits"])
+            self.assertEqual(1, stats["misses"])
+            cache.close()
+
+    def test_put_many_evicts_least_recently_used_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = EmbeddingCache(Path(tmpdir) / "cache.sqlite3", max_entries=2)
+            first, second, third = (text_sha256(text) for text in ("a", "b", "c"))
+            with patch("rag.engine.embedding_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+                cache.put_many("openai", "model", {first: [1.0]})
+                cache.put_many("openai", "model", {second: [2.0]})
+                cache.get_many("openai", "model", [first])
+                cache.put_many("openai", "model", {third: [3.0]})
+
+            remaining = cache.get_many("openai", "model", [first, second, third])
+            self.assertEqual({first, third}, set(remaining))
+            self.assertEqual(1, cache.stats()["evictions"])
+            self.assertEqual(2, cache.stats()["entries"])
+            cache.close()
+
+    def test_vectors_of_another_dimension_are_dropped_on_read(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = EmbeddingCache(Path(tmpdir) / "cache.sqlite3", max_entries=10)
+            old, new = text_sha256("old"), text_sha256("new")
+            cache.put_many("openai", "model", {old: [1.0, 2.0]})
+            # The model now returns three dimensions.
+            cache.put_many("openai", "model", {new: [1.0, 2.0, 3.0]})
+
+            self.assertEqual(
+                {new: [1.0, 2.0, 3.0]},
+                cache.get_many("openai", "model", [old, new]),
+            )
+            self.assertEqual(1, cache.stats()["entries"])
+            cache.close()
+
+    def test_truncated_vectors_are_treated_as_misses(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cache.sqlite3"
+            cache = EmbeddingCache(path, max_entries=10)
+            digest = text_sha256("hello")
+            cache.put_many("openai", "model", {digest: [0.25, 0.5]})
+            cache._conn.execute("UPDATE embedding_cache SET dimensions = 3")
+
+            self.assertEqual({}, cache.get_many("openai", "model", [digest]))
+            self.assertEqual(1, cache.stats()["misses"])
+            self.assertEqual(0, cache.stats()["entries"])
+            cache.close()
+
+
+class IndexPathsEmbeddingCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Keep token counting offline; tiktoken downloads encodings on first use.
+        token_utils._get_encoding.cache_clear()
+        tiktoken_patch = patch.object(token_utils, "tiktoken", None)
+        tiktoken_patch.start()
+        self.addCleanup(tiktoken_patch.stop)
+        self.addCleanup(token_utils._get_encoding.cache_clear)
+
+    def test_index_paths_embeds_identical_text_once_across_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.txt").write_text("shared content\n", encoding="utf-8")
+            (root / "b.txt").write_text("shared content\n", encoding="utf-8")
+            config = replace(
+                test_config(root),
+                embed_parallel_requests=1,
+                embed_cache_enabled=True,
+                embed_cache_path=root / "cache" / "embeddings.sqlite3",
+            )
+            embedding_function = _CountingEmbeddingFunction()
+            collection = _RecordingCollection()
+            paths = [root / "a.txt", root / "b.txt"]
+
+            with patch.object(
+                ingest, "build_embedding_function", return_value=embedding_function
+            ), patch.object(ingest, "log_event") as log_event:
+                ingest.index_paths(collection, config, paths)
+                ingest.index_paths(collection, config, paths)
+
+            self.assertEqual(["shared content"], embedding_function.embedded_texts)
+            self.assertEqual(2, len(collection.upserts))
+            for upsert in collection.upserts:
+                self.assertEqual(2, len(upsert["embeddings"]))
+                self.assertEqual(upsert["embeddings"][0], upsert["embeddings"][1])
+            summaries = [
+                call.kwargs
+                for call in log_event.call_args_list
+                if call.args and call.args[0] == "rag_index_summary"
+            ]
+            self.assertEqual(2, summaries[0]["embed_cache_misses"])
+            self.assertEqual(0, summaries[0]["embed_cache_hits"])
+            self.assertEqual(2, summaries[1]["embed_cache_hits"])
+            self.assertEqual(1.0, summaries[1]["embed_cache_hit_rate"])
+
+    def test_index_paths_re_embeds_cached_vectors_from_an_older_model_size(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.txt").write_text("cached content\n", encoding="utf-8")
+            (root / "b.txt").write_text("fresh content\n", encoding="utf-8")
+            config = replace(
+                test_config(root),
+                embed_parallel_requests=1,
+                embed_cache_enabled=True,
+                embed_cache_path=root / "cache" / "embeddings.sqlite3",
+            )
+            cache = EmbeddingCache(config.embed_cache_path, max_entries=10)
+            cache.put_many(
+                ingest.get_embedding_provider(config),
+                ingest.get_embedding_model(config),
+                {text_sha256("cached content"): [9.0, 9.0]},
+            )
+            cache.close()
+            embedding_function = _CountingEmbeddingFunction()
+            collection = _RecordingCollection()
+
+            with patch.object(
+                ingest, "build_embedding_function", return_value=embedding_function
+            ), patch.object(ingest, "log_event"):
+                ingest.index_paths(collection, config, [root / "a.txt", root / "b.txt"])
+
+            self.assertEqual(
+                ["fresh content", "cached content"], embedding_function.embedded_texts
+            )
+            self.assertEqual(
+                {3}, {len(vector) for vector in collection.upserts[0]["embeddings"]}
+            )
+
+    def test_index_paths_indexes_without_cache_when_it_cannot_open(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.txt").write_text("plain content\n", encoding="utf-8")
+            config = replace(
+                test_config(root),
+                embed_parallel_requests=1,
+                embed_cache_enabled=True,
+            )
+            collection = _RecordingCollection()
+
+            with patch.object(
+                ingest,
+                "open_embedding_cache",
+                side_effect=sqlite3.OperationalError("database is locked"),
+            ), patch.object(ingest, "log_event") as log_event:
+                ingest.index_paths(collection, config, [root / "a.txt"])
+
+            self.assertEqual(1, len(collection.upserts))
+            self.assertNotIn("embeddings", collection.upserts[0])
+            self.assertIn(
+                "rag_index_embed_cache_unavailable",
+                [call.args[0] for call in log_event.call_args_list if call.args],
+            )
+
+    def test_index_paths_without_cache_leaves_embedding_to_collection(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.txt").write_text("plain content\n", encoding="utf-8")
+            config = replace(test_config(root), embed_parallel_requests=1)
+            collection = _RecordingCollection()
+
+            with patch.object(ingest, "log_event"):
+                ingest.index_paths(collection, config, [root / "a.txt"])
+
+            self.assertEqual(1, len(collection.upserts))
+            self.assertNotIn("embeddings", collection.upserts[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,7 @@ from rag.integrations.google_drive_sync import (
     count_syncable_files,
     service_account_email,
     sync_folder,
+    sync_folder_incremental,
     verify_folder_access,
 )
 
@@ -47,13 +48,34 @@ class _FakeFilesApi:
         return _FakeRequest(payload)
 
 
+class _FakeChangesApi:
+    def __init__(self):
+        self.start_token = "1"
+        self.pages: dict[str, dict] = {}
+        self.list_calls: list[str] = []
+
+    def getStartPageToken(self, **kwargs):
+        return _FakeRequest({"startPageToken": self.start_token})
+
+    def list(self, *, pageToken, **kwargs):
+        self.list_calls.append(pageToken)
+        payload = self.pages.get(pageToken)
+        if payload is None:
+            raise RuntimeError("invalid page token")
+        return _FakeRequest(payload)
+
+
 class _FakeDriveService:
     def __init__(self, metadata_by_id, children_by_parent):
         self._files_api = _FakeFilesApi(metadata_by_id, children_by_parent)
+        self._changes_api = _FakeChangesApi()
 
     def files(self):
         return self._files_api
 
+    def changes(self):
+        return self._changes_api
+
 
 class GoogleDriveSyncTests(unittest.TestCase):
     def test_service_account_email_validates_json(self):
@@ -291,6 +313,219 @@ class GoogleDriveSyncTests(unittest.TestCase):
             self.assertTrue((destination / "b.txt").is_file())
             self.assertTrue((destination / "Design Doc.docx").is_file())
 
+    def _incremental_service(self):
+        return _FakeDriveService(
+            metadata_by_id={
+                "root": {
+                    "id": "root",
+                    "name": "Root",
+                    "mimeType": "application/vnd.google-apps.folder",
+                    "trashed": False,
+                }
+            },
+            children_by_parent={
+                "root": [
+                    {
+                        "id": "f-1",
+                        "name": "a.txt",
+                        "mimeType": "text/plain",
+                        "md5Checksum": "aaa",
+                    },
+                    {
+                        "id": "f-2",
+                        "name": "b.txt",
+                        "mimeType": "text/plain",
+                        "md5Checksum": "bbb",
+                    },
+                    {
+                        "id": "sub-1",
+                        "name": "Docs",
+                        "mimeType": "application/vnd.google-apps.folder",
+                    },
+                ],
+                "sub-1": [
+                    {
+                        "id": "g-1",
+                        "name": "Design Doc",
+                        "mimeType": "application/vnd.google-apps.document",
+                        "version": "3",
+                        "modifiedTime": "2026-01-01T00:00:00Z",
+                    }
+                ],
+            },
+        )
+
+    def _run_incremental(self, service, destination, **kwargs):
+        downloaded: list[str] = []
+
+        def _fake_download_file(_service, file_id, output_path):
+            downloaded.append(file_id)
+            output_path.write_text(f"file:{file_id}", encoding="utf-8")
+
+        def _fake_download_export(_service, file_id, mime_type, output_path):
+            downloaded.append(file_id)
+            output_path.write_text(f"export:{file_id}:{mime_type}", encoding="utf-8")
+
+        with patch(
+            "rag.integrations.google_drive_sync._download_file",
+            _fake_download_file,
+        ):
+            with patch(
+                "rag.integrations.google_drive_sync._download_export",
+                _fake_download_export,
+            ):
+                result = sync_folder_incremental(
+                    "",
+                    "root",
+                    destination,
+                    service=service,
+                    **kwargs,
+                )
+        return result, sorted(downloaded)
+
+    def test_incremental_sync_applies_only_drive_changes(self):
+        service = self._incremental_service()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            destination = Path(temp_dir) / "drive-sync"
+            first, downloaded = self._run_incremental(service, destination)
+
+            self.assertEqual("full", first.mode)
+            self.assertFalse(first.incremental)
+            self.assertEqual("1", first.change_token)
+            self.assertEqual(["f-1", "f-2", "g-1"], downloaded)
+            self.assertEqual("Docs/Design Doc.docx", first.manifest["g-1"].local_path)
+
+            service.changes().pages["1"] = {
+                "changes": [
+                    {
+                        "fileId": "f-1",
+                        "file": {
+                            "id": "f-1",
+                            "name": "a.txt",
+                            "mimeType": "text/plain",
+                            "parents": ["root"],
+                            "md5Checksum": "aaa-2",
+                        },
+                    },
+                    {"fileId": "f-2", "removed": True},
+                    {
+                        "fileId": "g-1",
+                        "file": {
+                            "id": "g-1",
+                            "name": "Design Doc",
+                            "mimeType": "application/vnd.google-apps.document",
+                            "parents": ["sub-1"],
+                            "version": "3",
+                            "modifiedTime": "2026-01-01T00:00:00Z",
+                        },
+                    },
+                    {
+                        "fileId": "other",
+                        "file": {
+                            "id": "other",
+                            "name": "elsewhere.txt",
+                            "mimeType": "text/plain",
+                            "parents": ["unrelated"],
+                        },
+                    },
+                ],
+                "newStartPageToken": "2",
+            }
+            second, downloaded = self._run_incremental(
+                service,
+                destination,
+                manifest=first.manifest,
+                change_token=first.change_token,
+            )
+
+            self.assertEqual("changes", second.mode)
+            self.assertTrue(second.incremental)
+            self.assertEqual("2", second.change_token)
+            self.assertEqual(["f-1"], downloaded)
+            self.assertEqual(["a.txt"], second.changed_paths)
+            self.assertEqual(["b.txt"], second.removed_paths)
+            self.assertFalse((destination / "b.txt").exists())
+            self.assertTrue((destination / "Docs" / "Design Doc.docx").is_file())
+            self.assertNotIn("other", second.manifest)
+
+    def test_incremental_sync_relists_when_change_token_is_invalid(self):
+        service = self._incremental_service()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            destination = Path(temp_dir) / "drive-sync"
+            first, _ = self._run_incremental(service, destination)
+            children = service.files()._children_by_parent
+            children["root"] = [
+                {
+                    "id": "f-1",
+                    "name": "renamed.txt",
+                    "mimeType": "text/plain",
+                    "md5Checksum": "aaa",
+                },
+                children["root"][2],
+            ]
+            children["sub-1"][0] = dict(children["sub-1"][0], version="4")
+            service.changes().start_token = "9"
+
+            second, downloaded = self._run_incremental(
+                service,
+                destination,
+                manifest=first.manifest,
+                change_token="expired",
+            )
+
+            self.assertEqual("full", second.mode)
+            self.assertEqual("9", second.change_token)
+            self.assertEqual(["g-1"], downloaded)
+            self.assertEqual(
+                ["Docs/Design Doc.docx", "renamed.txt"],
+                second.changed_paths,
+            )
+            self.assertEqual(["a.txt", "b.txt"], second.removed_paths)
+            self.assertEqual(
+                "file:f-1",
+                (destination / "renamed.txt").read_text(encoding="utf-8"),
+            )
+            self.assertFalse((destination / "a.txt").exists())
+
+    def test_incremental_sync_relists_on_folder_changes(self):
+        service = self._incremental_service()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            destination = Path(temp_dir) / "drive-sync"
+            first, _ = self._run_incremental(service, destination)
+            service.files()._children_by_parent["root"][2] = {
+                "id": "sub-1",
+                "name": "Guides",
+                "mimeType": "application/vnd.google-apps.folder",
+            }
+            service.changes().pages["1"] = {
+                "changes": [
+                    {
+                        "fileId": "sub-1",
+                        "file": {
+                            "id": "sub-1",
+                            "name": "Guides",
+                            "mimeType": "application/vnd.google-apps.folder",
+                            "parents": ["root"],
+                        },
+                    }
+                ],
+                "newStartPageToken": "2",
+            }
+
+            second, downloaded = self._run_incremental(
+                service,
+                destination,
+                manifest=first.manifest,
+                change_token=first.change_token,
+            )
+
+            self.assertEqual("full", second.mode)
+            self.assertEqual([], downloaded)
+            self.assertEqual(["Guides/Design Doc.docx"], second.changed_paths)
+            self.assertEqual(["Docs/Design Doc.docx"], second.removed_paths)
+            self.assertTrue((destination / "Guides" / "Design Doc.docx").is_file())
+            self.assertFalse((destination / "Docs").exists())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from dataclasses import replace
+import importlib.util
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+STUDIO_SRC = REPO_ROOT / "app" / "llmctl-studio-backend" / "src"
+STUDIO_APP_ROOT = REPO_ROOT / "app" / "llmctl-studio-backend"
+if str(STUDIO_SRC) not in sys.path:
+    sys.path.insert(0, str(STUDIO_SRC))
+if str(STUDIO_APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(STUDIO_APP_ROOT))
+
+from rag.engine import ingest, token_utils
+from rag.engine.lexical_index import open_lexical_index
+
+_HELPERS_SPEC = importlib.util.spec_from_file_location(
+    "rag_test_helpers",
+    STUDIO_APP_ROOT / "tests" / "rag" / "helpers.py",
+)
+if _HELPERS_SPEC is None or _HELPERS_SPEC.loader is None:  # pragma: no cover
+    raise RuntimeError("Failed to load rag test helpers.")
+_HELPERS_MODULE = importlib.util.module_from_spec(_HELPERS_SPEC)
+_HELPERS_SPEC.loader.exec_module(_HELPERS_MODULE)
+test_config = _HELPERS_MODULE.test_config
+
+
+def _tiktoken_encoding_available() -> bool:
+    try:
+        import tiktoken
+
+        tiktoken.get_encoding("cl100k_base")
+    except ImportError:
+        return True
+    except Exception:
+        return False
+    return True
+
+
+class _RecordingCollection:
+    def __init__(self) -> None:
+        self.upserts: list[dict] = []
+
+    def get(self, **_kwargs):
+        return {"metadatas": []}
+
+    def delete(self, **_kwargs):
+        return None
+
+    def upsert(self, **kwargs):
+        self.upserts.append(kwargs)
+
+
+class IndexPipelineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Keep token counting offline; tiktoken downloads encodings on first use.
+        token_utils._get_encoding.cache_clear()
+        tiktoken_patch = patch.object(token_utils, "tiktoken", None)
+        tiktoken_patch.start()
+        self.addCleanup(tiktoken_patch.stop)
+        self.addCleanup(token_utils._get_encoding.cache_clear)
+        log_patch = patch.object(ingest, "log_event")
+        log_patch.start()
+        self.addCleanup(log_patch.stop)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = Path(tmpdir.name)
+        self.paths: list[Path] = []
+        for index in range(8):
+            path = self.root / f"doc_{index}.txt"
+            path.write_text(
+                "\n".join(f"file {index} line {line}" for line in range(25)) + "\n",
+                encoding="utf-8",
+            )
+            self.paths.append(path)
+        skipped = self.root / "skip.bin"
+        skipped.write_bytes(b"\x00\x01binary")
+        self.paths.insert(3, skipped)
+
+    def _run(self, **overrides):
+        config = replace(
+            test_config(self.root),
+            embed_parallel_requests=1,
+            exclude_globs=["*.bin"],
+            **overrides,
+        )
+        collection = _RecordingCollection()
+        progress: list[tuple[str, str]] = []
+        results: list[tuple[str, bool, int]] = []
+        totals = ingest.index_paths(
+            collection,
+            config,
+            self.paths,
+            on_file_progress=lambda rel, _pos, _total, stage: progress.append((rel, stage)),
+            on_file_result=lambda rel, ok, _doc_type, chunks: results.append(
+                (rel, ok, chunks)
+            ),
+        )
+        ids = [doc_id for upsert in collection.upserts for doc_id in upsert["ids"]]
+        return totals, ids, progress, results
+
+    def test_parallel_prepare_matches_sequential_output_and_callbacks(self) -> None:
+        sequential = self._run(index_parallel_workers=1)
+        threaded = self._run(index_parallel_workers=4, index_prefetch_files=3)
+
+        self.assertEqual(sequential, threaded)
+        totals, ids, progress, results = sequential
+        self.assertEqual(8, totals[0])
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertIn(("skip.bin", "skipped"), progress)
+        self.assertEqual("doc_0.txt", results[0][0])
+
+    def test_process_pool_prepare_matches_sequential_output(self) -> None:
+        # Spawned parse workers load token encodings themselves.
+        if not _tiktoken_encoding_available():
+            self.skipTest("tiktoken encodings are not available offline.")
+        sequential = self._run(index_parallel_workers=1)
+        processed = self._run(index_parallel_workers=2, index_parse_executor="process")
+
+        self.assertEqual(sequential, processed)
+
+    def test_lexical_index_mirrors_chroma_ids_and_deletes(self) -> None:
+        _totals, ids, _progress, _results = self._run(
+            index_parallel_workers=1,
+            lexical_index_enabled=True,
+        )
+        config = replace(test_config(self.root), lexical_index_enabled=True)
+        lexical_index = open_lexical_index(config)
+        self.assertEqual(len(ids), lexical_index.count())
+        hits = lexical_index.search("file 5", 100)
+        self.assertTrue(set(hit["id"] for hit in hits) <= set(ids))
+        self.assertIn("doc_5.txt", {hit["metadata"]["path"] for hit in hits})
+
+        ingest.delete_paths(_RecordingCollection(), config, [self.root / "doc_5.txt"])
+        remaining = lexical_index.search("file 5", 100)
+        self.assertNotIn("doc_5.txt", {hit["metadata"]["path"] for hit in remaining})
+
+    def test_prefetch_window_bounds_files_prepared_ahead(self) -> None:
+        original_prepare = ingest._prepare_file
+        lock = threading.Lock()
+        started: list[str] = []
+        consumed: list[str] = []
+        max_ahead = 0
+
+        def tracking_prepare(path, *args):
+            nonlocal max_ahead
+            with lock:
+                started.append(path.name)
+                max_ahead = max(max_ahead, len(started) - len(consumed))
+            return original_prepare(path, *args)
+
+        def record_result(rel_path, *_args):
+            with lock:
+                consumed.append(rel_path)
+            time.sleep(0.01)
+
+        config = replace(
+            test_config(self.root),
+            embed_parallel_requests=1,
+            exclude_globs=["*.bin"],
+            index_parallel_workers=4,
+            index_prefetch_files=2,
+        )
+        with patch.object(ingest, "_prepare_file", side_effect=tracking_prepare):
+            ingest.index_paths(
+                _RecordingCollection(),
+                config,
+                self.paths,
+                on_file_result=record_result,
+            )
+
+        self.assertEqual(8, len(started))
+        self.assertLessEqual(max_ahead, 2)
+
+    def test_should_stop_cancels_remaining_files(self) -> None:
+        seen: list[str] = []
+        config = replace(
+            test_config(self.root),
+            embed_parallel_requests=1,
+            index_parallel_workers=4,
+        )
+        totals = ingest.index_paths(
+            _RecordingCollection(),
+            config,
+            self.paths[:3],
+            on_file_result=lambda rel, *_args: seen.append(rel),
+            should_stop=lambda: len(seen) >= 2,
+        )
+
+        self.assertEqual(["doc_0.txt", "doc_1.txt"], seen)
+        self.assertEqual(2, totals[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
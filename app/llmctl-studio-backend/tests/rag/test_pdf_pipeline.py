@@ -1,16 +1,38 @@
 from __future__ import annotations
 
+import importlib.util
+import sqlite3
 import sys
+import tempfile
 import unittest
+from dataclasses import replace
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 REPO_ROOT = Path(__file__).resolve().parents[4]
 STUDIO_SRC = REPO_ROOT / "app" / "llmctl-studio-backend" / "src"
+STUDIO_APP_ROOT = REPO_ROOT / "app" / "llmctl-studio-backend"
 if str(STUDIO_SRC) not in sys.path:
     sys.path.insert(0, str(STUDIO_SRC))
 
+from rag.engine import pdf_pipeline
 from rag.engine.pdf_pipeline import _should_capture_vector_payload, _summarize_vector_geometry
 
+_HELPERS_SPEC = importlib.util.spec_from_file_location(
+    "rag_test_helpers",
+    STUDIO_APP_ROOT / "tests" / "rag" / "helpers.py",
+)
+if _HELPERS_SPEC is None or _HELPERS_SPEC.loader is None:  # pragma: no cover
+    raise RuntimeError("Failed to load rag test helpers.")
+_HELPERS_MODULE = importlib.util.module_from_spec(_HELPERS_SPEC)
+_HELPERS_SPEC.loader.exec_module(_HELPERS_MODULE)
+test_config = _HELPERS_MODULE.test_config
+
+try:
+    import fitz
+except ImportError:  # pragma: no cover
+    fitz = None
+
 
 class PdfPipelineVectorGatingTests(unittest.TestCase):
     def test_axis_aligned_layout_is_skipped(self):
@@ -64,5 +86,123 @@ class PdfPipelineVectorGatingTests(unittest.TestCase):
         self.assertEqual(reason, "curve_or_quad")
 
 
+def _write_scanned_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    for index in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {index} is 12 mm wide")
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+        pix.clear_with(200)
+        page.insert_image(fitz.Rect(100, 100, 200, 200), pixmap=pix)
+    doc.save(str(path))
+    doc.close()
+
+
+@unittest.skipIf(fitz is None, "PyMuPDF is not installed")
+class PdfPipelinePageParsingTests(unittest.TestCase):
+    def test_page_ranges_are_contiguous_and_cover_every_page(self):
+        self.assertEqual(
+            [(0, 4), (4, 7), (7, 10)],
+            pdf_pipeline._page_ranges(10, 3),
+        )
+        self.assertEqual([(0, 1), (1, 2)], pdf_pipeline._page_ranges(2, 6))
+
+    def test_ocr_results_are_cached_by_file_hash_and_settings(self):
+        ocr_calls: list[int] = []
+
+        def _fake_ocr(image, **kwargs):
+            ocr_calls.append(kwargs["include_char_boxes"])
+            return {"text": "scanned 5 mm", "word_boxes": [], "char_boxes": []}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            pdf_path = root / "manual.pdf"
+            _write_scanned_pdf(pdf_path, 3)
+            config = replace(
+                test_config(root),
+                pdf_page_workers=2,
+                ocr_cache_enabled=True,
+            )
+            with patch.object(pdf_pipeline, "_ocr_page", _fake_ocr):
+                first = pdf_pipeline.parse_pdf(pdf_path, config)
+                second = pdf_pipeline.parse_pdf(pdf_path, config)
+                self.assertEqual(3, len(ocr_calls))
+                pdf_pipeline.parse_pdf(
+                    pdf_path,
+                    replace(config, ocr_include_char_boxes=True),
+                )
+
+        self.assertEqual(6, len(ocr_calls))
+        first_pages = first.structural_hints["pdf"]["pages"]
+        self.assertEqual([1, 2, 3], [page["page_number"] for page in first_pages])
+        self.assertEqual(first_pages, second.structural_hints["pdf"]["pages"])
+        self.assertEqual("scanned 5 mm", first_pages[2]["ocr"]["text"])
+
+    def test_ocr_runs_without_cache_when_it_cannot_open(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            pdf_path = root / "manual.pdf"
+            _write_scanned_pdf(pdf_path, 1)
+            config = replace(test_config(root), ocr_cache_enabled=True)
+            with (
+                patch.object(
+                    pdf_pipeline,
+                    "open_ocr_cache",
+                    side_effect=sqlite3.OperationalError("unable to open database file"),
+                ),
+                patch.object(
+                    pdf_pipeline,
+                    "_ocr_page",
+                    return_value={"text": "scanned", "word_boxes": [], "char_boxes": []},
+                ),
+                patch.object(pdf_pipeline, "log_event") as log_event,
+            ):
+                parsed = pdf_pipeline.parse_pdf(pdf_path, config)
+
+        self.assertEqual("scanned", parsed.structural_hints["pdf"]["pages"][0]["ocr"]["text"])
+        self.assertIn(
+            "rag_pdf_ocr_cache_unavailable",
+            [call.args[0] for call in log_event.call_args_list],
+        )
+
+    def test_ocr_cache_is_closed_when_page_parsing_fails(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            pdf_path = root / "manual.pdf"
+            _write_scanned_pdf(pdf_path, 1)
+            config = replace(test_config(root), ocr_cache_enabled=True)
+            ocr_cache = MagicMock()
+            with (
+                patch.object(pdf_pipeline, "open_ocr_cache", return_value=ocr_cache),
+                patch.object(
+                    pdf_pipeline, "_parse_pdf_page", side_effect=RuntimeError("bad page")
+                ),
+                self.assertRaises(RuntimeError),
+            ):
+                pdf_pipeline._parse_pdf_page_range(pdf_path, 0, 1, 1, config, "hash")
+
+        ocr_cache.close.assert_called_once_with()
+
+    def test_process_executor_matches_serial_parse(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            pdf_path = root / "manual.pdf"
+            _write_scanned_pdf(pdf_path, 4)
+            config = replace(test_config(root), ocr_enabled=False)
+            serial = pdf_pipeline.parse_pdf(
+                pdf_path,
+                replace(config, pdf_page_workers=1),
+            )
+            pooled = pdf_pipeline.parse_pdf(
+                pdf_path,
+                replace(config, pdf_page_workers=2, pdf_page_executor="process"),
+            )
+
+        self.assertEqual(
+            serial.structural_hints["pdf"]["pages"],
+            pooled.structural_hints["pdf"]["pages"],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 REPO_ROOT = Path(__file__).resolve().parents[4]
 STUDIO_SRC = REPO_ROOT / "app" / "llmctl-studio-backend" / "src"
 if str(STUDIO_SRC) not in sys.path:
     sys.path.insert(0, str(STUDIO_SRC))
 
+from rag.engine import retrieval
+from rag.engine.lexical_index import LexicalIndex
 from rag.engine.retrieval import build_context, build_query_text, query_collections
 
 
@@ -23,10 +30,36 @@ class _FakeCollection:
 
 
 class _FakeSource:
-    def __init__(self, source_id: int, name: str, kind: str):
+    def __init__(self, source_id: int, name: str, kind: str, collection: str | None = None):
         self.id = source_id
         self.name = name
         self.kind = kind
+        self.collection = collection
+
+
+class _EmbeddingQueryCollection:
+    def __init__(self, distance: float, delay_s: float = 0.0):
+        self.distance = distance
+        self.delay_s = delay_s
+        self.calls: list[dict] = []
+
+    def query(self, **kwargs):
+        self.calls.append(kwargs)
+        time.sleep(self.delay_s)
+        return {
+            "documents": [[f"doc-{self.distance}"]],
+            "metadatas": [[{"path": f"{self.distance}.md"}]],
+            "distances": [[self.distance]],
+        }
+
+
+class _CountingEmbeddingFunction:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, texts):
+        self.calls += 1
+        return [[0.1, 0.2, 0.3] for _ in texts]
 
 
 class RetrievalTests(unittest.TestCase):
@@ -93,6 +126,305 @@ class RetrievalTests(unittest.TestCase):
         self.assertEqual(2, len(sources))
         self.assertEqual("docs/b.md", sources[1]["path"])
 
+    def test_query_collections_embeds_once_and_fans_out_concurrently(self):
+        embedding_fn = _CountingEmbeddingFunction()
+        collections = [
+            {
+                "source": _FakeSource(index, f"source-{index}", "local", f"c{index}"),
+                "collection": _EmbeddingQueryCollection(distance=index / 10, delay_s=0.2),
+                "embedding_function": embedding_fn,
+            }
+            for index in range(1, 6)
+        ]
+
+        started = time.monotonic()
+        documents, metadatas = query_collections("question", collections, top_k=3)
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(1, embedding_fn.calls)
+        self.assertLess(elapsed, 0.8)
+        self.assertEqual(["doc-0.1", "doc-0.2", "doc-0.3"], documents)
+        self.assertEqual("c1", metadatas[0]["collection"])
+        for entry in collections:
+            call = entry["collection"].calls[0]
+            self.assertEqual([[0.1, 0.2, 0.3]], call["query_embeddings"])
+            self.assertNotIn("query_texts", call)
+
+    def test_query_collections_returns_partial_results_after_deadline(self):
+        release = threading.Event()
+
+        class _HangingCollection:
+            def query(self, **_kwargs):
+                release.wait(5)
+                return {"documents": [["late"]], "metadatas": [[{}]], "distances": [[0.0]]}
+
+        collections = [
+            {
+                "source": _FakeSource(1, "fast", "local", "fast"),
+                "collection": _EmbeddingQueryCollection(distance=0.5),
+            },
+            {
+                "source": _FakeSource(2, "slow", "local", "slow"),
+                "collection": _HangingCollection(),
+            },
+        ]
+        try:
+            with patch.object(retrieval, "log_event") as log_event:
+                documents, _ = query_collections(
+                    "question", collections, top_k=5, timeout_s=0.2
+                )
+        finally:
+            release.set()
+
+        self.assertEqual(["doc-0.5"], documents)
+        self.assertEqual(
+            ["slow"], log_event.call_args.kwargs["timed_out_collections"]
+        )
+
+    def test_query_collections_applies_deadline_to_single_collection(self):
+        release = threading.Event()
+
+        class _HangingCollection:
+            def query(self, **_kwargs):
+                release.wait(5)
+                return {"documents": [["late"]], "metadatas": [[{}]], "distances": [[0.0]]}
+
+        collections = [
+            {
+                "source": _FakeSource(1, "slow", "local", "slow"),
+                "collection": _HangingCollection(),
+            }
+        ]
+        started = time.monotonic()
+        try:
+            with self.assertRaises(TimeoutError):
+                query_collections("question", collections, top_k=5, timeout_s=0.2)
+        finally:
+            release.set()
+        self.assertLess(time.monotonic() - started, 2.0)
+
+    def test_get_collections_reuses_pooled_client_and_handles(self):
+        retrieval.invalidate_collection_handles()
+        created_clients = []
+
+        class _Client:
+            def __init__(self, **_kwargs):
+                self.opened: list[str] = []
+                created_clients.append(self)
+
+            def get_or_create_collection(self, name, embedding_function):
+                self.opened.append(name)
+                return _EmbeddingQueryCollection(distance=0.1)
+
+        config = SimpleNamespace(
+            chroma_host="chroma-pool-test",
+            chroma_port=8123,
+            embed_provider="openai",
+            embed_model="text-embedding-3-small",
+            openai_api_key="sk-test",
+            retrieval_handle_ttl_s=300.0,
+        )
+        sources = [
+            _FakeSource(1, "alpha", "local", "alpha"),
+            _FakeSource(2, "beta", "local", "beta"),
+        ]
+        with (
+            patch.object(
+                retrieval,
+                "import_chromadb",
+                return_value=SimpleNamespace(HttpClient=_Client),
+            ),
+            patch.object(
+                retrieval, "build_embedding_function", return_value=_CountingEmbeddingFunction()
+            ) as build_embedding,
+        ):
+            first = retrieval.get_collections(config, sources)
+            second = retrieval.get_collections(config, sources)
+            retrieval.invalidate_collection_handles("beta")
+            third = retrieval.get_collections(config, sources)
+
+        self.assertEqual(1, len(created_clients))
+        self.assertEqual(1, build_embedding.call_count)
+        self.assertEqual(["alpha", "beta", "beta"], created_clients[0].opened)
+        self.assertIs(first[0]["collection"], second[0]["collection"])
+        self.assertIs(first[0]["collection"], third[0]["collection"])
+        self.assertIsNot(first[1]["collection"], third[1]["collection"])
+
+    def test_query_collections_reopens_stale_collection_handle_once(self):
+        class _DeletedCollection:
+            def query(self, **_kwargs):
+                raise RuntimeError("Collection does not exist.")
+
+        fresh = _EmbeddingQueryCollection(distance=0.3)
+        collections = [
+            {
+                "source": _FakeSource(1, "alpha", "local", "alpha"),
+                "collection": _DeletedCollection(),
+                "reopen": lambda: fresh,
+            }
+        ]
+
+        documents, _ = query_collections("question", collections, top_k=1)
+
+        self.assertEqual(["doc-0.3"], documents)
+        self.assertEqual(1, len(fresh.calls))
+
+    def test_query_collections_does_not_reopen_on_other_errors(self):
+        class _UnreachableCollection:
+            def query(self, **_kwargs):
+                raise ConnectionError("chroma unreachable")
+
+        reopened = []
+        collections = [
+            {
+                "source": _FakeSource(1, "alpha", "local", "alpha"),
+                "collection": _UnreachableCollection(),
+                "reopen": lambda: reopened.append(True),
+            }
+        ]
+
+        with self.assertRaises(ConnectionError):
+            query_collections("question", collections, top_k=1)
+        self.assertEqual([], reopened)
+
+    def test_hybrid_retrieval_promotes_exact_identifier_matches(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            lexical_index = LexicalIndex(Path(temp_dir) / "docs.sqlite3")
+            self.addCleanup(lexical_index.close)
+            lexical_index.upsert(
+                ["c-1", "c-2", "c-3"],
+                [
+                    "General overview of the ingestion pipeline.",
+                    "Raise ERR_4012 when parse_pdf cannot open the file.",
+                    "Embedding batches and rate limits.",
+                ],
+                [{"path": "a.md"}, {"path": "b.md"}, {"path": "c.md"}],
+            )
+            collection = _FakeCollection(
+                {
+                    "ids": [["c-1", "c-3", "c-2"]],
+                    "documents": [
+                        [
+                            "General overview of the ingestion pipeline.",
+                            "Embedding batches and rate limits.",
+                            "Raise ERR_4012 when parse_pdf cannot open the file.",
+                        ]
+                    ],
+                    "metadatas": [[{"path": "a.md"}, {"path": "c.md"}, {"path": "b.md"}]],
+                    "distances": [[0.2, 0.3, 0.5]],
+                }
+            )
+            entry = {
+                "source": _FakeSource(1, "docs", "local", "docs"),
+                "collection": collection,
+                "lexical_index": lexical_index,
+                "lexical_weight": 0.5,
+            }
+
+            documents, metadatas = query_collections(
+                "what does ERR_4012 mean", [entry], top_k=1
+            )
+            vector_only, _ = query_collections(
+                "what does ERR_4012 mean",
+                [dict(entry, lexical_index=None)],
+                top_k=1,
+            )
+
+        self.assertEqual(["Raise ERR_4012 when parse_pdf cannot open the file."], documents)
+        self.assertEqual("c-2", metadatas[0]["chunk_id"])
+        self.assertEqual(1, metadatas[0]["lexical_rank"])
+        self.assertEqual(3, metadatas[0]["vector_rank"])
+        self.assertEqual(["General overview of the ingestion pipeline."], vector_only)
+
+    def test_hybrid_retrieval_returns_lexical_only_hits(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            lexical_index = LexicalIndex(Path(temp_dir) / "docs.sqlite3")
+            self.addCleanup(lexical_index.close)
+            lexical_index.upsert(
+                ["c-9"],
+                ["Ticket OPS-1234 tracks the outage."],
+                [{"path": "tickets.md"}],
+            )
+            entry = {
+                "source": _FakeSource(1, "docs", "local", "docs"),
+                "collection": _FakeCollection(
+                    {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
+                ),
+                "lexical_index": lexical_index,
+                "lexical_weight": 0.3,
+            }
+
+            documents, metadatas = query_collections("OPS-1234", [entry], top_k=3)
+
+        self.assertEqual(["Ticket OPS-1234 tracks the outage."], documents)
+        self.assertGreater(metadatas[0]["rrf_score"], 0.0)
+        self.assertNotIn("score", metadatas[0])
+        self.assertEqual("docs", metadatas[0]["collection"])
+
+    def test_hybrid_retrieval_weights_each_collection_separately(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            lexical_index = LexicalIndex(Path(temp_dir) / "docs.sqlite3")
+            self.addCleanup(lexical_index.close)
+            lexical_index.upsert(
+                ["c-9"], ["Ticket OPS-1234 tracks the outage."], [{"path": "tickets.md"}]
+            )
+            hybrid_entry = {
+                "source": _FakeSource(1, "docs", "local", "docs"),
+                "collection": _FakeCollection(
+                    {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
+                ),
+                "lexical_index": lexical_index,
+                "lexical_weight": 0.6,
+            }
+            vector_entry = {
+                "source": _FakeSource(2, "notes", "local", "notes"),
+                "collection": _FakeCollection(
+                    {
+                        "ids": [["n-1"]],
+                        "documents": [["Outage notes."]],
+                        "metadatas": [[{"path": "notes.md"}]],
+                        "distances": [[0.4]],
+                    }
+                ),
+            }
+
+            documents, metadatas = query_collections(
+                "OPS-1234", [hybrid_entry, vector_entry], top_k=2
+            )
+
+        # The vector-only collection keeps its full vector weight instead of
+        # taking the hybrid collection's 0.4 share.
+        self.assertEqual(["Outage notes.", "Ticket OPS-1234 tracks the outage."], documents)
+        self.assertEqual(0.4, metadatas[0]["score"])
+        self.assertGreater(metadatas[0]["rrf_score"], metadatas[1]["rrf_score"])
+
+    def test_hybrid_lexical_search_runs_under_the_deadline(self):
+        release = threading.Event()
+
+        class _HangingLexicalIndex:
+            def search(self, _text, _limit):
+                release.wait(5)
+                return []
+
+        entry = {
+            "source": _FakeSource(1, "docs", "local", "docs"),
+            "collection": _EmbeddingQueryCollection(distance=0.2),
+            "lexical_index": _HangingLexicalIndex(),
+            "lexical_weight": 0.5,
+        }
+        started = time.monotonic()
+        try:
+            with patch.object(retrieval, "log_event") as log_event:
+                documents, _ = query_collections("question", [entry], top_k=1, timeout_s=0.2)
+        finally:
+            release.set()
+
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(["doc-0.2"], documents)
+        self.assertEqual(
+            ["docs"], log_event.call_args.kwargs["timed_out_lexical_collections"]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,9 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+from dataclasses import replace
+import threading
+import time
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -20,6 +23,7 @@ os.environ.setdefault(
 
 from core.prompt_envelope import build_prompt_envelope
 from core.quick_node import build_quick_node_agent_info, build_quick_node_agent_profile
+from services.execution import agent_runtime, agent_stream
 from services.execution.agent_info import AgentInfo, coerce_agent_profile_payload
 from services.execution.agent_runtime import (
     FrontierAgent,
@@ -39,6 +43,7 @@ class AgentRuntimeAbstractionTests(unittest.TestCase):
         gemini_settings_from_model_config=None,
         load_gemini_auth_key=None,
         dispatch_tool_call=None,
+        tool_call_is_parallel_safe=None,
     ) -> FrontierAgentDependencies:
         return FrontierAgentDependencies(
             provider_label=lambda provider: provider,
@@ -53,6 +58,7 @@ class AgentRuntimeAbstractionTests(unittest.TestCase):
             default_claude_model="claude-sonnet-4-0",
             require_claude_api_key=True,
             dispatch_tool_call=dispatch_tool_call,
+            tool_call_is_parallel_safe=tool_call_is_parallel_safe,
         )
 
     @staticmethod
@@ -107,7 +113,7 @@ class AgentRuntimeAbstractionTests(unittest.TestCase):
             def __init__(self, dependencies) -> None:
                 captured["dependencies"] = dependencies
 
-            def run(self, request, *, on_update=None, on_log=None):
+            def run(self, request, *, on_update=None, on_log=None, should_cancel=None):
                 captured["request"] = request
                 return subprocess.CompletedProcess(["sdk:codex"], 0, "typed-runtime-ok", "")
 
@@ -131,7 +137,7 @@ class AgentRuntimeAbstractionTests(unittest.TestCase):
             def __init__(self, dependencies) -> None:
                 captured["dependencies"] = dependencies
 
-            def run(self, request, *, on_update=None, on_log=None):
+            def run(self, request, *, on_update=None, on_log=None, should_cancel=None):
                 captured["request"] = request
                 return subprocess.CompletedProcess(["sdk:codex"], 0, "ok", "")
 
@@ -188,7 +194,7 @@ class AgentRuntimeAbstractionTests(unittest.TestCase):
             def __init__(self, dependencies) -> None:
                 captured["dependencies"] = dependencies
 
-            def run(self, request, *, on_update=None, on_log=None):
+            def run(self, request, *, on_update=None, on_log=None, should_cancel=None):
                 return subprocess.CompletedProcess(["sdk:codex"], 0, "ok", "")
 
         fake_outcome = SimpleNamespace(
@@ -247,7 +253,7 @@ class AgentRuntimeAbstractionTests(unittest.TestCase):
             def __init__(self, dependencies) -> None:
                 captured["dependencies"] = dependencies
 
-            def run(self, request, *, on_update=None, on_log=None):
+            def run(self, request, *, on_update=None, on_log=None, should_cancel=None):
                 return subprocess.CompletedProcess(["sdk:codex"], 0, "ok", "")
 
         fake_outcome = SimpleNamespace(
@@ -305,7 +311,7 @@ class AgentRuntimeAbstractionTests(unittest.TestCase):
             def __init__(self, dependencies) -> None:
                 captured["dependencies"] = dependencies
 
-            def run(self, request, *, on_update=None, on_log=None):
+            def run(self, request, *, on_update=None, on_log=None, should_cancel=None):
                 return subprocess.CompletedProcess(["sdk:codex"], 0, "ok", "")
 
         with patch.object(studio_tasks, "FrontierAgent", _FakeFrontierAgent):
@@ -570,6 +576,512 @@ class AgentRuntimeAbstractionTests(unittest.TestCase):
         self.assertEqual("deterministic.workspace", tool_trace[0].get("tool_name"))
         self.assertEqual("read", tool_trace[0].get("operation"))
 
+    def test_frontier_agent_tool_loop_runs_read_calls_concurrently(self) -> None:
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+        events: list[str] = []
+
+        def _dispatch_tool_call(tool_call: FrontierToolCall) -> dict[str, object]:
+            operation = str(tool_call.arguments.get("operation"))
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+                events.append(f"start:{tool_call.call_id}")
+            time.sleep(0.2)
+            with lock:
+                active["now"] -= 1
+                events.append(f"end:{tool_call.call_id}")
+            return {
+                "call_id": tool_call.call_id,
+                "output": {"tool_domain": "workspace", "operation": operation},
+            }
+
+        runtime = FrontierAgent(
+            self._build_frontier_dependencies(
+                dispatch_tool_call=_dispatch_tool_call,
+                tool_call_is_parallel_safe=(
+                    studio_tasks._frontier_tool_call_is_parallel_safe
+                ),
+            )
+        )
+        request = FrontierAgentRequest(
+            provider="codex",
+            prompt="hello",
+            mcp_configs={},
+            model_config={},
+            env={"OPENAI_API_KEY": "env-key"},
+        )
+        calls = [
+            ("call_1", "deterministic.workspace", "read"),
+            ("call_2", "deterministic.workspace", "search"),
+            ("call_3", "deterministic.workspace", "read"),
+            ("call_4", "deterministic.git", "commit"),
+            ("call_5", "deterministic.workspace", "list"),
+        ]
+        first_payload = {
+            "output": [
+                {
+                    "type": "function_call",
+                    "id": call_id,
+                    "name": tool_name,
+                    "arguments": f"{{\"operation\":\"{operation}\"}}",
+                }
+                for call_id, tool_name, operation in calls
+            ]
+        }
+        with patch.object(
+            runtime,
+            "_run_codex",
+            side_effect=[
+                self._completed_with_payload(
+                    command=["sdk:codex"],
+                    returncode=0,
+                    stdout="",
+                    stderr="",
+                    payload=first_payload,
+                ),
+                self._completed_with_payload(
+                    command=["sdk:codex"],
+                    returncode=0,
+                    stdout="final-answer",
+                    stderr="",
+                    payload={"output": []},
+                ),
+            ],
+        ) as run_mock:
+            started = time.perf_counter()
+            result = runtime.run(request)
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual(0, result.returncode)
+        self.assertEqual(3, active["peak"])
+        self.assertLess(elapsed, 0.9)
+        # The git commit waits for the reads before it and runs alone.
+        commit_start = events.index("start:call_4")
+        for call_id in ("call_1", "call_2", "call_3"):
+            self.assertLess(events.index(f"end:{call_id}"), commit_start)
+        self.assertEqual(events.index("end:call_4") + 1, events.index("start:call_5"))
+        tool_trace = getattr(result, "_llmctl_tool_trace", None)
+        self.assertEqual(
+            ["call_1", "call_2", "call_3", "call_4", "call_5"],
+            [item.get("call_id") for item in tool_trace],
+        )
+        self.assertEqual(
+            ["parallel", "parallel", "parallel", "serial", "parallel"],
+            [item.get("dispatch_mode") for item in tool_trace],
+        )
+        self.assertTrue(all(item.get("elapsed_ms") >= 150 for item in tool_trace))
+        second_prompt = str(run_mock.call_args_list[1].kwargs.get("prompt") or "")
+        self.assertLess(second_prompt.index("call_1"), second_prompt.index("call_5"))
+
+    def test_frontier_tool_call_parallel_policy_by_domain(self) -> None:
+        def _call(tool_name: str, operation: str) -> FrontierToolCall:
+            return FrontierToolCall(
+                call_id="call",
+                tool_name=tool_name,
+                arguments={"operation": operation},
+            )
+
+        is_parallel_safe = studio_tasks._frontier_tool_call_is_parallel_safe
+        self.assertTrue(is_parallel_safe(_call("deterministic.workspace", "read")))
+        self.assertFalse(is_parallel_safe(_call("deterministic.workspace", "write")))
+        self.assertFalse(is_parallel_safe(_call("deterministic.git", "commit")))
+        self.assertFalse(is_parallel_safe(_call("deterministic.command", "run")))
+        self.assertFalse(is_parallel_safe(_call("unknown.tool", "read")))
+        # The SDK tool loop cannot dispatch RAG calls, so none run in parallel.
+        self.assertFalse(is_parallel_safe(_call("deterministic.rag", "query")))
+        with self.assertRaises(studio_tasks.FrontierToolDispatchError) as raised:
+            studio_tasks._dispatch_frontier_tool_call(
+                tool_call=_call("deterministic.rag", "query"),
+                workspace_root=None,
+                request_id=None,
+                correlation_id=None,
+                execution_id=None,
+            )
+        self.assertEqual("unsupported_tool_name", raised.exception.code)
+
+    def test_frontier_agent_codex_continues_with_previous_response_id(self) -> None:
+        create_calls: list[dict[str, object]] = []
+        responses = [
+            {
+                "id": "resp_1",
+                "output": [
+                    {
+                        "type": "function_call",
+                        "call_id": "call_1",
+                        "name": "deterministic.workspace",
+                        "arguments": "{\"operation\":\"read\"}",
+                    }
+                ],
+                "usage": {"input_tokens": 120, "output_tokens": 12},
+            },
+            {
+                "id": "resp_2",
+                "output_text": "final-answer",
+                "output": [],
+                "usage": {"input_tokens": 40, "output_tokens": 5},
+            },
+        ]
+
+        class _FakeOpenAI:
+            def __init__(self, **_kwargs) -> None:
+                self.responses = self
+
+            def create(self, **kwargs):
+                create_calls.append(kwargs)
+                return responses[len(create_calls) - 1]
+
+        runtime = FrontierAgent(
+            self._build_frontier_dependencies(
+                dispatch_tool_call=lambda tool_call: {
+                    "call_id": tool_call.call_id,
+                    "output": {"content": "x" * 2000},
+                }
+            )
+        )
+        request = FrontierAgentRequest(
+            provider="codex",
+            prompt="hello",
+            mcp_configs={},
+            model_config={"tool_output_max_chars": 500},
+            env={"OPENAI_API_KEY": "env-key"},
+        )
+        with patch.dict(sys.modules, {"openai": SimpleNamespace(OpenAI=_FakeOpenAI)}):
+            result = runtime.run(request)
+
+        self.assertEqual(0, result.returncode)
+        self.assertEqual(2, len(create_calls))
+        self.assertEqual("hello", create_calls[0]["input"])
+        self.assertNotIn("previous_response_id", create_calls[0])
+        self.assertEqual("resp_1", create_calls[1]["previous_response_id"])
+        follow_up = create_calls[1]["input"]
+        self.assertEqual(1, len(follow_up))
+        self.assertEqual("function_call_output", follow_up[0]["type"])
+        self.assertEqual("call_1", follow_up[0]["call_id"])
+        self.assertIn('"truncated": true', follow_up[0]["output"])
+        self.assertLess(len(follow_up[0]["output"]), 800)
+        self.assertEqual(
+            [
+                {"cycle": 1, "input_tokens": 120, "output_tokens": 12},
+                {"cycle": 2, "input_tokens": 40, "output_tokens": 5},
+            ],
+            getattr(result, "_llmctl_cycle_usage", None),
+        )
+
+    def test_frontier_agent_claude_replays_native_tool_result_blocks(self) -> None:
+        create_calls: list[dict[str, object]] = []
+        responses = [
+            SimpleNamespace(
+                content=[
+                    {"type": "text", "text": "reading"},
+                    {
+                        "type": "tool_use",
+                        "id": "toolu_1",
+                        "name": "deterministic.workspace",
+                        "input": {"operation": "read", "path": "README.md"},
+                    },
+                ],
+                usage=SimpleNamespace(input_tokens=90, output_tokens=20),
+            ),
+            SimpleNamespace(
+                content=[{"type": "text", "text": "final-answer"}],
+                usage=SimpleNamespace(input_tokens=130, output_tokens=4),
+            ),
+        ]
+
+        class _FakeAnthropic:
+            def __init__(self, **_kwargs) -> None:
+                self.messages = self
+
+            def create(self, **kwargs):
+                create_calls.append(
+                    {**kwargs, "messages": [dict(item) for item in kwargs["messages"]]}
+                )
+                return responses[len(create_calls) - 1]
+
+        runtime = FrontierAgent(
+            replace(
+                self._build_frontier_dependencies(
+                    dispatch_tool_call=lambda tool_call: {
+                        "call_id": tool_call.call_id,
+                        "output": {"content": "readme"},
+                    }
+                ),
+                resolve_claude_auth_key=lambda _env: ("claude-key", "env"),
+            )
+        )
+        request = FrontierAgentRequest(
+            provider="claude",
+            prompt="hello",
+            mcp_configs={},
+            model_config={},
+            env={},
+        )
+        with patch.dict(
+            sys.modules,
+            {"anthropic": SimpleNamespace(Anthropic=_FakeAnthropic)},
+        ):
+            result = runtime.run(request)
+
+        self.assertEqual(0, result.returncode)
+        self.assertEqual("final-answer", result.stdout)
+        messages = create_calls[1]["messages"]
+        self.assertEqual(["user", "assistant", "user"], [item["role"] for item in messages])
+        self.assertEqual("hello", messages[0]["content"])
+        self.assertEqual("tool_use", messages[1]["content"][1]["type"])
+        tool_result = messages[2]["content"][0]
+        self.assertEqual("tool_result", tool_result["type"])
+        self.assertEqual("toolu_1", tool_result["tool_use_id"])
+        self.assertIn("readme", tool_result["content"])
+        self.assertNotIn("Tool results from cycle", str(messages))
+
+    def test_frontier_agent_codex_streams_deltas_and_extracts_tool_calls(self) -> None:
+        create_calls: list[dict[str, object]] = []
+        updates: list[tuple[str, str]] = []
+        streams = [
+            [
+                SimpleNamespace(type="response.created"),
+                SimpleNamespace(type="response.output_text.delta", delta="read"),
+                SimpleNamespace(type="response.output_text.delta", delta="ing"),
+                SimpleNamespace(
+                    type="response.completed",
+                    response={
+                        "id": "resp_1",
+                        "output": [
+                            {
+                                "type": "function_call",
+                                "call_id": "call_1",
+                                "name": "deterministic.workspace",
+                                "arguments": "{\"operation\":\"read\"}",
+                            }
+                        ],
+                        "usage": {"input_tokens": 50, "output_tokens": 9},
+                    },
+                ),
+            ],
+            [
+                SimpleNamespace(type="response.output_text.delta", delta="final-"),
+                SimpleNamespace(type="response.output_text.delta", delta="answer"),
+                SimpleNamespace(
+                    type="response.completed",
+                    response=SimpleNamespace(
+                        id="resp_2",
+                        output_text="final-answer",
+                        output=[],
+                        usage=SimpleNamespace(input_tokens=20, output_tokens=3),
+                    ),
+                ),
+            ],
+        ]
+
+        class _FakeOpenAI:
+            def __init__(self, **_kwargs) -> None:
+                self.responses = self
+
+            def create(self, **kwargs):
+                create_calls.append(kwargs)
+                return iter(streams[len(create_calls) - 1])
+
+        runtime = FrontierAgent(
+            self._build_frontier_dependencies(
+                dispatch_tool_call=lambda tool_call: {
+                    "call_id": tool_call.call_id,
+                    "output": {"content": "readme"},
+                }
+            )
+        )
+        request = FrontierAgentRequest(
+            provider="codex",
+            prompt="hello",
+            mcp_configs={},
+            model_config={},
+            env={"OPENAI_API_KEY": "env-key"},
+        )
+        with patch.dict(sys.modules, {"openai": SimpleNamespace(OpenAI=_FakeOpenAI)}):
+            result = runtime.run(
+                request,
+                on_update=lambda stdout, stderr: updates.append((stdout, stderr)),
+            )
+
+        self.assertEqual(0, result.returncode)
+        self.assertEqual("final-answer", result.stdout)
+        self.assertEqual([True, True], [call_kwargs.get("stream") for call_kwargs in create_calls])
+        self.assertEqual("resp_1", create_calls[1]["previous_response_id"])
+        self.assertEqual(("read", ""), updates[0])
+        self.assertIn(("reading", ""), updates)
+        self.assertEqual(("final-answer", ""), updates[-1])
+        tool_trace = getattr(result, "_llmctl_tool_trace", None)
+        self.assertEqual(1, len(tool_trace))
+        metrics = getattr(result, "_llmctl_stream_metrics", None)
+        self.assertTrue(metrics["streamed"])
+        self.assertEqual(2, metrics["cycles"])
+        self.assertEqual(12, metrics["completion_tokens"])
+        self.assertEqual(70, metrics["prompt_tokens"])
+        self.assertIsNotNone(metrics["time_to_first_token_ms"])
+
+    def test_frontier_agent_claude_stream_stops_when_run_is_canceled(self) -> None:
+        consumed: list[str] = []
+        canceled = threading.Event()
+
+        class _FakeMessageStream:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_exc_info) -> None:
+                return None
+
+            def __iter__(self):
+                for text in ("partial ", "output ", "never"):
+                    consumed.append(text)
+                    if len(consumed) == 2:
+                        canceled.set()
+                    yield SimpleNamespace(type="text", text=text)
+
+            def get_final_message(self):
+                raise AssertionError("a canceled stream must not be finalized")
+
+        class _FakeAnthropic:
+            def __init__(self, **_kwargs) -> None:
+                self.messages = self
+
+            def stream(self, **_kwargs):
+                return _FakeMessageStream()
+
+        runtime = FrontierAgent(
+            replace(
+                self._build_frontier_dependencies(),
+                resolve_claude_auth_key=lambda _env: ("claude-key", "env"),
+            )
+        )
+        request = FrontierAgentRequest(
+            provider="claude",
+            prompt="hello",
+            mcp_configs={},
+            model_config={},
+            env={},
+        )
+        with patch.dict(
+            sys.modules,
+            {"anthropic": SimpleNamespace(Anthropic=_FakeAnthropic)},
+        ), patch.object(agent_stream, "STREAM_CANCEL_CHECK_INTERVAL_SECONDS", 0.0):
+            result = runtime.run(request, should_cancel=canceled.is_set)
+
+        self.assertEqual(1, result.returncode)
+        self.assertEqual("Canceled by user.", result.stderr)
+        self.assertEqual("partial output ", result.stdout)
+        self.assertEqual(["partial ", "output "], consumed)
+        self.assertTrue(getattr(result, "_llmctl_canceled", False))
+
+    def test_claude_stream_checks_cancel_on_non_text_events(self) -> None:
+        canceled = threading.Event()
+        consumed: list[str] = []
+
+        class _FakeMessageStream:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_exc_info) -> None:
+                return None
+
+            def __iter__(self):
+                for event_type in ("content_block_start", "input_json", "input_json"):
+                    consumed.append(event_type)
+                    canceled.set()
+                    yield SimpleNamespace(type=event_type)
+
+            def get_final_message(self):
+                raise AssertionError("a canceled stream must not be finalized")
+
+        client = SimpleNamespace(
+            messages=SimpleNamespace(stream=lambda **_kwargs: _FakeMessageStream())
+        )
+        relay = agent_stream.FrontierStreamRelay(
+            should_cancel=canceled.is_set, cancel_check_interval_s=0.0
+        )
+
+        with self.assertRaises(agent_stream.FrontierStreamCanceled):
+            agent_runtime._stream_claude_message(client, {}, relay)
+        self.assertEqual(["content_block_start"], consumed)
+
+    def test_frontier_agent_gemini_stream_rebuilds_function_calls(self) -> None:
+        from google.genai import types
+
+        stream_calls: list[dict[str, object]] = []
+        captured_calls: list[FrontierToolCall] = []
+        updates: list[str] = []
+
+        def _chunk(*parts, usage=None):
+            return types.GenerateContentResponse(
+                candidates=[types.Candidate(content=types.Content(role="model", parts=list(parts)))],
+                usage_metadata=usage,
+            )
+
+        streams = [
+            [
+                _chunk(types.Part(text="Look")),
+                _chunk(types.Part(text="ing")),
+                _chunk(
+                    types.Part(
+                        function_call=types.FunctionCall(
+                            id="gemini-call-1",
+                            name="deterministic.workspace",
+                            args={"operation": "read", "path": "README.md"},
+                        )
+                    ),
+                    usage=types.GenerateContentResponseUsageMetadata(
+                        prompt_token_count=30,
+                        candidates_token_count=8,
+                    ),
+                ),
+            ],
+            [_chunk(types.Part(text="gemini-"), types.Part(text="final"))],
+        ]
+
+        class _FakeModels:
+            def generate_content_stream(self, **kwargs):
+                stream_calls.append(kwargs)
+                return iter(streams[len(stream_calls) - 1])
+
+        class _FakeClient:
+            def __init__(self, **_kwargs) -> None:
+                self.models = _FakeModels()
+
+        def _dispatch_tool_call(tool_call: FrontierToolCall) -> dict[str, object]:
+            captured_calls.append(tool_call)
+            return {"call_id": tool_call.call_id, "output": {"content": "readme"}}
+
+        runtime = FrontierAgent(
+            self._build_frontier_dependencies(dispatch_tool_call=_dispatch_tool_call)
+        )
+        request = FrontierAgentRequest(
+            provider="gemini",
+            prompt="hello",
+            mcp_configs={},
+            model_config={},
+            env={"GEMINI_API_KEY": "env-key"},
+        )
+        fake_google = SimpleNamespace(genai=SimpleNamespace(Client=_FakeClient, types=types))
+        with patch.dict(
+            sys.modules,
+            {"google": fake_google, "google.genai": fake_google.genai},
+        ):
+            result = runtime.run(request, on_update=lambda stdout, _stderr: updates.append(stdout))
+
+        self.assertEqual(0, result.returncode)
+        self.assertEqual("gemini-final", result.stdout)
+        self.assertEqual(1, len(captured_calls))
+        self.assertEqual("gemini-call-1", captured_calls[0].call_id)
+        self.assertEqual("Look", updates[0])
+        recorded_turn = stream_calls[1]["contents"][1]
+        self.assertEqual(
+            ["Looking", None],
+            [part.text for part in recorded_turn.parts],
+        )
+        self.assertEqual("deterministic.workspace", recorded_turn.parts[1].function_call.name)
+        metrics = getattr(result, "_llmctl_stream_metrics", None)
+        self.assertEqual(2, metrics["cycles"])
+        self.assertEqual(30, metrics["prompt_tokens"])
+
     def test_sdk_tooling_evidence_payload_extracts_trace(self) -> None:
         completed = subprocess.CompletedProcess(["sdk:codex"], 0, "ok", "")
         setattr(
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+STUDIO_SRC = REPO_ROOT / "app" / "llmctl-studio-backend" / "src"
+if str(STUDIO_SRC) not in sys.path:
+    sys.path.insert(0, str(STUDIO_SRC))
+
+from chat import rag_client
+from chat.contracts import (
+    RAGContractError,
+    RAGRetrievalRequest,
+    RAG_HEALTH_CONFIGURED_HEALTHY,
+    RAG_HEALTH_CONFIGURED_UNHEALTHY,
+    RAG_REASON_UNAVAILABLE,
+)
+
+
+class _RagContractHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args) -> None:
+        return None
+
+    def do_GET(self) -> None:
+        self.server.requests.append((self.client_address, self.path, None))
+        if self.path.endswith("/contract/health"):
+            self._send_json(200, self.server.health)
+            return
+        self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length).decode("utf-8"))
+        self.server.requests.append((self.client_address, self.path, body))
+        time.sleep(self.server.post_delay_s)
+        if self.path.endswith("/contract/health-retrieve"):
+            self._send_json(200, self.server.combined)
+            return
+        if self.path.endswith("/contract/retrieve"):
+            self._send_json(200, self.server.combined.get("retrieval") or {})
+            return
+        self._send_json(404, {"error": "not found"})
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class ChatRagClientPoolStage10Tests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _RagContractHandler)
+        self.server.daemon_threads = True
+        self.server.requests = []
+        self.server.post_delay_s = 0.0
+        self.server.health = {"state": RAG_HEALTH_CONFIGURED_HEALTHY, "provider": "chroma"}
+        self.server.combined = {
+            "health": self.server.health,
+            "retrieval": {
+                "retrieval_context": [{"text": "ctx", "collection": "docs", "rank": 1}],
+                "retrieval_stats": {"retrieved_count": 1},
+                "collections": ["docs"],
+            },
+            "error": None,
+        }
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(rag_client.close_rag_connection_pools)
+        host, port = self.server.server_address
+        self.client = rag_client.HttpRAGContractClient(
+            base_url=f"http://{host}:{port}/",
+            timeout_seconds=5.0,
+        )
+        self.request = RAGRetrievalRequest(question="q", collections=["docs"], top_k=3)
+
+    def test_requests_reuse_one_keep_alive_connection(self) -> None:
+        self.client.health()
+        self.client.health()
+        self.client.retrieve(self.request)
+
+        clients = {client for client, _path, _body in self.server.requests}
+        self.assertEqual(3, len(self.server.requests))
+        self.assertEqual(1, len(clients))
+
+    def test_read_timeout_on_reused_connection_is_not_resent(self) -> None:
+        self.client.health()
+        self.server.post_delay_s = 0.5
+        client = rag_client.HttpRAGContractClient(
+            base_url=self.client.base_url,
+            timeout_seconds=0.1,
+        )
+
+        with self.assertRaises(RAGContractError) as ctx:
+            client.retrieve(self.request)
+
+        self.assertIn("timed out", str(ctx.exception))
+        retrieve_paths = [
+            path for _client, path, _body in self.server.requests if path.endswith("/retrieve")
+        ]
+        self.assertEqual(1, len(retrieve_paths))
+
+    def test_health_and_retrieve_uses_single_round_trip(self) -> None:
+        result = self.client.health_and_retrieve(self.request)
+
+        self.assertEqual(RAG_HEALTH_CONFIGURED_HEALTHY, result.health.state)
+        self.assertIsNone(result.error)
+        self.assertIsNotNone(result.retrieval)
+        self.assertIn("ctx", result.retrieval.retrieval_context[0])
+        self.assertEqual(1, len(self.server.requests))
+        _client, path, body = self.server.requests[0]
+        self.assertEqual("/api/rag/contract/health-retrieve", path)
+        self.assertEqual(["docs"], body["collections"])
+
+    def test_health_and_retrieve_surfaces_retrieval_error(self) -> None:
+        self.server.combined = {
+            "health": {"state": RAG_HEALTH_CONFIGURED_HEALTHY, "provider": "chroma"},
+            "retrieval": None,
+            "error": {
+                "reason_code": RAG_REASON_UNAVAILABLE,
+                "message": "One or more selected collections are not available.",
+                "metadata": {"missing_collections": ["docs"]},
+                "status": 400,
+            },
+        }
+
+        result = self.client.health_and_retrieve(self.request)
+
+        self.assertIsNone(result.retrieval)
+        self.assertIsInstance(result.error, RAGContractError)
+        self.assertEqual(RAG_REASON_UNAVAILABLE, result.error.reason_code)
+        self.assertEqual(["docs"], result.error.metadata["missing_collections"])
+
+    def test_health_and_retrieve_skips_retrieval_when_unhealthy(self) -> None:
+        self.server.combined = {
+            "health": {"state": RAG_HEALTH_CONFIGURED_UNHEALTHY, "provider": "chroma"},
+            "retrieval": None,
+            "error": None,
+        }
+
+        result = self.client.health_and_retrieve(self.request)
+
+        self.assertEqual(RAG_HEALTH_CONFIGURED_UNHEALTHY, result.health.state)
+        self.assertIsNone(result.retrieval)
+        self.assertIsNone(result.error)
+
+    def test_http_error_maps_to_contract_error(self) -> None:
+        with self.assertRaises(RAGContractError) as ctx:
+            self.client._request_json(method="GET", path="/api/rag/contract/missing")
+
+        self.assertEqual(404, ctx.exception.metadata["status"])
+
+    def test_pool_bounds_concurrent_connections(self) -> None:
+        pool = rag_client.RAGConnectionPool(self.client.base_url, max_connections=1)
+        connection, reused = pool.acquire(1.0)
+        self.assertFalse(reused)
+        with self.assertRaises(TimeoutError):
+            pool.acquire(0.05)
+        pool.release(connection, reusable=True)
+        again, reused = pool.acquire(0.05)
+        self.assertIs(connection, again)
+        self.assertTrue(reused)
+        pool.release(again, reusable=False)
+        pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,6 +32,9 @@ import core.db as core_db
 from chat.contracts import (
     CHAT_REASON_MCP_FAILED,
     RAGContractError,
+    RAGHealth,
+    RAGHealthRetrieval,
+    RAGRetrievalResponse,
     RAG_HEALTH_CONFIGURED_HEALTHY,
     RAG_HEALTH_CONFIGURED_UNHEALTHY,
     RAG_REASON_RETRIEVAL_FAILED,
@@ -628,6 +631,61 @@ class ChatRuntimeStage8Tests(StudioDbTestCase):
             citation_payload = json.loads(turn.citation_metadata_json or "[]") if turn else []
             self.assertEqual(1, len(citation_payload))
 
+    def test_rag_health_and_retrieval_share_one_round_trip_with_timings(self) -> None:
+        model = self._create_model(name="RAG Combined Model")
+        thread = create_thread(
+            title="RAG Combined",
+            model_id=model.id,
+            rag_collections=["docs"],
+        )
+        thread_id = int(thread["id"])
+        calls: list[str] = []
+
+        class _CombinedRagClient:
+            def health(self):
+                raise AssertionError("health should be answered by the combined call")
+
+            def retrieve(self, payload):
+                raise AssertionError("retrieve should be answered by the combined call")
+
+            def health_and_retrieve(self, payload):
+                calls.append(payload.question)
+                return RAGHealthRetrieval(
+                    health=RAGHealth(state=RAG_HEALTH_CONFIGURED_HEALTHY),
+                    retrieval=RAGRetrievalResponse(
+                        retrieval_context=["combined context"],
+                        retrieval_stats={"retrieved_count": 1},
+                    ),
+                )
+
+        with patch(
+            "chat.runtime._run_llm",
+            return_value=subprocess.CompletedProcess(["stub"], 0, "assistant reply", ""),
+        ):
+            result = execute_turn(
+                thread_id=thread_id,
+                message="Need retrieval",
+                rag_client=_CombinedRagClient(),
+            )
+
+        self.assertTrue(result.ok)
+        self.assertEqual(["Need retrieval"], calls)
+        with session_scope() as session:
+            event = (
+                session.execute(
+                    select(ChatActivityEvent)
+                    .where(ChatActivityEvent.turn_id == result.turn_id)
+                    .where(ChatActivityEvent.event_type == "retrieval_used")
+                )
+                .scalars()
+                .first()
+            )
+            self.assertIsNotNone(event)
+            metadata = json.loads(event.metadata_json or "{}") if event else {}
+        timings = metadata.get("rag_timings_ms") or {}
+        self.assertIn("health_retrieve", timings)
+        self.assertNotIn("retrieve", timings)
+
     def test_explicit_file_hint_scopes_retrieval_context_for_selected_collection(self) -> None:
         model = self._create_model(name="Scoped Retrieval Model")
         thread = create_thread(
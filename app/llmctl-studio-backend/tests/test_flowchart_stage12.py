@@ -33,10 +33,12 @@ from core.models import (
     FlowchartNode,
     FlowchartRun,
     FlowchartRunNode,
+    FlowchartRunTraceEntry,
     NodeArtifact,
     NODE_ARTIFACT_TYPE_MEMORY,
 )
 from services import tasks as studio_tasks
+from services.flowchart_trace import project_flowchart_run_node
 import web.views as studio_views
 
 
@@ -279,6 +281,96 @@ class FlowchartStage12Tests(unittest.TestCase):
         warnings = status_payload.get("warnings") or []
         self.assertEqual("deterministic_fallback_used", warnings[0].get("message"))
 
+    def test_trace_pages_projection_and_reprojects_stale_nodes(self) -> None:
+        _, node_id, run_id = self._create_flowchart_run(status="running")
+        with session_scope() as session:
+            node_run_ids = [
+                FlowchartRunNode.create(
+                    session,
+                    flowchart_run_id=run_id,
+                    flowchart_node_id=node_id,
+                    execution_index=index,
+                    status="failed" if index % 2 == 0 else "succeeded",
+                    error="boom" if index % 2 == 0 else None,
+                ).id
+                for index in range(1, 6)
+            ]
+
+        trace_response = self.client.get(
+            f"/flowcharts/runs/{run_id}/trace",
+            query_string={
+                "include": "node,failure,timeline",
+                "limit": "2",
+                "offset": "1",
+            },
+        )
+        self.assertEqual(200, trace_response.status_code)
+        trace_payload = trace_response.get_json() or {}
+        node_trace = trace_payload.get("node_trace") or {}
+        self.assertEqual(5, node_trace.get("total_count"))
+        self.assertEqual(
+            [2, 3],
+            [item.get("execution_index") for item in node_trace.get("items") or []],
+        )
+        failure_trace = trace_payload.get("failure_trace") or {}
+        self.assertEqual(2, failure_trace.get("total_count"))
+        self.assertEqual(
+            [node_run_ids[3]],
+            [item.get("flowchart_run_node_id") for item in failure_trace.get("items") or []],
+        )
+        timeline = trace_payload.get("timeline") or {}
+        self.assertEqual(6, timeline.get("total_count"))
+        self.assertEqual(2, len(timeline.get("items") or []))
+        with session_scope() as session:
+            self.assertEqual(
+                5,
+                session.query(FlowchartRunTraceEntry)
+                .filter(FlowchartRunTraceEntry.flowchart_run_id == run_id)
+                .count(),
+            )
+            session.get(FlowchartRunNode, node_run_ids[0]).status = "failed"
+
+        failed_response = self.client.get(
+            f"/flowcharts/runs/{run_id}/trace",
+            query_string={"include": "node", "status": "failed"},
+        )
+        failed_items = ((failed_response.get_json() or {}).get("node_trace") or {}).get(
+            "items"
+        ) or []
+        self.assertEqual(
+            [node_run_ids[0], node_run_ids[1], node_run_ids[3]],
+            [item.get("id") for item in failed_items],
+        )
+
+    def test_project_flowchart_run_node_upserts_single_entry(self) -> None:
+        _, node_id, run_id = self._create_flowchart_run(status="running")
+        with session_scope() as session:
+            node_run = FlowchartRunNode.create(
+                session,
+                flowchart_run_id=run_id,
+                flowchart_node_id=node_id,
+                execution_index=1,
+                status="running",
+            )
+            project_flowchart_run_node(session, node_run)
+            node_run.status = "succeeded"
+            node_run.output_state_json = json.dumps(
+                {"request_id": "proj-req", "correlation_id": "proj-corr"}
+            )
+            project_flowchart_run_node(session, node_run)
+            node_run_id = node_run.id
+
+        with session_scope() as session:
+            entries = (
+                session.query(FlowchartRunTraceEntry)
+                .filter(FlowchartRunTraceEntry.flowchart_run_node_id == node_run_id)
+                .all()
+            )
+            self.assertEqual(1, len(entries))
+            self.assertEqual("succeeded", entries[0].status)
+            self.assertEqual("proj-req", entries[0].request_id)
+            self.assertEqual("proj-corr", entries[0].correlation_id)
+
     def test_emit_flowchart_run_event_defaults_request_and_correlation(self) -> None:
         run = SimpleNamespace(
             id=99,
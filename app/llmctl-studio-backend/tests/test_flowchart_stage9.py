@@ -2376,6 +2376,283 @@ class FlowchartStage9UnitTests(StudioDbTestCase):
         overlap_seconds = min(call_ends.values()) - max(call_starts.values())
         self.assertGreater(overlap_seconds, 0.05)
 
+    def test_scheduler_dispatches_successors_without_waiting_for_slow_siblings(self) -> None:
+        with session_scope() as session:
+            flowchart = Flowchart.create(
+                session, name="streaming-fanout", max_parallel_nodes=2
+            )
+            start_node = FlowchartNode.create(
+                session,
+                flowchart_id=flowchart.id,
+                node_type=FLOWCHART_NODE_TYPE_START,
+                x=0.0,
+                y=0.0,
+            )
+            branch_nodes = {}
+            for name, x, y in (
+                ("slow", 1.0, 0.0),
+                ("fast", 1.0, 1.0),
+                ("fast_child", 2.0, 1.0),
+            ):
+                branch_nodes[name] = FlowchartNode.create(
+                    session,
+                    flowchart_id=flowchart.id,
+                    node_type=FLOWCHART_NODE_TYPE_MEMORY,
+                    x=x,
+                    y=y,
+                    config_json=json.dumps(
+                        {
+                            "action": "add",
+                            "mode": "deterministic",
+                            "additive_prompt": f"{name} branch",
+                        },
+                        sort_keys=True,
+                    ),
+                )
+            for source_node, target_node in (
+                (start_node, branch_nodes["slow"]),
+                (start_node, branch_nodes["fast"]),
+                (branch_nodes["fast"], branch_nodes["fast_child"]),
+            ):
+                FlowchartEdge.create(
+                    session,
+                    flowchart_id=flowchart.id,
+                    source_node_id=source_node.id,
+                    target_node_id=target_node.id,
+                )
+            flowchart_run = FlowchartRun.create(
+                session,
+                flowchart_id=flowchart.id,
+                status="queued",
+            )
+            flowchart_id = flowchart.id
+            run_id = flowchart_run.id
+            slow_node_id = branch_nodes["slow"].id
+            fast_child_node_id = branch_nodes["fast_child"].id
+            node_delays = {
+                branch_nodes["slow"].id: 0.6,
+                branch_nodes["fast"].id: 0.05,
+                branch_nodes["fast_child"].id: 0.05,
+            }
+
+        call_starts: dict[int, float] = {}
+        call_ends: dict[int, float] = {}
+        call_lock = threading.Lock()
+
+        class _SkewedLatencyRouter(_LocalExecutionRouter):
+            def execute_routed(self, request, execute_callback):
+                delay = node_delays.get(request.node_id)
+                if delay is None:
+                    return super().execute_routed(request, execute_callback)
+                with call_lock:
+                    call_starts[request.node_id] = time.monotonic()
+                time.sleep(delay)
+                result = super().execute_routed(request, execute_callback)
+                with call_lock:
+                    call_ends[request.node_id] = time.monotonic()
+                return result
+
+        with patch.object(studio_tasks, "ExecutionRouter", _SkewedLatencyRouter):
+            self._invoke_flowchart_run(flowchart_id, run_id)
+
+        with session_scope() as session:
+            run = session.get(FlowchartRun, run_id)
+            self.assertIsNotNone(run)
+            assert run is not None
+            self.assertEqual("completed", run.status)
+
+        self.assertEqual(set(node_delays), set(call_ends))
+        # The fast branch's successor must start while the slow sibling is
+        # still running instead of waiting for the whole wave to finish.
+        self.assertLess(call_starts[fast_child_node_id], call_ends[slow_node_id])
+
+    def test_scheduler_route_failure_drains_in_flight_siblings(self) -> None:
+        decision_config = {
+            "decision_conditions": [
+                {
+                    "connector_id": "left_connector",
+                    "condition_text": "no-such-signal",
+                },
+            ]
+        }
+        with session_scope() as session:
+            flowchart = Flowchart.create(
+                session, name="streaming-route-failure", max_parallel_nodes=2
+            )
+            start_node = FlowchartNode.create(
+                session,
+                flowchart_id=flowchart.id,
+                node_type=FLOWCHART_NODE_TYPE_START,
+                x=0.0,
+                y=0.0,
+            )
+            decision_node = FlowchartNode.create(
+                session,
+                flowchart_id=flowchart.id,
+                node_type=FLOWCHART_NODE_TYPE_DECISION,
+                x=1.0,
+                y=0.0,
+                config_json=json.dumps(decision_config, sort_keys=True),
+            )
+            end_node = FlowchartNode.create(
+                session,
+                flowchart_id=flowchart.id,
+                node_type=FLOWCHART_NODE_TYPE_END,
+                x=2.0,
+                y=0.0,
+            )
+            slow_node = FlowchartNode.create(
+                session,
+                flowchart_id=flowchart.id,
+                node_type=FLOWCHART_NODE_TYPE_MEMORY,
+                x=1.0,
+                y=1.0,
+                config_json=json.dumps(
+                    {
+                        "action": "add",
+                        "mode": "deterministic",
+                        "additive_prompt": "slow sibling",
+                    },
+                    sort_keys=True,
+                ),
+            )
+            for source_node, target_node, condition_key in (
+                (start_node, decision_node, None),
+                (start_node, slow_node, None),
+                (decision_node, end_node, "left_connector"),
+            ):
+                FlowchartEdge.create(
+                    session,
+                    flowchart_id=flowchart.id,
+                    source_node_id=source_node.id,
+                    target_node_id=target_node.id,
+                    condition_key=condition_key,
+                )
+            flowchart_run = FlowchartRun.create(
+                session,
+                flowchart_id=flowchart.id,
+                status="queued",
+            )
+            flowchart_id = flowchart.id
+            run_id = flowchart_run.id
+            decision_node_id = decision_node.id
+            slow_node_id = slow_node.id
+
+        class _SlowSiblingRouter(_LocalExecutionRouter):
+            def execute_routed(self, request, execute_callback):
+                if request.node_id == slow_node_id:
+                    time.sleep(0.4)
+                return super().execute_routed(request, execute_callback)
+
+        with patch.object(studio_tasks, "ExecutionRouter", _SlowSiblingRouter):
+            self._invoke_flowchart_run(flowchart_id, run_id)
+
+        with session_scope() as session:
+            run = session.get(FlowchartRun, run_id)
+            assert run is not None
+            self.assertEqual("failed", run.status)
+            self.assertIsNotNone(run.finished_at)
+            statuses = {
+                item.flowchart_node_id: item.status
+                for item in session.query(FlowchartRunNode)
+                .where(FlowchartRunNode.flowchart_run_id == run_id)
+                .all()
+            }
+            self.assertEqual("failed", statuses[decision_node_id])
+            # The sibling still in flight when routing failed is collected and
+            # persisted rather than left in a running state.
+            self.assertEqual("succeeded", statuses[slow_node_id])
+
+    @unittest.skipUnless(
+        os.getenv("FLOWCHART_PERF_TESTS"),
+        "Set FLOWCHART_PERF_TESTS=1 to enable flowchart scheduler benchmarks.",
+    )
+    def test_scheduler_benchmark_skewed_latency_wide_flowchart(self) -> None:
+        branch_count = 4
+        chain_length = 3
+        slow_seconds = 1.0
+        fast_seconds = 0.05
+        with session_scope() as session:
+            flowchart = Flowchart.create(
+                session,
+                name="streaming-benchmark",
+                max_parallel_nodes=branch_count,
+            )
+            start_node = FlowchartNode.create(
+                session,
+                flowchart_id=flowchart.id,
+                node_type=FLOWCHART_NODE_TYPE_START,
+                x=0.0,
+                y=0.0,
+            )
+            node_delays: dict[int, float] = {}
+            for branch_index in range(branch_count):
+                previous_node = start_node
+                for depth in range(chain_length):
+                    node = FlowchartNode.create(
+                        session,
+                        flowchart_id=flowchart.id,
+                        node_type=FLOWCHART_NODE_TYPE_MEMORY,
+                        x=float(depth + 1),
+                        y=float(branch_index),
+                        config_json=json.dumps(
+                            {
+                                "action": "add",
+                                "mode": "deterministic",
+                                "additive_prompt": f"branch {branch_index} depth {depth}",
+                            },
+                            sort_keys=True,
+                        ),
+                    )
+                    FlowchartEdge.create(
+                        session,
+                        flowchart_id=flowchart.id,
+                        source_node_id=previous_node.id,
+                        target_node_id=node.id,
+                    )
+                    # Exactly one branch is slow at every depth, and a different
+                    # one each time, so every wave contains one straggler.
+                    node_delays[node.id] = (
+                        slow_seconds if branch_index == depth % branch_count else fast_seconds
+                    )
+                    previous_node = node
+            flowchart_run = FlowchartRun.create(
+                session,
+                flowchart_id=flowchart.id,
+                status="queued",
+            )
+            flowchart_id = flowchart.id
+            run_id = flowchart_run.id
+
+        class _SkewedLatencyRouter(_LocalExecutionRouter):
+            def execute_routed(self, request, execute_callback):
+                time.sleep(node_delays.get(request.node_id, 0.0))
+                return super().execute_routed(request, execute_callback)
+
+        started = time.monotonic()
+        with patch.object(studio_tasks, "ExecutionRouter", _SkewedLatencyRouter):
+            self._invoke_flowchart_run(flowchart_id, run_id)
+        elapsed = time.monotonic() - started
+
+        with session_scope() as session:
+            run = session.get(FlowchartRun, run_id)
+            self.assertIsNotNone(run)
+            assert run is not None
+            self.assertEqual("completed", run.status)
+
+        # A wave-synchronous scheduler pays the straggler at every depth; the
+        # streaming scheduler only pays it once per branch.
+        barrier_lower_bound = chain_length * slow_seconds
+        streaming_critical_path = slow_seconds + (chain_length - 1) * fast_seconds
+        self.assertLess(
+            elapsed,
+            barrier_lower_bound,
+            msg=(
+                f"elapsed={elapsed:.3f}s "
+                f"streaming_critical_path={streaming_critical_path:.3f}s"
+            ),
+        )
+
     def test_dotted_edges_do_not_trigger_downstream_execution(self) -> None:
         with session_scope() as session:
             flowchart = Flowchart.create(session, name="dotted-no-trigger")
@@ -3658,8 +3935,18 @@ class FlowchartStage9UnitTests(StudioDbTestCase):
             self.assertEqual(1, persisted_artifact.payload_version)
 
     def test_plan_node_artifact_prunes_expired_ttl_entries(self) -> None:
+        with patch.object(Config, "NODE_ARTIFACT_RETENTION_SWEEP_ENABLED", False):
+            self._assert_plan_node_artifact_ttl_prune("plan-artifact-ttl-prune")
+
+    def test_plan_node_artifact_prunes_inline_when_sweep_interval_disabled(self) -> None:
+        with patch.object(
+            Config, "NODE_ARTIFACT_RETENTION_SWEEP_ENABLED", True
+        ), patch.object(Config, "NODE_ARTIFACT_RETENTION_SWEEP_INTERVAL_SECONDS", 0):
+            self._assert_plan_node_artifact_ttl_prune("plan-artifact-ttl-no-sweep")
+
+    def _assert_plan_node_artifact_ttl_prune(self, flowchart_name: str) -> None:
         with session_scope() as session:
-            flowchart = Flowchart.create(session, name="plan-artifact-ttl-prune")
+            flowchart = Flowchart.create(session, name=flowchart_name)
             plan = Plan.create(session, name="artifact-plan-ttl")
             stage = PlanStage.create(session, plan_id=plan.id, name="Stage TTL", position=1)
             task = PlanTask.create(session, plan_stage_id=stage.id, name="Task TTL", position=1)
@@ -3743,7 +4030,7 @@ class FlowchartStage9UnitTests(StudioDbTestCase):
             self.assertNotEqual(expired_artifact.id, remaining[0].id)
 
     def test_plan_node_artifact_prunes_to_max_count(self) -> None:
-        with session_scope() as session:
+        with patch.object(Config, "NODE_ARTIFACT_RETENTION_SWEEP_ENABLED", False), session_scope() as session:
             flowchart = Flowchart.create(session, name="plan-artifact-max-prune")
             plan = Plan.create(session, name="artifact-plan-max")
             stage = PlanStage.create(session, plan_id=plan.id, name="Stage Max", position=1)
@@ -3803,6 +4090,97 @@ class FlowchartStage9UnitTests(StudioDbTestCase):
             self.assertEqual(2, len(remaining))
             self.assertEqual([2, 3], [item.execution_index for item in remaining])
 
+    def test_node_artifact_retention_sweep_bulk_deletes_per_node_settings(self) -> None:
+        now = datetime.now(timezone.utc)
+        node_ids: dict[str, int] = {}
+        with session_scope() as session:
+            flowchart = Flowchart.create(session, name="artifact-retention-sweep")
+            run = FlowchartRun.create(session, flowchart_id=flowchart.id, status="completed")
+            retention_configs = {
+                "ttl": {"retention_mode": "ttl"},
+                "max_count": {"retention_mode": "max_count", "retention_max_count": 2},
+                "forever": {"retention_mode": "forever"},
+            }
+            for label, config in retention_configs.items():
+                node = FlowchartNode.create(
+                    session,
+                    flowchart_id=flowchart.id,
+                    node_type=FLOWCHART_NODE_TYPE_PLAN,
+                    x=0.0,
+                    y=0.0,
+                    config_json=json.dumps(config, sort_keys=True),
+                )
+                node_ids[label] = node.id
+                for execution_index in (1, 2, 3, 4):
+                    NodeArtifact.create(
+                        session,
+                        flowchart_id=flowchart.id,
+                        flowchart_node_id=node.id,
+                        flowchart_run_id=run.id,
+                        node_type=FLOWCHART_NODE_TYPE_PLAN,
+                        artifact_type=NODE_ARTIFACT_TYPE_PLAN,
+                        execution_index=execution_index,
+                        retention_mode=label,
+                        expires_at=(
+                            now - timedelta(seconds=10)
+                            if execution_index <= 2
+                            else now + timedelta(hours=1)
+                        ),
+                        created_at=now + timedelta(seconds=execution_index),
+                        payload_json=json.dumps({"action": "sweep"}, sort_keys=True),
+                    )
+
+        summary = studio_tasks._sweep_node_artifact_retention(batch_size=1, max_batches=50)
+
+        self.assertEqual(3, summary["nodes_scanned"])
+        self.assertEqual(2, summary["expired_deleted"])
+        self.assertEqual(2, summary["overflow_deleted"])
+        self.assertTrue(summary["drained"])
+        with session_scope() as session:
+            remaining = {
+                label: sorted(
+                    item.execution_index
+                    for item in session.query(NodeArtifact)
+                    .where(NodeArtifact.flowchart_node_id == node_id)
+                    .all()
+                )
+                for label, node_id in node_ids.items()
+            }
+        self.assertEqual([3, 4], remaining["ttl"])
+        self.assertEqual([3, 4], remaining["max_count"])
+        self.assertEqual([1, 2, 3, 4], remaining["forever"])
+
+    def test_node_artifact_retention_sweep_stops_at_batch_budget(self) -> None:
+        with session_scope() as session:
+            flowchart = Flowchart.create(session, name="artifact-retention-budget")
+            run = FlowchartRun.create(session, flowchart_id=flowchart.id, status="completed")
+            node = FlowchartNode.create(
+                session,
+                flowchart_id=flowchart.id,
+                node_type=FLOWCHART_NODE_TYPE_PLAN,
+                x=0.0,
+                y=0.0,
+                config_json=json.dumps({"retention_mode": "ttl"}),
+            )
+            for execution_index in range(1, 6):
+                NodeArtifact.create(
+                    session,
+                    flowchart_id=flowchart.id,
+                    flowchart_node_id=node.id,
+                    flowchart_run_id=run.id,
+                    node_type=FLOWCHART_NODE_TYPE_PLAN,
+                    artifact_type=NODE_ARTIFACT_TYPE_PLAN,
+                    execution_index=execution_index,
+                    expires_at=datetime.now(timezone.utc) - timedelta(seconds=10),
+                    payload_json=json.dumps({"action": "sweep"}, sort_keys=True),
+                )
+
+        summary = studio_tasks._sweep_node_artifact_retention(batch_size=2, max_batches=2)
+
+        self.assertEqual(4, summary["deleted"])
+        self.assertEqual(2, summary["batches"])
+        self.assertFalse(summary["drained"])
+
     def test_node_artifact_migration_does_not_backfill_existing_node_runs(self) -> None:
         with session_scope() as session:
             flowchart = Flowchart.create(session, name="artifact-no-backfill")
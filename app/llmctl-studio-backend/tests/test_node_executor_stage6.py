@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
 import sys
+import threading
+import time
 import unittest
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 
@@ -19,6 +22,7 @@ if str(STUDIO_SRC) not in sys.path:
     sys.path.insert(0, str(STUDIO_SRC))
 
 from services.execution.contracts import ExecutionRequest
+from services.execution import kubernetes_executor
 from services.execution.kubernetes_executor import (
     KubernetesExecutor,
     _KubernetesDispatchFailure,
@@ -26,6 +30,8 @@ from services.execution.kubernetes_executor import (
     _utcnow,
 )
 from services.execution.idempotency import clear_dispatch_registry
+from services.execution.kubernetes_watch import KubernetesJobWatch, PodLogFollower
+from services.execution.kubernetes_warm_pool import WarmPodPool
 from services.execution.router import ExecutionRouter
 
 
@@ -57,6 +63,76 @@ class _StubKubernetesExecutor:
         return self._result(request, execute_callback)
 
 
+class _FakeProcess:
+    def __init__(self, lines: list[str], returncode: int = 0) -> None:
+        self.stdout = iter(lines)
+        self.returncode = returncode
+
+    def wait(self, timeout=None) -> int:
+        return self.returncode
+
+    def poll(self) -> int:
+        return self.returncode
+
+    def terminate(self) -> None:
+        return None
+
+    def kill(self) -> None:
+        return None
+
+
+def _watch_event(event_type: str, item: dict) -> dict:
+    return {"type": event_type, "object": item}
+
+
+def _warm_pod(
+    name: str,
+    *,
+    state: str = "idle",
+    spec: str = "spec-a",
+    phase: str = "Running",
+    last_used: str = "2026-01-01T00:00:00Z",
+    lease_expires: str | None = None,
+) -> dict:
+    annotations = {"llmctl.executor.pool/last-used-at": last_used}
+    if lease_expires is not None:
+        annotations["llmctl.executor.pool/lease-expires-at"] = lease_expires
+    return {
+        "metadata": {
+            "name": name,
+            "resourceVersion": f"rv-{name}",
+            "labels": {
+                "llmctl.executor.pool": "frontier",
+                "llmctl.executor.pool-state": state,
+                "llmctl.executor.pool-spec": spec,
+            },
+            "annotations": annotations,
+        },
+        "status": {"phase": phase, "containerStatuses": [{"ready": phase == "Running"}]},
+    }
+
+
+class _FakeKubectl:
+    def __init__(self, *, pods: list[dict] | None = None, conflicts: set[str] | None = None):
+        self.pods = pods or []
+        self.conflicts = conflicts or set()
+        self.calls: list[list[str]] = []
+        self.applied: list[dict] = []
+
+    def __call__(self, command, **kwargs):
+        args = command[3:]
+        self.calls.append(args)
+        returncode = 0
+        stdout = ""
+        if args[:2] == ["get", "pods"]:
+            stdout = json.dumps({"items": self.pods})
+        elif args[:2] == ["patch", "pod"] and args[2] in self.conflicts:
+            returncode = 1
+        elif args[:1] == ["apply"]:
+            self.applied.append(json.loads(kwargs["input"]))
+        return subprocess.CompletedProcess(command, returncode, stdout=stdout, stderr="")
+
+
 class NodeExecutorStage6Tests(unittest.TestCase):
     def setUp(self) -> None:
         clear_dispatch_registry()
@@ -727,5 +803,405 @@ class NodeExecutorStage6Tests(unittest.TestCase):
         self.assertIn("No module named 'sqlalchemy'", message)
 
 
+
+class KubernetesJobWatchTests(unittest.TestCase):
+    def test_watch_stream_parses_pretty_printed_events(self) -> None:
+        job = {"metadata": {"name": "job-a"}, "status": {"active": 1}}
+        pod = {
+            "metadata": {"name": "pod-a", "labels": {"job-name": "job-a"}},
+            "status": {"phase": "Running"},
+        }
+        streams = {
+            "jobs": json.dumps(_watch_event("ADDED", job), indent=4) + "\n",
+            "pods": json.dumps(_watch_event("ADDED", pod), indent=4) + "\n",
+        }
+        commands: list[list[str]] = []
+
+        def _popen(command, **_kwargs):
+            commands.append(list(command))
+            kind = command[command.index("get") + 1]
+            text = streams.pop(kind, "")
+            return _FakeProcess(text.splitlines(keepends=True))
+
+        watch = KubernetesJobWatch(
+            ["--namespace", "default"],
+            label_selector="llmctl.executor=true",
+            popen=_popen,
+        )
+        watch.start()
+        try:
+            deadline = time.monotonic() + 5
+            while watch.snapshot("job-a")[1] is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            job_payload, pod_payload = watch.snapshot("job-a")
+        finally:
+            watch.close()
+
+        self.assertEqual(job, job_payload)
+        self.assertEqual(pod, pod_payload)
+        self.assertTrue(all("--watch" in command for command in commands))
+
+    def test_events_after_forget_are_ignored_until_job_is_tracked(self) -> None:
+        watch = KubernetesJobWatch(
+            ["--namespace", "default"],
+            label_selector="llmctl.executor=true",
+        )
+        job = {"metadata": {"name": "job-f"}, "status": {"active": 1}}
+        pod = {
+            "metadata": {"name": "pod-f", "labels": {"job-name": "job-f"}},
+            "status": {"phase": "Succeeded"},
+        }
+        watch.handle_event("jobs", _watch_event("ADDED", job))
+        watch.forget("job-f")
+
+        watch.handle_event("jobs", _watch_event("DELETED", job))
+        watch.handle_event("pods", _watch_event("MODIFIED", pod))
+
+        self.assertEqual((None, None), watch.snapshot("job-f"))
+        self.assertEqual(0, watch.version("job-f"))
+        self.assertNotIn("job-f", watch._pods)
+
+        watch.track("job-f")
+        watch.handle_event("jobs", _watch_event("ADDED", job))
+        self.assertEqual(job, watch.snapshot("job-f")[0])
+
+    def test_forgotten_jobs_are_bounded(self) -> None:
+        watch = KubernetesJobWatch(
+            ["--namespace", "default"],
+            label_selector="llmctl.executor=true",
+        )
+        with patch("services.execution.kubernetes_watch._FORGOTTEN_JOBS_MAX", 2):
+            for name in ("job-1", "job-2", "job-3"):
+                watch.forget(name)
+
+        self.assertEqual(["job-2", "job-3"], list(watch._forgotten))
+
+    def test_idle_watch_reconnects_do_not_count_as_failures(self) -> None:
+        runs = [_FakeProcess([]), _FakeProcess([]), _FakeProcess([])]
+        backoffs: list[float] = []
+        watch = KubernetesJobWatch(
+            ["--namespace", "default"],
+            label_selector="llmctl.executor=true",
+            popen=lambda _command, **_kwargs: runs.pop(0),
+        )
+
+        def _wait(timeout: float) -> bool:
+            backoffs.append(timeout)
+            if not runs:
+                watch._stop.set()
+            return watch._stop.is_set()
+
+        with patch.object(watch._stop, "wait", side_effect=_wait):
+            watch._run_stream("jobs")
+
+        self.assertEqual([1.0, 1.0, 1.0], backoffs)
+        self.assertEqual(0, watch._failures["jobs"])
+
+    def test_failed_watch_reconnects_back_off(self) -> None:
+        runs = [_FakeProcess([], returncode=1) for _ in range(3)]
+        backoffs: list[float] = []
+        watch = KubernetesJobWatch(
+            ["--namespace", "default"],
+            label_selector="llmctl.executor=true",
+            popen=lambda _command, **_kwargs: runs.pop(0),
+        )
+
+        def _wait(timeout: float) -> bool:
+            backoffs.append(timeout)
+            if not runs:
+                watch._stop.set()
+            return watch._stop.is_set()
+
+        with patch.object(watch._stop, "wait", side_effect=_wait):
+            watch._run_stream("jobs")
+
+        self.assertEqual([2.0, 5.0, 10.0], backoffs)
+        self.assertFalse(watch.healthy)
+
+    def test_pod_log_follower_resumes_without_duplicate_lines(self) -> None:
+        runs = [
+            _FakeProcess(
+                [
+                    "2026-01-01T00:00:01.5Z LLMCTL_EXECUTOR_STARTED\n",
+                    "2026-01-01T00:00:02.25Z working\n",
+                ],
+                returncode=1,
+            ),
+            _FakeProcess(
+                [
+                    "2026-01-01T00:00:02.250000000Z working\n",
+                    "2026-01-01T00:00:03Z done\n",
+                ]
+            ),
+        ]
+        commands: list[list[str]] = []
+        lines: list[str] = []
+
+        def _popen(command, **_kwargs):
+            commands.append(list(command))
+            return runs.pop(0)
+
+        follower = PodLogFollower(
+            ["--namespace", "default"],
+            pod_name="pod-a",
+            on_line=lines.append,
+            pod_terminated=lambda: True,
+            popen=_popen,
+        )
+        with patch("services.execution.kubernetes_watch._LOG_FOLLOW_RETRY_SECONDS", 0.0):
+            follower.start()
+            self.assertTrue(follower.wait_closed(5))
+
+        self.assertEqual(["LLMCTL_EXECUTOR_STARTED\n", "working\n", "done\n"], lines)
+        self.assertNotIn("--since-time", commands[0])
+        self.assertEqual(
+            "2026-01-01T00:00:02.25Z",
+            commands[1][commands[1].index("--since-time") + 1],
+        )
+
+    def test_wait_for_job_completion_uses_watch_without_polling(self) -> None:
+        executor = KubernetesExecutor({})
+        watch = KubernetesJobWatch(
+            ["--namespace", "default"],
+            label_selector="llmctl.executor=true",
+        )
+        result_line = "LLMCTL_EXECUTOR_RESULT_JSON=" + json.dumps({"status": "success"})
+
+        class _FakeFollower:
+            def __init__(self, _args, *, pod_name, on_line, pod_terminated, **_kwargs):
+                self.pod_name = pod_name
+                self._on_line = on_line
+                self._closed = threading.Event()
+
+            def start(self) -> None:
+                self._on_line("LLMCTL_EXECUTOR_STARTED\n")
+                self._on_line(result_line + "\n")
+                self._closed.set()
+
+            def stop(self) -> None:
+                return None
+
+            def wait_closed(self, timeout: float) -> bool:
+                return self._closed.wait(timeout)
+
+        def _pod(phase: str) -> dict:
+            return {
+                "metadata": {"name": "pod-w", "labels": {"job-name": "job-w"}},
+                "status": {"phase": phase, "startTime": "2026-01-01T00:00:00Z"},
+            }
+
+        watch.handle_event("jobs", _watch_event("ADDED", {"metadata": {"name": "job-w"}, "status": {"active": 1}}))
+        watch.handle_event("pods", _watch_event("ADDED", _pod("Running")))
+
+        def _finish() -> None:
+            time.sleep(0.2)
+            watch.handle_event("pods", _watch_event("MODIFIED", _pod("Succeeded")))
+            watch.handle_event(
+                "jobs",
+                _watch_event("MODIFIED", {"metadata": {"name": "job-w"}, "status": {"succeeded": 1}}),
+            )
+
+        finisher = threading.Thread(target=_finish)
+        with patch.object(kubernetes_executor, "PodLogFollower", _FakeFollower), patch(
+            "services.execution.kubernetes_executor.subprocess.run",
+            side_effect=AssertionError("kubectl should not be polled"),
+        ):
+            finisher.start()
+            started = time.monotonic()
+            outcome = executor._wait_for_job_completion(
+                ["--namespace", "default"],
+                job_name="job-w",
+                dispatch_timeout=60,
+                execution_timeout=60,
+                log_collection_timeout=5,
+                cancel_grace_timeout=1,
+                cancel_force_kill=False,
+                job_watch=watch,
+            )
+            elapsed = time.monotonic() - started
+        finisher.join()
+
+        self.assertEqual("pod-w", outcome.pod_name)
+        self.assertTrue(outcome.startup_marker_seen)
+        self.assertEqual({"status": "success"}, outcome.executor_result)
+        self.assertIn(result_line, outcome.stdout)
+        self.assertEqual("Succeeded", outcome.terminal_reason)
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual((None, None), watch.snapshot("job-w"))
+
+
+
+class WarmPodPoolTests(unittest.TestCase):
+    def test_lease_skips_conflicts_and_reconcile_refills_within_limit(self) -> None:
+        pods = [
+            _warm_pod("warm-old", last_used="2026-01-01T00:00:00Z"),
+            _warm_pod("warm-new", last_used="2026-01-02T00:00:00Z"),
+            _warm_pod("warm-stale", spec="spec-b"),
+            _warm_pod("warm-done", phase="Succeeded"),
+            _warm_pod("warm-busy", state="busy"),
+        ]
+        kubectl = _FakeKubectl(pods=pods, conflicts={"warm-new"})
+        pool = WarmPodPool(
+            ["--namespace", "default"],
+            image_class="frontier",
+            spec_hash="spec-a",
+            run=kubectl,
+        )
+
+        leased = pool.lease(pool.list_pods() or [], execution_timeout=600)
+        created = pool.reconcile(
+            pods,
+            leased=leased,
+            target_idle=2,
+            max_pods=4,
+            build_manifest=lambda name: {"kind": "Pod", "metadata": {"name": name}},
+        )
+
+        self.assertEqual("warm-old", leased)
+        patch_targets = [call[2] for call in kubectl.calls if call[:2] == ["patch", "pod"]]
+        self.assertEqual(["warm-new", "warm-old"], patch_targets)
+        self.assertIn(
+            ["delete", "pod", "warm-stale", "warm-done", "--ignore-not-found=true", "--wait=false"],
+            kubectl.calls,
+        )
+        # warm-new stays idle; busy + leased + idle = 3 alive, so only one fits.
+        self.assertEqual(1, len(created))
+        self.assertEqual(created, [item["metadata"]["name"] for item in kubectl.applied[0]["items"]])
+
+    def test_lease_records_expiry_and_reconcile_reclaims_expired_busy_pods(self) -> None:
+        pods = [
+            _warm_pod("warm-idle"),
+            _warm_pod("warm-expired", state="busy", lease_expires="2026-01-01T00:00:00Z"),
+            _warm_pod("warm-running", state="busy", lease_expires="2999-01-01T00:00:00Z"),
+        ]
+        kubectl = _FakeKubectl(pods=pods)
+        pool = WarmPodPool(
+            ["--namespace", "default"],
+            image_class="frontier",
+            spec_hash="spec-a",
+            run=kubectl,
+        )
+
+        started = datetime.now(timezone.utc)
+        leased = pool.lease(pods, execution_timeout=600)
+        created = pool.reconcile(
+            pods,
+            leased=leased,
+            target_idle=0,
+            max_pods=3,
+            build_manifest=lambda name: {"kind": "Pod", "metadata": {"name": name}},
+        )
+        pool.release("warm-idle")
+
+        self.assertEqual("warm-idle", leased)
+        self.assertEqual([], created)
+        lease_patch, release_patch = [
+            json.loads(call[-1]) for call in kubectl.calls if call[:2] == ["patch", "pod"]
+        ]
+        expires_at = datetime.fromisoformat(
+            lease_patch["metadata"]["annotations"][
+                "llmctl.executor.pool/lease-expires-at"
+            ].replace("Z", "+00:00")
+        )
+        self.assertGreaterEqual(expires_at, started + timedelta(seconds=600))
+        self.assertIsNone(
+            release_patch["metadata"]["annotations"]["llmctl.executor.pool/lease-expires-at"]
+        )
+        self.assertIn(
+            ["delete", "pod", "warm-expired", "--ignore-not-found=true", "--wait=false"],
+            kubectl.calls,
+        )
+
+    def test_dispatch_runs_payload_in_leased_pod_and_releases_it(self) -> None:
+        executor = KubernetesExecutor(
+            {
+                "k8s_warm_pool_enabled": "true",
+                "k8s_warm_pool_size": "0",
+                "k8s_warm_pool_frontier_max": "2",
+            }
+        )
+        spec_hash = executor._warm_pool_spec_hash(
+            spec=executor._build_warm_pod_manifest(
+                pod_name="",
+                namespace="default",
+                image="executor:latest",
+                labels={},
+                service_account="",
+                image_pull_secrets=[],
+                k8s_gpu_limit=0,
+                idle_ttl_seconds=600,
+            )["spec"]
+        )
+        kubectl = _FakeKubectl(pods=[_warm_pod("warm-1", spec=spec_hash)])
+        result_line = "LLMCTL_EXECUTOR_RESULT_JSON=" + json.dumps({"status": "success"})
+        exec_calls: list[tuple[list[str], str]] = []
+
+        class _ExecProcess:
+            returncode = 0
+
+            def __init__(self, command, **_kwargs) -> None:
+                self.command = command
+
+            def communicate(self, payload=None, timeout=None):
+                exec_calls.append((self.command, payload))
+                return f"LLMCTL_EXECUTOR_STARTED\n{result_line}\n", ""
+
+        with patch("services.execution.kubernetes_warm_pool.subprocess.run", kubectl), patch(
+            "services.execution.kubernetes_executor.subprocess.Popen", _ExecProcess
+        ):
+            outcome = executor._dispatch_via_warm_pool(
+                ["--namespace", "default"],
+                request=_request(),
+                job_name="job-warm",
+                payload_json='{"contract_version":"v1"}',
+                image_class="frontier",
+                namespace="default",
+                image="executor:latest",
+                service_account="",
+                image_pull_secrets=[],
+                k8s_gpu_limit=0,
+                execution_timeout=60,
+                live_code_enabled=False,
+                live_code_host_path="",
+                argocd_app_name="",
+            )
+
+        self.assertIsNotNone(outcome)
+        self.assertEqual("warm_pool", outcome.dispatch_path)
+        self.assertEqual("warm-1", outcome.pod_name)
+        self.assertEqual({"status": "success"}, outcome.executor_result)
+        command, payload = exec_calls[0]
+        self.assertEqual(["exec", "-i", "warm-1"], command[3:6])
+        self.assertEqual('{"contract_version":"v1"}', payload)
+        release = [call for call in kubectl.calls if call[:3] == ["patch", "pod", "warm-1"]][-1]
+        self.assertIn('"llmctl.executor.pool-state": "idle"', release[-1])
+
+    def test_dispatch_falls_back_to_job_when_pool_is_disabled_for_class(self) -> None:
+        executor = KubernetesExecutor(
+            {"k8s_warm_pool_enabled": "true", "k8s_warm_pool_vllm_max": "0"}
+        )
+        with patch(
+            "services.execution.kubernetes_warm_pool.subprocess.run",
+            side_effect=AssertionError("pool should not be consulted"),
+        ):
+            outcome = executor._dispatch_via_warm_pool(
+                ["--namespace", "default"],
+                request=_request(),
+                job_name="job-warm",
+                payload_json="{}",
+                image_class="vllm",
+                namespace="default",
+                image="executor:latest",
+                service_account="",
+                image_pull_secrets=[],
+                k8s_gpu_limit=1,
+                execution_timeout=60,
+                live_code_enabled=False,
+                live_code_host_path="",
+                argocd_app_name="",
+            )
+        self.assertIsNone(outcome)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
 import sys
 import tempfile
 import unittest
@@ -29,16 +30,20 @@ from core.db import session_scope
 from core.models import (
     Agent,
     AgentTask,
+    AgentTaskLogSegment,
     Attachment,
     FLOWCHART_NODE_TYPE_START,
     Flowchart,
     FlowchartNode,
     FlowchartRun,
     FlowchartRunNode,
+    LLMModel,
     MCPServer,
     Run,
     Script,
 )
+from services import tasks as studio_tasks
+from services.task_logs import TaskLogWriter
 import web.views as studio_views
 
 
@@ -820,5 +825,164 @@ class NodeExecutorStage8ApiTests(StudioDbTestCase):
             )
 
 
+    def _segment_rows(self, task_id: int) -> list[tuple[str, int, int, str]]:
+        with session_scope() as session:
+            return [
+                (row.stream, row.start_offset, row.end_offset, row.content)
+                for row in session.query(AgentTaskLogSegment)
+                .filter(AgentTaskLogSegment.agent_task_id == task_id)
+                .order_by(AgentTaskLogSegment.id.asc())
+                .all()
+            ]
+
+    def test_task_log_updates_append_deltas_and_serve_offset_reads(self) -> None:
+        with session_scope() as session:
+            task_id = int(AgentTask.create(session, status="running").id)
+        writer = TaskLogWriter(task_id)
+
+        with patch.object(studio_tasks, "_emit_task_event"):
+            studio_tasks._update_task_logs(
+                task_id, writer, error_delta="Stage 5/7: LLM Query\n", stage="llm_query"
+            )
+            studio_tasks._update_task_logs(
+                task_id, writer, output="hello ", error_delta="warn\n", stage="llm_query"
+            )
+            studio_tasks._update_task_logs(
+                task_id, writer, output="hello world", stage="llm_query"
+            )
+
+        self.assertEqual(
+            [
+                ("error", 0, 21, "Stage 5/7: LLM Query\n"),
+                ("output", 0, 6, "hello "),
+                ("error", 21, 26, "warn\n"),
+                ("output", 6, 11, "world"),
+            ],
+            self._segment_rows(task_id),
+        )
+        with session_scope() as session:
+            task = session.get(AgentTask, task_id)
+            self.assertIsNone(task.output)
+            self.assertEqual("llm_query", task.current_stage)
+
+        status_payload = self.client.get(f"/nodes/{task_id}/status").get_json() or {}
+        self.assertEqual("hello world", status_payload.get("output"))
+        self.assertEqual("Stage 5/7: LLM Query\nwarn\n", status_payload.get("error"))
+        self.assertEqual(
+            {"llm_query": "Stage 5/7: LLM Query\nwarn\n"},
+            status_payload.get("stage_logs"),
+        )
+
+        range_payload = self.client.get(
+            f"/nodes/{task_id}/logs?stream=output&offset=3&limit=5"
+        ).get_json() or {}
+        self.assertEqual("lo wo", range_payload.get("content"))
+        self.assertEqual(8, range_payload.get("next_offset"))
+        self.assertEqual(11, range_payload.get("total_length"))
+        self.assertTrue(range_payload.get("live"))
+        self.assertFalse(range_payload.get("complete"))
+
+        tail_payload = self.client.get(
+            f"/nodes/{task_id}/logs?stream=error&tail=5"
+        ).get_json() or {}
+        self.assertEqual("warn\n", tail_payload.get("content"))
+        self.assertEqual(21, tail_payload.get("offset"))
+
+        invalid = self.client.get(f"/nodes/{task_id}/logs?stream=stdout")
+        self.assertEqual(400, invalid.status_code)
+
+    def test_task_log_writer_restarts_stream_when_snapshot_is_rewritten(self) -> None:
+        with session_scope() as session:
+            task_id = int(AgentTask.create(session, status="running").id)
+        writer = TaskLogWriter(task_id)
+
+        with session_scope() as session:
+            writer.sync(session, "output", "draft one")
+        with session_scope() as session:
+            writer.sync(session, "output", "final")
+
+        self.assertEqual([("output", 0, 5, "final")], self._segment_rows(task_id))
+
+    def test_terminal_task_reads_leftover_segments_without_writing(self) -> None:
+        with session_scope() as session:
+            task_id = int(AgentTask.create(session, status="running").id)
+        writer = TaskLogWriter(task_id)
+        with session_scope() as session:
+            writer.sync(session, "output", "partial output", stage="llm_query")
+            writer.append(session, "error", "worker lost\n", stage="llm_query")
+            task = session.get(AgentTask, task_id)
+            task.status = "failed"
+        segments_before = self._segment_rows(task_id)
+
+        payload = self.client.get(f"/nodes/{task_id}/status").get_json() or {}
+        self.assertEqual("partial output", payload.get("output"))
+        self.assertEqual("worker lost\n", payload.get("error"))
+        self.assertEqual({"llm_query": "worker lost\n"}, payload.get("stage_logs"))
+        self.assertEqual(segments_before, self._segment_rows(task_id))
+        with session_scope() as session:
+            task = session.get(AgentTask, task_id)
+            self.assertIsNone(task.output)
+            self.assertIsNone(task.error)
+            self.assertIsNone(task.stage_logs)
+
+        read_payload = self.client.get(
+            f"/nodes/{task_id}/logs?stream=output&offset=8"
+        ).get_json() or {}
+        self.assertEqual("output", read_payload.get("content"))
+        self.assertTrue(read_payload.get("complete"))
+
+    def test_canceled_agent_run_skips_post_run_scripts(self) -> None:
+        with session_scope() as session:
+            agent = Agent.create(session, name="Cancel Agent", prompt_json="{}")
+            model = LLMModel.create(
+                session, name="cancel-model", provider="codex", config_json="{}"
+            )
+            task_id = int(
+                AgentTask.create(
+                    session,
+                    agent_id=agent.id,
+                    model_id=model.id,
+                    status="queued",
+                    prompt="Cancel me.",
+                ).id
+            )
+        stage_labels: list[str] = []
+        run_stage_scripts = studio_tasks._run_stage_scripts
+
+        def _record_stage_scripts(stage_label, *args, **kwargs):
+            stage_labels.append(stage_label)
+            return run_stage_scripts(stage_label, *args, **kwargs)
+
+        def _fake_run_llm(provider, _prompt, **_kwargs):
+            with session_scope() as session:
+                session.get(AgentTask, task_id).status = "canceled"
+            completed = subprocess.CompletedProcess(
+                [f"sdk:{provider}"], 1, "partial", "Canceled by user."
+            )
+            setattr(completed, "_llmctl_canceled", True)
+            return completed
+
+        with (
+            patch.object(studio_tasks, "_run_llm", side_effect=_fake_run_llm),
+            patch.object(
+                studio_tasks, "_run_stage_scripts", side_effect=_record_stage_scripts
+            ),
+            patch.object(studio_tasks, "load_integration_settings", return_value={}),
+            patch.object(
+                studio_tasks, "resolve_enabled_llm_providers", return_value={"codex"}
+            ),
+            patch.object(studio_tasks, "resolve_llm_provider", return_value="codex"),
+            patch.object(studio_tasks, "resolve_default_model_id", return_value=None),
+            patch.object(studio_tasks, "_emit_task_event"),
+        ):
+            studio_tasks._execute_agent_task(task_id)
+
+        self.assertNotIn("post-run", stage_labels)
+        with session_scope() as session:
+            task = session.get(AgentTask, task_id)
+            self.assertEqual("canceled", task.status)
+            self.assertIn("skipping post-run scripts", task.error or "")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -185,6 +185,64 @@ class RagStage7ContractApiTests(StudioDbTestCase):
         self.assertEqual([source.collection], metadata.get("selected_collections"))
         self.assertEqual("chroma", metadata.get("provider"))
 
+    def test_contract_health_retrieve_skips_retrieval_when_unhealthy(self) -> None:
+        with (
+            patch.object(
+                rag_views,
+                "rag_health_snapshot",
+                return_value={"state": "configured_unhealthy", "provider": "chroma"},
+            ),
+            patch.object(rag_views, "execute_query_contract") as mocked_execute,
+        ):
+            response = self.client.post(
+                "/api/rag/contract/health-retrieve",
+                json={"question": "What changed?", "collections": ["docs"]},
+            )
+
+        self.assertEqual(200, response.status_code)
+        payload = response.get_json() or {}
+        self.assertEqual("configured_unhealthy", (payload.get("health") or {}).get("state"))
+        self.assertIsNone(payload.get("retrieval"))
+        mocked_execute.assert_not_called()
+
+    def test_contract_health_retrieve_returns_health_and_retrieval(self) -> None:
+        with (
+            patch.object(
+                rag_views,
+                "rag_health_snapshot",
+                return_value={"state": "configured_healthy", "provider": "chroma"},
+            ),
+            patch.object(
+                rag_views,
+                "execute_query_contract",
+                return_value={
+                    "answer": None,
+                    "retrieval_context": [{"text": "ctx", "collection": "docs", "rank": 1}],
+                    "retrieval_stats": {"provider": "chroma", "retrieved_count": 1},
+                    "citation_records": [],
+                    "synthesis_error": None,
+                    "mode": "query",
+                    "collections": ["docs"],
+                },
+            ),
+        ):
+            response = self.client.post(
+                "/api/rag/contract/health-retrieve",
+                json={
+                    "question": "What changed?",
+                    "collections": ["docs"],
+                    "synthesize_answer": False,
+                },
+            )
+
+        self.assertEqual(200, response.status_code)
+        payload = response.get_json() or {}
+        self.assertEqual("configured_healthy", (payload.get("health") or {}).get("state"))
+        self.assertIsNone(payload.get("error"))
+        retrieval = payload.get("retrieval") or {}
+        self.assertEqual("ctx", retrieval["retrieval_context"][0]["text"])
+        self.assertEqual("v1", retrieval.get("contract_version"))
+
     def test_contract_retrieve_allows_skipping_answer_synthesis(self) -> None:
         with patch.object(
             rag_views,
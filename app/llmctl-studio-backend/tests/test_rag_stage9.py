@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import replace
 import json
 import os
+import subprocess
 import sys
 import tempfile
+import time
 import unittest
+import uuid
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
@@ -31,6 +35,13 @@ from core.models import (
     RAGRetrievalAudit,
 )
 from rag.domain import contracts as rag_contracts
+from rag.repositories.retrieval_audits import (
+    RetrievalAuditWriter,
+    flush_retrieval_audits,
+    retrieval_audit_values,
+)
+from rag.repositories.source_file_states import list_source_file_states
+from rag.repositories.sources import RAGSourceInput, create_source, get_source
 from services import tasks as studio_tasks
 
 
@@ -883,6 +894,21 @@ class RagStage9RuntimeTests(StudioDbTestCase):
 
 
 class RagStage9AuditContractTests(StudioDbTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._audit_request_ids: list[str] = []
+
+    def tearDown(self) -> None:
+        # Audit rows outlive the test database session; drop the ones this
+        # test wrote so counts in later tests stay exact.
+        if self._audit_request_ids:
+            flush_retrieval_audits()
+            with session_scope() as session:
+                session.query(RAGRetrievalAudit).filter(
+                    RAGRetrievalAudit.request_id.in_(self._audit_request_ids)
+                ).delete(synchronize_session=False)
+        super().tearDown()
+
     def test_query_contract_keeps_citation_metadata_without_snippet_leakage(self) -> None:
         source = SimpleNamespace(
             id=1,
@@ -893,6 +919,7 @@ class RagStage9AuditContractTests(StudioDbTestCase):
             last_indexed_at=object(),
         )
         config = SimpleNamespace()
+        self._audit_request_ids.append("req-123")
 
         with (
             patch.object(
@@ -951,13 +978,190 @@ class RagStage9AuditContractTests(StudioDbTestCase):
         self.assertEqual("chunk-1", citation_row.get("chunk_id"))
         self.assertNotIn("snippet", citation_row)
 
+        flush_retrieval_audits()
         with session_scope() as session:
-            rows = session.query(RAGRetrievalAudit).all()
+            rows = (
+                session.query(RAGRetrievalAudit)
+                .filter(RAGRetrievalAudit.request_id == "req-123")
+                .all()
+            )
             self.assertEqual(1, len(rows))
             self.assertEqual("docs", rows[0].collection)
             self.assertEqual("docs/readme.md", rows[0].path)
             self.assertEqual("retrieved snippet text", rows[0].snippet)
 
+    def test_query_contract_caches_results_until_source_reindexed(self) -> None:
+        source = SimpleNamespace(
+            id=1,
+            name="Docs",
+            kind="local",
+            collection="docs",
+            last_error=None,
+            last_indexed_at="2026-01-01T00:00:00",
+        )
+        config = SimpleNamespace(embed_provider="openai", embed_model="small")
+        request_id = f"req-cache-{uuid.uuid4().hex}"
+        self._audit_request_ids.append(request_id)
+
+        def _query(**kwargs):
+            return rag_contracts.execute_query_contract(
+                collections=["docs"],
+                top_k=5,
+                request_id=request_id,
+                runtime_kind="flowchart",
+                **kwargs,
+            )
+
+        with (
+            patch.object(
+                rag_contracts,
+                "rag_health_snapshot",
+                return_value={"state": "configured_healthy", "provider": "chroma"},
+            ),
+            patch.object(rag_contracts, "list_sources", return_value=[source]),
+            patch.object(rag_contracts, "load_config", return_value=config),
+            patch.object(rag_contracts, "has_embedding_api_key", return_value=True),
+            patch.object(rag_contracts, "get_collections", return_value=[]),
+            patch.object(
+                rag_contracts,
+                "query_collections",
+                return_value=(
+                    ["cached snippet"],
+                    [{"collection": "docs", "path": "a.md", "chunk_id": "c-1"}],
+                ),
+            ) as query_collections,
+            patch.object(
+                rag_contracts,
+                "_query_result_cache",
+                rag_contracts.QueryResultCache(),
+            ),
+        ):
+            first = _query(question="What is supported?")
+            second = _query(question="  what is   SUPPORTED? ")
+            source.last_indexed_at = "2026-01-02T00:00:00"
+            third = _query(question="What is supported?")
+
+        self.assertEqual(2, query_collections.call_count)
+        self.assertFalse(first["retrieval_stats"]["cache_hit"])
+        self.assertTrue(second["retrieval_stats"]["cache_hit"])
+        self.assertFalse(third["retrieval_stats"]["cache_hit"])
+        self.assertEqual(first["retrieval_context"], second["retrieval_context"])
+        cache_stats = third["retrieval_stats"]["cache"]
+        self.assertEqual(1, cache_stats["hits"])
+        self.assertEqual(2, cache_stats["misses"])
+        self.assertAlmostEqual(1 / 3, cache_stats["hit_rate"], places=3)
+        flush_retrieval_audits()
+        with session_scope() as session:
+            self.assertEqual(
+                3,
+                session.query(RAGRetrievalAudit)
+                .filter(RAGRetrievalAudit.request_id == request_id)
+                .count(),
+            )
+
+    def _audit_values(self, request_id: str, count: int) -> list[dict]:
+        return retrieval_audit_values(
+            [
+                {"collection": "docs", "path": f"doc-{index}.md", "retrieval_rank": index}
+                for index in range(1, count + 1)
+            ],
+            request_id=request_id,
+            runtime_kind="chat",
+            flowchart_run_id=None,
+            flowchart_node_run_id=None,
+            provider="chroma",
+        )
+
+    def _audit_count(self, request_id: str) -> int:
+        with session_scope() as session:
+            return (
+                session.query(RAGRetrievalAudit)
+                .filter(RAGRetrievalAudit.request_id == request_id)
+                .count()
+            )
+
+    def test_retrieval_audit_writer_flushes_full_batches_in_background(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            batch_id = f"req-batch-{uuid.uuid4().hex}"
+            self._audit_request_ids.append(batch_id)
+            writer = RetrievalAuditWriter(
+                batch_size=3,
+                flush_interval_s=60.0,
+                spool_path=Path(tmpdir) / "spool.jsonl",
+            )
+            self.addCleanup(writer.close)
+            writer.enqueue(self._audit_values(batch_id, 2))
+            self.assertEqual(2, writer.stats()["queue_depth"])
+            self.assertEqual(0, self._audit_count(batch_id))
+
+            writer.enqueue(self._audit_values(batch_id, 1))
+            deadline = time.monotonic() + 5.0
+            while writer.stats()["written"] < 3 and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+        stats = writer.stats()
+        self.assertEqual(3, stats["written"])
+        self.assertEqual(1, stats["flushes"])
+        self.assertEqual(0, stats["queue_depth"])
+        self.assertEqual(3, self._audit_count(batch_id))
+
+    def test_retrieval_audit_writer_spools_overflow_and_replays_on_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spool_path = Path(tmpdir) / "spool.jsonl"
+            overflow_id = f"req-overflow-{uuid.uuid4().hex}"
+            self._audit_request_ids.append(overflow_id)
+            writer = RetrievalAuditWriter(
+                batch_size=100,
+                flush_interval_s=60.0,
+                max_queue_rows=2,
+                spool_path=spool_path,
+            )
+            self.addCleanup(writer.close)
+            writer.enqueue(self._audit_values(overflow_id, 5))
+
+            stats = writer.stats()
+            self.assertEqual(2, stats["queue_depth"])
+            self.assertEqual(3, stats["spooled"])
+            self.assertEqual(0, stats["dropped"])
+            self.assertTrue(spool_path.exists())
+
+            self.assertEqual(5, writer.flush())
+
+            stats = writer.stats()
+            self.assertEqual(3, stats["replayed"])
+            self.assertFalse(stats["spool_pending"])
+        self.assertEqual(5, self._audit_count(overflow_id))
+
+    def test_retrieval_audit_writer_quarantines_rows_that_fail_on_replay(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spool_path = Path(tmpdir) / "spool.jsonl"
+            replay_id = f"req-quarantine-{uuid.uuid4().hex}"
+            self._audit_request_ids.append(replay_id)
+            writer = RetrievalAuditWriter(
+                batch_size=100,
+                flush_interval_s=60.0,
+                max_queue_rows=1,
+                spool_path=spool_path,
+            )
+            self.addCleanup(writer.close)
+            good_rows = self._audit_values(replay_id, 2)
+            bad_row = dict(good_rows[0], flowchart_run_id=2_000_000_000)
+            writer._spool([good_rows[0], bad_row, good_rows[1]])
+
+            self.assertEqual(2, writer.flush())
+
+            stats = writer.stats()
+            self.assertEqual(2, stats["replayed"])
+            self.assertEqual(1, stats["quarantined"])
+            self.assertFalse(stats["spool_pending"])
+            quarantine_path = spool_path.with_name(spool_path.name + ".quarantine")
+            self.assertEqual(
+                1, len(quarantine_path.read_text(encoding="utf-8").splitlines())
+            )
+            # A later flush does not retry the quarantined row.
+            self.assertEqual(0, writer.flush())
+        self.assertEqual(2, self._audit_count(replay_id))
+
     def test_format_retrieval_context_for_synthesis_includes_source_metadata(self) -> None:
         rendered = rag_contracts.format_retrieval_context_for_synthesis(
             [
@@ -980,5 +1184,142 @@ class RagStage9AuditContractTests(StudioDbTestCase):
         self.assertIn("Primary snippet", rendered)
 
 
+class RagDeltaIndexChangeDetectionTests(StudioDbTestCase):
+    def _run_delta(self, source_id: int, repo_root: Path) -> dict:
+        source = get_source(source_id)
+        source_config = rag_contracts.build_source_config(
+            rag_contracts.load_config(), source, {}
+        )
+        source_config = replace(source_config, repo_root=repo_root)
+        self.hashed: list[str] = []
+        self.indexed: list[str] = []
+        self.deleted: list[str] = []
+        original_fingerprint = rag_contracts._path_fingerprint
+
+        def _fingerprint(path: Path) -> str:
+            self.hashed.append(path.name)
+            return original_fingerprint(path)
+
+        def _index_paths(_collection, _config, paths, **kwargs):
+            for path in paths:
+                rel_path = path.relative_to(repo_root).as_posix()
+                self.indexed.append(rel_path)
+                kwargs["on_file_result"](rel_path, True, "text", 1)
+            return len(paths), len(paths), {"text": len(paths)}, {"text": len(paths)}
+
+        collection = SimpleNamespace(
+            delete=lambda where: self.deleted.append(where["path"])
+        )
+        with (
+            patch.object(rag_contracts, "chromadb", SimpleNamespace(HttpClient=lambda **_: None)),
+            patch.object(rag_contracts, "get_collection", return_value=collection),
+            patch.object(rag_contracts, "index_paths", side_effect=_index_paths),
+            patch.object(rag_contracts, "_path_fingerprint", side_effect=_fingerprint),
+            patch.object(rag_contracts, "ensure_git_repo"),
+            patch.object(rag_contracts, "git_fetch_and_reset"),
+        ):
+            return rag_contracts._run_delta_source_index(
+                source=source,
+                source_config=source_config,
+            )
+
+    def _git(self, repo_root: Path, *args: str) -> str:
+        return subprocess.run(
+            ["git", *args],
+            cwd=repo_root,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+    def test_local_delta_only_hashes_files_whose_stat_changed(self) -> None:
+        repo_root = Path(self._tmp.name) / "local-source"
+        repo_root.mkdir()
+        (repo_root / "a.txt").write_text("alpha\n", encoding="utf-8")
+        (repo_root / "b.txt").write_text("bravo\n", encoding="utf-8")
+        source = create_source(
+            RAGSourceInput(name="Local Delta", kind="local", local_path=str(repo_root))
+        )
+
+        self._run_delta(source.id, repo_root)
+        self.assertEqual(["a.txt", "b.txt"], sorted(self.indexed))
+
+        self._run_delta(source.id, repo_root)
+        self.assertEqual([], self.hashed)
+        self.assertEqual([], self.indexed)
+
+        (repo_root / "b.txt").write_text("bravo changed\n", encoding="utf-8")
+        (repo_root / "a.txt").unlink()
+        summary = self._run_delta(source.id, repo_root)
+        self.assertEqual(["b.txt"], self.hashed)
+        self.assertEqual(["b.txt"], self.indexed)
+        self.assertEqual(["a.txt"], self.deleted)
+        self.assertEqual(["b.txt"], summary["touched_paths"])
+        states = {state.path: state for state in list_source_file_states(source.id)}
+        self.assertEqual({"b.txt"}, set(states))
+        self.assertEqual(
+            (repo_root / "b.txt").stat().st_mtime_ns,
+            states["b.txt"].mtime_ns,
+        )
+
+    def test_local_delta_refreshes_stat_without_reindexing_identical_content(self) -> None:
+        repo_root = Path(self._tmp.name) / "touch-source"
+        repo_root.mkdir()
+        target = repo_root / "a.txt"
+        target.write_text("alpha\n", encoding="utf-8")
+        source = create_source(
+            RAGSourceInput(name="Touch Delta", kind="local", local_path=str(repo_root))
+        )
+        self._run_delta(source.id, repo_root)
+
+        os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+        self._run_delta(source.id, repo_root)
+        self.assertEqual(["a.txt"], self.hashed)
+        self.assertEqual([], self.indexed)
+
+        self._run_delta(source.id, repo_root)
+        self.assertEqual([], self.hashed)
+
+    def test_github_delta_uses_git_diff_between_indexed_commits(self) -> None:
+        source = create_source(
+            RAGSourceInput(
+                name="Git Delta",
+                kind="github",
+                git_repo="org/repo",
+                git_branch="main",
+            )
+        )
+        repo_root = Path(source.git_dir)
+        repo_root.mkdir(parents=True)
+        self._git(repo_root, "init", "-q", "-b", "main")
+        self._git(repo_root, "config", "user.email", "test@example.com")
+        self._git(repo_root, "config", "user.name", "Test")
+        for name in ("keep.txt", "edit.txt", "drop.txt"):
+            (repo_root / name).write_text(f"{name}\n", encoding="utf-8")
+        self._git(repo_root, "add", ".")
+        self._git(repo_root, "commit", "-q", "-m", "initial")
+        first_commit = self._git(repo_root, "rev-parse", "HEAD")
+
+        self._run_delta(source.id, repo_root)
+        self.assertEqual(first_commit, get_source(source.id).last_indexed_commit)
+
+        (repo_root / "edit.txt").write_text("edited\n", encoding="utf-8")
+        (repo_root / "new.txt").write_text("new\n", encoding="utf-8")
+        self._git(repo_root, "rm", "-q", "drop.txt")
+        self._git(repo_root, "add", ".")
+        self._git(repo_root, "commit", "-q", "-m", "change")
+        second_commit = self._git(repo_root, "rev-parse", "HEAD")
+
+        self._run_delta(source.id, repo_root)
+        self.assertEqual(["edit.txt", "new.txt"], sorted(self.hashed))
+        self.assertEqual(["edit.txt", "new.txt"], sorted(self.indexed))
+        self.assertEqual(["drop.txt"], self.deleted)
+        self.assertEqual(second_commit, get_source(source.id).last_indexed_commit)
+
+        self._run_delta(source.id, repo_root)
+        self.assertEqual([], self.hashed)
+        self.assertEqual([], self.indexed)
+
+
 if __name__ == "__main__":
     unittest.main()
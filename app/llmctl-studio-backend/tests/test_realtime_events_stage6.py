@@ -21,11 +21,13 @@ os.environ.setdefault(
 )
 
 from services.realtime_events import (
+    RealtimeEventCoalescer,
     build_event_envelope,
     emit_contract_event,
     normalize_runtime_metadata,
     task_scope_rooms,
 )
+import web.realtime as realtime_module
 
 try:
     import sqlalchemy  # noqa: F401
@@ -96,6 +98,223 @@ class RealtimeEventsStage6Tests(unittest.TestCase):
         self.assertEqual("flowchart:run:updated", envelope["event_type"])
         self.assertEqual("flowchart.run.updated", envelope.get("legacy_event_type"))
 
+    def test_coalescer_keeps_latest_superseded_update_per_room(self) -> None:
+        captured: list[tuple[str, dict[str, object], str | None]] = []
+
+        def _capture(event_name, payload=None, *, room=None, namespace="/rt") -> None:
+            del namespace
+            captured.append((event_name, payload or {}, room))
+
+        coalescer = RealtimeEventCoalescer(window_s=60.0)
+        envelopes = [
+            build_event_envelope(
+                event_type="node.task.updated",
+                entity_kind="task",
+                entity_id=314,
+                room_keys=["task:314"],
+                payload={"status": status},
+            )
+            for status in ("queued", "running", "succeeded")
+        ]
+        with patch("services.realtime_events.emit_realtime", side_effect=_capture):
+            for envelope in envelopes:
+                coalescer.submit(envelope, namespace="/rt")
+            self.assertEqual(
+                [envelopes[0]["event_id"]],
+                [payload["event_id"] for _name, payload, _room in captured],
+            )
+            coalescer.flush()
+
+        room_events = [item for item in captured if item[2] == "task:314"]
+        self.assertEqual(
+            [envelopes[0]["event_id"], envelopes[2]["event_id"]],
+            [payload["event_id"] for _name, payload, _room in room_events],
+        )
+        batches = [item for item in captured if item[0] == "rt.batch"]
+        self.assertEqual(1, len(batches))
+        self.assertEqual("batch:task:314", batches[0][2])
+        batch = batches[0][1]
+        self.assertEqual(1, batch["count"])
+        self.assertEqual(envelopes[2]["sequence"], batch["events"][0]["sequence"])
+        stats = coalescer.stats()
+        self.assertEqual(3, stats["submitted"])
+        self.assertEqual(2, stats["emitted"])
+        self.assertEqual(1, stats["coalesced"])
+        self.assertEqual(1, stats["batches_emitted"])
+        self.assertEqual(2, stats["batch_coalesced"])
+
+    def test_coalescer_releases_held_updates_before_other_events(self) -> None:
+        captured: list[tuple[str, dict[str, object], str | None]] = []
+
+        def _capture(event_name, payload=None, *, room=None, namespace="/rt") -> None:
+            del namespace
+            captured.append((event_name, payload or {}, room))
+
+        coalescer = RealtimeEventCoalescer(window_s=60.0)
+        first, second = (
+            build_event_envelope(
+                event_type="node.task.updated",
+                entity_kind="task",
+                entity_id=315,
+                room_keys=["task:315"],
+                payload={"status": status},
+            )
+            for status in ("running", "succeeded")
+        )
+        completed = build_event_envelope(
+            event_type="node.task.completed",
+            entity_kind="task",
+            entity_id=315,
+            room_keys=["task:315"],
+            payload={"status": "succeeded"},
+        )
+        with patch("services.realtime_events.emit_realtime", side_effect=_capture):
+            for envelope in (first, second, completed):
+                coalescer.submit(envelope, namespace="/rt")
+            self.assertEqual(
+                [first["event_id"], second["event_id"], completed["event_id"]],
+                [payload["event_id"] for _name, payload, _room in captured],
+            )
+            coalescer.flush()
+
+        batch = [item for item in captured if item[0] == "rt.batch"][0][1]
+        self.assertEqual(
+            [second["sequence"], completed["sequence"]],
+            [event["sequence"] for event in batch["events"]],
+        )
+
+    def test_coalescer_never_drops_flowchart_run_transitions(self) -> None:
+        captured: list[tuple[str, dict[str, object], str | None]] = []
+
+        def _capture(event_name, payload=None, *, room=None, namespace="/rt") -> None:
+            del namespace
+            captured.append((event_name, payload or {}, room))
+
+        coalescer = RealtimeEventCoalescer(window_s=60.0, batch_rooms=frozenset)
+        envelopes = [
+            build_event_envelope(
+                event_type="flowchart.run.updated",
+                entity_kind="flowchart_run",
+                entity_id=316,
+                room_keys=["flowchart_run:316"],
+                payload={"transition": transition},
+            )
+            for transition in ("paused", "resumed", "failed")
+        ]
+        with patch("services.realtime_events.emit_realtime", side_effect=_capture):
+            for envelope in envelopes:
+                coalescer.submit(envelope, namespace="/rt")
+            coalescer.flush()
+
+        self.assertEqual(
+            ["paused", "resumed", "failed"],
+            [payload["payload"]["transition"] for _name, payload, _room in captured],
+        )
+
+    def test_coalescer_skips_batches_for_rooms_without_batch_subscribers(self) -> None:
+        captured: list[tuple[str, dict[str, object], str | None]] = []
+
+        def _capture(event_name, payload=None, *, room=None, namespace="/rt") -> None:
+            del namespace
+            captured.append((event_name, payload or {}, room))
+
+        coalescer = RealtimeEventCoalescer(
+            window_s=60.0,
+            batch_rooms=lambda: frozenset({"run:9"}),
+        )
+        envelope = build_event_envelope(
+            event_type="node.task.updated",
+            entity_kind="task",
+            entity_id=317,
+            room_keys=["task:317", "run:9"],
+            payload={"status": "running"},
+        )
+        with patch("services.realtime_events.emit_realtime", side_effect=_capture):
+            coalescer.submit(envelope, namespace="/rt")
+            coalescer.flush()
+
+        self.assertEqual(
+            [
+                ("node:task:updated", "task:317"),
+                ("node:task:updated", "run:9"),
+                ("rt.batch", "batch:run:9"),
+            ],
+            [(name, room) for name, _payload, room in captured],
+        )
+
+    def test_zero_window_emits_inline_without_timer(self) -> None:
+        captured: list[tuple[str, dict[str, object], str | None]] = []
+
+        def _capture(event_name, payload=None, *, room=None, namespace="/rt") -> None:
+            del namespace
+            captured.append((event_name, payload or {}, room))
+
+        coalescer = RealtimeEventCoalescer(
+            window_s=0.0,
+            batch_rooms=lambda: frozenset({"task:318"}),
+        )
+        envelopes = [
+            build_event_envelope(
+                event_type="node.task.updated",
+                entity_kind="task",
+                entity_id=318,
+                room_keys=["task:318"],
+                payload={"status": status},
+            )
+            for status in ("running", "succeeded")
+        ]
+        with (
+            patch("services.realtime_events.emit_realtime", side_effect=_capture),
+            patch("services.realtime_events.threading.Timer") as timer,
+        ):
+            for envelope in envelopes:
+                coalescer.submit(envelope, namespace="/rt")
+
+        timer.assert_not_called()
+        self.assertEqual(
+            ["task:318", "batch:task:318", "task:318", "batch:task:318"],
+            [room for _name, _payload, room in captured],
+        )
+        self.assertEqual(0, coalescer.stats()["held"])
+
+    def test_batch_subscription_registry_counts_rooms_per_socket(self) -> None:
+        class _FakeRegistry:
+            def __init__(self) -> None:
+                self.counts: dict[str, int] = {}
+
+            def hincrby(self, _key, room, delta):
+                self.counts[room] = self.counts.get(room, 0) + delta
+                return self.counts[room]
+
+            def hdel(self, _key, room):
+                self.counts.pop(room, None)
+
+            def hgetall(self, _key):
+                return {
+                    room.encode("utf-8"): str(count).encode("utf-8")
+                    for room, count in self.counts.items()
+                }
+
+        registry = _FakeRegistry()
+        with (
+            patch.object(realtime_module, "_batch_registry", return_value=registry),
+            patch.object(realtime_module, "_batch_rooms_cache", None),
+            patch.dict(realtime_module._batch_sid_rooms, clear=True),
+        ):
+            realtime_module._track_batch_rooms("sid-a", joined=["task:1", "run:2"], left=[])
+            realtime_module._track_batch_rooms("sid-a", joined=["task:1"], left=[])
+            realtime_module._track_batch_rooms("sid-b", joined=["task:1"], left=[])
+            self.assertEqual({"task:1": 2, "run:2": 1}, registry.counts)
+            self.assertEqual(
+                frozenset({"task:1", "run:2"}),
+                realtime_module.batch_subscribed_rooms(),
+            )
+
+            realtime_module._track_batch_rooms("sid-a", joined=[], left=["run:2"])
+            realtime_module._release_batch_rooms("sid-a")
+            realtime_module._release_batch_rooms("sid-b")
+            self.assertEqual({}, registry.counts)
+
     def test_runtime_metadata_normalization(self) -> None:
         normalized = normalize_runtime_metadata(
             {
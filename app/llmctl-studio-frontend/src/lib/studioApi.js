@@ -167,6 +167,18 @@ export function getNodeStatus(nodeId) {
   return requestJson(`/nodes/${parsedId}/status`)
 }
 
+export function getNodeLogs(nodeId, { stream = 'output', offset = null, limit = null, tail = null } = {}) {
+  const parsedId = parsePositiveId(nodeId, 'nodeId')
+  return requestJson(
+    appendQuery(`/nodes/${parsedId}/logs`, {
+      stream,
+      offset: Number.isInteger(offset) && offset >= 0 ? offset : null,
+      limit: Number.isInteger(limit) && limit >= 0 ? limit : null,
+      tail: Number.isInteger(tail) && tail >= 0 ? tail : null,
+    }),
+  )
+}
+
 function parsePositiveId(value, fieldName) {
   const parsedId = Number.parseInt(String(value ?? ''), 10)
   if (!Number.isInteger(parsedId) || parsedId <= 0) {
@@ -1414,6 +1426,11 @@ export function updateSettingsRuntimeNodeExecutor({
   k8sJobTtlSeconds = '',
   k8sImagePullSecretsJson = '',
   k8sInCluster = false,
+  k8sWarmPoolEnabled = false,
+  k8sWarmPoolSize = '',
+  k8sWarmPoolIdleTtlSeconds = '',
+  k8sWarmPoolFrontierMax = '',
+  k8sWarmPoolVllmMax = '',
 } = {}) {
   const normalizedFrontierImage = String(k8sFrontierImage || '').trim()
   const normalizedVllmImage = String(k8sVllmImage || '').trim()
@@ -1439,6 +1456,11 @@ export function updateSettingsRuntimeNodeExecutor({
       k8s_job_ttl_seconds: k8sJobTtlSeconds,
       k8s_image_pull_secrets_json: k8sImagePullSecretsJson,
       k8s_in_cluster: k8sInCluster,
+      k8s_warm_pool_enabled: k8sWarmPoolEnabled,
+      k8s_warm_pool_size: k8sWarmPoolSize,
+      k8s_warm_pool_idle_ttl_seconds: k8sWarmPoolIdleTtlSeconds,
+      k8s_warm_pool_frontier_max: k8sWarmPoolFrontierMax,
+      k8s_warm_pool_vllm_max: k8sWarmPoolVllmMax,
     },
   })
 }
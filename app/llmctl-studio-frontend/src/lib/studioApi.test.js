@@ -110,6 +110,7 @@ import {
   getNodeArtifacts,
   getNodeMeta,
   getNodes,
+  getNodeLogs,
   getNodeStatus,
   getPlan,
   getPlanArtifact,
@@ -278,6 +279,15 @@ describe('studioApi', () => {
     expect(requestJson).toHaveBeenNthCalledWith(2, '/nodes/11/status')
   })
 
+  test('node log reads pass stream offsets through as query params', () => {
+    getNodeLogs(11, { stream: 'error', offset: 128 })
+    getNodeLogs('12', { tail: 4096 })
+
+    expect(requestJson).toHaveBeenNthCalledWith(1, '/nodes/11/logs?stream=error&offset=128')
+    expect(requestJson).toHaveBeenNthCalledWith(2, '/nodes/12/logs?stream=output&tail=4096')
+    expect(() => getNodeLogs(0)).toThrow('nodeId must be a positive integer.')
+  })
+
   test('chat thread read validates ids and preserves critical failure messaging', () => {
     expect(() => getChatThread('')).toThrow('threadId must be a positive integer.')
     expect(() => getChatRuntime({ threadId: 'bad' })).toThrow('threadId must be a positive integer.')
@@ -860,6 +870,11 @@ describe('studioApi', () => {
       k8sJobTtlSeconds: 600,
       k8sImagePullSecretsJson: '[]',
       k8sInCluster: true,
+      k8sWarmPoolEnabled: true,
+      k8sWarmPoolSize: 2,
+      k8sWarmPoolIdleTtlSeconds: 600,
+      k8sWarmPoolFrontierMax: 4,
+      k8sWarmPoolVllmMax: 0,
     })
     updateSettingsRuntimeRag({
       dbProvider: 'chroma',
@@ -976,6 +991,11 @@ describe('studioApi', () => {
         k8s_job_ttl_seconds: 600,
         k8s_image_pull_secrets_json: '[]',
         k8s_in_cluster: true,
+        k8s_warm_pool_enabled: true,
+        k8s_warm_pool_size: 2,
+        k8s_warm_pool_idle_ttl_seconds: 600,
+        k8s_warm_pool_frontier_max: 4,
+        k8s_warm_pool_vllm_max: 0,
       },
     })
     expect(requestJson).toHaveBeenNthCalledWith(16, '/settings/runtime/rag', {
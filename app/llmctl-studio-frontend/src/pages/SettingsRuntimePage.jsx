@@ -100,6 +100,11 @@ export default function SettingsRuntimePage() {
     k8sJobTtlSeconds: '',
     k8sImagePullSecretsJson: '',
     k8sInCluster: false,
+    k8sWarmPoolEnabled: false,
+    k8sWarmPoolSize: '',
+    k8sWarmPoolIdleTtlSeconds: '',
+    k8sWarmPoolFrontierMax: '',
+    k8sWarmPoolVllmMax: '',
   })
   const [instructionFlags, setInstructionFlags] = useState({})
 
@@ -171,6 +176,11 @@ export default function SettingsRuntimePage() {
         k8sJobTtlSeconds: String(nodeExecutor.k8s_job_ttl_seconds || ''),
         k8sImagePullSecretsJson: String(nodeExecutor.k8s_image_pull_secrets_json || ''),
         k8sInCluster: asBool(nodeExecutor.k8s_in_cluster),
+        k8sWarmPoolEnabled: asBool(nodeExecutor.k8s_warm_pool_enabled),
+        k8sWarmPoolSize: String(nodeExecutor.k8s_warm_pool_size || ''),
+        k8sWarmPoolIdleTtlSeconds: String(nodeExecutor.k8s_warm_pool_idle_ttl_seconds || ''),
+        k8sWarmPoolFrontierMax: String(nodeExecutor.k8s_warm_pool_frontier_max || ''),
+        k8sWarmPoolVllmMax: String(nodeExecutor.k8s_warm_pool_vllm_max || ''),
       })
 
       const flags = {}
@@ -324,11 +334,16 @@ export default function SettingsRuntimePage() {
                   <label className="field"><span>Service account</span><input type="text" value={nodeExecutorForm.k8sServiceAccount} onChange={(event) => setNodeExecutorForm((current) => ({ ...current, k8sServiceAccount: event.target.value }))} /></label>
                   <label className="field"><span>GPU limit</span><IntegerInput value={nodeExecutorForm.k8sGpuLimit} onValueChange={(value) => setNodeExecutorForm((current) => ({ ...current, k8sGpuLimit: value }))} /></label>
                   <label className="field"><span>Job TTL seconds</span><IntegerInput value={nodeExecutorForm.k8sJobTtlSeconds} onValueChange={(value) => setNodeExecutorForm((current) => ({ ...current, k8sJobTtlSeconds: value }))} /></label>
+                  <label className="field"><span>Warm pool idle pods per class</span><IntegerInput value={nodeExecutorForm.k8sWarmPoolSize} onValueChange={(value) => setNodeExecutorForm((current) => ({ ...current, k8sWarmPoolSize: value }))} /></label>
+                  <label className="field"><span>Warm pool idle TTL seconds</span><IntegerInput value={nodeExecutorForm.k8sWarmPoolIdleTtlSeconds} onValueChange={(value) => setNodeExecutorForm((current) => ({ ...current, k8sWarmPoolIdleTtlSeconds: value }))} /></label>
+                  <label className="field"><span>Warm pool frontier max pods</span><IntegerInput value={nodeExecutorForm.k8sWarmPoolFrontierMax} onValueChange={(value) => setNodeExecutorForm((current) => ({ ...current, k8sWarmPoolFrontierMax: value }))} /></label>
+                  <label className="field"><span>Warm pool vLLM max pods</span><IntegerInput value={nodeExecutorForm.k8sWarmPoolVllmMax} onValueChange={(value) => setNodeExecutorForm((current) => ({ ...current, k8sWarmPoolVllmMax: value }))} /></label>
                   <label className="field field-span"><span>Image pull secrets JSON</span><textarea value={nodeExecutorForm.k8sImagePullSecretsJson} onChange={(event) => setNodeExecutorForm((current) => ({ ...current, k8sImagePullSecretsJson: event.target.value }))} /></label>
                   <label className="field field-span"><span>Kubeconfig (optional)</span><textarea value={nodeExecutorForm.k8sKubeconfig} onChange={(event) => setNodeExecutorForm((current) => ({ ...current, k8sKubeconfig: event.target.value }))} /></label>
                   <label className="checkbox-item"><input type="checkbox" checked={nodeExecutorForm.k8sKubeconfigClear} onChange={(event) => setNodeExecutorForm((current) => ({ ...current, k8sKubeconfigClear: event.target.checked }))} /><span>Clear stored kubeconfig</span></label>
                   <label className="checkbox-item"><input type="checkbox" checked={nodeExecutorForm.cancelForceKillEnabled} onChange={(event) => setNodeExecutorForm((current) => ({ ...current, cancelForceKillEnabled: event.target.checked }))} /><span>Enable cancel force kill</span></label>
                   <label className="checkbox-item"><input type="checkbox" checked={nodeExecutorForm.k8sInCluster} onChange={(event) => setNodeExecutorForm((current) => ({ ...current, k8sInCluster: event.target.checked }))} /><span>Use in-cluster credentials</span></label>
+                  <label className="checkbox-item"><input type="checkbox" checked={nodeExecutorForm.k8sWarmPoolEnabled} onChange={(event) => setNodeExecutorForm((current) => ({ ...current, k8sWarmPoolEnabled: event.target.checked }))} /><span>Run payloads in warm executor pods</span></label>
                   <div className="form-actions">
                     <button
                       type="button"